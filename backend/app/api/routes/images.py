@@ -0,0 +1,84 @@
+"""画像配信APIのルーター"""
+
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Path, Response
+
+from app import container
+from app.application.gateway_interfaces.image_storage_gateway import ImageStorageGateway
+from app.config import IMAGE_RESPONSE_MAX_AGE_SECONDS
+
+router = APIRouter()
+
+# NOTE: コンテンツハッシュで指定した画像の内容は変わらないため、長期間キャッシュさせる
+_CACHE_CONTROL = f"public, max-age={IMAGE_RESPONSE_MAX_AGE_SECONDS}, immutable"
+
+
+def get_image_storage_gateway() -> ImageStorageGateway:
+    """ImageStorageGatewayのインスタンスを取得
+
+    Returns:
+        ImageStorageGateway: 画像ストレージGateway
+    """
+    return container.get_container().get(ImageStorageGateway)
+
+
+def build_image_url(content_hash: str) -> str:
+    """コンテンツハッシュから画像の取得先を構築
+
+    Args:
+        content_hash: 画像のコンテンツハッシュ
+
+    Returns:
+        str: 画像の取得先 (ルートからの相対パス)
+    """
+    return f"/images/{content_hash}"
+
+
+@router.get(
+    "/images/{content_hash}",
+    response_class=Response,
+    responses={
+        200: {"content": {"image/jpeg": {}}, "description": "画像データ"},
+        304: {"description": "クライアントのキャッシュが有効"},
+        404: {"description": "画像が見つからない"},
+    },
+)
+async def get_image(
+    content_hash: Annotated[
+        str,
+        Path(description="画像のコンテンツハッシュ (SHA-256の16進表記)", pattern="^[0-9a-f]{64}$"),
+    ],
+    if_none_match: Annotated[str | None, Header()] = None,
+    # NOTE: テストしやすいようにFastAPIの依存性注入機能を使用
+    image_storage: ImageStorageGateway = Depends(get_image_storage_gateway),  # noqa: B008
+) -> Response:
+    """画像を取得
+
+    Args:
+        content_hash: 画像のコンテンツハッシュ
+        if_none_match: クライアントがキャッシュしている画像のETag
+        image_storage: 画像ストレージGateway
+
+    Returns:
+        Response: 画像データ (ETagが一致する場合は本文なしの304)
+
+    Raises:
+        HTTPException: 画像が見つからない場合
+    """
+    etag = f'"{content_hash}"'
+    headers = {"ETag": etag, "Cache-Control": _CACHE_CONTROL}
+    # NOTE: 内容がハッシュで決まるため、ETagが一致すればストアを参照せずに304を返せる
+    if if_none_match is not None and _matches_etag(if_none_match, etag):
+        return Response(status_code=304, headers=headers)
+
+    image_data = await image_storage.find(content_hash)
+    if image_data is None:
+        raise HTTPException(status_code=404, detail="画像が見つかりませんでした")
+    return Response(content=image_data, media_type="image/jpeg", headers=headers)
+
+
+def _matches_etag(if_none_match: str, etag: str) -> bool:
+    """If-None-MatchヘッダーがETagに一致するかどうか (弱い比較)"""
+    tags = [tag.strip() for tag in if_none_match.split(",")]
+    return any(tag == "*" or tag.removeprefix("W/") == etag for tag in tags)
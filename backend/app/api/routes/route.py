@@ -1,22 +1,39 @@
 """ルート生成APIのルーター"""
 
+import asyncio
 import logging
+from collections.abc import AsyncGenerator, AsyncIterator
+from contextlib import aclosing
 
 from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import StreamingResponse
 from pydantic import ValidationError
 
 from app import container
+from app.api.routes.images import build_image_url, get_image_storage_gateway
 from app.api.schemas import (
     RouteRequest,
     RouteRequestDestination,
     RouteRequestRandom,
     RouteResponse,
+    RouteStreamErrorEvent,
+    route_stream_event_from_dto,
 )
+from app.application.deadline import Deadline
+from app.application.gateway_interfaces.image_storage_gateway import ImageStorageGateway
 from app.application.usecases.generate_route_usecase import (
     GenerateRouteUseCase,
 )
+from app.application.usecases.route_pool import RoutePool
+from app.application.usecases.route_result_dto import (
+    RouteDestinationEventDto,
+    RouteEventDto,
+    RouteMidpointEventDto,
+    RouteResultDto,
+)
+from app.config import ROUTE_REQUEST_TIME_BUDGET_MS
 from app.domain.exceptions import ExternalServiceError, RouteGenerationError
-from app.domain.value_objects import Coordinate
+from app.domain.value_objects import Coordinate, StreetViewImage
 
 logger = logging.getLogger(__name__)
 
@@ -33,17 +50,36 @@ def get_generate_route_usecase() -> GenerateRouteUseCase:
     return container_instance.get(GenerateRouteUseCase)
 
 
+def get_route_pool() -> RoutePool:
+    """RoutePoolのインスタンスを取得
+
+    Returns:
+        RoutePool: 事前生成ルートのプール
+    """
+    container_instance = container.get_container()
+    return container_instance.get(RoutePool)
+
+
 @router.post("/route")
-def route(
+async def route(
     request: RouteRequest,
     # NOTE: テストしやすいようにFastAPIの依存性注入機能を使用
     usecase: GenerateRouteUseCase = Depends(get_generate_route_usecase),  # noqa: B008
+    image_storage: ImageStorageGateway = Depends(get_image_storage_gateway),  # noqa: B008
+    route_pool: RoutePool = Depends(get_route_pool),  # noqa: B008
 ) -> RouteResponse:
     """ルートを生成
 
+    image_delivery に reference を指定した場合は、画像を保存して image_url に
+    GET /images/{content_hash} の取得先を返し、レスポンスに画像を埋め込まない。
+    ただし画像の保存先をインスタンス間で共有していない場合は、画像を埋め込んで返す。
+    ランダムモードで事前生成の対象エリアからのリクエストの場合は、事前生成したルートを返す。
+
     Args:
         request: ルート生成リクエスト(現在地の緯度・経度、半径または目的地座標を含む)
         usecase: ルート生成ユースケース
+        image_storage: 画像ストレージGateway
+        route_pool: 事前生成ルートのプール
 
     Returns:
         RouteResponse: ルート情報
@@ -51,6 +87,96 @@ def route(
     Raises:
         HTTPException: 外部サービスエラーが発生した場合、またはバリデーションエラーが発生した場合
     """
+    # NOTE: リクエスト全体の時間予算を期限として、ユースケースからGatewayまで受け渡す
+    deadline = Deadline.after(ROUTE_REQUEST_TIME_BUDGET_MS / 1000)
+    current_coordinate, radius_m, destination_coordinate = _parse_request(request)
+
+    try:
+        result = None
+        if radius_m is not None and destination_coordinate is None:
+            result = route_pool.take(current_coordinate, radius_m)
+        if result is None:
+            result = await usecase.execute(
+                current_coordinate,
+                radius_m=radius_m,
+                destination_coordinate=destination_coordinate,
+                deadline=deadline,
+            )
+        if _delivers_image_reference(request, image_storage):
+            image_urls = await _publish_images(result, image_storage)
+            return RouteResponse.from_dto(result, image_url_for=image_urls.__getitem__)
+        return RouteResponse.from_dto(result)
+    except Exception as e:
+        raise _to_http_exception(request, e) from e
+
+
+@router.post(
+    "/route/stream",
+    response_class=StreamingResponse,
+    responses={
+        200: {
+            "content": {"application/x-ndjson": {}},
+            "description": "1行に1つのイベント (JSON) を決まった順に返す",
+        }
+    },
+)
+async def route_stream(
+    request: RouteRequest,
+    # NOTE: テストしやすいようにFastAPIの依存性注入機能を使用
+    usecase: GenerateRouteUseCase = Depends(get_generate_route_usecase),  # noqa: B008
+    image_storage: ImageStorageGateway = Depends(get_image_storage_gateway),  # noqa: B008
+) -> StreamingResponse:
+    """ルートを生成し、決まった地点から順にNDJSONで返す
+
+    1行目に目的地 (type=destination)、続いて中間地点 (type=midpoint) をルート上の順に、
+    最後にルート全体 (type=completed) を返す。目的地が決まる前に失敗した場合は /route と
+    同じエラーレスポンスを返し、目的地を返した後に失敗した場合は最後の行に type=error を返す。
+
+    Args:
+        request: ルート生成リクエスト(現在地の緯度・経度、半径または目的地座標を含む)
+        usecase: ルート生成ユースケース
+        image_storage: 画像ストレージGateway
+
+    Returns:
+        StreamingResponse: ルート生成イベントのストリーム
+
+    Raises:
+        HTTPException: 目的地が決まる前に外部サービスエラーやバリデーションエラーが発生した場合
+    """
+    deadline = Deadline.after(ROUTE_REQUEST_TIME_BUDGET_MS / 1000)
+    current_coordinate, radius_m, destination_coordinate = _parse_request(request)
+
+    events = usecase.stream(
+        current_coordinate,
+        radius_m=radius_m,
+        destination_coordinate=destination_coordinate,
+        deadline=deadline,
+    )
+    # NOTE: 目的地が決まるまではHTTPステータスでエラーを返せるよう、最初のイベントを先に待つ
+    try:
+        first_event = await anext(events)
+    except Exception as e:
+        await events.aclose()
+        raise _to_http_exception(request, e) from e
+
+    return StreamingResponse(
+        _encode_events(request, first_event, events, image_storage),
+        media_type="application/x-ndjson",
+    )
+
+
+def _parse_request(request: RouteRequest) -> tuple[Coordinate, int | None, Coordinate | None]:
+    """リクエストから現在地・半径・目的地を取得
+
+    Args:
+        request: ルート生成リクエスト
+
+    Returns:
+        tuple[Coordinate, int | None, Coordinate | None]: 現在地、半径、目的地
+
+    Raises:
+        HTTPException: 座標が不正な場合
+    """
     try:
         current_coordinate = Coordinate(latitude=request.current_lat, longitude=request.current_lng)
         destination_coordinate = None
@@ -74,30 +200,118 @@ def route(
         logger.exception(f"Exception in /route: {e}")
         logger.debug(f"Exception in /route: {e}", extra=extra_log)
         raise HTTPException(status_code=500, detail="リクエストの処理に失敗しました") from e
+    return current_coordinate, radius_m, destination_coordinate
 
-    try:
-        result = usecase.execute(
-            current_coordinate,
-            radius_m=radius_m,
-            destination_coordinate=destination_coordinate,
-        )
-        return RouteResponse.from_dto(result)
-    except RouteGenerationError as e:
-        extra_log = _build_extra_log(request)
-        logger.warning(f"RouteGenerationError in /route: {e}")
-        logger.debug(f"RouteGenerationError in /route: {e}", extra=extra_log)
-        raise HTTPException(status_code=500, detail=e.message) from e
-    except ExternalServiceError as e:
-        extra_log = _build_extra_log(request)
-        logger.error(f"ExternalServiceError in /route: {e}")
-        logger.debug(f"ExternalServiceError in /route: {e}", extra=extra_log)
-        raise HTTPException(status_code=500, detail="外部サービスとの通信に失敗しました") from e
-    except Exception as e:
-        # NOTE: 未知のエラーはスタックトレースを含むexceptionレベルでログを出力
-        extra_log = _build_extra_log(request)
-        logger.exception(f"Exception in /route: {e}")
-        logger.debug(f"Exception in /route: {e}", extra=extra_log)
-        raise HTTPException(status_code=500, detail="ルート生成に失敗しました") from e
+
+def _to_http_exception(request: RouteRequest, error: Exception) -> HTTPException:
+    """ルート生成中の例外をログに出力し、レスポンス用のHTTPExceptionに変換
+
+    Args:
+        request: ルート生成リクエスト
+        error: ルート生成中に発生した例外
+
+    Returns:
+        HTTPException: レスポンス用の例外
+    """
+    extra_log = _build_extra_log(request)
+    if isinstance(error, RouteGenerationError):
+        logger.warning(f"RouteGenerationError in /route: {error}")
+        logger.debug(f"RouteGenerationError in /route: {error}", extra=extra_log)
+        return HTTPException(status_code=500, detail=error.message)
+    if isinstance(error, ExternalServiceError):
+        logger.error(f"ExternalServiceError in /route: {error}")
+        logger.debug(f"ExternalServiceError in /route: {error}", extra=extra_log)
+        return HTTPException(status_code=500, detail="外部サービスとの通信に失敗しました")
+    # NOTE: 未知のエラーはスタックトレースを含めてログを出力
+    logger.error(f"Exception in /route: {error}", exc_info=error)
+    logger.debug(f"Exception in /route: {error}", extra=extra_log)
+    return HTTPException(status_code=500, detail="ルート生成に失敗しました")
+
+
+async def _encode_events(
+    request: RouteRequest,
+    first_event: RouteEventDto,
+    events: AsyncGenerator[RouteEventDto],
+    image_storage: ImageStorageGateway,
+) -> AsyncIterator[str]:
+    """ルート生成イベントをNDJSONの行に変換する
+
+    Args:
+        request: ルート生成リクエスト
+        first_event: 先に受け取った最初のイベント
+        events: 残りのイベント
+        image_storage: 画像ストレージGateway
+
+    Yields:
+        str: 1イベント分のJSON (改行付き)
+    """
+    async with aclosing(events):
+        try:
+            yield await _encode_event(request, first_event, image_storage)
+            async for event in events:
+                yield await _encode_event(request, event, image_storage)
+        except Exception as e:
+            # NOTE: レスポンスのステータスは送信済みのため、エラーをイベントとして返す
+            http_exception = _to_http_exception(request, e)
+            yield RouteStreamErrorEvent(detail=http_exception.detail).model_dump_json() + "\n"
+
+
+async def _encode_event(
+    request: RouteRequest, event: RouteEventDto, image_storage: ImageStorageGateway
+) -> str:
+    """ルート生成イベントを1行のJSONに変換する (referenceの場合は画像を保存する)"""
+    point = None
+    match event:
+        case RouteDestinationEventDto():
+            point = event.destination
+        case RouteMidpointEventDto():
+            point = event.midpoint
+
+    image_url = None
+    if point is not None and _delivers_image_reference(request, image_storage):
+        content_hash = await image_storage.save(point.street_view_image.image_data)
+        image_url = build_image_url(content_hash)
+    return route_stream_event_from_dto(event, image_url=image_url).model_dump_json() + "\n"
+
+
+def _delivers_image_reference(request: RouteRequest, image_storage: ImageStorageGateway) -> bool:
+    """画像の取得先を返すかどうか
+
+    NOTE: 画像を保存したインスタンス以外に後続の取得が振り分けられると404になるため、
+          保存先をインスタンス間で共有していない場合は画像を埋め込んで返す
+
+    Args:
+        request: ルート生成リクエスト
+        image_storage: 画像ストレージGateway
+
+    Returns:
+        bool: 画像の取得先を返す場合はTrue
+    """
+    return request.image_delivery == "reference" and image_storage.shared
+
+
+async def _publish_images(
+    result: RouteResultDto, image_storage: ImageStorageGateway
+) -> dict[StreetViewImage, str]:
+    """ルートに含まれる画像を保存し、画像ごとの取得先を返す
+
+    Args:
+        result: ルート生成結果DTO
+        image_storage: 画像ストレージGateway
+
+    Returns:
+        dict[StreetViewImage, str]: 画像と取得先の対応
+    """
+    images = [result.destination.street_view_image] + [
+        point.street_view_image for point in result.midpoints
+    ]
+    content_hashes = await asyncio.gather(
+        *(image_storage.save(image.image_data) for image in images)
+    )
+    return {
+        image: build_image_url(content_hash)
+        for image, content_hash in zip(images, content_hashes, strict=True)
+    }
 
 
 def _build_extra_log(
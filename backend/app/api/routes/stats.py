@@ -0,0 +1,30 @@
+"""運用監視用統計APIのルーター"""
+
+from fastapi import APIRouter
+
+from app import container
+from app.application.gateway_interfaces.async_google_maps_gateway import AsyncGoogleMapsGateway
+from app.application.services import LandmarkImageSelectionService
+from app.application.usecases.route_pool import RoutePool
+
+router = APIRouter()
+
+
+# NOTE: 運用監視専用のため、クライアントコード生成対象のOpenAPIスキーマには含めない
+@router.get("/stats", include_in_schema=False)
+async def stats() -> dict:
+    """外部サービス連携の統計情報を取得
+
+    Returns:
+        dict: Gatewayの統計情報 (コネクションプールの利用状況など) と
+            画像付きランドマーク選択の統計情報 (並行試行で無駄になった呼び出し数など)、
+            事前生成ルートのプールの統計情報 (払い出し数など)
+    """
+    injector = container.get_container()
+    gateway = injector.get(AsyncGoogleMapsGateway)
+    landmark_selector = injector.get(LandmarkImageSelectionService)
+    return {
+        "google_maps_gateway": gateway.get_stats(),
+        "landmark_image_selection": landmark_selector.get_stats().model_dump(),
+        "route_pool": injector.get(RoutePool).get_stats().model_dump(),
+    }
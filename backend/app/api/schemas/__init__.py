@@ -7,6 +7,12 @@ from app.api.schemas.route import (
     RouteRequestDestination,
     RouteRequestRandom,
     RouteResponse,
+    RouteStreamCompletedEvent,
+    RouteStreamDestinationEvent,
+    RouteStreamErrorEvent,
+    RouteStreamEvent,
+    RouteStreamMidpointEvent,
+    route_stream_event_from_dto,
 )
 
 __all__ = [
@@ -16,4 +22,10 @@ __all__ = [
     "RouteRequestDestination",
     "RouteRequestRandom",
     "RouteResponse",
+    "RouteStreamCompletedEvent",
+    "RouteStreamDestinationEvent",
+    "RouteStreamErrorEvent",
+    "RouteStreamEvent",
+    "RouteStreamMidpointEvent",
+    "route_stream_event_from_dto",
 ]
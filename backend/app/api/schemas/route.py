@@ -1,13 +1,22 @@
 """ルートAPIスキーマ定義"""
 
 import base64
+from collections.abc import Callable
 from typing import Annotated, Literal
 from urllib.parse import urlencode
 
 from pydantic import BaseModel, Discriminator, Field
 
-from app.application.usecases.route_result_dto import RoutePointDto, RouteResultDto
+from app.application.usecases.route_result_dto import (
+    RouteCompletedEventDto,
+    RouteDestinationEventDto,
+    RouteEventDto,
+    RouteMidpointEventDto,
+    RoutePointDto,
+    RouteResultDto,
+)
 from app.domain.value_objects.coordinate import Coordinate
+from app.domain.value_objects.street_view_image import StreetViewImage
 
 
 class RouteRequestBase(BaseModel):
@@ -25,6 +34,15 @@ class RouteRequestBase(BaseModel):
         le=180,
         examples=[139.8133963],
     )
+    image_delivery: Literal["inline", "reference"] = Field(
+        default="inline",
+        description=(
+            "画像の返し方 (inline: image_base64 に画像を含める / "
+            "reference: image_url に画像の取得先を返す。画像の保存先をインスタンス間で"
+            "共有していない場合は inline として扱う)"
+        ),
+        examples=["reference"],
+    )
 
 
 class RouteRequestRandom(RouteRequestBase):
@@ -91,17 +109,19 @@ class MidPoint(BaseModel):
     image_latitude: float | None = None
     image_longitude: float | None = None
     image_base64: str | None = None
+    image_url: str | None = None
     heading: float | None = None
     name: str | None = None
     genre: str | None = None
     google_maps_url: str | None = None
 
     @classmethod
-    def from_dto(cls, point: RoutePointDto) -> "MidPoint":
+    def from_dto(cls, point: RoutePointDto, image_url: str | None = None) -> "MidPoint":
         """地点DTOからMidPointを作成
 
         Args:
             point: 地点DTO
+            image_url: 画像の取得先 (指定した場合は画像をbase64で埋め込まない)
 
         Returns:
             MidPoint: 中間地点モデル
@@ -116,7 +136,11 @@ class MidPoint(BaseModel):
         )
 
         image_lat, image_lng = street_view_image.metadata_coordinate.to_float_tuple()
-        image_data_base64 = base64.b64encode(street_view_image.image_data).decode("utf-8")
+        image_data_base64 = (
+            base64.b64encode(street_view_image.image_data).decode("utf-8")
+            if image_url is None
+            else None
+        )
 
         return cls(
             latitude=lat,
@@ -124,6 +148,7 @@ class MidPoint(BaseModel):
             image_latitude=image_lat,
             image_longitude=image_lng,
             image_base64=image_data_base64,
+            image_url=image_url,
             heading=street_view_image.heading,
             name=landmark.display_name if landmark is not None else None,
             genre=_extract_genre(point),
@@ -140,25 +165,104 @@ class RouteResponse(BaseModel):
     overview_polyline: str
 
     @classmethod
-    def from_dto(cls, dto: RouteResultDto) -> "RouteResponse":
+    def from_dto(
+        cls,
+        dto: RouteResultDto,
+        image_url_for: Callable[[StreetViewImage], str] | None = None,
+    ) -> "RouteResponse":
         """RouteResultDtoからAPIレスポンススキーマを作成
 
         Args:
             dto: ルート生成結果DTO
+            image_url_for: 画像の取得先を返す関数 (Noneの場合は画像をbase64で埋め込む)
 
         Returns:
             RouteResponse: APIレスポンススキーマ
         """
         departure_lat, departure_lng = dto.departure.to_float_tuple()
 
+        def to_mid_point(point: RoutePointDto) -> MidPoint:
+            image_url = (
+                image_url_for(point.street_view_image) if image_url_for is not None else None
+            )
+            return MidPoint.from_dto(point, image_url=image_url)
+
         return cls(
             departure=Point(latitude=departure_lat, longitude=departure_lng),
-            destination=MidPoint.from_dto(dto.destination),
-            midpoints=[MidPoint.from_dto(point) for point in dto.midpoints],
+            destination=to_mid_point(dto.destination),
+            midpoints=[to_mid_point(point) for point in dto.midpoints],
             overview_polyline=dto.overview_polyline,
         )
 
 
+class RouteStreamDestinationEvent(BaseModel):
+    """ストリーミングで最初に返す目的地のイベント"""
+
+    type: Literal["destination"] = "destination"
+    departure: Point
+    destination: MidPoint
+
+
+class RouteStreamMidpointEvent(BaseModel):
+    """ストリーミングで中間地点が決まるたびに返すイベント (ルート上の順)"""
+
+    type: Literal["midpoint"] = "midpoint"
+    index: int
+    midpoint: MidPoint
+
+
+class RouteStreamCompletedEvent(BaseModel):
+    """ストリーミングで最後に返すルート全体のイベント"""
+
+    type: Literal["completed"] = "completed"
+    overview_polyline: str
+
+
+class RouteStreamErrorEvent(BaseModel):
+    """ストリーミングの途中でルート生成に失敗した場合に最後に返すイベント"""
+
+    type: Literal["error"] = "error"
+    detail: str
+
+
+# ストリーミングで1行ずつ返すイベント
+RouteStreamEvent = Annotated[
+    RouteStreamDestinationEvent
+    | RouteStreamMidpointEvent
+    | RouteStreamCompletedEvent
+    | RouteStreamErrorEvent,
+    Discriminator("type"),
+]
+
+
+def route_stream_event_from_dto(
+    event: RouteEventDto, image_url: str | None = None
+) -> RouteStreamEvent:
+    """ルート生成イベントからストリーミングのイベントを作成
+
+    Args:
+        event: ルート生成イベント
+        image_url: イベントに含まれる画像の取得先 (Noneの場合は画像をbase64で埋め込む)
+
+    Returns:
+        RouteStreamEvent: ストリーミングのイベント
+    """
+    match event:
+        case RouteDestinationEventDto():
+            departure_lat, departure_lng = event.departure.to_float_tuple()
+            return RouteStreamDestinationEvent(
+                departure=Point(latitude=departure_lat, longitude=departure_lng),
+                destination=MidPoint.from_dto(event.destination, image_url=image_url),
+            )
+        case RouteMidpointEventDto():
+            return RouteStreamMidpointEvent(
+                index=event.index,
+                midpoint=MidPoint.from_dto(event.midpoint, image_url=image_url),
+            )
+        case RouteCompletedEventDto():
+            return RouteStreamCompletedEvent(overview_polyline=event.overview_polyline)
+
+
 def _extract_genre(point: RoutePointDto) -> str | None:
     """地点DTOから表示用ジャンルを取得する"""
     landmark = point.landmark
@@ -0,0 +1,89 @@
+"""リクエストの期限
+
+1つのリクエストで使える残り時間を、ユースケースからGatewayまで受け渡すための期限を定義します。
+"""
+
+import time
+from collections.abc import Callable
+
+
+class Deadline:
+    """単調増加時計に基づくリクエストの期限
+
+    外部APIの呼び出しごとに固定のタイムアウトを使うのではなく、
+    リクエスト全体の残り時間でタイムアウトを切り詰めるために使用します。
+    """
+
+    __slots__ = ("_clock", "_expires_at")
+
+    def __init__(self, expires_at: float, clock: Callable[[], float] = time.monotonic) -> None:
+        """初期化
+
+        Args:
+            expires_at: 期限の時刻 (clockと同じ基準の秒)
+            clock: 現在時刻 (秒) を返す関数 (テスト用)
+        """
+        self._expires_at = expires_at
+        self._clock = clock
+
+    @classmethod
+    def after(cls, seconds: float, clock: Callable[[], float] = time.monotonic) -> "Deadline":
+        """現在から指定秒数後を期限とする
+
+        Args:
+            seconds: 残り時間 (秒)
+            clock: 現在時刻 (秒) を返す関数 (テスト用)
+
+        Returns:
+            Deadline: 期限
+        """
+        return cls(clock() + seconds, clock)
+
+    def remaining_seconds(self) -> float:
+        """期限までの残り時間を取得
+
+        Returns:
+            float: 残り時間 (秒)。期限を過ぎている場合は0
+        """
+        return max(0.0, self._expires_at - self._clock())
+
+    def expired(self) -> bool:
+        """期限を過ぎているかどうか
+
+        Returns:
+            bool: 期限を過ぎている場合はTrue
+        """
+        return self._clock() >= self._expires_at
+
+    def within(self, seconds: float) -> "Deadline":
+        """現在から指定秒数後とこの期限のうち、早い方を期限とする
+
+        Args:
+            seconds: 処理の予算 (秒)
+
+        Returns:
+            Deadline: 予算を適用した期限
+        """
+        return Deadline(min(self._expires_at, self._clock() + seconds), self._clock)
+
+    def reserve(self, seconds: float) -> "Deadline":
+        """後続の処理のために指定秒数を残した期限を取得
+
+        Args:
+            seconds: 後続の処理のために残す時間 (秒)
+
+        Returns:
+            Deadline: 指定秒数だけ早めた期限
+        """
+        return Deadline(self._expires_at - seconds, self._clock)
+
+    def clamp_timeout(self, timeout: float) -> float:
+        """タイムアウトを期限までの残り時間で切り詰める
+
+        Args:
+            timeout: 本来のタイムアウト (秒)
+
+        Returns:
+            float: タイムアウトと残り時間のうち短い方 (秒)
+        """
+        return min(timeout, self.remaining_seconds())
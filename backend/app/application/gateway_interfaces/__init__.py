@@ -3,9 +3,18 @@
 外部サービスへのインターフェースを定義します。
 """
 
+from app.application.gateway_interfaces.async_google_maps_gateway import AsyncGoogleMapsGateway
 from app.application.gateway_interfaces.google_maps_gateway import (
     GoogleMapsGateway,
     StreetViewMetadata,
 )
+from app.application.gateway_interfaces.image_storage_gateway import ImageStorageGateway
+from app.application.gateway_interfaces.landmark_catalog_gateway import LandmarkCatalogGateway
 
-__all__ = ["GoogleMapsGateway", "StreetViewMetadata"]
+__all__ = [
+    "AsyncGoogleMapsGateway",
+    "GoogleMapsGateway",
+    "ImageStorageGateway",
+    "LandmarkCatalogGateway",
+    "StreetViewMetadata",
+]
@@ -0,0 +1,156 @@
+"""非同期Google Maps Gatewayポート定義
+
+Google Maps APIへの非同期アクセスを抽象化するポートです。
+"""
+
+from abc import ABC, abstractmethod
+from typing import Literal
+
+from app.application.deadline import Deadline
+from app.application.gateway_interfaces.google_maps_gateway import StreetViewMetadata
+from app.domain.value_objects import Coordinate, ImageSize, Landmark
+
+
+class AsyncGoogleMapsGateway(ABC):
+    """Google Maps APIへの非同期アクセスを提供するポート
+
+    GoogleMapsGatewayと同じ操作をコルーチンとして提供します。
+    """
+
+    def get_stats(self) -> dict:
+        """運用監視用の統計情報を取得
+
+        Returns:
+            dict: 実装ごとの統計情報 (統計を持たない実装では空の辞書)
+        """
+        return {}
+
+    async def aclose(self) -> None:  # noqa: B027
+        """保持しているリソース (コネクションなど) を解放する"""
+
+    @abstractmethod
+    async def get_directions(
+        self,
+        origin: Coordinate,
+        destination: Coordinate,
+        waypoints: list[Coordinate] | None = None,
+        deadline: Deadline | None = None,
+    ) -> tuple[list[Coordinate], str]:
+        """ルート情報を取得
+
+        Args:
+            origin: 出発地の座標
+            destination: 目的地の座標
+            waypoints: 経由地の座標リスト (通過点として扱われる)
+            deadline: リクエストの期限 (Noneの場合はタイムアウトを切り詰めない)
+
+        Returns:
+            tuple[list[Coordinate], str]:
+                (ルート座標リスト, overview_polyline文字列)
+        """
+        ...
+
+    @abstractmethod
+    async def get_street_view_metadata(
+        self, coordinate: Coordinate, deadline: Deadline | None = None
+    ) -> StreetViewMetadata:
+        """Street Viewメタデータを取得
+
+        Args:
+            coordinate: 座標
+            deadline: リクエストの期限 (Noneの場合はタイムアウトを切り詰めない)
+
+        Returns:
+            StreetViewMetadata: メタデータ
+
+        Raises:
+            ExternalServiceValidationError: メタデータが不完全または無効な場合
+            ExternalServiceTimeoutError: 期限を過ぎている場合
+        """
+        ...
+
+    @abstractmethod
+    async def get_street_view_image(
+        self,
+        coordinate: Coordinate,
+        image_size: ImageSize,
+        heading: float | None = None,
+        deadline: Deadline | None = None,
+    ) -> bytes:
+        """Street View画像を取得
+
+        Args:
+            coordinate: 座標
+            image_size: 画像サイズ
+            heading: カメラの方向 (0-360度、北が0度、時計回り)。Noneの場合はデフォルト方向
+            deadline: リクエストの期限 (Noneの場合はタイムアウトを切り詰めない)
+
+        Returns:
+            bytes: 画像データ
+        """
+        ...
+
+    @abstractmethod
+    async def search_landmarks_nearby(
+        self,
+        coordinate: Coordinate,
+        radius: int,
+        included_types: list[str] | None = None,
+        rank_preference: Literal["POPULARITY", "DISTANCE"] = "POPULARITY",
+        deadline: Deadline | None = None,
+    ) -> list[Landmark]:
+        """Places API (New) でランドマーク検索
+
+        Args:
+            coordinate: 検索中心座標
+            radius: 検索半径 (メートル)
+            included_types: 検索対象のタイプリスト (Noneの場合はデフォルトタイプを使用)
+            rank_preference: ソート順 ("POPULARITY" または "DISTANCE")
+            deadline: リクエストの期限 (Noneの場合はタイムアウトを切り詰めない)
+
+        Returns:
+            list[Landmark]: ランドマークのリスト
+
+        Raises:
+            ExternalServiceError: API呼び出しエラーが発生した場合
+        """
+        ...
+
+    @abstractmethod
+    async def snap_to_road(
+        self, coordinate: Coordinate, deadline: Deadline | None = None
+    ) -> Coordinate | None:
+        """Roads API (Nearest Roads) を使用して、指定された座標を最寄りの道路中心線にスナップする
+
+        Args:
+            coordinate: スナップする座標
+            deadline: リクエストの期限 (Noneの場合はタイムアウトを切り詰めない)
+
+        Returns:
+            Coordinate | None: スナップされた座標。道路が見つからない場合は None
+
+        Raises:
+            ExternalServiceError: API呼び出しエラーが発生した場合
+            ExternalServiceTimeoutError: API呼び出しがタイムアウトした場合
+        """
+        ...
+
+    @abstractmethod
+    async def snap_to_roads(
+        self, coordinates: list[Coordinate], deadline: Deadline | None = None
+    ) -> list[Coordinate | None]:
+        """Roads API (Nearest Roads) を使用して、複数の座標を1回の呼び出しで道路中心線にスナップする
+
+        Args:
+            coordinates: スナップする座標のリスト
+            deadline: リクエストの期限 (Noneの場合はタイムアウトを切り詰めない)
+
+        Returns:
+            list[Coordinate | None]: 入力と同じ順のスナップされた座標。
+                道路が見つからない座標は None
+
+        Raises:
+            ExternalServiceError: API呼び出しエラーが発生した場合
+            ExternalServiceTimeoutError: API呼び出しがタイムアウトした場合
+        """
+        ...
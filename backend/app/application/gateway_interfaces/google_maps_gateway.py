@@ -33,6 +33,14 @@ class StreetViewMetadata(BaseModel):
 class GoogleMapsGateway(ABC):
     """Google Maps APIへのアクセスを提供するポート"""
 
+    def get_stats(self) -> dict:
+        """運用監視用の統計情報を取得
+
+        Returns:
+            dict: 実装ごとの統計情報 (統計を持たない実装では空の辞書)
+        """
+        return {}
+
     @abstractmethod
     def get_directions(
         self,
@@ -123,3 +131,20 @@ class GoogleMapsGateway(ABC):
             ExternalServiceTimeoutError: API呼び出しがタイムアウトした場合
         """
         ...
+
+    @abstractmethod
+    def snap_to_roads(self, coordinates: list[Coordinate]) -> list[Coordinate | None]:
+        """Roads API (Nearest Roads) を使用して、複数の座標を1回の呼び出しで道路中心線にスナップする
+
+        Args:
+            coordinates: スナップする座標のリスト
+
+        Returns:
+            list[Coordinate | None]: 入力と同じ順のスナップされた座標。
+                道路が見つからない座標は None
+
+        Raises:
+            ExternalServiceError: API呼び出しエラーが発生した場合
+            ExternalServiceTimeoutError: API呼び出しがタイムアウトした場合
+        """
+        ...
@@ -0,0 +1,47 @@
+"""画像ストレージGatewayポート定義
+
+取得したStreet View画像をコンテンツハッシュで保存・取得するポートです。
+"""
+
+from abc import ABC, abstractmethod
+
+
+class ImageStorageGateway(ABC):
+    """画像をコンテンツハッシュで保存・取得するポート
+
+    /route のレスポンスに画像本体の代わりに参照を返し、画像は別のエンドポイントから
+    配信するために使用します。
+    """
+
+    @property
+    @abstractmethod
+    def shared(self) -> bool:
+        """他のインスタンスからも保存した画像を取得できるかどうか
+
+        Falseの場合、別のインスタンスに振り分けられた画像の取得が失敗するため、
+        画像の参照を返さずに画像本体を返す。
+        """
+
+    @abstractmethod
+    async def save(self, image_data: bytes) -> str:
+        """画像を保存する
+
+        保存した画像はキャッシュの上限による削除の対象とせず、保持期間の間は取得できる。
+
+        Args:
+            image_data: 画像データ
+
+        Returns:
+            str: 画像のコンテンツハッシュ (SHA-256の16進表記)
+        """
+
+    @abstractmethod
+    async def find(self, content_hash: str) -> bytes | None:
+        """コンテンツハッシュに対応する画像を取得する
+
+        Args:
+            content_hash: 画像のコンテンツハッシュ
+
+        Returns:
+            bytes | None: 画像データ (存在しない場合はNone)
+        """
@@ -0,0 +1,39 @@
+"""ランドマークカタログGatewayポート定義
+
+Places APIで取得したランドマークを蓄積し、位置で検索するポートです。
+"""
+
+from abc import ABC, abstractmethod
+
+from app.domain.value_objects import Coordinate, Landmark
+
+
+class LandmarkCatalogGateway(ABC):
+    """取得済みのランドマークを蓄積し、中心からの距離で検索するポート
+
+    ランドマークが十分に蓄積されたエリアでは、Places APIを呼び出さずに
+    ランドマークを検索するために使用します。
+    """
+
+    @abstractmethod
+    async def add(self, landmarks: list[Landmark]) -> None:
+        """ランドマークを蓄積する (同じPlace IDのランドマークは上書きする)
+
+        Args:
+            landmarks: Places APIで取得したランドマーク
+        """
+
+    @abstractmethod
+    async def find_within(
+        self, center: Coordinate, min_distance_m: float, max_distance_m: float
+    ) -> list[Landmark]:
+        """中心からの距離が範囲内のランドマークを検索する
+
+        Args:
+            center: 中心座標
+            min_distance_m: 距離の下限 (メートル)
+            max_distance_m: 距離の上限 (メートル)
+
+        Returns:
+            list[Landmark]: min_distance_m 以上 max_distance_m 以下の距離にあるランドマーク
+        """
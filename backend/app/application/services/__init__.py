@@ -2,10 +2,12 @@
 
 from app.application.services.landmark_image_selection_service import LandmarkImageSelectionService
 from app.application.services.landmark_search_service import LandmarkSearchService
+from app.application.services.street_view_dead_zone_cache import StreetViewDeadZoneCache
 from app.application.services.street_view_image_fetch_service import StreetViewImageFetchService
 
 __all__ = [
     "LandmarkImageSelectionService",
     "LandmarkSearchService",
+    "StreetViewDeadZoneCache",
     "StreetViewImageFetchService",
 ]
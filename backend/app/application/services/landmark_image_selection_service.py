@@ -3,54 +3,107 @@
 画像が取得可能なランドマークを選択するロジックを提供します。
 """
 
+import asyncio
 import logging
 import random
 
 from injector import inject
+from pydantic import BaseModel, ConfigDict, Field
 
+from app.application.deadline import Deadline
+from app.application.services.street_view_dead_zone_cache import StreetViewDeadZoneCache
 from app.application.services.street_view_image_fetch_service import StreetViewImageFetchService
-from app.domain.exceptions import ExternalServiceValidationError
+from app.config import LANDMARK_IMAGE_SELECTION_PARALLELISM
+from app.domain.exceptions import (
+    ExternalServiceNotFoundError,
+    ExternalServiceTimeoutError,
+    ExternalServiceValidationError,
+)
 from app.domain.value_objects import ImageSize, Landmark, StreetViewImage
 
 logger = logging.getLogger(__name__)
 
 
+class LandmarkImageSelectionStats(BaseModel):
+    """画像付きランドマーク選択の統計"""
+
+    model_config = ConfigDict(frozen=True)
+
+    selections: int = Field(ge=0, description="selectの呼び出し数")
+    attempts: int = Field(ge=0, description="画像取得を試行した候補数")
+    wasted_attempts: int = Field(
+        ge=0, description="採用されなかった成功と、完了前にキャンセルした試行の数"
+    )
+    deprioritized: int = Field(
+        ge=0, description="Street View画像がなかった候補として後回しにした候補数"
+    )
+    dead_zones: int = Field(ge=0, description="Street View画像がなかった候補として記録中のキーの数")
+
+
 class LandmarkImageSelectionService:
     """画像付きランドマーク選択サービス
 
     候補ランドマークから画像が取得可能なものを選択します。
+    画像を取得できなかった候補をリクエスト間で記録し、並行試行で無駄になった呼び出し数を
+    集計するため、DIコンテナではシングルトンとして扱います。
     """
 
     @inject
-    def __init__(self, street_view_service: StreetViewImageFetchService) -> None:
+    def __init__(
+        self,
+        street_view_service: StreetViewImageFetchService,
+        dead_zone_cache: StreetViewDeadZoneCache | None = None,
+    ) -> None:
         """初期化
 
         Args:
             street_view_service: Street View 画像取得サービス
+            dead_zone_cache: 画像を取得できなかった候補のネガティブキャッシュ
+                (Noneの場合はデフォルト設定で生成)
         """
         self._street_view_service = street_view_service
+        self._dead_zones = (
+            dead_zone_cache if dead_zone_cache is not None else StreetViewDeadZoneCache()
+        )
+        self._selections = 0
+        self._attempts = 0
+        self._wasted_attempts = 0
+        self._deprioritized = 0
 
-    def select(
+    async def select(
         self,
         candidates: list[Landmark],
         image_size: ImageSize | None = None,
         shuffle: bool = False,
+        deadline: Deadline | None = None,
+        parallelism: int = LANDMARK_IMAGE_SELECTION_PARALLELISM,
     ) -> tuple[Landmark, StreetViewImage]:
         """画像が取得できるランドマークを選択する
 
-        候補リストを順番に試行し、画像が取得できたランドマークを返す。
+        候補リストの先頭から最大parallelism件の画像取得を並行に試行し、失敗した分だけ次の候補を
+        試行する。shuffle=Falseの場合はリスト順で最初に画像が取得できた候補を、
+        shuffle=Trueの場合は最初に画像の取得が完了した候補を返し、残りの試行はキャンセルする。
+        道路へのスナップは全候補分を1回のRoads API呼び出しでまとめて行う。
+        以前にStreet View画像が存在しなかった候補 (Place IDまたは近くの座標) は、
+        他の候補がすべて失敗した場合にだけ試行するよう後回しにする。
+        期限を過ぎた場合は残りの候補を試行せずに打ち切る。
 
         Args:
             candidates: ランドマーク候補リスト
             image_size: 画像サイズ (Noneの場合はデフォルトサイズを使用)
             shuffle: Trueの場合、候補リストをランダムにシャッフルしてから選択
+            deadline: リクエストの期限 (Noneの場合は期限なし)
+            parallelism: 画像取得を同時に試行する候補の最大数 (1の場合は逐次試行)
 
         Returns:
             (ランドマーク, 画像) のタプル
 
         Raises:
             ExternalServiceValidationError: すべての候補で画像取得に失敗した場合
+            ExternalServiceTimeoutError: 画像を取得できないまま期限を過ぎた場合
         """
+        if parallelism < 1:
+            raise ValueError("parallelism は1以上を指定してください")
         if not candidates:
             raise ExternalServiceValidationError(
                 "画像を取得できませんでした",
@@ -59,23 +112,136 @@ class LandmarkImageSelectionService:
 
         # シャッフルが必要な場合は非破壊的にランダムな順序を取得
         candidates_to_use = random.sample(candidates, len(candidates)) if shuffle else candidates
+        candidates_to_use = self._deprioritize_dead_zones(candidates_to_use)
 
-        for idx, candidate in enumerate(candidates_to_use):
-            try:
-                image = self._street_view_service.get_image(
-                    candidate.coordinate,
-                    image_size,
-                )
-                logger.info(f"Successfully selected landmark: {candidate.place_id}")
-                return candidate, image
-            except ExternalServiceValidationError:
-                logger.warning(
-                    f"Failed to fetch image for candidate {idx + 1}/{len(candidates_to_use)} "
-                    f"(place_id: {candidate.place_id}), trying next candidate"
+        road_coordinates = await self._street_view_service.get_nearest_road_coordinates(
+            [candidate.coordinate for candidate in candidates_to_use], deadline=deadline
+        )
+
+        total = len(candidates_to_use)
+        # 試行中のタスクと候補のインデックス
+        running: dict[asyncio.Task[StreetViewImage], int] = {}
+        # 完了した試行の結果 (画像または例外)
+        outcomes: dict[int, StreetViewImage | BaseException] = {}
+        next_index = 0
+        # リスト順で結果を確定させる次の候補のインデックス (shuffle=Falseの場合に使用)
+        next_ordered_index = 0
+        selected_index: int | None = None
+        deadline_exceeded = False
+        self._selections += 1
+        try:
+            while selected_index is None:
+                # 画像を取得できた候補が確定待ちの間は、それより後ろの候補を試行しない
+                has_pending_success = any(
+                    isinstance(outcome, StreetViewImage) for outcome in outcomes.values()
                 )
-                continue
+                while not has_pending_success and len(running) < parallelism and next_index < total:
+                    if deadline is not None and deadline.expired():
+                        deadline_exceeded = True
+                        break
+                    candidate = candidates_to_use[next_index]
+                    task = asyncio.create_task(
+                        self._street_view_service.get_image(
+                            candidate.coordinate,
+                            image_size,
+                            road_coordinate=road_coordinates[next_index],
+                            deadline=deadline,
+                        )
+                    )
+                    running[task] = next_index
+                    next_index += 1
+                    self._attempts += 1
+                if not running:
+                    break
+
+                done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                # NOTE: 複数同時に完了した場合は、リスト順で先の候補を優先する
+                for task in sorted(done, key=running.__getitem__):
+                    idx = running.pop(task)
+                    outcome = task.exception() or task.result()
+                    outcomes[idx] = outcome
+                    if isinstance(outcome, ExternalServiceValidationError):
+                        # NOTE: 一時的なエラーで良い候補を後回しにしないよう、
+                        #       画像が存在しないと確定した場合だけ記録する
+                        if isinstance(outcome, ExternalServiceNotFoundError):
+                            self._dead_zones.record(candidates_to_use[idx])
+                        logger.warning(
+                            f"Failed to fetch image for candidate {idx + 1}/{total} "
+                            f"(place_id: {candidates_to_use[idx].place_id}), "
+                            "trying next candidate"
+                        )
+                    elif shuffle and selected_index is None:
+                        # 最初に完了した候補の結果を採用する (失敗の場合は例外を送出)
+                        selected_index = idx
+
+                if not shuffle:
+                    # 先行の候補がすべて画像なしと確定した候補の結果を採用する
+                    while next_ordered_index in outcomes:
+                        outcome = outcomes[next_ordered_index]
+                        if not isinstance(outcome, ExternalServiceValidationError):
+                            selected_index = next_ordered_index
+                            break
+                        next_ordered_index += 1
+        finally:
+            for task in running:
+                task.cancel()
+            # 採用されなかった成功と、完了前にキャンセルした試行は無駄な呼び出しとして数える
+            self._wasted_attempts += len(running) + sum(
+                1
+                for idx, outcome in outcomes.items()
+                if isinstance(outcome, StreetViewImage) and idx != selected_index
+            )
 
+        if selected_index is not None:
+            outcome = outcomes[selected_index]
+            if isinstance(outcome, BaseException):
+                raise outcome
+            candidate = candidates_to_use[selected_index]
+            self._dead_zones.discard(candidate)
+            logger.info(f"Successfully selected landmark: {candidate.place_id}")
+            return candidate, outcome
+
+        if deadline_exceeded:
+            logger.warning(f"Deadline exceeded after trying {next_index}/{total} candidates")
+            raise ExternalServiceTimeoutError(
+                "期限内に画像を取得できませんでした",
+                service_name="Street View API",
+            )
         raise ExternalServiceValidationError(
             "画像を取得できませんでした",
             service_name="Street View API",
         )
+
+    def get_stats(self) -> LandmarkImageSelectionStats:
+        """候補の試行の統計を取得
+
+        Returns:
+            LandmarkImageSelectionStats: 試行数と無駄になった試行数、後回しにした候補数
+        """
+        return LandmarkImageSelectionStats(
+            selections=self._selections,
+            attempts=self._attempts,
+            wasted_attempts=self._wasted_attempts,
+            deprioritized=self._deprioritized,
+            dead_zones=self._dead_zones.get_stats().size,
+        )
+
+    def _deprioritize_dead_zones(self, candidates: list[Landmark]) -> list[Landmark]:
+        """Street View画像がなかった候補を、順序を保ったまま末尾に移動する
+
+        Args:
+            candidates: ランドマーク候補リスト
+
+        Returns:
+            list[Landmark]: 記録のない候補、記録のある候補の順に並べた候補リスト
+        """
+        live: list[Landmark] = []
+        dead: list[Landmark] = []
+        for candidate in candidates:
+            (dead if self._dead_zones.contains(candidate) else live).append(candidate)
+        if dead:
+            self._deprioritized += len(dead)
+            logger.info(
+                f"Deprioritized {len(dead)}/{len(candidates)} candidates without Street View"
+            )
+        return live + dead
@@ -3,13 +3,18 @@
 ランドマーク検索のオーケストレーションを提供します。
 """
 
+import asyncio
 import logging
 
 from injector import inject
 
-from app.application.gateway_interfaces.google_maps_gateway import GoogleMapsGateway
+from app.application.deadline import Deadline
+from app.application.gateway_interfaces.async_google_maps_gateway import AsyncGoogleMapsGateway
+from app.application.gateway_interfaces.landmark_catalog_gateway import LandmarkCatalogGateway
 from app.config import (
     LANDMARK_DISTANCE_TOLERANCE_PERCENT,
+    LANDMARK_SEARCH_RING_PARALLELISM,
+    LANDMARK_SEARCH_TIME_BUDGET_MS,
     MIN_SEARCH_RADIUS_M,
 )
 from app.domain.exceptions import ExternalServiceError
@@ -27,23 +32,33 @@ class LandmarkSearchService:
     """ランドマーク検索サービス
 
     段階的探索戦略を用いてランドマークを検索します。
+    ランドマークカタログを指定した場合は、蓄積済みのランドマークで足りない分だけ
+    Places APIで検索し、取得したランドマークをカタログに蓄積します。
     """
 
     @inject
-    def __init__(self, gateway: GoogleMapsGateway) -> None:
+    def __init__(
+        self,
+        gateway: AsyncGoogleMapsGateway,
+        landmark_catalog: LandmarkCatalogGateway | None = None,
+    ) -> None:
         """初期化
 
         Args:
-            gateway: GoogleMapsGatewayのインスタンス
+            gateway: AsyncGoogleMapsGatewayのインスタンス
+            landmark_catalog: 取得済みのランドマークのカタログ (Noneの場合は常にPlaces APIで検索)
         """
         self._gateway = gateway
+        self._landmark_catalog = landmark_catalog
 
-    def search_landmarks(
+    async def search_landmarks(
         self,
         center: Coordinate,
         target_distance_m: int,
         target_count: int,
         max_calls: int,
+        parallelism: int = LANDMARK_SEARCH_RING_PARALLELISM,
+        deadline: Deadline | None = None,
     ) -> list[Landmark]:
         """ランドマーク検索
 
@@ -53,12 +68,23 @@ class LandmarkSearchService:
         2. 円周上に等間隔の点を生成し、それぞれの点から指定した距離内のランドマークを20件検索
         3. 2つの検索結果を結合して、目標件数に達するまで繰り返す
 
+        カタログに距離の範囲内のランドマークが目標件数以上あればPlaces APIを呼び出さずに返し、
+        足りない場合はカタログのランドマークに1.以降の検索結果を追加する
+
+        円周上の点の検索は最大parallelism件を先読みで並行に発行し、
+        目標件数に達した時点で残りの検索はキャンセルする
+
+        検索全体はLANDMARK_SEARCH_TIME_BUDGET_MSの時間予算 (deadlineの方が早ければdeadline) で
+        打ち切り、それまでに見つかったランドマークを返す
+
         Args:
             center: 中心座標
             target_distance_m: 指定距離 (メートル)。検索半径および距離フィルタリングに使用。
                 ±LANDMARK_DISTANCE_TOLERANCE_PERCENT%の範囲でフィルタリング
             target_count: 目標件数
             max_calls: 最大API呼び出し回数
+            parallelism: 円周上の点を同時に検索する最大数 (1の場合は逐次検索)
+            deadline: リクエストの期限 (Noneの場合は時間予算のみを適用)
 
         Returns:
             ランドマークのリスト (重複排除済み、距離フィルタリング適用済み)
@@ -70,12 +96,29 @@ class LandmarkSearchService:
         max_filter_distance = target_distance_m * (1 + tolerance)
 
         seen: dict[str, Landmark] = {}  # Place IDをキーとした重複排除用マップ
+        if self._landmark_catalog is not None:
+            cataloged = await self._landmark_catalog.find_within(
+                center, min_filter_distance, max_filter_distance
+            )
+            seen = {landmark.place_id: landmark for landmark in cataloged}
+            logger.debug(f"Find {len(seen)} cataloged landmarks around center")
+            if len(seen) >= target_count:
+                return list(seen.values())
         calls = 0
+        budget_seconds = LANDMARK_SEARCH_TIME_BUDGET_MS / 1000
+        search_deadline = (
+            deadline.within(budget_seconds)
+            if deadline is not None
+            else Deadline.after(budget_seconds)
+        )
 
         # 1. 中心地から指定した距離内のランドマークを検索
         logger.debug(f"Search landmarks around center: {center}")
         try:
-            landmarks = self._gateway.search_landmarks_nearby(center, target_distance_m)
+            landmarks = await self._gateway.search_landmarks_nearby(
+                center, target_distance_m, deadline=search_deadline
+            )
+            await self._add_to_catalog(landmarks)
             calls += 1
             seen = self._add_landmarks(
                 seen, landmarks, min_filter_distance, max_filter_distance, center
@@ -88,7 +131,8 @@ class LandmarkSearchService:
                 f"中心点 ({center.latitude:.4f}, {center.longitude:.4f}) でのランドマーク検索失敗",
                 exc_info=True,
             )
-            return []
+            # NOTE: Places APIが失敗してもカタログで見つかったランドマークは返す
+            return list(seen.values())
 
         # 2. 円周上に等間隔の点を生成し、それぞれの点から指定した距離内のランドマークを検索
         search_radius = calculate_search_radius(target_distance_m, tolerance, MIN_SEARCH_RADIUS_M)
@@ -96,29 +140,141 @@ class LandmarkSearchService:
 
         # 円周上の点から指定した距離内のランドマークを検索
         logger.debug(f"Search landmarks around circle points: {circle_points}")
-        for point_lat, point_lng in circle_points:
-            try:
-                point_coordinate = Coordinate(latitude=point_lat, longitude=point_lng)
-                landmarks = self._gateway.search_landmarks_nearby(point_coordinate, search_radius)
-                calls += 1
-                prev_seen_length = len(seen)
-                seen = self._add_landmarks(
-                    seen, landmarks, min_filter_distance, max_filter_distance, center
-                )
-                logger.debug(
-                    f"Find {len(seen) - prev_seen_length} new landmarks around circle points"
-                )
-                if self._should_stop(seen, target_count, calls, max_calls):
-                    return list(seen.values())
-            except ExternalServiceError as e:
-                # 個別の点でのエラーは無視して続行
-                logger.warning(
-                    f"円周上の点 ({point_lat:.4f}, {point_lng:.4f}) で検索失敗: {e}",
-                    exc_info=True,
+        seen = await self._search_circle_points(
+            circle_points,
+            search_radius,
+            seen,
+            calls,
+            max_calls,
+            target_count,
+            parallelism,
+            min_filter_distance,
+            max_filter_distance,
+            center,
+            search_deadline,
+        )
+        return list(seen.values())
+
+    async def _search_circle_points(
+        self,
+        circle_points: list[tuple[float, float]],
+        search_radius: int,
+        seen: dict[str, Landmark],
+        calls: int,
+        max_calls: int,
+        target_count: int,
+        parallelism: int,
+        min_filter_distance: float,
+        max_filter_distance: float,
+        center: Coordinate,
+        deadline: Deadline,
+    ) -> dict[str, Landmark]:
+        """円周上の点を先読みで並行に検索し、点の順番どおりに結果を結合する
+
+        最大parallelism件の検索を同時に発行し、完了した結果は点の順番に結合する。
+        停止条件を満たした時点で実行中の検索はキャンセルし、結果は破棄する。
+        成功した呼び出し数と実行中の呼び出し数の合計がmax_callsを超えないように発行するため、
+        結果は逐次検索と同じになる。
+        期限を過ぎた場合は新たな検索を発行せず、実行中の検索もキャンセルする。
+
+        Args:
+            circle_points: 円周上の点のリスト [(lat, lng), ...]
+            search_radius: 各点での検索半径 (メートル)
+            seen: 発見済みランドマークのマップ
+            calls: これまでの呼び出し回数
+            max_calls: 最大API呼び出し回数
+            target_count: 目標件数
+            parallelism: 同時に発行する検索の最大数
+            min_filter_distance: 距離フィルタリングの下限 (メートル)
+            max_filter_distance: 距離フィルタリングの上限 (メートル)
+            center: 距離フィルタリングの中心座標
+            deadline: 検索の期限
+
+        Returns:
+            発見済みランドマークのマップ
+        """
+        pending: dict[asyncio.Task[list[Landmark] | None], int] = {}
+        completed: dict[int, list[Landmark] | None] = {}
+        next_index = 0  # 次に発行する点
+        merge_index = 0  # 次に結合する点
+
+        try:
+            while True:
+                # 成功済み + 結合待ちの呼び出しがmax_callsを超えない範囲で先読みする
+                while (
+                    len(pending) < max(1, parallelism)
+                    and next_index < len(circle_points)
+                    and calls + (next_index - merge_index) < max_calls
+                    and not deadline.expired()
+                ):
+                    task = asyncio.create_task(
+                        self._search_circle_point(
+                            circle_points[next_index], search_radius, deadline
+                        )
+                    )
+                    pending[task] = next_index
+                    next_index += 1
+                if not pending:
+                    return seen
+
+                done, _ = await asyncio.wait(
+                    pending,
+                    timeout=deadline.remaining_seconds(),
+                    return_when=asyncio.FIRST_COMPLETED,
                 )
-                continue
+                if not done:
+                    logger.warning("Landmark search time budget exhausted")
+                    return seen
+                for task in done:
+                    completed[pending.pop(task)] = task.result()
 
-        return list(seen.values())
+                # 点の順番どおりに結合し、停止条件を判定する
+                while merge_index in completed:
+                    landmarks = completed.pop(merge_index)
+                    merge_index += 1
+                    if landmarks is None:
+                        continue
+                    calls += 1
+                    prev_seen_length = len(seen)
+                    seen = self._add_landmarks(
+                        seen, landmarks, min_filter_distance, max_filter_distance, center
+                    )
+                    logger.debug(
+                        f"Find {len(seen) - prev_seen_length} new landmarks around circle points"
+                    )
+                    if self._should_stop(seen, target_count, calls, max_calls):
+                        return seen
+        finally:
+            for task in pending:
+                task.cancel()
+            if pending:
+                logger.debug(f"Cancelled {len(pending)} speculative circle point searches")
+                await asyncio.gather(*pending, return_exceptions=True)
+
+    async def _search_circle_point(
+        self, point: tuple[float, float], search_radius: int, deadline: Deadline
+    ) -> list[Landmark] | None:
+        """円周上の1点でランドマークを検索する (失敗した場合はNone)"""
+        point_lat, point_lng = point
+        try:
+            point_coordinate = Coordinate.trusted(point_lat, point_lng)
+            landmarks = await self._gateway.search_landmarks_nearby(
+                point_coordinate, search_radius, deadline=deadline
+            )
+        except ExternalServiceError as e:
+            # 個別の点でのエラーは無視して続行
+            logger.warning(
+                f"円周上の点 ({point_lat:.4f}, {point_lng:.4f}) で検索失敗: {e}",
+                exc_info=True,
+            )
+            return None
+        await self._add_to_catalog(landmarks)
+        return landmarks
+
+    async def _add_to_catalog(self, landmarks: list[Landmark]) -> None:
+        """Places APIで取得したランドマークをカタログに蓄積する (カタログがない場合は何もしない)"""
+        if self._landmark_catalog is not None and landmarks:
+            await self._landmark_catalog.add(landmarks)
 
     def _add_landmarks(
         self,
@@ -0,0 +1,142 @@
+"""Street View画像がなかった候補のネガティブキャッシュ
+
+Street View画像を取得できなかったランドマークを記録し、次回以降の選択で後回しにします。
+"""
+
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+
+from pydantic import BaseModel, ConfigDict, Field
+
+from app.config import (
+    STREET_VIEW_DEAD_ZONE_CELL_DECIMAL_PLACES,
+    STREET_VIEW_DEAD_ZONE_MAX_ENTRIES,
+    STREET_VIEW_DEAD_ZONE_TTL_SECONDS,
+)
+from app.domain.value_objects import Landmark
+
+# Place IDまたは量子化した座標のキー
+type _DeadZoneKey = tuple[str, str] | tuple[str, float, float]
+
+
+class StreetViewDeadZoneStats(BaseModel):
+    """Street View画像がなかった候補のネガティブキャッシュの統計"""
+
+    model_config = ConfigDict(frozen=True)
+
+    hits: int = Field(ge=0, description="記録済みと判定した候補数")
+    recorded: int = Field(ge=0, description="画像がなかった候補として記録した回数")
+    size: int = Field(ge=0, description="保持しているキーの数 (期限切れを含む)")
+    max_entries: int = Field(ge=1, description="保持できるキーの数の上限")
+
+
+class StreetViewDeadZoneCache:
+    """Street View画像がなかった候補のネガティブキャッシュ
+
+    Place IDと、座標を cell_decimal_places 桁に量子化したセルの両方をキーとして記録するため、
+    同じ場所にある別のPlace IDの候補も記録済みと判定します。
+    記録は ttl_seconds で期限切れとなり、キーの数が max_entries を超えた場合は
+    最も古く記録したキーから削除します。
+    イベントループ上でのみ使用するため、状態はロックで保護しません。
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float = STREET_VIEW_DEAD_ZONE_TTL_SECONDS,
+        max_entries: int = STREET_VIEW_DEAD_ZONE_MAX_ENTRIES,
+        cell_decimal_places: int = STREET_VIEW_DEAD_ZONE_CELL_DECIMAL_PLACES,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """初期化
+
+        Args:
+            ttl_seconds: 記録の有効期間 (秒)
+            max_entries: 保持できるキーの数の上限
+            cell_decimal_places: 座標を量子化する小数桁数
+            clock: 現在時刻 (秒) を返す関数 (テスト用)
+        """
+        if max_entries < 1:
+            raise ValueError("max_entries は1以上を指定してください")
+        self._ttl_seconds = ttl_seconds
+        self._max_entries = max_entries
+        self._cell_decimal_places = cell_decimal_places
+        self._clock = clock
+        # キー -> 有効期限 (記録順)
+        self._entries: OrderedDict[_DeadZoneKey, float] = OrderedDict()
+        self._hits = 0
+        self._recorded = 0
+
+    def contains(self, landmark: Landmark) -> bool:
+        """ランドマークがStreet View画像のない候補として記録されているかどうか
+
+        Args:
+            landmark: ランドマーク
+
+        Returns:
+            bool: Place IDまたは座標のセルが有効期限内で記録されている場合はTrue
+        """
+        now = self._clock()
+        for key in self._keys(landmark):
+            expires_at = self._entries.get(key)
+            if expires_at is None:
+                continue
+            if expires_at > now:
+                self._hits += 1
+                return True
+            del self._entries[key]
+        return False
+
+    def record(self, landmark: Landmark) -> None:
+        """ランドマークをStreet View画像のない候補として記録する
+
+        Args:
+            landmark: 画像を取得できなかったランドマーク
+        """
+        expires_at = self._clock() + self._ttl_seconds
+        for key in self._keys(landmark):
+            self._entries.pop(key, None)
+            self._entries[key] = expires_at
+        self._recorded += 1
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def discard(self, landmark: Landmark) -> None:
+        """画像を取得できたランドマークの記録を削除する
+
+        Args:
+            landmark: 画像を取得できたランドマーク
+        """
+        for key in self._keys(landmark):
+            self._entries.pop(key, None)
+
+    def get_stats(self) -> StreetViewDeadZoneStats:
+        """ネガティブキャッシュの統計を取得
+
+        Returns:
+            StreetViewDeadZoneStats: 判定数と記録数
+        """
+        return StreetViewDeadZoneStats(
+            hits=self._hits,
+            recorded=self._recorded,
+            size=len(self._entries),
+            max_entries=self._max_entries,
+        )
+
+    def _keys(self, landmark: Landmark) -> tuple[_DeadZoneKey, _DeadZoneKey]:
+        """ランドマークのPlace IDと座標のセルのキーを取得
+
+        Args:
+            landmark: ランドマーク
+
+        Returns:
+            tuple[_DeadZoneKey, _DeadZoneKey]: Place IDのキーと座標のセルのキー
+        """
+        return (
+            ("place_id", landmark.place_id),
+            (
+                "cell",
+                round(landmark.coordinate.latitude, self._cell_decimal_places),
+                round(landmark.coordinate.longitude, self._cell_decimal_places),
+            ),
+        )
@@ -7,9 +7,11 @@ import logging
 
 from injector import inject
 
-from app.application.gateway_interfaces.google_maps_gateway import GoogleMapsGateway
+from app.application.deadline import Deadline
+from app.application.gateway_interfaces.async_google_maps_gateway import AsyncGoogleMapsGateway
 from app.domain.exceptions import (
     ExternalServiceError,
+    ExternalServiceNotFoundError,
     ExternalServiceTimeoutError,
     ExternalServiceValidationError,
 )
@@ -18,6 +20,10 @@ from app.domain.value_objects import Coordinate, ImageSize, StreetViewImage
 
 logger = logging.getLogger(__name__)
 
+# 対象の座標にStreet View画像が存在しないことを表すメタデータのステータス
+# NOTE: OVER_QUERY_LIMIT や UNKNOWN_ERROR などは一時的なエラーなので含めない
+_NO_IMAGERY_STATUSES = frozenset({"ZERO_RESULTS", "NOT_FOUND"})
+
 
 class StreetViewImageFetchService:
     """Street View 画像取得サービス
@@ -26,28 +32,36 @@ class StreetViewImageFetchService:
     """
 
     @inject
-    def __init__(self, gateway: GoogleMapsGateway) -> None:
+    def __init__(self, gateway: AsyncGoogleMapsGateway) -> None:
         """初期化
 
         Args:
-            gateway: Google Maps Gateway
+            gateway: 非同期Google Maps Gateway
         """
         self._gateway = gateway
         self._default_image_size = ImageSize(width=600, height=300)
 
-    def get_image(
-        self, coordinate: Coordinate, image_size: ImageSize | None = None
+    async def get_image(
+        self,
+        coordinate: Coordinate,
+        image_size: ImageSize | None = None,
+        road_coordinate: Coordinate | None = None,
+        deadline: Deadline | None = None,
     ) -> StreetViewImage:
         """Street View Image Metadata APIを使用して画像のメタデータを取得
 
         Args:
             coordinate: 座標
             image_size: 画像サイズ (Noneの場合はデフォルトサイズを使用)
+            road_coordinate: スナップ済みの道路上の座標
+                (get_nearest_road_coordinatesで取得済みの場合に指定。Noneの場合はここでスナップする)
+            deadline: リクエストの期限 (Noneの場合は期限なし)
 
         Returns:
             StreetViewImage: Street View画像情報
 
         Raises:
+            ExternalServiceNotFoundError: 対象の座標にStreet View画像が存在しない場合
             ExternalServiceValidationError: Street View画像が取得できない場合
             ExternalServiceTimeoutError: Street View画像の取得がタイムアウトした場合
             ExternalServiceError: 外部サービスエラーが発生した場合
@@ -57,11 +71,17 @@ class StreetViewImageFetchService:
 
         # ランドマークの座標だと屋内の画像が取得される可能性があるため、近くの道路上の座標を取得する
         # NOTE: ただし道路の真下に地下道があると、地下道が出てしまうケースが多い
-        target_coordinate = self._get_nearest_road_coordinate(coordinate)
+        target_coordinate = (
+            road_coordinate
+            if road_coordinate is not None
+            else await self._get_nearest_road_coordinate(coordinate, deadline)
+        )
 
         # 対象座標にストリートビューが存在するかを確認するためにメタデータを取得
         try:
-            metadata = self._gateway.get_street_view_metadata(target_coordinate)
+            metadata = await self._gateway.get_street_view_metadata(
+                target_coordinate, deadline=deadline
+            )
         except ExternalServiceValidationError as e:
             logger.error(f"Street View metadata validation failed: {e}")
             raise ExternalServiceValidationError(str(e), service_name="Street View API") from e
@@ -71,7 +91,12 @@ class StreetViewImageFetchService:
                 f"Street View metadata API returned a non-OK status for a requested location. "
                 f"Status: {metadata.status}"
             )
-            raise ExternalServiceValidationError(
+            error_class = (
+                ExternalServiceNotFoundError
+                if metadata.status in _NO_IMAGERY_STATUSES
+                else ExternalServiceValidationError
+            )
+            raise error_class(
                 f"Street View metadata unavailable: {metadata.status}.",
                 service_name="Street View API",
             )
@@ -94,10 +119,11 @@ class StreetViewImageFetchService:
 
         # ストリートビュー画像を取得
         try:
-            image_content = self._gateway.get_street_view_image(
+            image_content = await self._gateway.get_street_view_image(
                 coordinate=metadata_coordinate,
                 image_size=image_size,
                 heading=heading,
+                deadline=deadline,
             )
         except ExternalServiceTimeoutError as e:
             logger.error(f"Street View image timeout: {e}")
@@ -113,11 +139,44 @@ class StreetViewImageFetchService:
             heading=heading,
         )
 
-    def _get_nearest_road_coordinate(self, coordinate: Coordinate) -> Coordinate:
+    async def get_nearest_road_coordinates(
+        self, coordinates: list[Coordinate], deadline: Deadline | None = None
+    ) -> list[Coordinate]:
+        """複数の座標の近くにある道路上の座標を1回のRoads API呼び出しでまとめて取得する
+
+        Args:
+            coordinates: 対象座標のリスト
+            deadline: リクエストの期限 (Noneの場合は期限なし)
+
+        Returns:
+            list[Coordinate]: 入力と同じ順の道路上の座標 (道路が見つからない座標は元の座標)
+
+        Raises:
+            ExternalServiceError: Roads API呼び出しエラーが発生した場合
+            ExternalServiceTimeoutError: Roads API呼び出しがタイムアウトした場合
+        """
+        if not coordinates:
+            return []
+
+        try:
+            snapped_coordinates = await self._gateway.snap_to_roads(coordinates, deadline=deadline)
+        except (ExternalServiceError, ExternalServiceTimeoutError) as e:
+            logger.error(f"Roads API error while getting nearest road coordinates: {e}")
+            raise
+
+        return [
+            snapped if snapped is not None else coordinate
+            for coordinate, snapped in zip(coordinates, snapped_coordinates, strict=True)
+        ]
+
+    async def _get_nearest_road_coordinate(
+        self, coordinate: Coordinate, deadline: Deadline | None = None
+    ) -> Coordinate:
         """座標の近くにある道路上の座標を取得する
 
         Args:
             coordinate: 対象座標
+            deadline: リクエストの期限 (Noneの場合は期限なし)
 
         Returns:
             Coordinate: 最寄りの道路上の座標、または元の座標 (道路が見つからない場合は元の座標)
@@ -127,7 +186,7 @@ class StreetViewImageFetchService:
             ExternalServiceTimeoutError: Roads API呼び出しがタイムアウトした場合
         """
         try:
-            snapped_coordinate = self._gateway.snap_to_road(coordinate)
+            snapped_coordinate = await self._gateway.snap_to_road(coordinate, deadline=deadline)
             if snapped_coordinate is not None:
                 logger.info(
                     f"Using nearest road coordinate {snapped_coordinate} "
@@ -3,26 +3,43 @@
 ルート生成のビジネスロジックをオーケストレーションします。
 """
 
+import asyncio
 import logging
+from collections.abc import AsyncIterator
+from contextlib import aclosing
 
 from injector import inject
 
-from app.application.gateway_interfaces.google_maps_gateway import GoogleMapsGateway
+from app.application.deadline import Deadline
+from app.application.gateway_interfaces.async_google_maps_gateway import AsyncGoogleMapsGateway
+from app.application.gateway_interfaces.landmark_catalog_gateway import LandmarkCatalogGateway
 from app.application.services import (
     LandmarkImageSelectionService,
     LandmarkSearchService,
     StreetViewImageFetchService,
 )
-from app.application.usecases.route_result_dto import RoutePointDto, RouteResultDto
+from app.application.usecases.route_result_dto import (
+    RouteCompletedEventDto,
+    RouteDestinationEventDto,
+    RouteEventDto,
+    RouteMidpointEventDto,
+    RoutePointDto,
+    RouteResultDto,
+)
 from app.config import (
     DIRECTIONS_API_MAX_WAYPOINTS,
     LANDMARK_SEARCH_MAX_CALLS,
     LANDMARK_SEARCH_TARGET_COUNT,
+    MIDPOINT_CANDIDATE_MODE,
     MIDPOINT_DEDUP_MIN_DISTANCE_TO_DESTINATION_M,
+    MIDPOINT_GEODESIC_MAX_OFFSET_RATIO,
     MIDPOINT_MIN_SEARCH_RADIUS_M,
+    MIDPOINT_SEARCH_CONCURRENCY,
+    ROUTE_FINAL_DIRECTIONS_RESERVE_MS,
 )
 from app.domain.exceptions import (
     ExternalServiceError,
+    ExternalServiceTimeoutError,
     ExternalServiceValidationError,
     RouteGenerationError,
 )
@@ -43,32 +60,82 @@ class GenerateRouteUseCase:
     @inject
     def __init__(
         self,
-        google_maps_gateway: GoogleMapsGateway,
+        google_maps_gateway: AsyncGoogleMapsGateway,
         landmark_search_service: LandmarkSearchService,
         landmark_selector: LandmarkImageSelectionService,
         street_view_image_fetch_service: StreetViewImageFetchService,
+        landmark_catalog: LandmarkCatalogGateway | None = None,
     ) -> None:
         """初期化
 
         Args:
-            google_maps_gateway: Google Maps Gateway
+            google_maps_gateway: 非同期Google Maps Gateway
             landmark_search_service: ランドマーク検索サービス
             landmark_selector: 画像付きランドマーク選択サービス
             street_view_image_fetch_service: Street View画像取得サービス
+            landmark_catalog: 中間地点の検索で取得したランドマークを蓄積するカタログ
         """
         self.google_maps_gateway = google_maps_gateway
         self.landmark_search_service = landmark_search_service
         self.landmark_selector = landmark_selector
         self.street_view_image_fetch_service = street_view_image_fetch_service
+        self.landmark_catalog = landmark_catalog
 
-    def execute(
+    async def execute(
         self,
         current_coordinate: Coordinate,
         radius_m: int | None = None,
         destination_coordinate: Coordinate | None = None,
+        deadline: Deadline | None = None,
     ) -> RouteResultDto:
         """ルートを生成する
 
+        streamが発生させるイベントをすべて受け取り、1つのルート情報にまとめて返す。
+
+        Args:
+            current_coordinate: 現在地の座標
+            radius_m: 半径 (メートル単位、ランダムモード用)
+            destination_coordinate: 目的地の座標 (目的地指定モード用)
+            deadline: リクエストの期限 (Noneの場合は期限なし)
+
+        Returns:
+            RouteResultDto: ルート情報
+        """
+        destination: RoutePointDto | None = None
+        midpoints: list[RoutePointDto] = []
+        overview_polyline: str | None = None
+        async for event in self.stream(
+            current_coordinate,
+            radius_m=radius_m,
+            destination_coordinate=destination_coordinate,
+            deadline=deadline,
+        ):
+            match event:
+                case RouteDestinationEventDto():
+                    destination = event.destination
+                case RouteMidpointEventDto():
+                    midpoints.append(event.midpoint)
+                case RouteCompletedEventDto():
+                    overview_polyline = event.overview_polyline
+
+        if destination is None or overview_polyline is None:
+            raise RouteGenerationError(message="ルート生成が完了しませんでした")
+        return RouteResultDto(
+            departure=current_coordinate,
+            destination=destination,
+            overview_polyline=overview_polyline,
+            midpoints=midpoints,
+        )
+
+    async def stream(
+        self,
+        current_coordinate: Coordinate,
+        radius_m: int | None = None,
+        destination_coordinate: Coordinate | None = None,
+        deadline: Deadline | None = None,
+    ) -> AsyncIterator[RouteEventDto]:
+        """ルートを生成し、決まった地点から順にイベントとして返す
+
         2つのモードをサポート:
         - ランダムモード: radius_m を指定し、目的地を自動選択
         - 目的地指定モード: destination_coordinate を指定
@@ -76,18 +143,30 @@ class GenerateRouteUseCase:
         アプローチ:
         1. 目的地のランドマークを決定 (ランダムモードの場合)
         2. 必要なmission地点数を計算(距離に応じて)
-        3. 現在地→目的地のルートを先に取得
-        4. ルート上を等分割して複数の中間地点候補を生成
+        3. 現在地→目的地のルートを先に取得 (geodesicモードでは取得しない)
+        4. ルート上 (geodesicモードでは測地線上) を等分割して複数の中間地点候補を生成
         5. 各中間地点付近でランドマークを検索
         6. 初期地点→目的地のルートを取得(waypoints=[地点1, 地点2, ...])
 
+        目的地が決まった時点で目的地のイベントを、中間地点はルート上の順に決まったものから
+        中間地点のイベントを、最後にルート全体のイベントを返す。
+        返し終えた地点の画像は保持しないため、すべての画像をまとめて保持する必要がない。
+
+        deadlineを指定した場合は各外部API呼び出しのタイムアウトを残り時間で切り詰め、
+        中間地点の探索は最後のルート取得の時間を残して打ち切る。
+
         Args:
             current_coordinate: 現在地の座標
             radius_m: 半径 (メートル単位、ランダムモード用)
             destination_coordinate: 目的地の座標 (目的地指定モード用)
+            deadline: リクエストの期限 (Noneの場合は期限なし)
 
-        Returns:
-            RouteResultDto: ルート情報
+        Yields:
+            RouteEventDto: 目的地・中間地点・ルート全体のイベント
+
+        Raises:
+            ValueError: radius_m と destination_coordinate の指定が不正な場合
+            RouteGenerationError: ルートを生成できなかった場合
         """
         if destination_coordinate is None and radius_m is None:
             raise ValueError("radius_m または destination_coordinate のいずれかを指定してください")
@@ -103,8 +182,8 @@ class GenerateRouteUseCase:
             if destination_coordinate is not None:
                 # 目的地指定モード: 指定された座標をそのまま使用し、Street View画像を取得
                 logger.info("Using specified destination coordinate")
-                destination_image = self.street_view_image_fetch_service.get_image(
-                    destination_coordinate
+                destination_image = await self.street_view_image_fetch_service.get_image(
+                    destination_coordinate, deadline=deadline
                 )
                 logger.info("Successfully fetched Street View image for specified destination")
             else:
@@ -115,11 +194,12 @@ class GenerateRouteUseCase:
                         "radius_m または destination_coordinate のいずれかを指定してください"
                     )
 
-                destination_landmarks = self.landmark_search_service.search_landmarks(
+                destination_landmarks = await self.landmark_search_service.search_landmarks(
                     center=current_coordinate,
                     target_distance_m=radius_m,
                     target_count=LANDMARK_SEARCH_TARGET_COUNT,
                     max_calls=LANDMARK_SEARCH_MAX_CALLS,
+                    deadline=deadline,
                 )
                 logger.info(f"Find {len(destination_landmarks)} landmarks around destination")
                 if not destination_landmarks:
@@ -128,13 +208,24 @@ class GenerateRouteUseCase:
                         service_name="Places API",
                     )
 
-                destination_landmark, destination_image = self.landmark_selector.select(
-                    destination_landmarks, shuffle=True
+                destination_landmark, destination_image = await self.landmark_selector.select(
+                    destination_landmarks, shuffle=True, deadline=deadline
                 )
                 used_place_ids.add(destination_landmark.place_id)
                 destination_coordinate = destination_image.metadata_coordinate
                 logger.info("Successfully fetched Street View image for random destination")
 
+            yield RouteDestinationEventDto(
+                departure=current_coordinate,
+                destination=RoutePointDto(
+                    coordinate=destination_coordinate,
+                    street_view_image=destination_image,
+                    landmark=destination_landmark,
+                ),
+            )
+            # NOTE: 返し終えた画像は保持しない
+            destination_image = None
+
             # 2. 目的地指定モードでは、現在地〜目的地の距離から半径を計算
             if radius_m is None:
                 radius_m = int(
@@ -166,96 +257,61 @@ class GenerateRouteUseCase:
                 radius_m,
             )
 
-            # 4. 現在地→目的地の実ルート上から複数の中間地点候補を生成
+            # 4. 現在地→目的地の間から複数の中間地点候補を生成
+            midpoint_search_radius = max(MIDPOINT_MIN_SEARCH_RADIUS_M, radius_m // 4)
             candidate_coordinates = []
             if midpoint_target_count > 0:
-                route_coordinates, _ = self.google_maps_gateway.get_directions(
-                    origin=current_coordinate,
-                    destination=destination_coordinate,
-                    waypoints=None,
-                )
-                candidate_coordinates = coordinate_service.divide_route_into_segments(
-                    route_coordinates=route_coordinates,
-                    num_segments=midpoint_target_count,
+                candidate_coordinates = await self._generate_midpoint_candidates(
+                    current_coordinate,
+                    destination_coordinate,
+                    midpoint_target_count,
+                    midpoint_search_radius,
+                    deadline,
                 )
 
-            # 5. 各中間地点付近でランドマーク検索
-            midpoint_results: list[RoutePointDto] = []
-            midpoint_search_radius = max(MIDPOINT_MIN_SEARCH_RADIUS_M, radius_m // 4)
-
-            for i, candidate_coord in enumerate(candidate_coordinates, 1):
-                logger.info(f"Searching landmarks for mission point {i}/{midpoint_target_count}")
-
-                # 各候補地点周辺でランドマーク検索
-                landmarks = self.google_maps_gateway.search_landmarks_nearby(
-                    coordinate=candidate_coord,
-                    radius=midpoint_search_radius,
-                    rank_preference="DISTANCE",
+            # 5. 各中間地点付近でランドマーク検索 (決まったものからルート上の順に返す)
+            midpoint_deadline = (
+                deadline.reserve(ROUTE_FINAL_DIRECTIONS_RESERVE_MS / 1000)
+                if deadline is not None
+                else None
+            )
+            midpoint_coords: list[Coordinate] = []
+            async with aclosing(
+                self._iter_midpoints(
+                    candidate_coordinates,
+                    midpoint_search_radius,
+                    used_place_ids,
+                    destination_coordinate,
+                    midpoint_deadline,
                 )
-
-                if landmarks:
-                    filtered_landmarks = self._filter_midpoint_landmark_candidates(
-                        landmarks, used_place_ids, destination_coordinate
-                    )
-                    if not filtered_landmarks:
-                        logger.warning(
-                            (
-                                "All landmark candidates for mission point %s/%s were "
-                                "filtered as duplicates of the destination or prior midpoints"
-                            ),
-                            i,
-                            midpoint_target_count,
-                        )
-                        continue
-                    try:
-                        landmark, image = self.landmark_selector.select(filtered_landmarks)
-                        used_place_ids.add(landmark.place_id)
-                        midpoint_results.append(
-                            RoutePointDto(
-                                coordinate=image.metadata_coordinate,
-                                street_view_image=image,
-                                landmark=landmark,
-                            )
-                        )
-                        logger.info(f"Mission point {i} found at {image.metadata_coordinate}")
-                    except ExternalServiceValidationError:
-                        logger.warning(f"No image available for mission point {i}")
-                else:
-                    logger.warning(f"No landmarks found for mission point {i}")
+            ) as midpoints:
+                async for midpoint in midpoints:
+                    yield RouteMidpointEventDto(index=len(midpoint_coords), midpoint=midpoint)
+                    midpoint_coords.append(midpoint.coordinate)
 
             # 必要数に満たない場合の警告
-            if len(midpoint_results) < midpoint_target_count:
+            if len(midpoint_coords) < midpoint_target_count:
                 logger.warning(
-                    f"Only {len(midpoint_results)}/{midpoint_target_count} "
+                    f"Only {len(midpoint_coords)}/{midpoint_target_count} "
                     "mission points could be generated"
                 )
 
             # 6. ルート全体を取得(waypointsとして全midpointを渡す)
-            midpoint_coords = [point.coordinate for point in midpoint_results]
-            _, overview_polyline = self.google_maps_gateway.get_directions(
+            _, overview_polyline = await self.google_maps_gateway.get_directions(
                 origin=current_coordinate,
                 destination=destination_coordinate,
                 waypoints=midpoint_coords,  # 複数のwaypointsを渡す
+                deadline=deadline,
             )
 
-            # デバッグ用ログ: 生成されたルートの中間地点と画像の数を出力
+            # デバッグ用ログ: 生成されたルートの中間地点の数を出力
             logger.info(
-                "RouteResultDto midpoints count=%s, midpoint_images count=%s, total missions=%s",
+                "Route generated: midpoints count=%s, total missions=%s",
                 len(midpoint_coords),
-                len(midpoint_results),
-                len(midpoint_coords) + (1 if destination_image is not None else 0),
+                len(midpoint_coords) + 1,
             )
 
-            return RouteResultDto(
-                departure=current_coordinate,
-                destination=RoutePointDto(
-                    coordinate=destination_coordinate,
-                    street_view_image=destination_image,
-                    landmark=destination_landmark,
-                ),
-                overview_polyline=overview_polyline,
-                midpoints=midpoint_results,
-            )
+            yield RouteCompletedEventDto(overview_polyline=overview_polyline)
         except (ExternalServiceValidationError, ExternalServiceError, ValueError) as e:
             raise RouteGenerationError(
                 message=(
@@ -264,6 +320,186 @@ class GenerateRouteUseCase:
                 ),
             ) from e
 
+    async def _generate_midpoint_candidates(
+        self,
+        origin: Coordinate,
+        destination: Coordinate,
+        count: int,
+        search_radius: int,
+        deadline: Deadline | None = None,
+    ) -> list[Coordinate]:
+        """現在地〜目的地の間に中間地点候補を生成する
+
+        MIDPOINT_CANDIDATE_MODE が directions の場合は実ルートを取得してルート上を等分割し、
+        geodesic の場合はDirections APIを呼ばずに測地線上を等分割して左右にずらす。
+        ずらす距離は検索半径の MIDPOINT_GEODESIC_MAX_OFFSET_RATIO 倍までとし、
+        候補の周辺検索が測地線付近から離れすぎないようにする。
+
+        Args:
+            origin: 現在地の座標
+            destination: 目的地の座標
+            count: 中間地点候補の数
+            search_radius: 中間地点の検索半径 (メートル)
+            deadline: リクエストの期限 (Noneの場合は期限なし)
+
+        Returns:
+            list[Coordinate]: 中間地点候補の座標リスト (現在地に近い順)
+        """
+        if MIDPOINT_CANDIDATE_MODE == "geodesic":
+            return coordinate_service.generate_geodesic_midpoints(
+                start=origin,
+                end=destination,
+                num_points=count,
+                max_lateral_offset_m=search_radius * MIDPOINT_GEODESIC_MAX_OFFSET_RATIO,
+            )
+
+        route_coordinates, _ = await self.google_maps_gateway.get_directions(
+            origin=origin,
+            destination=destination,
+            waypoints=None,
+            deadline=deadline,
+        )
+        return coordinate_service.divide_route_into_segments(
+            route_coordinates=route_coordinates,
+            num_segments=count,
+        )
+
+    async def _iter_midpoints(
+        self,
+        candidate_coordinates: list[Coordinate],
+        search_radius: int,
+        used_place_ids: set[str],
+        destination_coordinate: Coordinate,
+        deadline: Deadline | None = None,
+    ) -> AsyncIterator[RoutePointDto]:
+        """各中間地点候補でランドマークを検索し、画像付きのmission地点を決まった順に返す
+
+        候補ごとの検索と画像取得は同時実行数を制限して並行に行い、
+        既採用ランドマークとの重複排除は候補の順番どおりにマージする段階で行う。
+        先行の候補がすべて完了した候補から順にマージし、採用した中間地点をすぐに返す。
+        マージ時に先行の候補と重複した場合だけ、残りの候補で選択をやり直す。
+        期限を過ぎた候補はスキップし、それまでに決まった中間地点だけを返す。
+        いずれかの候補の検索が失敗した場合は、残りの候補をキャンセルして例外を送出する。
+
+        Args:
+            candidate_coordinates: 中間地点候補の座標リスト (ルート上の順)
+            search_radius: 検索半径 (メートル)
+            used_place_ids: 採用済みのplace_id (採用した中間地点のplace_idを追加する)
+            destination_coordinate: 目的地の座標
+            deadline: 中間地点の探索の期限 (Noneの場合は期限なし)
+
+        Yields:
+            RoutePointDto: 採用された中間地点 (候補の順)
+        """
+        total = len(candidate_coordinates)
+        semaphore = asyncio.Semaphore(MIDPOINT_SEARCH_CONCURRENCY)
+        # 並行実行中は目的地との重複のみ除外する (中間地点同士の重複はマージ時に判定)
+        initial_used_place_ids = frozenset(used_place_ids)
+
+        async def search(
+            index: int, coordinate: Coordinate
+        ) -> tuple[list[Landmark], tuple[Landmark, StreetViewImage] | None]:
+            async with semaphore:
+                if deadline is not None and deadline.expired():
+                    logger.warning(f"Skipped mission point {index}: time budget exhausted")
+                    return [], None
+                logger.info(f"Searching landmarks for mission point {index}/{total}")
+                try:
+                    landmarks = await self.google_maps_gateway.search_landmarks_nearby(
+                        coordinate=coordinate,
+                        radius=search_radius,
+                        rank_preference="DISTANCE",
+                        deadline=deadline,
+                    )
+                except ExternalServiceTimeoutError:
+                    if deadline is None or not deadline.expired():
+                        raise
+                    logger.warning(f"Skipped mission point {index}: time budget exhausted")
+                    return [], None
+                if self.landmark_catalog is not None and landmarks:
+                    await self.landmark_catalog.add(landmarks)
+                if not landmarks:
+                    logger.warning(f"No landmarks found for mission point {index}")
+                    return [], None
+
+                filtered_landmarks = self._filter_midpoint_landmark_candidates(
+                    landmarks, set(initial_used_place_ids), destination_coordinate
+                )
+                if not filtered_landmarks:
+                    return [], None
+                return filtered_landmarks, await self._select_midpoint(
+                    filtered_landmarks, index, deadline
+                )
+
+        tasks = [
+            asyncio.create_task(search(i, coordinate))
+            for i, coordinate in enumerate(candidate_coordinates, 1)
+        ]
+        pending = set(tasks)
+        try:
+            for i, task in enumerate(tasks, 1):
+                # 先行の候補を待つ間に他の候補が失敗した場合も、すぐに例外を送出する
+                while not task.done():
+                    done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                    errors = [
+                        error for finished in done if (error := finished.exception()) is not None
+                    ]
+                    if errors:
+                        raise errors[0]
+
+                filtered_landmarks, selection = task.result()
+                if selection is not None and selection[0].place_id in used_place_ids:
+                    # 先行の中間地点と重複したため、未採用の候補だけで選択をやり直す
+                    filtered_landmarks = self._filter_midpoint_landmark_candidates(
+                        filtered_landmarks, used_place_ids, destination_coordinate
+                    )
+                    selection = (
+                        await self._select_midpoint(filtered_landmarks, i, deadline)
+                        if filtered_landmarks
+                        else None
+                    )
+                if not filtered_landmarks:
+                    logger.warning(
+                        (
+                            "All landmark candidates for mission point %s/%s were "
+                            "filtered as duplicates of the destination or prior midpoints"
+                        ),
+                        i,
+                        total,
+                    )
+                    continue
+                if selection is None:
+                    continue
+
+                landmark, image = selection
+                used_place_ids.add(landmark.place_id)
+                logger.info(f"Mission point {i} found at {image.metadata_coordinate}")
+                yield RoutePointDto(
+                    coordinate=image.metadata_coordinate,
+                    street_view_image=image,
+                    landmark=landmark,
+                )
+        finally:
+            # 例外や呼び出し元の打ち切りで残った候補の検索はキャンセルし、終了を待つ
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _select_midpoint(
+        self, landmarks: list[Landmark], index: int, deadline: Deadline | None = None
+    ) -> tuple[Landmark, StreetViewImage] | None:
+        """中間地点の候補から画像付きのランドマークを選択する (画像がないか期限切れならNone)"""
+        try:
+            return await self.landmark_selector.select(landmarks, deadline=deadline)
+        except ExternalServiceValidationError:
+            logger.warning(f"No image available for mission point {index}")
+            return None
+        except ExternalServiceTimeoutError:
+            if deadline is None or not deadline.expired():
+                raise
+            logger.warning(f"Skipped mission point {index}: time budget exhausted")
+            return None
+
     @staticmethod
     def _filter_midpoint_landmark_candidates(
         landmarks: list[Landmark],
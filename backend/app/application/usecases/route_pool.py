@@ -0,0 +1,239 @@
+"""事前生成ルートのプール
+
+人気エリアを出発地とするランダムモードのルートをバックグラウンドで生成しておき、
+近くから同じくらいの半径でリクエストされた場合に生成済みのルートを払い出します。
+"""
+
+import asyncio
+import contextlib
+import logging
+import time
+from collections import deque
+from collections.abc import Callable
+
+from pydantic import BaseModel, ConfigDict, Field
+
+from app.application.deadline import Deadline
+from app.application.usecases.generate_route_usecase import GenerateRouteUseCase
+from app.application.usecases.route_result_dto import RouteResultDto
+from app.config import (
+    ROUTE_POOL_RADIUS_BUCKET_M,
+    ROUTE_POOL_REFILL_INTERVAL_SECONDS,
+    ROUTE_POOL_SIZE_PER_AREA,
+    ROUTE_POOL_START_TOLERANCE_M,
+    ROUTE_POOL_TTL_SECONDS,
+    ROUTE_REQUEST_TIME_BUDGET_MS,
+)
+from app.domain.services import coordinate_service
+from app.domain.value_objects import Coordinate
+
+logger = logging.getLogger(__name__)
+
+
+class RoutePoolArea(BaseModel):
+    """ルートを事前生成するエリア"""
+
+    model_config = ConfigDict(frozen=True)
+
+    start: Coordinate = Field(description="出発地とするエリアの中心")
+    radius_m: int = Field(gt=0, description="ランダムモードの半径 (メートル)")
+    ttl_seconds: float = Field(
+        default=ROUTE_POOL_TTL_SECONDS, gt=0, description="生成したルートを払い出せる期間 (秒)"
+    )
+
+
+class RoutePoolStats(BaseModel):
+    """事前生成ルートのプールの統計"""
+
+    model_config = ConfigDict(frozen=True)
+
+    areas: int = Field(ge=0, description="事前生成の対象エリア数")
+    size: int = Field(ge=0, description="払い出し可能なルート数 (期限切れを含む)")
+    hits: int = Field(ge=0, description="事前生成したルートを払い出したリクエスト数")
+    misses: int = Field(ge=0, description="対象エリア内で払い出せるルートがなかったリクエスト数")
+    generated: int = Field(ge=0, description="事前生成したルート数")
+    expired: int = Field(ge=0, description="期限切れで破棄したルート数")
+    failures: int = Field(ge=0, description="事前生成に失敗した回数")
+
+
+class RoutePool:
+    """人気エリアのランダムモードのルートを事前生成して払い出すプール
+
+    エリアごとに size_per_area 件のルートを保持し、払い出しや期限切れで減った分を
+    バックグラウンドで補充します。払い出しは古い順に行い、ttl_seconds を過ぎたルートは
+    払い出さずに破棄します。1件ずつ順に生成するため、補充によるAPI呼び出しが
+    リクエストの処理と同時に集中することはありません。
+    イベントループ上でのみ使用するため、状態はロックで保護しません。
+    """
+
+    def __init__(
+        self,
+        usecase: GenerateRouteUseCase,
+        areas: list[RoutePoolArea],
+        size_per_area: int = ROUTE_POOL_SIZE_PER_AREA,
+        start_tolerance_m: float = ROUTE_POOL_START_TOLERANCE_M,
+        radius_bucket_m: int = ROUTE_POOL_RADIUS_BUCKET_M,
+        refill_interval_seconds: float = ROUTE_POOL_REFILL_INTERVAL_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """初期化
+
+        Args:
+            usecase: ルート生成ユースケース
+            areas: 事前生成の対象エリア
+            size_per_area: エリアごとに保持するルート数
+            start_tolerance_m: 出発地とエリアの中心の距離の許容範囲 (メートル)
+            radius_bucket_m: 半径を丸める単位 (メートル)
+            refill_interval_seconds: 期限切れの確認と補充を行う間隔 (秒)
+            clock: 現在時刻 (秒) を返す関数 (テスト用)
+        """
+        if size_per_area < 1:
+            raise ValueError("size_per_area は1以上を指定してください")
+        if radius_bucket_m < 1:
+            raise ValueError("radius_bucket_m は1以上を指定してください")
+        self._usecase = usecase
+        self._areas = areas
+        self._size_per_area = size_per_area
+        self._start_tolerance_m = start_tolerance_m
+        self._radius_bucket_m = radius_bucket_m
+        self._refill_interval_seconds = refill_interval_seconds
+        self._clock = clock
+        # エリアのインデックス -> (生成時刻, ルート) の生成順のキュー
+        self._routes: list[deque[tuple[float, RouteResultDto]]] = [deque() for _ in areas]
+        self._wakeup = asyncio.Event()
+        self._task: asyncio.Task[None] | None = None
+        self._hits = 0
+        self._misses = 0
+        self._generated = 0
+        self._expired = 0
+        self._failures = 0
+
+    def take(self, current_coordinate: Coordinate, radius_m: int) -> RouteResultDto | None:
+        """リクエストに合う事前生成したルートを払い出す
+
+        出発地がエリアの中心から許容範囲内で、半径がエリアと同じ単位に丸まる場合に、
+        最も近いエリアの最も古い有効なルートを払い出す。
+        払い出すルートの出発地はリクエストの現在地ではなくエリアの中心となる。
+
+        Args:
+            current_coordinate: 現在地の座標
+            radius_m: 半径 (メートル単位)
+
+        Returns:
+            RouteResultDto | None: 払い出したルート。対象エリア外か在庫がない場合はNone
+        """
+        index = self._find_area(current_coordinate, radius_m)
+        if index is None:
+            return None
+
+        self._evict_expired(index)
+        routes = self._routes[index]
+        if not routes:
+            self._misses += 1
+            self._wakeup.set()
+            return None
+
+        _, route = routes.popleft()
+        self._hits += 1
+        # NOTE: 払い出した分をすぐに補充する
+        self._wakeup.set()
+        return route
+
+    async def refill(self) -> int:
+        """期限切れのルートを破棄し、不足しているルートを生成する
+
+        Returns:
+            int: 生成したルート数
+        """
+        generated = 0
+        for index, area in enumerate(self._areas):
+            self._evict_expired(index)
+            while len(self._routes[index]) < self._size_per_area:
+                try:
+                    route = await self._usecase.execute(
+                        area.start,
+                        radius_m=area.radius_m,
+                        deadline=Deadline.after(ROUTE_REQUEST_TIME_BUDGET_MS / 1000),
+                    )
+                except Exception as e:
+                    # NOTE: 失敗したエリアは次の補充まで待ち、他のエリアの補充を続ける
+                    self._failures += 1
+                    logger.warning(f"Failed to pre-generate route for {area.start}: {e}")
+                    break
+                self._routes[index].append((self._clock(), route))
+                self._generated += 1
+                generated += 1
+        return generated
+
+    def start(self) -> None:
+        """バックグラウンドでの補充を開始する (対象エリアがない場合は何もしない)"""
+        if self._areas and self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def aclose(self) -> None:
+        """バックグラウンドでの補充を停止する"""
+        if self._task is None:
+            return
+        self._task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._task
+        self._task = None
+
+    def get_stats(self) -> RoutePoolStats:
+        """事前生成ルートのプールの統計を取得
+
+        Returns:
+            RoutePoolStats: 在庫数と払い出し数
+        """
+        return RoutePoolStats(
+            areas=len(self._areas),
+            size=sum(len(routes) for routes in self._routes),
+            hits=self._hits,
+            misses=self._misses,
+            generated=self._generated,
+            expired=self._expired,
+            failures=self._failures,
+        )
+
+    async def _run(self) -> None:
+        """一定間隔または払い出しのたびに補充する"""
+        while True:
+            # NOTE: 補充中の払い出しで次の補充を起こせるよう、補充の前にクリアする
+            self._wakeup.clear()
+            await self.refill()
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self._refill_interval_seconds)
+
+    def _find_area(self, current_coordinate: Coordinate, radius_m: int) -> int | None:
+        """リクエストに合うエリアのうち、出発地に最も近いエリアを探す
+
+        Args:
+            current_coordinate: 現在地の座標
+            radius_m: 半径 (メートル単位)
+
+        Returns:
+            int | None: エリアのインデックス。該当するエリアがない場合はNone
+        """
+        bucket = round(radius_m / self._radius_bucket_m)
+        nearest = None
+        nearest_distance = self._start_tolerance_m
+        for index, area in enumerate(self._areas):
+            if round(area.radius_m / self._radius_bucket_m) != bucket:
+                continue
+            distance = coordinate_service.calculate_distance(current_coordinate, area.start)
+            if distance <= nearest_distance:
+                nearest = index
+                nearest_distance = distance
+        return nearest
+
+    def _evict_expired(self, index: int) -> None:
+        """エリアの期限切れのルートを破棄する
+
+        Args:
+            index: エリアのインデックス
+        """
+        routes = self._routes[index]
+        expires_before = self._clock() - self._areas[index].ttl_seconds
+        while routes and routes[0][0] <= expires_before:
+            routes.popleft()
+            self._expired += 1
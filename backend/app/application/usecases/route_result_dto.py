@@ -1,5 +1,7 @@
 """ルート生成結果DTO定義"""
 
+from typing import Literal
+
 from pydantic import BaseModel, ConfigDict, Field
 
 from app.domain.value_objects import Coordinate, Landmark, StreetViewImage
@@ -33,3 +35,36 @@ class RouteResultDto(BaseModel):
     destination: RoutePointDto = Field(description="目的地の詳細情報")
     midpoints: list[RoutePointDto] = Field(description="中間地点の詳細情報リスト")
     overview_polyline: str = Field(description="ルートの概要ポリライン文字列")
+
+
+class RouteDestinationEventDto(BaseModel):
+    """目的地が決まったことを表すルート生成イベント"""
+
+    model_config = ConfigDict(frozen=True)
+
+    type: Literal["destination"] = "destination"
+    departure: Coordinate = Field(description="出発地点の座標")
+    destination: RoutePointDto = Field(description="目的地の詳細情報")
+
+
+class RouteMidpointEventDto(BaseModel):
+    """中間地点が決まったことを表すルート生成イベント (ルート上の順に発生する)"""
+
+    model_config = ConfigDict(frozen=True)
+
+    type: Literal["midpoint"] = "midpoint"
+    index: int = Field(ge=0, description="ルート上での中間地点の順番 (0始まり)")
+    midpoint: RoutePointDto = Field(description="中間地点の詳細情報")
+
+
+class RouteCompletedEventDto(BaseModel):
+    """ルート全体が決まったことを表すルート生成イベント (最後に1回だけ発生する)"""
+
+    model_config = ConfigDict(frozen=True)
+
+    type: Literal["completed"] = "completed"
+    overview_polyline: str = Field(description="ルートの概要ポリライン文字列")
+
+
+# ルート生成の途中経過を表すイベント
+type RouteEventDto = RouteDestinationEventDto | RouteMidpointEventDto | RouteCompletedEventDto
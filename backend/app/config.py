@@ -13,21 +13,91 @@ load_dotenv()
 # リクエストタイムアウト定数 (秒)
 REQUEST_TIMEOUT_SECONDS = 15
 
+# HTTPコネクションプールの設定
+HTTP_POOL_CONNECTIONS = 10  # 保持するホスト別コネクションプールの最大数
+HTTP_POOL_MAXSIZE = 20  # ホストあたりに保持するkeep-aliveコネクションの最大数
+
+# サーキットブレーカーの設定 (外部APIごとに失敗率を判定する)
+CIRCUIT_BREAKER_WINDOW_SIZE = 20  # 失敗率を算出する直近の呼び出し数
+CIRCUIT_BREAKER_MINIMUM_CALLS = 10  # 失敗率を判定するのに必要な最小呼び出し数
+CIRCUIT_BREAKER_FAILURE_RATE_THRESHOLD = 0.5  # オープンに遷移する失敗率 (タイムアウトを含む)
+CIRCUIT_BREAKER_OPEN_SECONDS = 30.0  # オープン状態で呼び出しを即時失敗させる時間 (秒)
+CIRCUIT_BREAKER_HALF_OPEN_MAX_CALLS = 1  # ハーフオープン状態で同時に許可する試行呼び出し数
+
+# 外部APIごとのクライアント側レート制限 (1秒あたりのリクエスト数とバースト数)
+DIRECTIONS_API_RATE_LIMIT_QPS = 50.0
+DIRECTIONS_API_RATE_LIMIT_BURST = 50
+STREET_VIEW_METADATA_API_RATE_LIMIT_QPS = 100.0
+STREET_VIEW_METADATA_API_RATE_LIMIT_BURST = 100
+STREET_VIEW_IMAGE_API_RATE_LIMIT_QPS = 100.0
+STREET_VIEW_IMAGE_API_RATE_LIMIT_BURST = 100
+PLACES_API_RATE_LIMIT_QPS = 10.0
+PLACES_API_RATE_LIMIT_BURST = 20
+ROADS_API_RATE_LIMIT_QPS = 50.0
+ROADS_API_RATE_LIMIT_BURST = 50
+RATE_LIMIT_MAX_WAIT_SECONDS = 2.0  # トークン待ちの上限 (超える場合は待たずに失敗させる)
+
+# Street View (メタデータ・画像) のヘッジリクエストの設定
+HEDGE_LATENCY_PERCENTILE = 0.9  # 追加のリクエストを送信するまでの待ち時間とする応答時間の分位点
+HEDGE_LATENCY_WINDOW_SIZE = 200  # 分位点を算出する直近の応答時間の件数
+HEDGE_MIN_SAMPLES = 20  # 追加のリクエストを送信するのに必要な最小サンプル数
+HEDGE_BUDGET_RATIO = 0.1  # 追加のリクエストの上限 (全リクエストに対する割合)
+HEDGE_BUDGET_BURST = 10.0  # 貯めておける追加のリクエストの予算の上限
+
+# ルート生成リクエスト全体の時間予算 (ミリ秒)
+ROUTE_REQUEST_TIME_BUDGET_MS = 20000
+ROUTE_FINAL_DIRECTIONS_RESERVE_MS = 2000  # 最後のDirections API呼び出しのために残す時間 (ミリ秒)
+
 # ルート生成のリトライ回数
 ROUTE_GENERATION_MAX_RETRY_COUNT = 3
 
 # キャッシュTTL定数 (秒) - 24時間
 CACHE_TTL_SECONDS = 86400
+STREET_VIEW_METADATA_CACHE_MAX_ENTRIES = 10000  # Street Viewメタデータキャッシュの最大エントリ数
+DIRECTIONS_CACHE_MAX_ENTRIES = 2000  # Directionsキャッシュの最大エントリ数
+PLACES_CACHE_MAX_ENTRIES = 5000  # Places searchNearbyキャッシュの最大エントリ数
+PLACES_CACHE_CELL_DECIMAL_PLACES = 3  # 検索中心を量子化する小数桁数 (約110m四方のセル)
+PLACES_CACHE_RADIUS_BUCKET_M = 50  # 検索半径を切り上げる単位 (メートル)
+STREET_VIEW_IMAGE_CACHE_MAX_BYTES = 512 * 1024 * 1024  # Street View画像ストアの合計バイト数の上限
+# 保存先を指定しない場合 (一時ディレクトリに保存する場合) の合計バイト数の上限
+# NOTE: 一時ディレクトリがメモリ上にある環境でもメモリを使いすぎないよう小さくする
+STREET_VIEW_IMAGE_CACHE_DEFAULT_DIR_MAX_BYTES = 32 * 1024 * 1024
+STREET_VIEW_IMAGE_CACHE_RESCAN_INTERVAL_SECONDS = (
+    60.0  # 他のワーカーの書き込みを含めて走査し直す間隔 (秒)
+)
+IMAGE_RESPONSE_MAX_AGE_SECONDS = 365 * 24 * 60 * 60  # /images のレスポンスをキャッシュさせる秒数
+# /route で参照を返した画像を最終参照から保持する秒数 (キャッシュの上限による削除の対象外とする)
+PUBLISHED_IMAGE_RETENTION_SECONDS = 24 * 60 * 60
+STREET_VIEW_IMAGE_CACHE_HEADING_STEP_DEG = 5  # 画像ストア利用時にheadingを丸める単位 (度)
 
 # ランドマーク検索の設定
 LANDMARK_SEARCH_TARGET_COUNT = 5  # 目標件数
 LANDMARK_SEARCH_MAX_CALLS = 8  # 最大API呼び出し回数
+LANDMARK_SEARCH_RING_PARALLELISM = 4  # 円周上の点を同時に検索する最大数 (1の場合は逐次検索)
 LANDMARK_DISTANCE_TOLERANCE_PERCENT = 15.0  # 許容誤差 (%)
 LANDMARK_SEARCH_TIME_BUDGET_MS = 3000  # タイムアウト予算 (ミリ秒)
+LANDMARK_CATALOG_MAX_ENTRIES = 100000  # 蓄積するランドマーク数の上限 (超えた場合は古い順に削除)
+LANDMARK_CATALOG_TTL_SECONDS = 7 * 24 * 60 * 60  # 再取得されないランドマークを古いとみなす秒数
+LANDMARK_CATALOG_CELL_SIZE_DEG = 0.01  # カタログの空間インデックスのセルの大きさ (度、約1km)
 MIN_SEARCH_RADIUS_M = 50  # Google Maps Nearby Search APIの最小検索半径 (メートル)
 PLACES_API_MAX_SEARCH_RADIUS_M = 50000  # Places API searchNearby の最大検索半径 (メートル)
+LANDMARK_IMAGE_SELECTION_PARALLELISM = 3  # 画像取得を同時に試行する候補の最大数 (1の場合は逐次試行)
+STREET_VIEW_DEAD_ZONE_TTL_SECONDS = (
+    7 * 24 * 60 * 60
+)  # Street View画像がなかった候補を後回しにする秒数
+STREET_VIEW_DEAD_ZONE_MAX_ENTRIES = 20000  # Street View画像がなかった候補を記録する最大件数
+STREET_VIEW_DEAD_ZONE_CELL_DECIMAL_PLACES = 4  # 画像がなかった座標を量子化する小数桁数 (約11m四方)
 MIDPOINT_MIN_SEARCH_RADIUS_M = 300  # 中間地点検索の最小半径 (メートル)
 MIDPOINT_DEDUP_MIN_DISTANCE_TO_DESTINATION_M = 10  # 中間地点と最終目的地の重複判定 (メートル)
+MIDPOINT_SEARCH_CONCURRENCY = 5  # 中間地点ごとの検索・画像取得を同時に実行する最大数
+MIDPOINT_GEODESIC_MAX_OFFSET_RATIO = 0.5  # geodesicモードで候補を左右にずらす上限 (検索半径比)
+
+# 人気エリアのランダムモードのルートを事前生成するプールの設定
+ROUTE_POOL_SIZE_PER_AREA = 3  # エリアごとに事前生成しておくルート数
+ROUTE_POOL_TTL_SECONDS = 600  # 事前生成したルートを払い出せる期間 (秒、エリアごとに上書き可能)
+ROUTE_POOL_START_TOLERANCE_M = 150  # 出発地とエリアの中心の距離の許容範囲 (メートル)
+ROUTE_POOL_RADIUS_BUCKET_M = 500  # 半径を丸める単位 (同じ単位に丸まる半径のリクエストに払い出す)
+ROUTE_POOL_REFILL_INTERVAL_SECONDS = 30.0  # 期限切れの確認と補充を行う間隔 (秒)
 
 # Directions API制約
 DIRECTIONS_API_MAX_WAYPOINTS = 25  # origin/destination を除く waypoint 最大数
@@ -100,5 +170,54 @@ if not GOOGLE_API_KEY:
         "GOOGLE_API_KEY環境変数が設定されていません。.envファイルまたは環境変数に設定してください。"
     )
 
+# Street View画像ストアの保存先 (複数ワーカーで共有可能)
+# 指定した場合は STREET_VIEW_IMAGE_CACHE_MAX_BYTES まで保存し、未指定の場合は一時ディレクトリに
+# STREET_VIEW_IMAGE_CACHE_DEFAULT_DIR_MAX_BYTES まで保存する
+# NOTE: 未指定の場合は他のインスタンスから画像を取得できないため、image_delivery=reference の
+#       リクエストにも画像を埋め込んで返す
+STREET_VIEW_IMAGE_CACHE_DIR = os.environ.get("STREET_VIEW_IMAGE_CACHE_DIR")
+
+# ランドマークカタログのSQLiteファイルのパス
+# 指定した場合は複数ワーカーと再起動をまたいで共有し、未指定の場合はプロセスごとにメモリ上に保持する
+LANDMARK_CATALOG_PATH = os.environ.get("LANDMARK_CATALOG_PATH")
+
+# 中間地点候補の生成方法
+# - directions: 出発地〜目的地の実ルートをDirections APIで取得し、ルート上を等分割する
+# - geodesic: 出発地〜目的地の測地線を等分割し、左右にずらす (Directions APIの呼び出しを1回省く)
+MIDPOINT_CANDIDATE_MODE = os.environ.get("MIDPOINT_CANDIDATE_MODE", "directions")
+if MIDPOINT_CANDIDATE_MODE not in ("directions", "geodesic"):
+    raise ValueError(
+        "MIDPOINT_CANDIDATE_MODE環境変数には directions または geodesic を指定してください。"
+    )
+
+
+def _parse_route_pool_hot_areas(value: str) -> list[tuple[float, float, int, float]]:
+    """事前生成の対象エリアの設定を解析
+
+    Args:
+        value: lat,lng,radius_m[,ttl_seconds] をセミコロンで区切った文字列
+
+    Returns:
+        list[tuple[float, float, int, float]]: 中心の緯度・経度、半径、払い出せる期間 (秒)
+
+    Raises:
+        ValueError: 書式が不正な場合
+    """
+    areas = []
+    for area in filter(None, (part.strip() for part in value.split(";"))):
+        fields = [field.strip() for field in area.split(",")]
+        if len(fields) not in (3, 4):
+            raise ValueError(
+                "ROUTE_POOL_HOT_AREAS環境変数には lat,lng,radius_m[,ttl_seconds] を"
+                f"セミコロン区切りで指定してください: {area}"
+            )
+        ttl_seconds = float(fields[3]) if len(fields) == 4 else float(ROUTE_POOL_TTL_SECONDS)
+        areas.append((float(fields[0]), float(fields[1]), int(fields[2]), ttl_seconds))
+    return areas
+
+
+# ランダムモードのルートを事前生成するエリア (未設定の場合は事前生成しない)
+ROUTE_POOL_HOT_AREAS = _parse_route_pool_hot_areas(os.environ.get("ROUTE_POOL_HOT_AREAS", ""))
+
 # 環境 (dev または prod) を取得
 ENV = os.environ.get("ENV", "dev")
@@ -4,10 +4,160 @@
 Infrastructure層の実装への依存は、この設定モジュールに集約されます。
 """
 
-from injector import Injector
+import tempfile
+from pathlib import Path
 
+from injector import CallableProvider, Injector, inject, singleton
+
+from app.application.gateway_interfaces.async_google_maps_gateway import AsyncGoogleMapsGateway
 from app.application.gateway_interfaces.google_maps_gateway import GoogleMapsGateway
+from app.application.gateway_interfaces.image_storage_gateway import ImageStorageGateway
+from app.application.gateway_interfaces.landmark_catalog_gateway import LandmarkCatalogGateway
+from app.application.services import LandmarkImageSelectionService
+from app.application.usecases.generate_route_usecase import GenerateRouteUseCase
+from app.application.usecases.route_pool import RoutePool, RoutePoolArea
+from app.config import (
+    DIRECTIONS_API_RATE_LIMIT_BURST,
+    DIRECTIONS_API_RATE_LIMIT_QPS,
+    DIRECTIONS_CACHE_MAX_ENTRIES,
+    LANDMARK_CATALOG_PATH,
+    PLACES_API_RATE_LIMIT_BURST,
+    PLACES_API_RATE_LIMIT_QPS,
+    PLACES_CACHE_MAX_ENTRIES,
+    ROADS_API_RATE_LIMIT_BURST,
+    ROADS_API_RATE_LIMIT_QPS,
+    ROUTE_POOL_HOT_AREAS,
+    STREET_VIEW_IMAGE_API_RATE_LIMIT_BURST,
+    STREET_VIEW_IMAGE_API_RATE_LIMIT_QPS,
+    STREET_VIEW_IMAGE_CACHE_DEFAULT_DIR_MAX_BYTES,
+    STREET_VIEW_IMAGE_CACHE_DIR,
+    STREET_VIEW_IMAGE_CACHE_MAX_BYTES,
+    STREET_VIEW_METADATA_API_RATE_LIMIT_BURST,
+    STREET_VIEW_METADATA_API_RATE_LIMIT_QPS,
+    STREET_VIEW_METADATA_CACHE_MAX_ENTRIES,
+)
+from app.domain.value_objects import Coordinate
+from app.infrastructure.cache import DiskImageStore, TtlCache
+from app.infrastructure.gateways import google_maps_api
+from app.infrastructure.gateways.async_google_maps_gateway_impl import AsyncGoogleMapsGatewayImpl
+from app.infrastructure.gateways.disk_image_storage_gateway_impl import DiskImageStorageGatewayImpl
 from app.infrastructure.gateways.google_maps_gateway_impl import GoogleMapsGatewayImpl
+from app.infrastructure.gateways.in_memory_landmark_catalog_gateway_impl import (
+    InMemoryLandmarkCatalogGatewayImpl,
+)
+from app.infrastructure.gateways.sqlite_landmark_catalog_gateway_impl import (
+    SqliteLandmarkCatalogGatewayImpl,
+)
+from app.infrastructure.resilience import CircuitBreaker, HedgingPolicy, RateLimiter
+
+
+def _create_circuit_breakers() -> dict[str, CircuitBreaker]:
+    """外部サービスごとのサーキットブレーカーを生成"""
+    return {
+        service_name: CircuitBreaker(service_name) for service_name in google_maps_api.SERVICE_NAMES
+    }
+
+
+def _create_rate_limiters() -> dict[str, RateLimiter]:
+    """外部サービスごとのレート制限を生成"""
+    limits = {
+        google_maps_api.DIRECTIONS_SERVICE_NAME: (
+            DIRECTIONS_API_RATE_LIMIT_QPS,
+            DIRECTIONS_API_RATE_LIMIT_BURST,
+        ),
+        google_maps_api.STREET_VIEW_METADATA_SERVICE_NAME: (
+            STREET_VIEW_METADATA_API_RATE_LIMIT_QPS,
+            STREET_VIEW_METADATA_API_RATE_LIMIT_BURST,
+        ),
+        google_maps_api.STREET_VIEW_IMAGE_SERVICE_NAME: (
+            STREET_VIEW_IMAGE_API_RATE_LIMIT_QPS,
+            STREET_VIEW_IMAGE_API_RATE_LIMIT_BURST,
+        ),
+        google_maps_api.PLACES_SERVICE_NAME: (
+            PLACES_API_RATE_LIMIT_QPS,
+            PLACES_API_RATE_LIMIT_BURST,
+        ),
+        google_maps_api.ROADS_SERVICE_NAME: (ROADS_API_RATE_LIMIT_QPS, ROADS_API_RATE_LIMIT_BURST),
+    }
+    return {
+        service_name: RateLimiter(service_name, rate_per_second, burst)
+        for service_name, (rate_per_second, burst) in limits.items()
+    }
+
+
+def _create_hedging_policies() -> dict[str, HedgingPolicy]:
+    """Street Viewのメタデータと画像の取得に使うヘッジリクエストのポリシーを生成"""
+    return {
+        google_maps_api.STREET_VIEW_METADATA_SERVICE_NAME: HedgingPolicy(),
+        google_maps_api.STREET_VIEW_IMAGE_SERVICE_NAME: HedgingPolicy(),
+    }
+
+
+def _create_image_store() -> DiskImageStore:
+    """Street View画像のディスクストアを生成 (保存先の指定がない場合は一時ディレクトリに保存する)"""
+    if STREET_VIEW_IMAGE_CACHE_DIR:
+        return DiskImageStore(STREET_VIEW_IMAGE_CACHE_DIR, STREET_VIEW_IMAGE_CACHE_MAX_BYTES)
+    return DiskImageStore(
+        Path(tempfile.gettempdir()) / "snampo" / "street_view_images",
+        STREET_VIEW_IMAGE_CACHE_DEFAULT_DIR_MAX_BYTES,
+    )
+
+
+@inject
+def _create_image_storage_gateway(image_store: DiskImageStore) -> DiskImageStorageGatewayImpl:
+    """画像配信用の画像ストレージGatewayを生成
+
+    保存先を指定しない場合は一時ディレクトリに保存するため、他のインスタンスと共有しない。
+    """
+    return DiskImageStorageGatewayImpl(image_store, shared=STREET_VIEW_IMAGE_CACHE_DIR is not None)
+
+
+def _create_landmark_catalog() -> LandmarkCatalogGateway:
+    """ランドマークカタログを生成 (パスを指定した場合はSQLiteに永続化する)"""
+    if LANDMARK_CATALOG_PATH:
+        return SqliteLandmarkCatalogGatewayImpl(LANDMARK_CATALOG_PATH)
+    return InMemoryLandmarkCatalogGatewayImpl()
+
+
+@inject
+def _create_google_maps_gateway(image_store: DiskImageStore) -> GoogleMapsGatewayImpl:
+    """キャッシュ・サーキットブレーカー・レート制限を設定した同期Google Maps Gatewayを生成"""
+    return GoogleMapsGatewayImpl(
+        metadata_cache=TtlCache(max_entries=STREET_VIEW_METADATA_CACHE_MAX_ENTRIES),
+        places_cache=TtlCache(max_entries=PLACES_CACHE_MAX_ENTRIES),
+        directions_cache=TtlCache(max_entries=DIRECTIONS_CACHE_MAX_ENTRIES),
+        image_store=image_store,
+        circuit_breakers=_create_circuit_breakers(),
+        rate_limiters=_create_rate_limiters(),
+    )
+
+
+@inject
+def _create_async_google_maps_gateway(image_store: DiskImageStore) -> AsyncGoogleMapsGatewayImpl:
+    """キャッシュ・サーキットブレーカー・レート制限・ヘッジリクエストを設定した非同期Gatewayを生成"""
+    return AsyncGoogleMapsGatewayImpl(
+        metadata_cache=TtlCache(max_entries=STREET_VIEW_METADATA_CACHE_MAX_ENTRIES),
+        places_cache=TtlCache(max_entries=PLACES_CACHE_MAX_ENTRIES),
+        directions_cache=TtlCache(max_entries=DIRECTIONS_CACHE_MAX_ENTRIES),
+        image_store=image_store,
+        circuit_breakers=_create_circuit_breakers(),
+        rate_limiters=_create_rate_limiters(),
+        hedging_policies=_create_hedging_policies(),
+    )
+
+
+@inject
+def _create_route_pool(usecase: GenerateRouteUseCase) -> RoutePool:
+    """設定したエリアのルートを事前生成するプールを生成"""
+    areas = [
+        RoutePoolArea(
+            start=Coordinate(latitude=latitude, longitude=longitude),
+            radius_m=radius_m,
+            ttl_seconds=ttl_seconds,
+        )
+        for latitude, longitude, radius_m, ttl_seconds in ROUTE_POOL_HOT_AREAS
+    ]
+    return RoutePool(usecase, areas)
 
 
 def create_container() -> Injector:
@@ -17,7 +167,43 @@ def create_container() -> Injector:
         Injector: 設定済みのDIコンテナ
     """
     injector = Injector()
-    injector.binder.bind(GoogleMapsGateway, to=GoogleMapsGatewayImpl)
+    # NOTE: Gatewayと画像配信で同じ画像ストアを共有し、取得済みの画像を重複して保存しない
+    injector.binder.bind(
+        DiskImageStore,
+        to=CallableProvider(_create_image_store),
+        scope=singleton,
+    )
+    injector.binder.bind(
+        ImageStorageGateway,
+        to=CallableProvider(_create_image_storage_gateway),
+        scope=singleton,
+    )
+    # NOTE: コネクションプールとキャッシュをリクエスト間で共有するため、Gatewayはシングルトンとする
+    # NOTE: APIサーバーは非同期Gatewayを使用し、同期Gatewayはテストやスクリプト向けに提供する
+    injector.binder.bind(
+        GoogleMapsGateway,
+        to=CallableProvider(_create_google_maps_gateway),
+        scope=singleton,
+    )
+    injector.binder.bind(
+        AsyncGoogleMapsGateway,
+        to=CallableProvider(_create_async_google_maps_gateway),
+        scope=singleton,
+    )
+    # NOTE: 取得したランドマークをリクエスト間で蓄積するため、シングルトンとする
+    injector.binder.bind(
+        LandmarkCatalogGateway,
+        to=CallableProvider(_create_landmark_catalog),
+        scope=singleton,
+    )
+    # NOTE: 並行試行で無駄になった呼び出し数をリクエスト間で集計するため、シングルトンとする
+    injector.binder.bind(LandmarkImageSelectionService, scope=singleton)
+    # NOTE: 事前生成したルートをリクエスト間で共有するため、シングルトンとする
+    injector.binder.bind(
+        RoutePool,
+        to=CallableProvider(_create_route_pool),
+        scope=singleton,
+    )
     return injector
 
 
@@ -4,14 +4,18 @@
 """
 
 from app.domain.exceptions.external_service import (
+    ExternalServiceDeadlineExceededError,
     ExternalServiceError,
+    ExternalServiceNotFoundError,
     ExternalServiceTimeoutError,
     ExternalServiceValidationError,
 )
 from app.domain.exceptions.route import RouteGenerationError
 
 __all__ = [
+    "ExternalServiceDeadlineExceededError",
     "ExternalServiceError",
+    "ExternalServiceNotFoundError",
     "ExternalServiceTimeoutError",
     "ExternalServiceValidationError",
     "RouteGenerationError",
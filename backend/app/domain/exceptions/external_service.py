@@ -38,6 +38,23 @@ class ExternalServiceTimeoutError(ExternalServiceError):
         super().__init__(message, service_name)
 
 
+class ExternalServiceDeadlineExceededError(ExternalServiceTimeoutError):
+    """リクエストの期限切れによるタイムアウトエラー
+
+    外部サービスの応答が遅いためではなく、呼び出し側のリクエストの期限を過ぎたために
+    外部サービスの呼び出しを打ち切った場合に発生します。
+    """
+
+    def __init__(self, message: str, service_name: str | None = None) -> None:
+        """初期化
+
+        Args:
+            message: エラーメッセージ
+            service_name: サービス名 (オプション)
+        """
+        super().__init__(message, service_name)
+
+
 class ExternalServiceValidationError(ExternalServiceError):
     """外部サービスのバリデーションエラー
 
@@ -52,3 +69,20 @@ class ExternalServiceValidationError(ExternalServiceError):
             service_name: サービス名 (オプション)
         """
         super().__init__(message, service_name)
+
+
+class ExternalServiceNotFoundError(ExternalServiceValidationError):
+    """外部サービスに対象のデータが存在しないエラー
+
+    外部サービスが正常に応答し、要求したデータが存在しないと返した場合に発生します。
+    一時的なエラーとは異なり、同じ要求を再試行しても結果は変わりません。
+    """
+
+    def __init__(self, message: str, service_name: str | None = None) -> None:
+        """初期化
+
+        Args:
+            message: エラーメッセージ
+            service_name: サービス名 (オプション)
+        """
+        super().__init__(message, service_name)
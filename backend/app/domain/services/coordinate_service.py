@@ -3,13 +3,21 @@
 座標に関するビジネスロジックを提供します。
 """
 
-from itertools import pairwise
+import math
+import random
 
 from geographiclib.geodesic import Geodesic
 from geopy.distance import geodesic
 
+from app.domain.services.route_geometry import DistanceModel, RouteGeometry
 from app.domain.value_objects import Coordinate
 
+# 緯度・経度1度あたりの距離の下限 (メートル)
+# NOTE: 範囲を漏れなく覆うため、赤道上の子午線方向の長さ (約110.57km) より小さい値を使う
+_MIN_METERS_PER_DEGREE = 110_000.0
+# 経度方向の範囲を絞り込まず、全経度を覆う緯度 (度)
+_POLAR_LATITUDE_DEG = 89.0
+
 
 def calculate_distance(start: Coordinate, end: Coordinate) -> float:
     """2点間の測地線距離を計算
@@ -59,17 +67,59 @@ def calculate_bearing(start: Coordinate, end: Coordinate) -> float:
     return bearing
 
 
+def calculate_bounding_boxes(
+    center: Coordinate, distance_m: float
+) -> list[tuple[float, float, float, float]]:
+    """中心から指定距離までの範囲を覆う緯度・経度の矩形を計算
+
+    空間インデックスの検索範囲に使うため、範囲を漏れなく覆うやや大きめの矩形を返します。
+    日付変更線をまたぐ場合は、経度180度で2つの矩形に分割します。
+
+    Args:
+        center: 中心座標
+        distance_m: 距離 (メートル単位)
+
+    Returns:
+        list[tuple[float, float, float, float]]: (南端の緯度, 北端の緯度, 西端の経度, 東端の経度)
+    """
+    delta_latitude = distance_m / _MIN_METERS_PER_DEGREE
+    south = max(-90.0, center.latitude - delta_latitude)
+    north = min(90.0, center.latitude + delta_latitude)
+
+    # NOTE: 範囲内で最も極に近い緯度で経度1度の長さが最短となるため、その緯度で幅を求める
+    max_abs_latitude = max(abs(south), abs(north))
+    if max_abs_latitude >= _POLAR_LATITUDE_DEG:
+        return [(south, north, -180.0, 180.0)]
+    delta_longitude = distance_m / (
+        _MIN_METERS_PER_DEGREE * math.cos(math.radians(max_abs_latitude))
+    )
+    if delta_longitude >= 180.0:
+        return [(south, north, -180.0, 180.0)]
+
+    west = center.longitude - delta_longitude
+    east = center.longitude + delta_longitude
+    if west < -180.0:
+        return [(south, north, west + 360.0, 180.0), (south, north, -180.0, east)]
+    if east > 180.0:
+        return [(south, north, west, 180.0), (south, north, -180.0, east - 360.0)]
+    return [(south, north, west, east)]
+
+
 def divide_route_into_segments(
-    route_coordinates: list[Coordinate], num_segments: int
+    route_coordinates: list[Coordinate],
+    num_segments: int,
+    distance_model: DistanceModel = "ellipsoidal",
 ) -> list[Coordinate]:
     """ルート座標列から等間隔の中間地点を抽出する
 
     Directions API などで得たルート座標列に沿って、総距離を等分した位置にある
     中間地点を返します。始点・終点そのものは含みません。
+    区間距離は RouteGeometry で配列としてまとめて計算します。
 
     Args:
         route_coordinates: ルートを表す座標列
         num_segments: 取得したい中間地点の数
+        distance_model: 区間距離の計算方法
 
     Returns:
         中間地点のリスト(num_segments個以下)
@@ -83,56 +133,56 @@ def divide_route_into_segments(
     if len(route_coordinates) < 2:
         return []
 
-    segment_distances: list[float] = []
-    total_distance = 0.0
-    for start, end in pairwise(route_coordinates):
-        distance = calculate_distance(start, end)
-        segment_distances.append(distance)
-        total_distance += distance
-
-    if total_distance <= 0:
-        return []
-
-    target_distances = [total_distance * i / (num_segments + 1) for i in range(1, num_segments + 1)]
-    intermediate_points: list[Coordinate] = []
-    traversed_distance = 0.0
-    segment_index = 0
+    return RouteGeometry.from_coordinates(route_coordinates, distance_model).divide(num_segments)
 
-    for target_distance in target_distances:
-        while segment_index < len(segment_distances):
-            segment_distance = segment_distances[segment_index]
-            start = route_coordinates[segment_index]
-            end = route_coordinates[segment_index + 1]
 
-            if segment_distance <= 0:
-                traversed_distance += segment_distance
-                segment_index += 1
-                continue
+def generate_geodesic_midpoints(
+    start: Coordinate,
+    end: Coordinate,
+    num_points: int,
+    max_lateral_offset_m: float = 0.0,
+    rng: random.Random | None = None,
+) -> list[Coordinate]:
+    """始点と終点を結ぶ測地線から等間隔の中間地点を生成する
 
-            if traversed_distance + segment_distance >= target_distance:
-                distance_from_segment_start = target_distance - traversed_distance
-                intermediate_points.append(
-                    _interpolate_point_on_segment(start, end, distance_from_segment_start)
-                )
-                break
+    実ルートを取得せずに中間地点の候補を作るため、測地線の距離を等分した位置を
+    進行方向に対して左右にランダムにずらして返します。始点・終点そのものは含みません。
 
-            traversed_distance += segment_distance
-            segment_index += 1
+    Args:
+        start: 始点の座標
+        end: 終点の座標
+        num_points: 取得したい中間地点の数
+        max_lateral_offset_m: 左右にずらす距離の上限 (メートル単位、0の場合はずらさない)
+        rng: ずらす距離を決める乱数生成器 (Noneの場合はrandomモジュールを使用)
 
-    return intermediate_points
+    Returns:
+        中間地点のリスト(始点と終点が同じ場合は空配列)
 
+    Raises:
+        ValueError: num_pointsが0以下、またはmax_lateral_offset_mが負の場合
+    """
+    if num_points <= 0:
+        raise ValueError("num_points must be positive")
+    if max_lateral_offset_m < 0:
+        raise ValueError("max_lateral_offset_m must not be negative")
 
-def _interpolate_point_on_segment(
-    start: Coordinate, end: Coordinate, distance_from_start: float
-) -> Coordinate:
-    """2点を結ぶ測地線上の指定距離地点を返す"""
-    if start == end or distance_from_start <= 0:
-        return start
+    if start == end:
+        return []
 
-    inverse_result = Geodesic.WGS84.Inverse(
-        start.latitude, start.longitude, end.latitude, end.longitude
-    )
-    bearing = inverse_result["azi1"]
-    start_point = (start.latitude, start.longitude)
-    point = geodesic(meters=distance_from_start).destination(start_point, bearing)
-    return Coordinate(latitude=point.latitude, longitude=point.longitude)
+    uniform = rng.uniform if rng is not None else random.uniform
+    line = Geodesic.WGS84.InverseLine(start.latitude, start.longitude, end.latitude, end.longitude)
+    midpoints: list[Coordinate] = []
+    for i in range(1, num_points + 1):
+        position = line.Position(line.s13 * i / (num_points + 1))
+        latitude, longitude = position["lat2"], position["lon2"]
+        if max_lateral_offset_m > 0:
+            # 進行方向から90度の方向へずらす (負の距離は反対側へずらす)
+            offset = Geodesic.WGS84.Direct(
+                latitude,
+                longitude,
+                position["azi2"] + 90.0,
+                uniform(-max_lateral_offset_m, max_lateral_offset_m),
+            )
+            latitude, longitude = offset["lat2"], offset["lon2"]
+        midpoints.append(Coordinate.trusted(latitude, longitude))
+    return midpoints
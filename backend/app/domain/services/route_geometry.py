@@ -0,0 +1,212 @@
+"""ルート形状ドメインサービス
+
+ルート座標列を緯度・経度の配列として保持し、区間距離や累積距離をまとめて計算します。
+"""
+
+from typing import Literal
+
+import numpy as np
+from geographiclib.geodesic import Geodesic
+
+from app.domain.value_objects import Coordinate
+
+# 区間距離の計算方法
+# - geodesic: WGS84楕円体上の測地線距離を1区間ずつ計算する (最も正確だが最も遅い)
+# - ellipsoidal: 区間の中点の緯度におけるWGS84楕円体の曲率半径で平面近似する
+#   (数百メートル以下の区間では測地線距離との差がミリメートル未満)
+# - haversine: 球面上の大円距離 (楕円体との差で最大0.5%程度の誤差がある)
+type DistanceModel = Literal["geodesic", "ellipsoidal", "haversine"]
+
+# WGS84楕円体の長半径 (メートル) と第一離心率の2乗
+_WGS84_SEMI_MAJOR_AXIS_M = 6_378_137.0
+_WGS84_FLATTENING = 1 / 298.257223563
+_WGS84_ECCENTRICITY_SQUARED = _WGS84_FLATTENING * (2 - _WGS84_FLATTENING)
+# 地球の平均半径 (メートル)
+_EARTH_MEAN_RADIUS_M = 6_371_008.8
+
+
+class RouteGeometry:
+    """緯度・経度の配列で表したルート形状
+
+    区間距離と累積距離を配列で保持し、総距離に対する位置から区間を二分探索で特定します。
+    """
+
+    def __init__(
+        self,
+        latitudes: np.ndarray,
+        longitudes: np.ndarray,
+        distance_model: DistanceModel = "ellipsoidal",
+    ) -> None:
+        """初期化
+
+        Args:
+            latitudes: 各点の緯度 (度)
+            longitudes: 各点の経度 (度)
+            distance_model: 区間距離の計算方法
+
+        Raises:
+            ValueError: 緯度と経度の配列の長さが異なる場合
+        """
+        latitudes = np.asarray(latitudes, dtype=np.float64)
+        longitudes = np.asarray(longitudes, dtype=np.float64)
+        if latitudes.shape != longitudes.shape or latitudes.ndim != 1:
+            raise ValueError("latitudes and longitudes must be 1-D arrays of the same length")
+
+        self.latitudes = latitudes
+        self.longitudes = longitudes
+        self.segment_lengths = calculate_segment_lengths(latitudes, longitudes, distance_model)
+        # NOTE: 先頭を0とし、i番目の要素がi番目の点までの距離となるようにする
+        self.cumulative_distances = np.concatenate(([0.0], np.cumsum(self.segment_lengths)))
+
+    @classmethod
+    def from_coordinates(
+        cls, coordinates: list[Coordinate], distance_model: DistanceModel = "ellipsoidal"
+    ) -> "RouteGeometry":
+        """座標列からルート形状を生成する
+
+        Args:
+            coordinates: ルートを表す座標列
+            distance_model: 区間距離の計算方法
+
+        Returns:
+            RouteGeometry: ルート形状
+        """
+        latitudes = np.fromiter(
+            (coordinate.latitude for coordinate in coordinates),
+            dtype=np.float64,
+            count=len(coordinates),
+        )
+        longitudes = np.fromiter(
+            (coordinate.longitude for coordinate in coordinates),
+            dtype=np.float64,
+            count=len(coordinates),
+        )
+        return cls(latitudes, longitudes, distance_model)
+
+    @property
+    def total_distance(self) -> float:
+        """ルートの総距離 (メートル単位)"""
+        return float(self.cumulative_distances[-1])
+
+    def divide(self, num_segments: int) -> list[Coordinate]:
+        """総距離を等分した位置にある中間地点を返す
+
+        始点・終点そのものは含みません。各地点は、その位置を含む区間の両端を結ぶ
+        測地線上に、区間距離に対する割合で配置します。
+
+        Args:
+            num_segments: 取得したい中間地点の数
+
+        Returns:
+            中間地点のリスト(点が2つ未満か総距離が0の場合は空配列)
+
+        Raises:
+            ValueError: num_segmentsが0以下の場合
+        """
+        if num_segments <= 0:
+            raise ValueError("num_segments must be positive")
+
+        total_distance = self.total_distance
+        if len(self.segment_lengths) == 0 or total_distance <= 0:
+            return []
+
+        target_distances = total_distance * np.arange(1, num_segments + 1) / (num_segments + 1)
+        # NOTE: 区間の終端までの累積距離が目標以上となる最初の区間を探すため、長さ0の区間は
+        #       直前の区間の終端で目標に達しているので選ばれない
+        segment_indices = np.searchsorted(
+            self.cumulative_distances[1:], target_distances, side="left"
+        )
+        segment_indices = np.minimum(segment_indices, len(self.segment_lengths) - 1)
+        fractions = (
+            target_distances - self.cumulative_distances[segment_indices]
+        ) / self.segment_lengths[segment_indices]
+
+        return [
+            self._interpolate(index, fraction)
+            for index, fraction in zip(segment_indices.tolist(), fractions.tolist(), strict=True)
+        ]
+
+    def _interpolate(self, index: int, fraction: float) -> Coordinate:
+        """区間の両端を結ぶ測地線上で、区間距離に対する割合の位置にある地点を返す
+
+        Args:
+            index: 区間のインデックス
+            fraction: 区間の始点からの距離の割合 (0以上1以下)
+
+        Returns:
+            Coordinate: 区間上の地点
+        """
+        start_latitude = float(self.latitudes[index])
+        start_longitude = float(self.longitudes[index])
+        if fraction <= 0:
+            return Coordinate.trusted(start_latitude, start_longitude)
+
+        line = Geodesic.WGS84.InverseLine(
+            start_latitude,
+            start_longitude,
+            float(self.latitudes[index + 1]),
+            float(self.longitudes[index + 1]),
+        )
+        position = line.Position(line.s13 * min(fraction, 1.0))
+        return Coordinate.trusted(position["lat2"], position["lon2"])
+
+
+def calculate_segment_lengths(
+    latitudes: np.ndarray, longitudes: np.ndarray, distance_model: DistanceModel = "ellipsoidal"
+) -> np.ndarray:
+    """連続する点の間の距離をまとめて計算する
+
+    Args:
+        latitudes: 各点の緯度 (度)
+        longitudes: 各点の経度 (度)
+        distance_model: 区間距離の計算方法
+
+    Returns:
+        np.ndarray: i番目の要素がi番目とi+1番目の点の間の距離 (メートル単位) の配列
+
+    Raises:
+        ValueError: 未対応の計算方法を指定した場合
+    """
+    if len(latitudes) < 2:
+        return np.zeros(0, dtype=np.float64)
+
+    if distance_model == "geodesic":
+        return np.fromiter(
+            (
+                Geodesic.WGS84.Inverse(lat1, lng1, lat2, lng2, Geodesic.DISTANCE)["s12"]
+                for lat1, lng1, lat2, lng2 in zip(
+                    latitudes[:-1].tolist(),
+                    longitudes[:-1].tolist(),
+                    latitudes[1:].tolist(),
+                    longitudes[1:].tolist(),
+                    strict=True,
+                )
+            ),
+            dtype=np.float64,
+            count=len(latitudes) - 1,
+        )
+
+    phi = np.radians(latitudes)
+    delta_phi = np.diff(phi)
+    # NOTE: 日付変更線をまたぐ区間で遠回りしないよう、経度差を -π 以上 π 以下に正規化する
+    delta_lambda = np.remainder(np.diff(np.radians(longitudes)) + np.pi, 2 * np.pi) - np.pi
+
+    if distance_model == "ellipsoidal":
+        mean_phi = (phi[:-1] + phi[1:]) / 2
+        sin_squared = np.sin(mean_phi) ** 2
+        w = np.sqrt(1 - _WGS84_ECCENTRICITY_SQUARED * sin_squared)
+        # 子午線曲率半径と卯酉線曲率半径
+        meridian_radius = _WGS84_SEMI_MAJOR_AXIS_M * (1 - _WGS84_ECCENTRICITY_SQUARED) / w**3
+        prime_vertical_radius = _WGS84_SEMI_MAJOR_AXIS_M / w
+        return np.hypot(
+            meridian_radius * delta_phi, prime_vertical_radius * np.cos(mean_phi) * delta_lambda
+        )
+
+    if distance_model == "haversine":
+        h = (
+            np.sin(delta_phi / 2) ** 2
+            + np.cos(phi[:-1]) * np.cos(phi[1:]) * np.sin(delta_lambda / 2) ** 2
+        )
+        return 2 * _EARTH_MEAN_RADIUS_M * np.arcsin(np.sqrt(np.minimum(h, 1.0)))
+
+    raise ValueError(f"Unsupported distance_model: {distance_model}")
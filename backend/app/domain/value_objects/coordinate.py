@@ -5,6 +5,13 @@
 
 from pydantic import BaseModel, ConfigDict, Field
 
+# trusted で生成した座標で共有する、明示的に設定されたフィールド名の集合
+# NOTE: frozen のため変更されず、model_copy などでは複製してから更新されるので共有できる
+_TRUSTED_FIELDS_SET = {"latitude", "longitude"}
+
+_object_new = object.__new__
+_object_setattr = object.__setattr__
+
 
 class Coordinate(BaseModel):
     """座標を表す値オブジェクト (緯度・経度のペア)"""
@@ -23,6 +30,29 @@ class Coordinate(BaseModel):
         description="経度の値 (-180から180の範囲)",
     )
 
+    @classmethod
+    def trusted(cls, latitude: float, longitude: float) -> "Coordinate":
+        """範囲内であることが保証された値から、バリデーションを省略して座標を生成
+
+        ポリラインのデコードや測地線計算の結果など、ドメインサービスやマッパーの内部で
+        大量に生成する座標に使用します。APIリクエストや外部APIのレスポンスなど、
+        外部から受け取る値には通常のコンストラクタを使用してください。
+
+        Args:
+            latitude: 緯度 (-90から90の範囲のfloat)
+            longitude: 経度 (-180から180の範囲のfloat)
+
+        Returns:
+            Coordinate: 座標
+        """
+        # NOTE: model_construct はフィールドの既定値を走査するため、通常の生成より遅い
+        coordinate = _object_new(cls)
+        _object_setattr(coordinate, "__dict__", {"latitude": latitude, "longitude": longitude})
+        _object_setattr(coordinate, "__pydantic_fields_set__", _TRUSTED_FIELDS_SET)
+        _object_setattr(coordinate, "__pydantic_extra__", None)
+        _object_setattr(coordinate, "__pydantic_private__", None)
+        return coordinate
+
     def __hash__(self) -> int:
         """ハッシュ値を計算
 
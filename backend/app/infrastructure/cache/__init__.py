@@ -0,0 +1,10 @@
+"""キャッシュ実装
+
+外部サービスの呼び出し結果を再利用するためのキャッシュを定義します。
+"""
+
+from app.infrastructure.cache.compact_route import CompactRoute
+from app.infrastructure.cache.disk_image_store import DiskImageStore, ImageStoreStats
+from app.infrastructure.cache.ttl_cache import CacheStats, TtlCache
+
+__all__ = ["CacheStats", "CompactRoute", "DiskImageStore", "ImageStoreStats", "TtlCache"]
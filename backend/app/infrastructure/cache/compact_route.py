@@ -0,0 +1,73 @@
+"""コンパクトなルート表現
+
+キャッシュに保存するルート座標列を、座標オブジェクトではなく数値配列として保持します。
+"""
+
+from array import array
+
+from app.domain.value_objects import Coordinate
+
+
+class CompactRoute:
+    """ルート座標列とoverview_polylineをコンパクトに保持する
+
+    座標は緯度・経度それぞれのdouble配列で保持し、
+    1点あたりのメモリを座標オブジェクトの数百バイトから16バイトに抑えます。
+    """
+
+    __slots__ = ("_latitudes", "_longitudes", "overview_polyline")
+
+    def __init__(
+        self, latitudes: array[float], longitudes: array[float], overview_polyline: str
+    ) -> None:
+        """初期化
+
+        Args:
+            latitudes: ルート座標の緯度の配列
+            longitudes: ルート座標の経度の配列
+            overview_polyline: overview_polyline文字列
+
+        Raises:
+            ValueError: 緯度と経度の長さが異なる場合
+        """
+        if len(latitudes) != len(longitudes):
+            raise ValueError("latitudes and longitudes must have the same length")
+        self._latitudes = latitudes
+        self._longitudes = longitudes
+        self.overview_polyline = overview_polyline
+
+    @classmethod
+    def from_coordinates(
+        cls, coordinates: list[Coordinate], overview_polyline: str
+    ) -> "CompactRoute":
+        """座標リストから生成する
+
+        Args:
+            coordinates: ルート座標リスト
+            overview_polyline: overview_polyline文字列
+
+        Returns:
+            CompactRoute: コンパクトなルート表現
+        """
+        return cls(
+            array("d", (coordinate.latitude for coordinate in coordinates)),
+            array("d", (coordinate.longitude for coordinate in coordinates)),
+            overview_polyline,
+        )
+
+    def __len__(self) -> int:
+        """ルート座標の点数を返す"""
+        return len(self._latitudes)
+
+    def to_result(self) -> tuple[list[Coordinate], str]:
+        """get_directionsの戻り値の形式に復元する
+
+        Returns:
+            tuple[list[Coordinate], str]: (ルート座標リスト, overview_polyline文字列)
+        """
+        # NOTE: 保存時に検証済みの値のため、バリデーションを省略して復元する
+        coordinates = [
+            Coordinate.trusted(latitude, longitude)
+            for latitude, longitude in zip(self._latitudes, self._longitudes, strict=True)
+        ]
+        return coordinates, self.overview_polyline
@@ -0,0 +1,369 @@
+"""ディスク上の画像ストア
+
+Street View画像をコンテンツハッシュで重複排除してディスクに保存します。
+"""
+
+import contextlib
+import hashlib
+import logging
+import os
+import re
+import tempfile
+import threading
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+from pydantic import BaseModel, ConfigDict, Field
+
+from app.config import (
+    PUBLISHED_IMAGE_RETENTION_SECONDS,
+    STREET_VIEW_IMAGE_CACHE_RESCAN_INTERVAL_SECONDS,
+)
+
+logger = logging.getLogger(__name__)
+
+# 上限超過時に削除を続ける目安 (上限に対する割合)
+_EVICTION_LOW_WATERMARK = 0.9
+# 前回の走査以降に自身が書き込んだバイト数がこの割合を超えたら、ディレクトリを走査し直す
+_RESCAN_WRITTEN_BYTES_RATIO = 0.1
+# コンテンツハッシュ (SHA-256の16進表記) の形式
+_CONTENT_HASH_PATTERN = re.compile(r"[0-9a-f]{64}")
+
+
+class ImageStoreStats(BaseModel):
+    """画像ストアの統計"""
+
+    model_config = ConfigDict(frozen=True)
+
+    hits: int = Field(ge=0, description="ストアから返した回数")
+    misses: int = Field(ge=0, description="ストアに存在しなかった回数")
+    stored_bytes: int = Field(
+        ge=0,
+        description="保存している画像の合計バイト数 (最後の走査結果に自身の書き込みを加えた推定値)",
+    )
+    max_bytes: int = Field(ge=1, description="保存できる画像の合計バイト数の上限")
+    evicted_files: int = Field(ge=0, description="上限超過により削除した画像ファイル数")
+    expired_published_files: int = Field(
+        ge=0, description="保持期間を過ぎたため削除した公開済みの画像ファイル数"
+    )
+
+
+class DiskImageStore:
+    """コンテンツアドレス方式のディスク画像ストア
+
+    画像本体は内容のSHA-256をファイル名として blobs/ に1つだけ保存し、
+    リクエストのキーから画像のハッシュへの対応は keys/ に保存します。
+    書き込みは一時ファイルからのリネームで行うため、複数のワーカープロセスが
+    同じディレクトリを共有しても読み手が書きかけのファイルを見ることはありません。
+    最終参照時刻はファイルの更新時刻で管理し、合計バイト数が上限を超えた場合は
+    最も長く参照されていない画像から削除します。
+    他のワーカーの書き込みも上限に含めるため、一定間隔ごと、または前回の走査以降の
+    自身の書き込みが上限の一定割合を超えるごとにディレクトリを走査し直し、実際の合計で
+    上限を判定します。走査時には画像が削除されたキーのファイルも削除します。
+    取得先をクライアントに返した画像は published/ に別に保存し、上限による削除の対象とせず、
+    最終参照から保持期間を過ぎたものを走査時に削除します。
+    """
+
+    def __init__(
+        self,
+        root_dir: str | Path,
+        max_bytes: int,
+        rescan_interval_seconds: float = STREET_VIEW_IMAGE_CACHE_RESCAN_INTERVAL_SECONDS,
+        published_retention_seconds: float = PUBLISHED_IMAGE_RETENTION_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """初期化
+
+        Args:
+            root_dir: 保存先ディレクトリ
+            max_bytes: 保存できる画像の合計バイト数の上限 (公開済みの画像は含まない)
+            rescan_interval_seconds: ディレクトリを走査し直す間隔 (秒)
+            published_retention_seconds: 公開済みの画像を最終参照から保持する秒数
+            clock: 現在時刻 (秒) を返す関数 (テスト用)
+        """
+        if max_bytes < 1:
+            raise ValueError("max_bytes は1以上を指定してください")
+        self._blobs_dir = Path(root_dir) / "blobs"
+        self._keys_dir = Path(root_dir) / "keys"
+        self._published_dir = Path(root_dir) / "published"
+        self._blobs_dir.mkdir(parents=True, exist_ok=True)
+        self._keys_dir.mkdir(parents=True, exist_ok=True)
+        self._published_dir.mkdir(parents=True, exist_ok=True)
+        self._published_retention_seconds = published_retention_seconds
+        self._max_bytes = max_bytes
+        self._rescan_interval_seconds = rescan_interval_seconds
+        self._clock = clock
+        self._lock = threading.Lock()
+        # NOTE: 走査は時間がかかるため、_lock とは別のロックで同時に1つだけ実行する
+        self._scan_lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evicted_files = 0
+        self._expired_published_files = 0
+        self._stored_bytes = sum(size for _, size, _ in self._scan_blobs())
+        self._written_bytes_since_scan = 0
+        self._last_scanned_at = clock()
+
+    def get(self, key: str) -> bytes | None:
+        """キーに対応する画像を取得
+
+        Args:
+            key: 画像のキー
+
+        Returns:
+            bytes | None: 画像データ (存在しない場合はNone)
+        """
+        key_path = self._key_path(key)
+        try:
+            content_hash = key_path.read_text(encoding="ascii")
+            blob_path = self._blob_path(content_hash)
+            data = blob_path.read_bytes()
+        except FileNotFoundError:
+            # 他のワーカーが画像を削除した場合もミスとして扱う
+            key_path.unlink(missing_ok=True)
+            self._count(hit=False)
+            return None
+
+        self._touch(blob_path)
+        self._count(hit=True)
+        return data
+
+    def get_by_hash(self, content_hash: str) -> bytes | None:
+        """コンテンツハッシュに対応する画像を取得
+
+        公開済みの画像を優先し、なければキャッシュした画像から探す。
+        画像配信用のため、ヒット数・ミス数には計上しない。
+
+        Args:
+            content_hash: 画像のコンテンツハッシュ (SHA-256の16進表記)
+
+        Returns:
+            bytes | None: 画像データ (形式が不正な場合や存在しない場合はNone)
+        """
+        # NOTE: 任意のパスを読み出させないよう、ハッシュの形式を検証してからパスを組み立てる
+        if not _CONTENT_HASH_PATTERN.fullmatch(content_hash):
+            return None
+        for path in (self._published_path(content_hash), self._blob_path(content_hash)):
+            try:
+                data = path.read_bytes()
+            except FileNotFoundError:
+                continue
+            self._touch(path)
+            return data
+        return None
+
+    def put(self, key: str, data: bytes) -> str:
+        """画像を保存する
+
+        Args:
+            key: 画像のキー
+            data: 画像データ
+
+        Returns:
+            str: 画像のコンテンツハッシュ
+        """
+        content_hash = self._put_blob(data)
+        self._write_atomic(self._key_path(key), content_hash.encode("ascii"))
+        self._evict_if_needed()
+        return content_hash
+
+    def publish(self, data: bytes) -> str:
+        """取得先をクライアントに返す画像を、上限による削除の対象外として保存する
+
+        保存済みの場合は最終参照時刻を更新し、保持期間を延長する。
+
+        Args:
+            data: 画像データ
+
+        Returns:
+            str: 画像のコンテンツハッシュ
+        """
+        content_hash = hashlib.sha256(data).hexdigest()
+        published_path = self._published_path(content_hash)
+        if published_path.exists():
+            self._touch(published_path)
+        else:
+            published_path.parent.mkdir(exist_ok=True)
+            self._write_atomic(published_path, data)
+        self._evict_if_needed()
+        return content_hash
+
+    def get_stats(self) -> ImageStoreStats:
+        """画像ストアの統計を取得
+
+        Returns:
+            ImageStoreStats: ヒット数・ミス数・保存バイト数など
+        """
+        with self._lock:
+            return ImageStoreStats(
+                hits=self._hits,
+                misses=self._misses,
+                stored_bytes=self._stored_bytes,
+                max_bytes=self._max_bytes,
+                evicted_files=self._evicted_files,
+                expired_published_files=self._expired_published_files,
+            )
+
+    def _put_blob(self, data: bytes) -> str:
+        """画像本体を保存し、コンテンツハッシュを返す (保存済みの場合は最終参照時刻を更新する)"""
+        content_hash = hashlib.sha256(data).hexdigest()
+        blob_path = self._blob_path(content_hash)
+        if blob_path.exists():
+            self._touch(blob_path)
+        else:
+            blob_path.parent.mkdir(exist_ok=True)
+            self._write_atomic(blob_path, data)
+            with self._lock:
+                self._stored_bytes += len(data)
+                self._written_bytes_since_scan += len(data)
+        return content_hash
+
+    def _evict_if_needed(self) -> None:
+        """必要に応じてディレクトリを走査し、上限を超えていれば最も長く参照されていない画像から削除する
+
+        推定値が上限を超えた場合に加え、一定間隔ごと、または前回の走査以降の自身の書き込みが
+        上限の一定割合を超えた場合に走査し、他のワーカーの書き込みを含めた実際の合計で判定する。
+        """
+        with self._lock:
+            if not self._should_rescan():
+                return
+        # NOTE: 他のスレッドの走査中は、その結果に任せて待たずに戻る
+        if not self._scan_lock.acquire(blocking=False):
+            return
+        try:
+            self._rescan()
+        finally:
+            self._scan_lock.release()
+
+    def _should_rescan(self) -> bool:
+        """ディレクトリを走査し直す必要があるか (_lock を保持して呼び出す)"""
+        return (
+            self._stored_bytes > self._max_bytes
+            or self._written_bytes_since_scan >= self._max_bytes * _RESCAN_WRITTEN_BYTES_RATIO
+            or self._clock() - self._last_scanned_at >= self._rescan_interval_seconds
+        )
+
+    def _rescan(self) -> None:
+        """ディレクトリを走査して合計バイト数を求め直し、上限を超えた分と不要なファイルを削除する"""
+        with self._lock:
+            self._written_bytes_since_scan = 0
+            self._last_scanned_at = self._clock()
+        # NOTE: 走査の開始後に書き込まれたキーは、画像の走査に間に合わなかった可能性があるため残す
+        scan_started_at = time.time()
+
+        # NOTE: 他のワーカーの書き込みも含めるため、実際のファイルから合計を求め直す
+        blobs = sorted(self._scan_blobs(), key=lambda blob: blob[2])
+        total = sum(size for _, size, _ in blobs)
+        target = self._max_bytes * _EVICTION_LOW_WATERMARK
+        evicted_files = 0
+        if total > self._max_bytes:
+            for path, size, _ in blobs:
+                if total <= target:
+                    break
+                path.unlink(missing_ok=True)
+                total -= size
+                evicted_files += 1
+            logger.info(f"Evicted Street View images; stored bytes: {total}")
+        remaining_hashes = {path.name for path, _, _ in blobs[evicted_files:]}
+        self._remove_orphan_keys(remaining_hashes, scan_started_at)
+        expired_published_files = self._remove_expired_published(
+            scan_started_at - self._published_retention_seconds
+        )
+
+        with self._lock:
+            self._evicted_files += evicted_files
+            self._expired_published_files += expired_published_files
+            self._stored_bytes = total + self._written_bytes_since_scan
+
+    def _remove_orphan_keys(self, content_hashes: set[str], written_before: float) -> None:
+        """画像が削除されたキーのファイルを削除する
+
+        Args:
+            content_hashes: 存在する画像のコンテンツハッシュ
+            written_before: この時刻 (UNIX時間の秒) より前に書き込まれたキーだけを対象とする
+        """
+        for key_path in self._keys_dir.iterdir():
+            if key_path.name.startswith("."):
+                continue
+            try:
+                if key_path.stat().st_mtime >= written_before:
+                    continue
+                content_hash = key_path.read_text(encoding="ascii")
+            except FileNotFoundError:
+                continue
+            if content_hash not in content_hashes:
+                key_path.unlink(missing_ok=True)
+
+    def _remove_expired_published(self, referenced_before: float) -> int:
+        """保持期間を過ぎた公開済みの画像を削除する
+
+        Args:
+            referenced_before: この時刻 (UNIX時間の秒) より前に最後に参照された画像を削除する
+
+        Returns:
+            int: 削除した画像ファイル数
+        """
+        removed_files = 0
+        for path in self._published_dir.glob("*/*"):
+            if path.name.startswith("."):
+                continue
+            try:
+                if path.stat().st_mtime >= referenced_before:
+                    continue
+            except FileNotFoundError:
+                continue
+            path.unlink(missing_ok=True)
+            removed_files += 1
+        return removed_files
+
+    def _scan_blobs(self) -> list[tuple[Path, int, float]]:
+        """保存済みの画像を (パス, サイズ, 最終参照時刻) のリストで返す"""
+        blobs: list[tuple[Path, int, float]] = []
+        for path in self._blobs_dir.glob("*/*"):
+            if path.name.startswith("."):
+                continue
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            blobs.append((path, stat.st_size, stat.st_mtime))
+        return blobs
+
+    def _count(self, hit: bool) -> None:
+        """ヒット数・ミス数を計上する"""
+        with self._lock:
+            if hit:
+                self._hits += 1
+            else:
+                self._misses += 1
+
+    def _blob_path(self, content_hash: str) -> Path:
+        """コンテンツハッシュに対応する画像ファイルのパス"""
+        return self._blobs_dir / content_hash[:2] / content_hash
+
+    def _published_path(self, content_hash: str) -> Path:
+        """コンテンツハッシュに対応する公開済みの画像ファイルのパス"""
+        return self._published_dir / content_hash[:2] / content_hash
+
+    def _key_path(self, key: str) -> Path:
+        """キーに対応するインデックスファイルのパス"""
+        return self._keys_dir / hashlib.sha256(key.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def _touch(path: Path) -> None:
+        """最終参照時刻を更新する (削除済みの場合は何もしない)"""
+        with contextlib.suppress(FileNotFoundError):
+            os.utime(path)
+
+    @staticmethod
+    def _write_atomic(path: Path, data: bytes) -> None:
+        """一時ファイルに書き込んでからリネームし、書きかけのファイルを公開しない"""
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as tmp_file:
+                tmp_file.write(data)
+            Path(tmp_name).replace(path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
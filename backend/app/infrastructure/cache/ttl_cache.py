@@ -0,0 +1,110 @@
+"""TTL付きインメモリキャッシュ
+
+有効期限と最大エントリ数を持つ、スレッドセーフなLRUキャッシュを提供します。
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+
+from pydantic import BaseModel, ConfigDict, Field
+
+from app.config import CACHE_TTL_SECONDS
+
+
+class CacheStats(BaseModel):
+    """キャッシュの統計"""
+
+    model_config = ConfigDict(frozen=True)
+
+    hits: int = Field(ge=0, description="キャッシュヒット数")
+    misses: int = Field(ge=0, description="キャッシュミス数 (期限切れを含む)")
+    size: int = Field(ge=0, description="保持しているエントリ数")
+    max_entries: int = Field(ge=1, description="保持できるエントリ数の上限")
+
+
+class TtlCache[K: Hashable, V]:
+    """TTL付きのLRUキャッシュ
+
+    有効期限を過ぎたエントリは参照時に削除し、エントリ数が上限を超えた場合は
+    最も長く参照されていないエントリから削除します。
+    同期Gatewayから複数スレッドで共有されるため、操作はロックで保護します。
+    """
+
+    def __init__(
+        self,
+        max_entries: int,
+        ttl_seconds: float = CACHE_TTL_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """初期化
+
+        Args:
+            max_entries: 保持できるエントリ数の上限
+            ttl_seconds: エントリの有効期間 (秒)
+            clock: 現在時刻 (秒) を返す関数 (テスト用)
+        """
+        if max_entries < 1:
+            raise ValueError("max_entries は1以上を指定してください")
+        self._max_entries = max_entries
+        self._ttl_seconds = ttl_seconds
+        self._clock = clock
+        # キー -> (有効期限, 値)
+        self._entries: OrderedDict[K, tuple[float, V]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def get(self, key: K) -> V | None:
+        """キャッシュから値を取得
+
+        Args:
+            key: キー
+
+        Returns:
+            V | None: キャッシュされた値 (存在しないか期限切れの場合はNone)
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] <= self._clock():
+                if entry is not None:
+                    del self._entries[key]
+                self._misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return entry[1]
+
+    def set(self, key: K, value: V) -> None:
+        """キャッシュに値を保存
+
+        Args:
+            key: キー
+            value: 値
+        """
+        with self._lock:
+            self._entries[key] = (self._clock() + self._ttl_seconds, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """すべてのエントリを削除する"""
+        with self._lock:
+            self._entries.clear()
+
+    def get_stats(self) -> CacheStats:
+        """キャッシュの統計を取得
+
+        Returns:
+            CacheStats: ヒット数・ミス数・エントリ数
+        """
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                size=len(self._entries),
+                max_entries=self._max_entries,
+            )
@@ -0,0 +1,12 @@
+"""並行処理ユーティリティ
+
+外部サービス呼び出しの並行実行を制御する部品を定義します。
+"""
+
+from app.infrastructure.concurrency.single_flight import (
+    AsyncSingleFlight,
+    SingleFlight,
+    SingleFlightStats,
+)
+
+__all__ = ["AsyncSingleFlight", "SingleFlight", "SingleFlightStats"]
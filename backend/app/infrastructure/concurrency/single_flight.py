@@ -0,0 +1,172 @@
+"""単一実行 (single-flight) による呼び出しの集約
+
+同じキーで同時に実行中の呼び出しを1つにまとめ、結果や例外を待機中の呼び出し元で共有します。
+"""
+
+import asyncio
+import threading
+from collections.abc import Awaitable, Callable, Hashable
+from typing import cast
+
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class SingleFlightStats(BaseModel):
+    """呼び出し集約の統計"""
+
+    model_config = ConfigDict(frozen=True)
+
+    calls: int = Field(ge=0, description="実際に実行した呼び出し数")
+    shared: int = Field(ge=0, description="実行中の呼び出しの結果を共有した回数")
+
+
+class _Call[T]:
+    """実行中の呼び出し (同期版)"""
+
+    def __init__(self) -> None:
+        """初期化"""
+        self.done = threading.Event()
+        self.result: T | None = None
+        self.error: BaseException | None = None
+
+
+class SingleFlight:
+    """スレッド間で同一キーの呼び出しを集約する
+
+    最初の呼び出し元が処理を実行し、同じキーで後から呼び出したスレッドは
+    その完了を待って同じ結果を受け取ります (例外の場合は同じ例外を送出します)。
+    完了後の呼び出しは新たに実行されるため、結果のキャッシュは行いません。
+    """
+
+    def __init__(self) -> None:
+        """初期化"""
+        self._lock = threading.Lock()
+        self._in_flight: dict[Hashable, _Call] = {}
+        self._calls = 0
+        self._shared = 0
+
+    def run[T](self, key: Hashable, func: Callable[[], T]) -> T:
+        """キーごとに集約して関数を実行する
+
+        Args:
+            key: 呼び出しを識別するキー
+            func: 実行する関数
+
+        Returns:
+            T: 関数の戻り値 (他のスレッドが実行した結果を含む)
+        """
+        with self._lock:
+            call: _Call[T] | None = self._in_flight.get(key)
+            is_leader = call is None
+            if call is None:
+                call = _Call()
+                self._in_flight[key] = call
+                self._calls += 1
+            else:
+                self._shared += 1
+
+        if not is_leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return cast("T", call.result)
+
+        try:
+            call.result = func()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._in_flight[key]
+            call.done.set()
+
+    def get_stats(self) -> SingleFlightStats:
+        """呼び出し集約の統計を取得
+
+        Returns:
+            SingleFlightStats: 実行数と共有数
+        """
+        with self._lock:
+            return SingleFlightStats(calls=self._calls, shared=self._shared)
+
+
+class AsyncSingleFlight:
+    """イベントループ上で同一キーのコルーチン呼び出しを集約する
+
+    最初の呼び出しでタスクを作成し、同じキーで実行中の呼び出し元はそのタスクを待ちます。
+    一部の呼び出し元がキャンセルされたり待ち時間を過ぎたりしても、他の呼び出し元のために
+    タスクは継続し、待っている呼び出し元がいなくなった時点でキャンセルします。
+    """
+
+    def __init__(self) -> None:
+        """初期化"""
+        self._in_flight: dict[Hashable, asyncio.Task] = {}
+        self._waiters: dict[asyncio.Task, int] = {}
+        self._calls = 0
+        self._shared = 0
+
+    async def run[T](
+        self, key: Hashable, func: Callable[[], Awaitable[T]], timeout: float | None = None
+    ) -> T:
+        """キーごとに集約してコルーチン関数を実行する
+
+        Args:
+            key: 呼び出しを識別するキー
+            func: 実行するコルーチン関数
+            timeout: この呼び出し元が結果を待つ秒数 (Noneの場合は完了まで待つ)
+
+        Returns:
+            T: コルーチンの戻り値 (他の呼び出し元が開始した結果を含む)
+
+        Raises:
+            TimeoutError: timeout までに実行が完了しなかった場合
+        """
+        task = self._in_flight.get(key)
+        if task is not None:
+            self._shared += 1
+        else:
+            task = asyncio.ensure_future(func())
+            self._in_flight[key] = task
+            self._calls += 1
+            task.add_done_callback(lambda done_task: self._on_done(key, done_task))
+        self._waiters[task] = self._waiters.get(task, 0) + 1
+        try:
+            if timeout is None:
+                return await asyncio.shield(task)
+            # NOTE: asyncio.wait は待ち時間を過ぎても待機対象をキャンセルしない
+            done, _ = await asyncio.wait({task}, timeout=max(timeout, 0.0))
+            if not done:
+                raise TimeoutError(f"Timed out waiting for in-flight call: {key!r}")
+            return task.result()
+        finally:
+            self._leave(key, task)
+
+    def get_stats(self) -> SingleFlightStats:
+        """呼び出し集約の統計を取得
+
+        Returns:
+            SingleFlightStats: 実行数と共有数
+        """
+        return SingleFlightStats(calls=self._calls, shared=self._shared)
+
+    def _leave(self, key: Hashable, task: asyncio.Task) -> None:
+        """呼び出し元の待機を終え、待っている呼び出し元がいなければタスクをキャンセルする"""
+        self._waiters[task] -= 1
+        if self._waiters[task] > 0:
+            return
+        del self._waiters[task]
+        if not task.done():
+            # NOTE: 後から同じキーで呼び出した場合は、キャンセル中のタスクを待たずに新たに実行する
+            if self._in_flight.get(key) is task:
+                del self._in_flight[key]
+            task.cancel()
+
+    def _on_done(self, key: Hashable, task: asyncio.Task) -> None:
+        """完了したタスクを実行中の一覧から外す"""
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+        # NOTE: すべての呼び出し元がキャンセルされた場合に未取得の例外として警告されないようにする
+        if not task.cancelled():
+            task.exception()
@@ -3,6 +3,20 @@
 外部サービスへのGateway実装を定義します。
 """
 
+from app.infrastructure.gateways.async_google_maps_gateway_impl import AsyncGoogleMapsGatewayImpl
+from app.infrastructure.gateways.disk_image_storage_gateway_impl import DiskImageStorageGatewayImpl
 from app.infrastructure.gateways.google_maps_gateway_impl import GoogleMapsGatewayImpl
+from app.infrastructure.gateways.in_memory_landmark_catalog_gateway_impl import (
+    InMemoryLandmarkCatalogGatewayImpl,
+)
+from app.infrastructure.gateways.sqlite_landmark_catalog_gateway_impl import (
+    SqliteLandmarkCatalogGatewayImpl,
+)
 
-__all__ = ["GoogleMapsGatewayImpl"]
+__all__ = [
+    "AsyncGoogleMapsGatewayImpl",
+    "DiskImageStorageGatewayImpl",
+    "GoogleMapsGatewayImpl",
+    "InMemoryLandmarkCatalogGatewayImpl",
+    "SqliteLandmarkCatalogGatewayImpl",
+]
@@ -0,0 +1,784 @@
+"""非同期Google Maps Gateway実装
+
+httpxを使用して、Google Maps APIへのリクエストをイベントループ上で非同期に処理します。
+"""
+
+import asyncio
+import json
+import logging
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Literal
+
+import httpx
+from tenacity import (
+    retry,
+    retry_if_exception_type,
+    stop_after_attempt,
+    wait_exponential,
+)
+
+from app.application.deadline import Deadline
+from app.application.gateway_interfaces.async_google_maps_gateway import AsyncGoogleMapsGateway
+from app.application.gateway_interfaces.google_maps_gateway import StreetViewMetadata
+from app.config import (
+    LANDMARK_INCLUDED_TYPES,
+    REQUEST_TIMEOUT_SECONDS,
+)
+from app.domain.exceptions import (
+    ExternalServiceDeadlineExceededError,
+    ExternalServiceError,
+    ExternalServiceTimeoutError,
+)
+from app.domain.value_objects import Coordinate, ImageSize, Landmark
+from app.infrastructure import mappers
+from app.infrastructure.cache import CompactRoute, DiskImageStore, TtlCache
+from app.infrastructure.concurrency import AsyncSingleFlight
+from app.infrastructure.gateways import google_maps_api
+from app.infrastructure.http import AsyncPooledHttpTransport
+from app.infrastructure.resilience import CircuitBreaker, HedgingPolicy, RateLimiter
+
+logger = logging.getLogger(__name__)
+
+
+class RetryableHTTPStatusError(httpx.HTTPStatusError):
+    """429/503エラー用のリトライ可能な例外"""
+
+
+class AsyncGoogleMapsGatewayImpl(AsyncGoogleMapsGateway):
+    """Google Maps API非同期Gatewayの実装"""
+
+    def __init__(
+        self,
+        transport: AsyncPooledHttpTransport | None = None,
+        metadata_cache: TtlCache[Coordinate, StreetViewMetadata] | None = None,
+        places_cache: TtlCache[google_maps_api.SearchNearbyCacheKey, list[Landmark]] | None = None,
+        directions_cache: TtlCache[google_maps_api.DirectionsCacheKey, CompactRoute] | None = None,
+        image_store: DiskImageStore | None = None,
+        single_flight: AsyncSingleFlight | None = None,
+        circuit_breakers: dict[str, CircuitBreaker] | None = None,
+        rate_limiters: dict[str, RateLimiter] | None = None,
+        hedging_policies: dict[str, HedgingPolicy] | None = None,
+    ) -> None:
+        """初期化
+
+        Args:
+            transport: 非同期HTTPトランスポート (Noneの場合はデフォルト設定のプールを生成)
+            metadata_cache: Street Viewメタデータのキャッシュ (Noneの場合はキャッシュしない)
+            places_cache: Places searchNearbyのキャッシュ (Noneの場合はキャッシュしない)
+            directions_cache: Directionsのキャッシュ (Noneの場合はキャッシュしない)
+            image_store: Street View画像のディスクストア (Noneの場合は保存しない)
+            single_flight: 同時に実行中の同一リクエストを集約する仕組み (Noneの場合は新規に生成)
+            circuit_breakers: 外部サービス名ごとのサーキットブレーカー
+                (Noneの場合や含まれないサービスはブレーカーを通さない)
+            rate_limiters: 外部サービス名ごとのレート制限
+                (Noneの場合や含まれないサービスは制限しない)
+            hedging_policies: 外部サービス名ごとのヘッジリクエストのポリシー
+                (Noneの場合や含まれないサービスは追加のリクエストを送信しない)
+        """
+        self._transport = transport if transport is not None else AsyncPooledHttpTransport()
+        self._metadata_cache = metadata_cache
+        self._places_cache = places_cache
+        self._directions_cache = directions_cache
+        self._image_store = image_store
+        # NOTE: キャッシュの有無に関わらず、同時に実行中の同一リクエストは1回にまとめる
+        self._single_flight = single_flight if single_flight is not None else AsyncSingleFlight()
+        self._circuit_breakers = dict(circuit_breakers) if circuit_breakers is not None else {}
+        self._rate_limiters = dict(rate_limiters) if rate_limiters is not None else {}
+        self._hedging_policies = dict(hedging_policies) if hedging_policies is not None else {}
+
+    def get_stats(self) -> dict:
+        """運用監視用の統計情報を取得
+
+        Returns:
+            dict: ホストごとのコネクションプール統計とキャッシュ統計
+        """
+        stats: dict = {
+            "http_pools": [
+                {**pool_stats.model_dump(), "connections_reused": pool_stats.connections_reused}
+                for pool_stats in self._transport.get_stats()
+            ],
+            "single_flight": self._single_flight.get_stats().model_dump(),
+        }
+        if self._metadata_cache is not None:
+            stats["street_view_metadata_cache"] = self._metadata_cache.get_stats().model_dump()
+        if self._places_cache is not None:
+            stats["places_cache"] = self._places_cache.get_stats().model_dump()
+        if self._directions_cache is not None:
+            stats["directions_cache"] = self._directions_cache.get_stats().model_dump()
+        if self._image_store is not None:
+            stats["street_view_image_store"] = self._image_store.get_stats().model_dump()
+        if self._circuit_breakers:
+            stats["circuit_breakers"] = {
+                service_name: breaker.get_stats().model_dump()
+                for service_name, breaker in self._circuit_breakers.items()
+            }
+        if self._rate_limiters:
+            stats["rate_limiters"] = {
+                service_name: limiter.get_stats().model_dump()
+                for service_name, limiter in self._rate_limiters.items()
+            }
+        if self._hedging_policies:
+            stats["hedging"] = {
+                service_name: policy.get_stats().model_dump()
+                for service_name, policy in self._hedging_policies.items()
+            }
+        return stats
+
+    async def _call_api[**P, T](
+        self,
+        service_name: str,
+        deadline: Deadline | None,
+        func: Callable[P, Awaitable[T]],
+        /,
+        *args: P.args,
+        **kwargs: P.kwargs,
+    ) -> T:
+        """サービスのレート制限とサーキットブレーカーを通して外部APIを呼び出す
+
+        レート制限の待ちや期限切れで失敗した呼び出しは外部APIの障害ではないため、
+        ブレーカーの失敗率には含めない。ブレーカーを通した後に期限を過ぎた場合も
+        ExternalServiceDeadlineExceededError として失敗率から除外される。
+
+        Args:
+            service_name: 外部サービス名
+            deadline: リクエストの期限 (Noneの場合は期限を確認しない)
+            func: 外部APIを呼び出すコルーチン関数
+            *args: funcの位置引数
+            **kwargs: funcのキーワード引数
+
+        Returns:
+            T: funcの戻り値
+
+        Raises:
+            ExternalServiceError: レート制限の待ち時間が上限を超える場合、
+                またはサーキットブレーカーがオープンしている場合
+            ExternalServiceDeadlineExceededError: 期限を過ぎた場合、
+                またはレート制限の待機中に期限を過ぎる場合 (トークンは消費しない)
+        """
+        self._check_deadline(service_name, deadline)
+        limiter = self._rate_limiters.get(service_name)
+        if limiter is not None:
+            await limiter.acquire_async(
+                deadline.remaining_seconds() if deadline is not None else None
+            )
+        breaker = self._circuit_breakers.get(service_name)
+        if breaker is None:
+            return await func(*args, **kwargs)
+        return await breaker.call_async(lambda: func(*args, **kwargs))
+
+    async def _call_api_hedged[**P, T](
+        self,
+        service_name: str,
+        deadline: Deadline | None,
+        func: Callable[P, Awaitable[T]],
+        /,
+        *args: P.args,
+        **kwargs: P.kwargs,
+    ) -> T:
+        """サービスのヘッジリクエストのポリシーに従って外部APIを呼び出す
+
+        追加のリクエストもレート制限とサーキットブレーカーを通すため、
+        クォータの消費と失敗率には送信したすべてのリクエストが含まれる。
+
+        Args:
+            service_name: 外部サービス名
+            deadline: リクエストの期限 (Noneの場合は期限を確認しない)
+            func: 外部APIを呼び出すコルーチン関数
+            *args: funcの位置引数
+            **kwargs: funcのキーワード引数
+
+        Returns:
+            T: 先に成功したリクエストの戻り値
+        """
+        policy = self._hedging_policies.get(service_name)
+        if policy is None:
+            return await self._call_api(service_name, deadline, func, *args, **kwargs)
+        return await policy.run(
+            lambda: self._call_api(service_name, deadline, func, *args, **kwargs)
+        )
+
+    async def _run_shared[T](
+        self,
+        key: Hashable,
+        service_name: str,
+        deadline: Deadline | None,
+        func: Callable[[], Awaitable[T]],
+    ) -> T:
+        """同一キーで実行中の呼び出しを集約して外部APIを呼び出す
+
+        集約した呼び出しは他の呼び出し元と共有するため、呼び出し元ごとの期限を渡さずに実行し、
+        期限は各呼び出し元が結果を待つ時間として適用する。
+        期限の短い呼び出し元のタイムアウトが、期限の長い呼び出し元に伝播しないようにするため。
+
+        Args:
+            key: 呼び出しを識別するキー
+            service_name: 外部サービス名
+            deadline: この呼び出し元の期限 (Noneの場合は完了まで待つ)
+            func: 期限なしで外部APIを呼び出すコルーチン関数
+
+        Returns:
+            T: funcの戻り値 (他の呼び出し元が開始した結果を含む)
+
+        Raises:
+            ExternalServiceDeadlineExceededError: 結果を受け取る前に期限を過ぎた場合
+        """
+        self._check_deadline(service_name, deadline)
+        timeout = deadline.remaining_seconds() if deadline is not None else None
+        try:
+            return await self._single_flight.run(key, func, timeout=timeout)
+        except TimeoutError as e:
+            raise ExternalServiceDeadlineExceededError(
+                f"Deadline exceeded while waiting for {service_name}",
+                service_name=service_name,
+            ) from e
+
+    @staticmethod
+    def _check_deadline(service_name: str, deadline: Deadline | None) -> None:
+        """期限を過ぎていれば外部APIを呼び出さずにタイムアウトとする"""
+        if deadline is not None and deadline.expired():
+            raise ExternalServiceDeadlineExceededError(
+                f"Deadline exceeded before calling {service_name}",
+                service_name=service_name,
+            )
+
+    async def aclose(self) -> None:
+        """保持しているコネクションをすべて閉じる"""
+        await self._transport.aclose()
+
+    async def get_directions(
+        self,
+        origin: Coordinate,
+        destination: Coordinate,
+        waypoints: list[Coordinate] | None = None,
+        deadline: Deadline | None = None,
+    ) -> tuple[list[Coordinate], str]:
+        """ルート情報を取得
+
+        Args:
+            origin: 出発地の座標
+            destination: 目的地の座標
+            waypoints: 経由地の座標リスト (通過点として扱われる)
+            deadline: リクエストの期限 (Noneの場合はタイムアウトを切り詰めない)
+
+        Returns:
+            tuple[list[Coordinate], str]:
+                (ルート座標リスト, overview_polyline文字列)
+        """
+        cache_key: google_maps_api.DirectionsCacheKey = (
+            google_maps_api.format_coordinate(origin),
+            google_maps_api.format_coordinate(destination),
+            google_maps_api.format_waypoints(waypoints),
+        )
+        if self._directions_cache is not None:
+            cached_route = self._directions_cache.get(cache_key)
+            if cached_route is not None:
+                return cached_route.to_result()
+
+        data = await self._call_api(
+            google_maps_api.DIRECTIONS_SERVICE_NAME,
+            deadline,
+            self._fetch_directions,
+            *cache_key,
+            deadline=deadline,
+        )
+        # NOTE: 座標オブジェクトは戻り値を作るときに一度だけ生成する
+        route = CompactRoute(*mappers.map_directions_response_arrays(data))
+        if self._directions_cache is not None:
+            self._directions_cache.set(cache_key, route)
+        return route.to_result()
+
+    async def _fetch_directions(
+        self,
+        origin: str,
+        destination: str,
+        waypoints: str = "",
+        deadline: Deadline | None = None,
+    ) -> dict:
+        """Google Directions APIからルート情報を取得
+
+        Args:
+            origin: 出発地の座標 ("緯度,経度"形式の文字列)
+            destination: 目的地の座標 ("緯度,経度"形式の文字列)
+            waypoints: 経由地 ("via:緯度,経度|via:緯度,経度"形式、空文字列は経由地なし)
+            deadline: リクエストの期限 (タイムアウトを残り時間で切り詰める)
+
+        Returns:
+            dict: Directions APIのレスポンスJSON
+        """
+        params = google_maps_api.build_directions_params(origin, destination, waypoints)
+
+        try:
+            response = await self._transport.get(
+                google_maps_api.DIRECTIONS_API_URL,
+                params=params,
+                timeout=google_maps_api.request_timeout(
+                    deadline, google_maps_api.DIRECTIONS_SERVICE_NAME
+                ),
+            )
+            response.raise_for_status()
+            return response.json()
+        except httpx.TimeoutException as e:
+            logger.error("Timeout error while fetching directions.")
+            raise google_maps_api.timeout_error(
+                "Request timeout: Failed to retrieve directions",
+                google_maps_api.DIRECTIONS_SERVICE_NAME,
+                deadline,
+            ) from e
+        except (httpx.HTTPError, json.JSONDecodeError) as e:
+            logger.error(f"Request error while fetching directions: {e}")
+            raise ExternalServiceError(
+                f"Failed to retrieve directions: {e}",
+                service_name=google_maps_api.DIRECTIONS_SERVICE_NAME,
+            ) from e
+
+    async def get_street_view_metadata(
+        self, coordinate: Coordinate, deadline: Deadline | None = None
+    ) -> StreetViewMetadata:
+        """Street Viewメタデータを取得
+
+        Args:
+            coordinate: 座標
+            deadline: リクエストの期限 (結果を待つ時間に適用する。Noneの場合は完了まで待つ)
+
+        Returns:
+            StreetViewMetadata: メタデータ
+
+        Raises:
+            ExternalServiceValidationError: メタデータが不完全または無効な場合
+        """
+        normalized_coordinate = google_maps_api.normalize_coordinate(coordinate)
+        if self._metadata_cache is not None:
+            cached_metadata = self._metadata_cache.get(normalized_coordinate)
+            if cached_metadata is not None:
+                return cached_metadata
+
+        metadata_dict = await self._run_shared(
+            ("street_view_metadata", normalized_coordinate),
+            google_maps_api.STREET_VIEW_METADATA_SERVICE_NAME,
+            deadline,
+            lambda: self._call_api_hedged(
+                google_maps_api.STREET_VIEW_METADATA_SERVICE_NAME,
+                None,
+                self._fetch_street_view_metadata,
+                normalized_coordinate,
+            ),
+        )
+        metadata = mappers.map_street_view_metadata_response(metadata_dict)
+        if (
+            self._metadata_cache is not None
+            and metadata.status in google_maps_api.STREET_VIEW_METADATA_CACHEABLE_STATUSES
+        ):
+            self._metadata_cache.set(normalized_coordinate, metadata)
+        return metadata
+
+    async def _fetch_street_view_metadata(self, coordinate: Coordinate) -> dict:
+        """Street View Metadata APIからメタデータを取得
+
+        Args:
+            coordinate: 座標
+
+        Returns:
+            dict: メタデータ
+        """
+        params = google_maps_api.build_street_view_metadata_params(coordinate)
+
+        try:
+            response = await self._transport.get(
+                google_maps_api.STREET_VIEW_METADATA_API_URL,
+                params=params,
+                timeout=REQUEST_TIMEOUT_SECONDS,
+            )
+            response.raise_for_status()
+            return response.json()
+        except httpx.TimeoutException as e:
+            logger.error(
+                "Timeout error while fetching Street View metadata for a requested location."
+            )
+            raise ExternalServiceTimeoutError(
+                "Request timeout: Failed to retrieve Street View metadata",
+                service_name=google_maps_api.STREET_VIEW_METADATA_SERVICE_NAME,
+            ) from e
+        except (httpx.HTTPError, json.JSONDecodeError) as e:
+            logger.error(f"Request error while fetching Street View metadata: {e}")
+            raise ExternalServiceError(
+                f"Failed to retrieve Street View metadata: {e}",
+                service_name=google_maps_api.STREET_VIEW_METADATA_SERVICE_NAME,
+            ) from e
+
+    async def get_street_view_image(
+        self,
+        coordinate: Coordinate,
+        image_size: ImageSize,
+        heading: float | None = None,
+        deadline: Deadline | None = None,
+    ) -> bytes:
+        """Street View画像を取得
+
+        Args:
+            coordinate: 座標
+            image_size: 画像サイズ
+            heading: カメラの方向 (0-360度、北が0度、時計回り)。Noneの場合はデフォルト方向
+            deadline: リクエストの期限 (Noneの場合はタイムアウトを切り詰めない)
+
+        Returns:
+            bytes: 画像データ
+        """
+        normalized_coordinate = google_maps_api.normalize_coordinate(coordinate)
+        if self._image_store is None:
+            normalized_heading = google_maps_api.normalize_heading(heading)
+            return await self._call_api_hedged(
+                google_maps_api.STREET_VIEW_IMAGE_SERVICE_NAME,
+                deadline,
+                self._fetch_street_view_image,
+                normalized_coordinate,
+                image_size,
+                normalized_heading,
+                deadline=deadline,
+            )
+
+        # NOTE: 同じ向きの画像を共有するため、headingを丸めて問い合わせる
+        quantized_heading = google_maps_api.quantize_heading(heading)
+        cache_key = google_maps_api.build_street_view_image_cache_key(
+            normalized_coordinate, image_size, quantized_heading
+        )
+        # ファイルI/Oでイベントループを止めないよう、ストアの操作はスレッドで実行する
+        cached_image = await asyncio.to_thread(self._image_store.get, cache_key)
+        if cached_image is not None:
+            return cached_image
+
+        image = await self._call_api_hedged(
+            google_maps_api.STREET_VIEW_IMAGE_SERVICE_NAME,
+            deadline,
+            self._fetch_street_view_image,
+            normalized_coordinate,
+            image_size,
+            quantized_heading,
+            deadline=deadline,
+        )
+        await asyncio.to_thread(self._image_store.put, cache_key, image)
+        return image
+
+    async def _fetch_street_view_image(
+        self,
+        coordinate: Coordinate,
+        image_size: ImageSize,
+        heading: float | None = None,
+        deadline: Deadline | None = None,
+    ) -> bytes:
+        """Street View Static APIから画像を取得
+
+        Args:
+            coordinate: 座標
+            image_size: 画像サイズ
+            heading: カメラの方向 (0-360度、北が0度、時計回り)。Noneの場合はデフォルト方向
+            deadline: リクエストの期限 (タイムアウトを残り時間で切り詰める)
+
+        Returns:
+            bytes: 画像データ
+        """
+        params = google_maps_api.build_street_view_image_params(coordinate, image_size, heading)
+
+        try:
+            response = await self._transport.get(
+                google_maps_api.STREET_VIEW_IMAGE_API_URL,
+                params=params,
+                timeout=google_maps_api.request_timeout(
+                    deadline, google_maps_api.STREET_VIEW_IMAGE_SERVICE_NAME
+                ),
+            )
+            response.raise_for_status()
+            return response.content
+        except httpx.TimeoutException as e:
+            logger.error("Timeout error while fetching Street View image for a requested location.")
+            raise google_maps_api.timeout_error(
+                "Request timeout: Failed to retrieve Street View image",
+                google_maps_api.STREET_VIEW_IMAGE_SERVICE_NAME,
+                deadline,
+            ) from e
+        except (httpx.HTTPError, json.JSONDecodeError) as e:
+            logger.error(f"Request error while fetching Street View image: {e}")
+            raise ExternalServiceError(
+                f"Failed to retrieve Street View image: {e}",
+                service_name=google_maps_api.STREET_VIEW_IMAGE_SERVICE_NAME,
+            ) from e
+
+    async def search_landmarks_nearby(
+        self,
+        coordinate: Coordinate,
+        radius: int,
+        included_types: list[str] | None = None,
+        rank_preference: Literal["POPULARITY", "DISTANCE"] = "POPULARITY",
+        deadline: Deadline | None = None,
+    ) -> list[Landmark]:
+        """Places API (New) でランドマーク検索
+
+        Args:
+            coordinate: 検索中心座標
+            radius: 検索半径 (メートル)
+            included_types: 検索対象のタイプリスト (Noneの場合はデフォルトタイプを使用)
+            rank_preference: ソート順 ("POPULARITY" または "DISTANCE")
+            deadline: リクエストの期限 (結果を待つ時間に適用する。Noneの場合は完了まで待つ)
+
+        Returns:
+            list[Landmark]: ランドマークのリスト
+
+        Raises:
+            ExternalServiceError: API呼び出しエラーが発生した場合
+        """
+        if included_types is None:
+            included_types = LANDMARK_INCLUDED_TYPES
+
+        if self._places_cache is None:
+            search_center = google_maps_api.normalize_coordinate(coordinate)
+            search_radius = radius
+        else:
+            # NOTE: 同じタイルの検索結果を共有するため、検索範囲を量子化して問い合わせる
+            search_center, search_radius = google_maps_api.quantize_search_nearby_area(
+                coordinate, radius
+            )
+        cache_key = google_maps_api.build_search_nearby_cache_key(
+            search_center, search_radius, included_types, rank_preference
+        )
+        if self._places_cache is not None:
+            cached_landmarks = self._places_cache.get(cache_key)
+            if cached_landmarks is not None:
+                return list(cached_landmarks)
+
+        places = await self._run_shared(
+            ("places", cache_key),
+            google_maps_api.PLACES_SERVICE_NAME,
+            deadline,
+            lambda: self._call_api(
+                google_maps_api.PLACES_SERVICE_NAME,
+                None,
+                self._search_nearby_once,
+                search_center,
+                search_radius,
+                included_types,
+                rank_preference,
+            ),
+        )
+        landmarks = mappers.map_places_response(places)
+        if self._places_cache is not None:
+            self._places_cache.set(cache_key, landmarks)
+            return list(landmarks)
+        return landmarks
+
+    @retry(
+        stop=stop_after_attempt(3),
+        wait=wait_exponential(multiplier=1, min=1, max=10),
+        retry=retry_if_exception_type((RetryableHTTPStatusError, httpx.NetworkError)),
+    )
+    async def _search_nearby_once(
+        self,
+        coordinate: Coordinate,
+        radius: int,
+        included_types: list[str],
+        rank_preference: str = "POPULARITY",
+    ) -> list[dict]:
+        """Places API v1 searchNearbyを1回呼び出す (リトライ付き)
+
+        Args:
+            coordinate: 検索中心座標
+            radius: 検索半径 (メートル)
+            included_types: 検索対象のタイプリスト
+            rank_preference: ソート順 ("POPULARITY" または "DISTANCE")
+
+        Returns:
+            list[dict]: Places APIのレスポンス (placesリスト)
+
+        Raises:
+            ExternalServiceError: API呼び出しエラーが発生した場合
+            ExternalServiceTimeoutError: タイムアウトした場合
+        """
+        request_body, headers = google_maps_api.build_search_nearby_request(
+            coordinate, radius, included_types, rank_preference
+        )
+
+        try:
+            response = await self._transport.post(
+                google_maps_api.PLACES_SEARCH_NEARBY_API_URL,
+                json=request_body,
+                headers=headers,
+                timeout=REQUEST_TIMEOUT_SECONDS,
+            )
+
+            # 429/503エラーはリトライ可能な例外として発生
+            if response.status_code in [429, 503]:
+                raise RetryableHTTPStatusError(
+                    f"HTTP {response.status_code}: {response.reason_phrase}",
+                    request=response.request,
+                    response=response,
+                )
+
+            # エラーレスポンスの詳細をログ出力
+            if response.status_code >= 400:
+                logger.error(f"Places API error response: {response.text}")
+
+            # その他のエラーは通常通り例外を発生 (リトライしない)
+            response.raise_for_status()
+
+            data = response.json()
+            return data.get("places", [])
+
+        except httpx.TimeoutException as e:
+            logger.error("Timeout error while fetching landmarks.")
+            raise ExternalServiceTimeoutError(
+                "Request timeout: Failed to retrieve landmarks",
+                service_name=google_maps_api.PLACES_SERVICE_NAME,
+            ) from e
+        except (RetryableHTTPStatusError, httpx.NetworkError):
+            # リトライ可能なエラーはそのまま再発生 (tenacityが処理)
+            raise
+        except (httpx.HTTPError, json.JSONDecodeError) as e:
+            logger.error(f"Request error while fetching landmarks: {e}")
+            raise ExternalServiceError(
+                f"Failed to retrieve landmarks: {e}",
+                service_name=google_maps_api.PLACES_SERVICE_NAME,
+            ) from e
+
+    async def snap_to_road(
+        self, coordinate: Coordinate, deadline: Deadline | None = None
+    ) -> Coordinate | None:
+        """Roads API (Nearest Roads) を使用して、指定された座標を最寄りの道路中心線にスナップする
+
+        Args:
+            coordinate: スナップする座標
+            deadline: リクエストの期限 (結果を待つ時間に適用する。Noneの場合は完了まで待つ)
+
+        Returns:
+            Coordinate | None: スナップされた座標。道路が見つからない場合は None
+
+        Raises:
+            ExternalServiceError: API呼び出しエラーが発生した場合
+            ExternalServiceTimeoutError: API呼び出しがタイムアウトした場合
+        """
+        normalized_coordinate = google_maps_api.normalize_coordinate(coordinate)
+        return await self._run_shared(
+            ("snap_to_road", normalized_coordinate),
+            google_maps_api.ROADS_SERVICE_NAME,
+            deadline,
+            lambda: self._call_api(
+                google_maps_api.ROADS_SERVICE_NAME,
+                None,
+                self._snap_to_road,
+                normalized_coordinate,
+            ),
+        )
+
+    async def _snap_to_road(self, coordinate: Coordinate) -> Coordinate | None:
+        """Roads API (Nearest Roads) から座標を道路上にスナップ
+
+        Args:
+            coordinate: スナップする座標
+
+        Returns:
+            Coordinate | None: スナップされた座標。道路が見つからない場合は None
+
+        Raises:
+            ExternalServiceError: API呼び出しエラーが発生した場合
+            ExternalServiceTimeoutError: API呼び出しがタイムアウトした場合
+        """
+        params = google_maps_api.build_nearest_roads_params(coordinate)
+
+        try:
+            response = await self._transport.get(
+                google_maps_api.ROADS_NEAREST_API_URL,
+                params=params,
+                timeout=REQUEST_TIMEOUT_SECONDS,
+            )
+            response.raise_for_status()
+            return mappers.map_nearest_roads_response(response.json(), coordinate)
+
+        except httpx.TimeoutException as e:
+            logger.error("Timeout error while snapping coordinate to road.")
+            raise ExternalServiceTimeoutError(
+                "Request timeout: Failed to snap coordinate to road",
+                service_name=google_maps_api.ROADS_SERVICE_NAME,
+            ) from e
+        except (httpx.HTTPError, json.JSONDecodeError) as e:
+            logger.error(f"Request error while snapping coordinate to road: {e}")
+            raise ExternalServiceError(
+                f"Failed to snap coordinate to road: {e}",
+                service_name=google_maps_api.ROADS_SERVICE_NAME,
+            ) from e
+
+    async def snap_to_roads(
+        self, coordinates: list[Coordinate], deadline: Deadline | None = None
+    ) -> list[Coordinate | None]:
+        """Roads API (Nearest Roads) を使用して、複数の座標を1回の呼び出しで道路中心線にスナップする
+
+        1リクエストあたりROADS_NEAREST_MAX_POINTS件ずつに分割して問い合わせる。
+
+        Args:
+            coordinates: スナップする座標のリスト
+            deadline: リクエストの期限 (Noneの場合はタイムアウトを切り詰めない)
+
+        Returns:
+            list[Coordinate | None]: 入力と同じ順のスナップされた座標。
+                道路が見つからない座標は None
+
+        Raises:
+            ExternalServiceError: API呼び出しエラーが発生した場合
+            ExternalServiceTimeoutError: API呼び出しがタイムアウトした場合
+        """
+        normalized_coordinates = [
+            google_maps_api.normalize_coordinate(coordinate) for coordinate in coordinates
+        ]
+        max_points = google_maps_api.ROADS_NEAREST_MAX_POINTS
+        results: list[Coordinate | None] = []
+        for start in range(0, len(normalized_coordinates), max_points):
+            chunk = normalized_coordinates[start : start + max_points]
+            results.extend(
+                await self._call_api(
+                    google_maps_api.ROADS_SERVICE_NAME,
+                    deadline,
+                    self._snap_to_roads,
+                    chunk,
+                    deadline=deadline,
+                )
+            )
+        return results
+
+    async def _snap_to_roads(
+        self, coordinates: list[Coordinate], deadline: Deadline | None = None
+    ) -> list[Coordinate | None]:
+        """Roads API (Nearest Roads) から複数の座標をまとめて道路上にスナップ
+
+        Args:
+            coordinates: スナップする座標のリスト (最大ROADS_NEAREST_MAX_POINTS件)
+            deadline: リクエストの期限 (タイムアウトを残り時間で切り詰める)
+
+        Returns:
+            list[Coordinate | None]: 入力と同じ順のスナップされた座標
+
+        Raises:
+            ExternalServiceError: API呼び出しエラーが発生した場合
+            ExternalServiceTimeoutError: API呼び出しがタイムアウトした場合
+        """
+        params = google_maps_api.build_nearest_roads_batch_params(coordinates)
+
+        try:
+            response = await self._transport.get(
+                google_maps_api.ROADS_NEAREST_API_URL,
+                params=params,
+                timeout=google_maps_api.request_timeout(
+                    deadline, google_maps_api.ROADS_SERVICE_NAME
+                ),
+            )
+            response.raise_for_status()
+            return mappers.map_nearest_roads_batch_response(response.json(), coordinates)
+
+        except httpx.TimeoutException as e:
+            logger.error("Timeout error while snapping coordinates to roads.")
+            raise google_maps_api.timeout_error(
+                "Request timeout: Failed to snap coordinates to roads",
+                google_maps_api.ROADS_SERVICE_NAME,
+                deadline,
+            ) from e
+        except (httpx.HTTPError, json.JSONDecodeError) as e:
+            logger.error(f"Request error while snapping coordinates to roads: {e}")
+            raise ExternalServiceError(
+                f"Failed to snap coordinates to roads: {e}",
+                service_name=google_maps_api.ROADS_SERVICE_NAME,
+            ) from e
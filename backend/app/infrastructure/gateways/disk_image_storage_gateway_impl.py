@@ -0,0 +1,58 @@
+"""ディスク画像ストレージGateway実装
+
+DiskImageStoreを使用して、画像をコンテンツハッシュで保存・取得します。
+"""
+
+import asyncio
+
+from injector import inject
+
+from app.application.gateway_interfaces.image_storage_gateway import ImageStorageGateway
+from app.infrastructure.cache import DiskImageStore
+
+
+class DiskImageStorageGatewayImpl(ImageStorageGateway):
+    """ディスク画像ストレージGatewayの実装
+
+    Street View画像のキャッシュと同じストアを使用し、保存した画像はキャッシュとは別に
+    上限による削除の対象外として保持します。
+    """
+
+    @inject
+    def __init__(self, image_store: DiskImageStore, shared: bool = False) -> None:
+        """初期化
+
+        Args:
+            image_store: 画像を保存するディスクストア
+            shared: ストアの保存先を他のインスタンスと共有しているかどうか
+        """
+        self._image_store = image_store
+        self._shared = shared
+
+    @property
+    def shared(self) -> bool:
+        """他のインスタンスからも保存した画像を取得できるかどうか"""
+        return self._shared
+
+    async def save(self, image_data: bytes) -> str:
+        """画像を保存する (キャッシュの上限による削除の対象外とする)
+
+        Args:
+            image_data: 画像データ
+
+        Returns:
+            str: 画像のコンテンツハッシュ (SHA-256の16進表記)
+        """
+        # ファイルI/Oでイベントループを止めないよう、ストアの操作はスレッドで実行する
+        return await asyncio.to_thread(self._image_store.publish, image_data)
+
+    async def find(self, content_hash: str) -> bytes | None:
+        """コンテンツハッシュに対応する画像を取得する
+
+        Args:
+            content_hash: 画像のコンテンツハッシュ
+
+        Returns:
+            bytes | None: 画像データ (形式が不正な場合や存在しない場合はNone)
+        """
+        return await asyncio.to_thread(self._image_store.get_by_hash, content_hash)
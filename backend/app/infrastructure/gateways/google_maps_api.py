@@ -0,0 +1,377 @@
+"""Google Maps APIリクエスト定義
+
+同期・非同期のGateway実装で共有する、エンドポイントとリクエストパラメータの組み立てを定義します。
+"""
+
+import math
+
+from app.application.deadline import Deadline
+from app.config import (
+    GOOGLE_API_KEY,
+    PLACES_API_MAX_SEARCH_RADIUS_M,
+    PLACES_CACHE_CELL_DECIMAL_PLACES,
+    PLACES_CACHE_RADIUS_BUCKET_M,
+    REQUEST_TIMEOUT_SECONDS,
+    STREET_VIEW_IMAGE_CACHE_HEADING_STEP_DEG,
+)
+from app.domain.exceptions import (
+    ExternalServiceDeadlineExceededError,
+    ExternalServiceTimeoutError,
+)
+from app.domain.value_objects import Coordinate, ImageSize
+
+COORDINATE_DECIMAL_PLACES = 6
+
+# API Doc: https://developers.google.com/maps/documentation/directions/get-directions?hl=ja
+DIRECTIONS_API_URL = "https://maps.googleapis.com/maps/api/directions/json"
+# API Doc: https://developers.google.com/maps/documentation/streetview/metadata?hl=ja
+STREET_VIEW_METADATA_API_URL = "https://maps.googleapis.com/maps/api/streetview/metadata"
+# API Doc: https://developers.google.com/maps/documentation/streetview/request-streetview?hl=ja
+STREET_VIEW_IMAGE_API_URL = "https://maps.googleapis.com/maps/api/streetview"
+# API Doc: https://developers.google.com/maps/documentation/places/web-service/nearby-search?hl=ja
+PLACES_SEARCH_NEARBY_API_URL = "https://places.googleapis.com/v1/places:searchNearby"
+# API Doc: https://developers.google.com/maps/documentation/roads/nearest?hl=ja
+ROADS_NEAREST_API_URL = "https://roads.googleapis.com/v1/nearestRoads"
+# Nearest Roads で1リクエストに指定できる座標の最大数
+ROADS_NEAREST_MAX_POINTS = 100
+
+# 外部サービス名 (エラーのservice_nameとサーキットブレーカーの単位に使用)
+DIRECTIONS_SERVICE_NAME = "Directions API"
+STREET_VIEW_METADATA_SERVICE_NAME = "Street View Metadata API"
+STREET_VIEW_IMAGE_SERVICE_NAME = "Street View Static API"
+PLACES_SERVICE_NAME = "Places API"
+ROADS_SERVICE_NAME = "Roads API"
+SERVICE_NAMES = (
+    DIRECTIONS_SERVICE_NAME,
+    STREET_VIEW_METADATA_SERVICE_NAME,
+    STREET_VIEW_IMAGE_SERVICE_NAME,
+    PLACES_SERVICE_NAME,
+    ROADS_SERVICE_NAME,
+)
+
+# 緯度・経度1度あたりの距離の上限 (メートル)
+# NOTE: 子午線方向は極で最大の約111.69km、経線方向は赤道で最大の約111.32kmとなる
+_MAX_METERS_PER_DEGREE = 111_700.0
+
+# キャッシュするStreet Viewメタデータのステータス (一時的なエラーはキャッシュしない)
+STREET_VIEW_METADATA_CACHEABLE_STATUSES = frozenset({"OK", "ZERO_RESULTS"})
+
+# Directionsキャッシュのキー (出発地, 目的地, 経由地) の文字列
+type DirectionsCacheKey = tuple[str, str, str]
+
+# searchNearbyキャッシュのキー (検索中心セル, 半径バケット, 対象タイプ, ソート順)
+type SearchNearbyCacheKey = tuple[Coordinate, int, tuple[str, ...], str]
+
+# Nearby Search (新版) で取得するフィールド (Pro SKUの範囲に限定する)
+PLACES_SEARCH_NEARBY_FIELD_MASK = (
+    "places.id,places.displayName,places.location,places.primaryType,places.types"
+)
+
+
+def request_timeout(deadline: Deadline | None, service_name: str) -> float:
+    """HTTPリクエストのタイムアウトを期限までの残り時間で切り詰める
+
+    Args:
+        deadline: リクエストの期限 (Noneの場合は切り詰めない)
+        service_name: 外部サービス名
+
+    Returns:
+        float: タイムアウト (秒)
+
+    Raises:
+        ExternalServiceDeadlineExceededError: 期限を過ぎている場合
+    """
+    if deadline is None:
+        return REQUEST_TIMEOUT_SECONDS
+    timeout = deadline.clamp_timeout(REQUEST_TIMEOUT_SECONDS)
+    # NOTE: 0以下のタイムアウトでリクエストを送らず、期限切れとして扱う
+    if timeout <= 0:
+        raise ExternalServiceDeadlineExceededError(
+            f"Deadline exceeded before calling {service_name}", service_name=service_name
+        )
+    return timeout
+
+
+def timeout_error(
+    message: str, service_name: str, deadline: Deadline | None
+) -> ExternalServiceTimeoutError:
+    """HTTPリクエストのタイムアウトを表す例外を生成する
+
+    期限を過ぎている場合は、期限までの残り時間で切り詰めたタイムアウトによる打ち切りとして
+    外部サービスの障害と区別する。
+
+    Args:
+        message: エラーメッセージ
+        service_name: 外部サービス名
+        deadline: リクエストの期限
+
+    Returns:
+        ExternalServiceTimeoutError: 期限を過ぎている場合は ExternalServiceDeadlineExceededError
+    """
+    if deadline is not None and deadline.expired():
+        return ExternalServiceDeadlineExceededError(message, service_name=service_name)
+    return ExternalServiceTimeoutError(message, service_name=service_name)
+
+
+def normalize_coordinate(coordinate: Coordinate) -> Coordinate:
+    """API送信値で使う座標を丸める"""
+    # NOTE: 範囲内の座標を丸めても範囲外にはならないため、バリデーションを省略する
+    return Coordinate.trusted(
+        round(coordinate.latitude, COORDINATE_DECIMAL_PLACES),
+        round(coordinate.longitude, COORDINATE_DECIMAL_PLACES),
+    )
+
+
+def format_coordinate(coordinate: Coordinate) -> str:
+    """APIリクエスト用の座標文字列を安定化する"""
+    normalized_coordinate = normalize_coordinate(coordinate)
+    return (
+        f"{normalized_coordinate.latitude:.{COORDINATE_DECIMAL_PLACES}f},"
+        f"{normalized_coordinate.longitude:.{COORDINATE_DECIMAL_PLACES}f}"
+    )
+
+
+def format_waypoints(waypoints: list[Coordinate] | None) -> str:
+    """経由地をDirections APIのwaypointsパラメータ形式に変換する
+
+    Args:
+        waypoints: 経由地の座標リスト
+
+    Returns:
+        str: "via:緯度,経度|via:緯度,経度"形式の文字列 (経由地なしの場合は空文字列)
+    """
+    if not waypoints:
+        return ""
+    # via: プレフィックスを使用して通過点 (pass through) として指定
+    return "|".join(f"via:{format_coordinate(wp)}" for wp in waypoints)
+
+
+def normalize_heading(heading: float | None) -> int | None:
+    """Street View APIに送るheadingへ正規化する"""
+    if heading is None:
+        return None
+
+    return int(heading)
+
+
+def quantize_heading(heading: float | None) -> int | None:
+    """画像ストアのキーに合わせてheadingを丸める (0-359度の整数)"""
+    if heading is None:
+        return None
+
+    step = STREET_VIEW_IMAGE_CACHE_HEADING_STEP_DEG
+    return int(round(heading / step) * step) % 360
+
+
+def build_street_view_image_cache_key(
+    coordinate: Coordinate, image_size: ImageSize, heading: int | None
+) -> str:
+    """Street View画像ストアのキーを組み立てる
+
+    Args:
+        coordinate: 座標 (正規化済み)
+        image_size: 画像サイズ
+        heading: カメラの方向 (丸め済み)。Noneの場合はデフォルト方向
+
+    Returns:
+        str: キー文字列
+    """
+    heading_part = "default" if heading is None else str(heading)
+    return f"{format_coordinate(coordinate)}|{heading_part}|{image_size.to_string()}"
+
+
+def build_directions_params(origin: str, destination: str, waypoints: str = "") -> dict:
+    """Directions APIのクエリパラメータを組み立てる
+
+    Args:
+        origin: 出発地の座標 ("緯度,経度"形式の文字列)
+        destination: 目的地の座標 ("緯度,経度"形式の文字列)
+        waypoints: 経由地 ("via:緯度,経度|via:緯度,経度"形式、空文字列は経由地なし)
+
+    Returns:
+        dict: クエリパラメータ
+    """
+    params = {
+        "origin": origin,
+        "destination": destination,
+        "key": GOOGLE_API_KEY,
+        "mode": "walking",
+        "avoid": "highways|ferries",
+    }
+    if waypoints:
+        params["waypoints"] = waypoints
+    return params
+
+
+def build_street_view_metadata_params(coordinate: Coordinate) -> dict:
+    """Street View Metadata APIのクエリパラメータを組み立てる
+
+    Args:
+        coordinate: 座標 (正規化済み)
+
+    Returns:
+        dict: クエリパラメータ
+    """
+    lat_float, lng_float = coordinate.to_float_tuple()
+    return {
+        "location": f"{lat_float},{lng_float}",
+        "source": "outdoor",
+        "key": GOOGLE_API_KEY,
+    }
+
+
+def build_street_view_image_params(
+    coordinate: Coordinate, image_size: ImageSize, heading: float | None = None
+) -> dict:
+    """Street View Static APIのクエリパラメータを組み立てる
+
+    Args:
+        coordinate: 座標 (正規化済み)
+        image_size: 画像サイズ
+        heading: カメラの方向 (0-360度、北が0度、時計回り)。Noneの場合はデフォルト方向
+
+    Returns:
+        dict: クエリパラメータ
+    """
+    lat_float, lng_float = coordinate.to_float_tuple()
+    params = {
+        "size": image_size.to_string(),
+        "location": f"{lat_float},{lng_float}",
+        "source": "outdoor",
+        "key": GOOGLE_API_KEY,
+    }
+
+    # headingが指定されている場合、APIリクエストに追加
+    if heading is not None:
+        # Google Street View APIの仕様に従い、headingは0-360度の整数値
+        params["heading"] = str(heading)
+
+    return params
+
+
+def build_search_nearby_request(
+    coordinate: Coordinate,
+    radius: int,
+    included_types: list[str],
+    rank_preference: str = "POPULARITY",
+) -> tuple[dict, dict]:
+    """Places API searchNearbyのリクエストボディとヘッダーを組み立てる
+
+    Args:
+        coordinate: 検索中心座標 (正規化済み)
+        radius: 検索半径 (メートル)
+        included_types: 検索対象のタイプリスト
+        rank_preference: ソート順 ("POPULARITY" または "DISTANCE")
+
+    Returns:
+        tuple[dict, dict]: (リクエストボディ, ヘッダー)
+    """
+    lat_float, lng_float = coordinate.to_float_tuple()
+    clamped_radius = max(50, min(radius, PLACES_API_MAX_SEARCH_RADIUS_M))
+
+    request_body = {
+        "includedPrimaryTypes": included_types,
+        "maxResultCount": 20,
+        "locationRestriction": {
+            "circle": {
+                "center": {
+                    "latitude": lat_float,
+                    "longitude": lng_float,
+                },
+                "radius": clamped_radius,
+            }
+        },
+        "languageCode": "ja",
+        "rankPreference": rank_preference,
+    }
+
+    headers = {
+        "Content-Type": "application/json",
+        "X-Goog-Api-Key": GOOGLE_API_KEY,
+        "X-Goog-FieldMask": PLACES_SEARCH_NEARBY_FIELD_MASK,
+    }
+
+    return request_body, headers
+
+
+def quantize_search_nearby_area(coordinate: Coordinate, radius: int) -> tuple[Coordinate, int]:
+    """searchNearbyの検索範囲をキャッシュのタイルに合わせて量子化する
+
+    検索中心はセルの格子点に丸め、半径は丸めで中心が動く距離の上限 (セルの対角線の半分) を
+    加えてからバケット単位に切り上げる。これにより量子化した検索範囲は元の検索範囲を含む
+    (ただしAPIの最大検索半径を超える場合を除く)。
+    同じセル・バケットの検索は同じリクエストになるため、結果をそのまま共有できる。
+
+    Args:
+        coordinate: 検索中心座標
+        radius: 検索半径 (メートル)
+
+    Returns:
+        tuple[Coordinate, int]: (量子化した検索中心, 量子化した検索半径)
+    """
+    center = Coordinate.trusted(
+        round(coordinate.latitude, PLACES_CACHE_CELL_DECIMAL_PLACES),
+        round(coordinate.longitude, PLACES_CACHE_CELL_DECIMAL_PLACES),
+    )
+    # NOTE: 同じセルの検索が同じ半径になるよう、元の座標ではなくセル内で最大となる距離を使う
+    half_cell_deg = 0.5 * 10**-PLACES_CACHE_CELL_DECIMAL_PLACES
+    half_cell_m = half_cell_deg * _MAX_METERS_PER_DEGREE
+    # 経度方向の距離はセル内で最も赤道に近い緯度で最大となる
+    longitude_scale = math.cos(math.radians(max(0.0, abs(center.latitude) - half_cell_deg)))
+    padding = math.hypot(half_cell_m, half_cell_m * longitude_scale)
+    bucketed_radius = (
+        math.ceil((radius + padding) / PLACES_CACHE_RADIUS_BUCKET_M) * PLACES_CACHE_RADIUS_BUCKET_M
+    )
+    return center, min(bucketed_radius, PLACES_API_MAX_SEARCH_RADIUS_M)
+
+
+def build_search_nearby_cache_key(
+    center: Coordinate,
+    radius: int,
+    included_types: list[str],
+    rank_preference: str,
+) -> SearchNearbyCacheKey:
+    """searchNearbyキャッシュのキーを組み立てる
+
+    Args:
+        center: 量子化した検索中心
+        radius: 量子化した検索半径 (メートル)
+        included_types: 検索対象のタイプリスト (順序は問わない)
+        rank_preference: ソート順
+
+    Returns:
+        SearchNearbyCacheKey: キャッシュキー
+    """
+    return center, radius, tuple(sorted(set(included_types))), rank_preference
+
+
+def build_nearest_roads_params(coordinate: Coordinate) -> dict:
+    """Roads API (Nearest Roads) のクエリパラメータを組み立てる
+
+    Args:
+        coordinate: スナップする座標 (正規化済み)
+
+    Returns:
+        dict: クエリパラメータ
+    """
+    lat_float, lng_float = coordinate.to_float_tuple()
+    return {
+        "points": f"{lat_float},{lng_float}",
+        "key": GOOGLE_API_KEY,
+    }
+
+
+def build_nearest_roads_batch_params(coordinates: list[Coordinate]) -> dict:
+    """複数座標をまとめてスナップするRoads API (Nearest Roads) のクエリパラメータを組み立てる
+
+    Args:
+        coordinates: スナップする座標のリスト (正規化済み、最大ROADS_NEAREST_MAX_POINTS件)
+
+    Returns:
+        dict: クエリパラメータ
+    """
+    points = "|".join("{},{}".format(*coordinate.to_float_tuple()) for coordinate in coordinates)
+    return {
+        "points": points,
+        "key": GOOGLE_API_KEY,
+    }
@@ -4,6 +4,7 @@ Google Maps API (Street View, Directions) へのリクエストを処理しま
 """
 
 import logging
+from collections.abc import Callable
 from typing import Literal
 
 import requests
@@ -20,23 +21,23 @@ from app.application.gateway_interfaces.google_maps_gateway import (
     StreetViewMetadata,
 )
 from app.config import (
-    GOOGLE_API_KEY,
     LANDMARK_INCLUDED_TYPES,
-    PLACES_API_MAX_SEARCH_RADIUS_M,
     REQUEST_TIMEOUT_SECONDS,
 )
 from app.domain.exceptions import (
     ExternalServiceError,
     ExternalServiceTimeoutError,
-    ExternalServiceValidationError,
 )
 from app.domain.value_objects import Coordinate, ImageSize, Landmark
 from app.infrastructure import mappers
+from app.infrastructure.cache import CompactRoute, DiskImageStore, TtlCache
+from app.infrastructure.concurrency import SingleFlight
+from app.infrastructure.gateways import google_maps_api
+from app.infrastructure.http import PooledHttpTransport
+from app.infrastructure.resilience import CircuitBreaker, RateLimiter
 
 logger = logging.getLogger(__name__)
 
-COORDINATE_DECIMAL_PLACES = 6
-
 
 class RetryableHTTPError(HTTPError):
     """429/503エラー用のリトライ可能な例外"""
@@ -45,27 +46,107 @@ class RetryableHTTPError(HTTPError):
 class GoogleMapsGatewayImpl(GoogleMapsGateway):
     """Google Maps API Gatewayの実装"""
 
-    def _normalize_coordinate(self, coordinate: Coordinate) -> Coordinate:
-        """API送信値で使う座標を丸める"""
-        return Coordinate(
-            latitude=round(coordinate.latitude, COORDINATE_DECIMAL_PLACES),
-            longitude=round(coordinate.longitude, COORDINATE_DECIMAL_PLACES),
-        )
+    def __init__(
+        self,
+        transport: PooledHttpTransport | None = None,
+        metadata_cache: TtlCache[Coordinate, StreetViewMetadata] | None = None,
+        places_cache: TtlCache[google_maps_api.SearchNearbyCacheKey, list[Landmark]] | None = None,
+        directions_cache: TtlCache[google_maps_api.DirectionsCacheKey, CompactRoute] | None = None,
+        image_store: DiskImageStore | None = None,
+        single_flight: SingleFlight | None = None,
+        circuit_breakers: dict[str, CircuitBreaker] | None = None,
+        rate_limiters: dict[str, RateLimiter] | None = None,
+    ) -> None:
+        """初期化
 
-    def _format_coordinate(self, coordinate: Coordinate) -> str:
-        """APIリクエスト用の座標文字列を安定化する"""
-        normalized_coordinate = self._normalize_coordinate(coordinate)
-        return (
-            f"{normalized_coordinate.latitude:.{COORDINATE_DECIMAL_PLACES}f},"
-            f"{normalized_coordinate.longitude:.{COORDINATE_DECIMAL_PLACES}f}"
-        )
+        Args:
+            transport: HTTPトランスポート (Noneの場合はデフォルト設定のプールを生成)
+            metadata_cache: Street Viewメタデータのキャッシュ (Noneの場合はキャッシュしない)
+            places_cache: Places searchNearbyのキャッシュ (Noneの場合はキャッシュしない)
+            directions_cache: Directionsのキャッシュ (Noneの場合はキャッシュしない)
+            image_store: Street View画像のディスクストア (Noneの場合は保存しない)
+            single_flight: 同時に実行中の同一リクエストを集約する仕組み (Noneの場合は新規に生成)
+            circuit_breakers: 外部サービス名ごとのサーキットブレーカー
+                (Noneの場合や含まれないサービスはブレーカーを通さない)
+            rate_limiters: 外部サービス名ごとのレート制限
+                (Noneの場合や含まれないサービスは制限しない)
+        """
+        # NOTE: 同一ホストへのコネクションを使い回すため、トランスポートはGatewayが所有する
+        self._transport = transport if transport is not None else PooledHttpTransport()
+        self._metadata_cache = metadata_cache
+        self._places_cache = places_cache
+        self._directions_cache = directions_cache
+        self._image_store = image_store
+        # NOTE: キャッシュの有無に関わらず、同時に実行中の同一リクエストは1回にまとめる
+        self._single_flight = single_flight if single_flight is not None else SingleFlight()
+        self._circuit_breakers = dict(circuit_breakers) if circuit_breakers is not None else {}
+        self._rate_limiters = dict(rate_limiters) if rate_limiters is not None else {}
+
+    def get_stats(self) -> dict:
+        """運用監視用の統計情報を取得
+
+        Returns:
+            dict: ホストごとのコネクションプール統計とキャッシュ統計
+        """
+        stats: dict = {
+            "http_pools": [
+                {**pool_stats.model_dump(), "connections_reused": pool_stats.connections_reused}
+                for pool_stats in self._transport.get_stats()
+            ],
+            "single_flight": self._single_flight.get_stats().model_dump(),
+        }
+        if self._metadata_cache is not None:
+            stats["street_view_metadata_cache"] = self._metadata_cache.get_stats().model_dump()
+        if self._places_cache is not None:
+            stats["places_cache"] = self._places_cache.get_stats().model_dump()
+        if self._directions_cache is not None:
+            stats["directions_cache"] = self._directions_cache.get_stats().model_dump()
+        if self._image_store is not None:
+            stats["street_view_image_store"] = self._image_store.get_stats().model_dump()
+        if self._circuit_breakers:
+            stats["circuit_breakers"] = {
+                service_name: breaker.get_stats().model_dump()
+                for service_name, breaker in self._circuit_breakers.items()
+            }
+        if self._rate_limiters:
+            stats["rate_limiters"] = {
+                service_name: limiter.get_stats().model_dump()
+                for service_name, limiter in self._rate_limiters.items()
+            }
+        return stats
+
+    def _call_api[**P, T](
+        self,
+        service_name: str,
+        func: Callable[P, T],
+        *args: P.args,
+        **kwargs: P.kwargs,
+    ) -> T:
+        """サービスのレート制限とサーキットブレーカーを通して外部APIを呼び出す
+
+        レート制限の待ちで失敗した呼び出しは外部APIの障害ではないため、
+        ブレーカーの失敗率には含めない。
+
+        Args:
+            service_name: 外部サービス名
+            func: 外部APIを呼び出す関数
+            *args: funcの位置引数
+            **kwargs: funcのキーワード引数
 
-    def _normalize_heading(self, heading: float | None) -> int | None:
-        """Street View APIに送るheadingへ正規化する"""
-        if heading is None:
-            return None
+        Returns:
+            T: funcの戻り値
 
-        return int(heading)
+        Raises:
+            ExternalServiceError: レート制限の待ち時間が上限を超える場合、
+                またはサーキットブレーカーがオープンしている場合
+        """
+        limiter = self._rate_limiters.get(service_name)
+        if limiter is not None:
+            limiter.acquire()
+        breaker = self._circuit_breakers.get(service_name)
+        if breaker is None:
+            return func(*args, **kwargs)
+        return breaker.call(lambda: func(*args, **kwargs))
 
     def get_directions(
         self,
@@ -84,42 +165,28 @@ class GoogleMapsGatewayImpl(GoogleMapsGateway):
             tuple[list[Coordinate], str]:
                 (ルート座標リスト, overview_polyline文字列)
         """
-        origin_str = self._format_coordinate(origin)
-        destination_str = self._format_coordinate(destination)
-        waypoints_str = ""
-        if waypoints:
-            # via: プレフィックスを使用して通過点 (pass through) として指定
-            waypoints_str = "|".join(f"via:{self._format_coordinate(wp)}" for wp in waypoints)
-        data = self._fetch_directions(origin_str, destination_str, waypoints_str)
-
-        if data.get("status") != "OK":
-            logger.error(f"Directions API returned non-OK status: {data.get('status')}")
-            raise ExternalServiceValidationError(
-                f"Directions API error: {data.get('status')}",
-                service_name="Directions API",
-            )
-
-        routes = data.get("routes", [])
-        if not routes or not routes[0].get("legs"):
-            logger.error("Directions API returned empty routes")
-            raise ExternalServiceValidationError(
-                "No route found",
-                service_name="Directions API",
-            )
-
-        route_coordinates: list[Coordinate] = []
-        for step in routes[0]["legs"][0]["steps"]:
-            route_coordinates.extend(mappers.decode_polyline(step["polyline"]["points"]))
-
-        overview_polyline = routes[0]["overview_polyline"]["points"]
+        cache_key: google_maps_api.DirectionsCacheKey = (
+            google_maps_api.format_coordinate(origin),
+            google_maps_api.format_coordinate(destination),
+            google_maps_api.format_waypoints(waypoints),
+        )
+        if self._directions_cache is not None:
+            cached_route = self._directions_cache.get(cache_key)
+            if cached_route is not None:
+                return cached_route.to_result()
 
-        return route_coordinates, overview_polyline
+        data = self._call_api(
+            google_maps_api.DIRECTIONS_SERVICE_NAME, self._fetch_directions, *cache_key
+        )
+        # NOTE: 座標オブジェクトは戻り値を作るときに一度だけ生成する
+        route = CompactRoute(*mappers.map_directions_response_arrays(data))
+        if self._directions_cache is not None:
+            self._directions_cache.set(cache_key, route)
+        return route.to_result()
 
     def _fetch_directions(self, origin: str, destination: str, waypoints: str = "") -> dict:
         """Google Directions APIからルート情報を取得
 
-        API Doc: https://developers.google.com/maps/documentation/directions/get-directions?hl=ja
-
         Args:
             origin: 出発地の座標 ("緯度,経度"形式の文字列)
             destination: 目的地の座標 ("緯度,経度"形式の文字列)
@@ -128,32 +195,27 @@ class GoogleMapsGatewayImpl(GoogleMapsGateway):
         Returns:
             dict: Directions APIのレスポンスJSON
         """
-        url = "https://maps.googleapis.com/maps/api/directions/json"
-        params = {
-            "origin": origin,
-            "destination": destination,
-            "key": GOOGLE_API_KEY,
-            "mode": "walking",
-            "avoid": "highways|ferries",
-        }
-        if waypoints:
-            params["waypoints"] = waypoints
+        params = google_maps_api.build_directions_params(origin, destination, waypoints)
 
         try:
-            response = requests.get(url, params=params, timeout=REQUEST_TIMEOUT_SECONDS)
+            response = self._transport.get(
+                google_maps_api.DIRECTIONS_API_URL,
+                params=params,
+                timeout=REQUEST_TIMEOUT_SECONDS,
+            )
             response.raise_for_status()
             return response.json()
         except Timeout as e:
             logger.error("Timeout error while fetching directions.")
             raise ExternalServiceTimeoutError(
                 "Request timeout: Failed to retrieve directions",
-                service_name="Directions API",
+                service_name=google_maps_api.DIRECTIONS_SERVICE_NAME,
             ) from e
         except RequestException as e:
             logger.error(f"Request error while fetching directions: {e}")
             raise ExternalServiceError(
                 f"Failed to retrieve directions: {e}",
-                service_name="Directions API",
+                service_name=google_maps_api.DIRECTIONS_SERVICE_NAME,
             ) from e
 
     def get_street_view_metadata(self, coordinate: Coordinate) -> StreetViewMetadata:
@@ -168,75 +230,45 @@ class GoogleMapsGatewayImpl(GoogleMapsGateway):
         Raises:
             ExternalServiceValidationError: メタデータが不完全または無効な場合
         """
-        normalized_coordinate = self._normalize_coordinate(coordinate)
-        metadata_dict = self._fetch_street_view_metadata(normalized_coordinate)
-
-        status = metadata_dict.get("status", "")
-        location_coordinate: Coordinate | None = None
-
-        if status == "OK":
-            location = metadata_dict.get("location")
-            if not isinstance(location, dict):
-                logger.error(
-                    f"Street View metadata missing or invalid 'location' field. "
-                    f"Status: {status}, Metadata: {metadata_dict}"
-                )
-                raise ExternalServiceValidationError(
-                    f"Street View metadata incomplete: 'location' field is missing or invalid. "
-                    f"Status: {status}, Metadata: {metadata_dict}",
-                    service_name="Street View Metadata API",
-                )
-
-            lat_value = location.get("lat")
-            lng_value = location.get("lng")
-
-            if lat_value is None or lng_value is None:
-                logger.error(
-                    f"Street View metadata missing 'lat' or 'lng' in location. "
-                    f"Status: {status}, Location: {location}, Metadata: {metadata_dict}"
-                )
-                raise ExternalServiceValidationError(
-                    f"Street View metadata incomplete: 'lat' or 'lng' is missing in location. "
-                    f"Status: {status}, Location: {location}, Metadata: {metadata_dict}",
-                    service_name="Street View Metadata API",
-                )
-
-            if not isinstance(lat_value, (int, float)) or not isinstance(lng_value, (int, float)):
-                logger.error(
-                    f"Street View metadata has invalid type for 'lat' or 'lng'. "
-                    f"Status: {status}, Location: {location}, Metadata: {metadata_dict}"
-                )
-                raise ExternalServiceValidationError(
-                    f"Street View metadata incomplete: 'lat' or 'lng' has invalid type. "
-                    f"Status: {status}, Location: {location}, Metadata: {metadata_dict}",
-                    service_name="Street View Metadata API",
-                )
-
-            location_coordinate = Coordinate(latitude=float(lat_value), longitude=float(lng_value))
-
-        return StreetViewMetadata(status=status, location=location_coordinate)
+        normalized_coordinate = google_maps_api.normalize_coordinate(coordinate)
+        if self._metadata_cache is not None:
+            cached_metadata = self._metadata_cache.get(normalized_coordinate)
+            if cached_metadata is not None:
+                return cached_metadata
+
+        metadata_dict = self._single_flight.run(
+            ("street_view_metadata", normalized_coordinate),
+            lambda: self._call_api(
+                google_maps_api.STREET_VIEW_METADATA_SERVICE_NAME,
+                self._fetch_street_view_metadata,
+                normalized_coordinate,
+            ),
+        )
+        metadata = mappers.map_street_view_metadata_response(metadata_dict)
+        if (
+            self._metadata_cache is not None
+            and metadata.status in google_maps_api.STREET_VIEW_METADATA_CACHEABLE_STATUSES
+        ):
+            self._metadata_cache.set(normalized_coordinate, metadata)
+        return metadata
 
     def _fetch_street_view_metadata(self, coordinate: Coordinate) -> dict:
         """Street View Metadata APIからメタデータを取得
 
-        API Doc: https://developers.google.com/maps/documentation/streetview/metadata?hl=ja
-
         Args:
             coordinate: 座標
 
         Returns:
             dict: メタデータ
         """
-        lat_float, lng_float = coordinate.to_float_tuple()
-        url = "https://maps.googleapis.com/maps/api/streetview/metadata"
-        params = {
-            "location": f"{lat_float},{lng_float}",
-            "source": "outdoor",
-            "key": GOOGLE_API_KEY,
-        }
+        params = google_maps_api.build_street_view_metadata_params(coordinate)
 
         try:
-            metadata_response = requests.get(url, params=params, timeout=REQUEST_TIMEOUT_SECONDS)
+            metadata_response = self._transport.get(
+                google_maps_api.STREET_VIEW_METADATA_API_URL,
+                params=params,
+                timeout=REQUEST_TIMEOUT_SECONDS,
+            )
             metadata_response.raise_for_status()
             return metadata_response.json()
         except Timeout as e:
@@ -245,13 +277,13 @@ class GoogleMapsGatewayImpl(GoogleMapsGateway):
             )
             raise ExternalServiceTimeoutError(
                 "Request timeout: Failed to retrieve Street View metadata",
-                service_name="Street View Metadata API",
+                service_name=google_maps_api.STREET_VIEW_METADATA_SERVICE_NAME,
             ) from e
         except RequestException as e:
             logger.error(f"Request error while fetching Street View metadata: {e}")
             raise ExternalServiceError(
                 f"Failed to retrieve Street View metadata: {e}",
-                service_name="Street View Metadata API",
+                service_name=google_maps_api.STREET_VIEW_METADATA_SERVICE_NAME,
             ) from e
 
     def get_street_view_image(
@@ -267,17 +299,41 @@ class GoogleMapsGatewayImpl(GoogleMapsGateway):
         Returns:
             bytes: 画像データ
         """
-        normalized_coordinate = self._normalize_coordinate(coordinate)
-        normalized_heading = self._normalize_heading(heading)
-        return self._fetch_street_view_image(normalized_coordinate, image_size, normalized_heading)
+        normalized_coordinate = google_maps_api.normalize_coordinate(coordinate)
+        if self._image_store is None:
+            normalized_heading = google_maps_api.normalize_heading(heading)
+            return self._call_api(
+                google_maps_api.STREET_VIEW_IMAGE_SERVICE_NAME,
+                self._fetch_street_view_image,
+                normalized_coordinate,
+                image_size,
+                normalized_heading,
+            )
+
+        # NOTE: 同じ向きの画像を共有するため、headingを丸めて問い合わせる
+        quantized_heading = google_maps_api.quantize_heading(heading)
+        cache_key = google_maps_api.build_street_view_image_cache_key(
+            normalized_coordinate, image_size, quantized_heading
+        )
+        cached_image = self._image_store.get(cache_key)
+        if cached_image is not None:
+            return cached_image
+
+        image = self._call_api(
+            google_maps_api.STREET_VIEW_IMAGE_SERVICE_NAME,
+            self._fetch_street_view_image,
+            normalized_coordinate,
+            image_size,
+            quantized_heading,
+        )
+        self._image_store.put(cache_key, image)
+        return image
 
     def _fetch_street_view_image(
         self, coordinate: Coordinate, image_size: ImageSize, heading: float | None = None
     ) -> bytes:
         """Street View Static APIから画像を取得
 
-        API Doc: https://developers.google.com/maps/documentation/streetview/request-streetview?hl=ja
-
         Args:
             coordinate: 座標
             image_size: 画像サイズ
@@ -286,35 +342,27 @@ class GoogleMapsGatewayImpl(GoogleMapsGateway):
         Returns:
             bytes: 画像データ
         """
-        lat_float, lng_float = coordinate.to_float_tuple()
-        url = "https://maps.googleapis.com/maps/api/streetview"
-        params = {
-            "size": image_size.to_string(),
-            "location": f"{lat_float},{lng_float}",
-            "source": "outdoor",
-            "key": GOOGLE_API_KEY,
-        }
-
-        # headingが指定されている場合、APIリクエストに追加
-        if heading is not None:
-            # Google Street View APIの仕様に従い、headingは0-360度の整数値
-            params["heading"] = str(heading)
+        params = google_maps_api.build_street_view_image_params(coordinate, image_size, heading)
 
         try:
-            response = requests.get(url, params=params, timeout=REQUEST_TIMEOUT_SECONDS)
+            response = self._transport.get(
+                google_maps_api.STREET_VIEW_IMAGE_API_URL,
+                params=params,
+                timeout=REQUEST_TIMEOUT_SECONDS,
+            )
             response.raise_for_status()
             return response.content
         except Timeout as e:
             logger.error("Timeout error while fetching Street View image for a requested location.")
             raise ExternalServiceTimeoutError(
                 "Request timeout: Failed to retrieve Street View image",
-                service_name="Street View Static API",
+                service_name=google_maps_api.STREET_VIEW_IMAGE_SERVICE_NAME,
             ) from e
         except RequestException as e:
             logger.error(f"Request error while fetching Street View image: {e}")
             raise ExternalServiceError(
                 f"Failed to retrieve Street View image: {e}",
-                service_name="Street View Static API",
+                service_name=google_maps_api.STREET_VIEW_IMAGE_SERVICE_NAME,
             ) from e
 
     def search_landmarks_nearby(
@@ -341,52 +389,37 @@ class GoogleMapsGatewayImpl(GoogleMapsGateway):
         if included_types is None:
             included_types = LANDMARK_INCLUDED_TYPES
 
-        normalized_coordinate = self._normalize_coordinate(coordinate)
-        places = self._search_nearby_once(
-            normalized_coordinate, radius, included_types, rank_preference
-        )
-
-        landmarks: list[Landmark] = []
-        for place in places:
-            place_id = place.get("id")
-            if not place_id:
-                continue
-
-            display_name_dict = place.get("displayName", {})
-            display_name = (
-                display_name_dict.get("text", "")
-                if isinstance(display_name_dict, dict)
-                else str(display_name_dict)
-            )
-
-            location = place.get("location", {})
-            if not isinstance(location, dict):
-                continue
-
-            lat_value = location.get("latitude")
-            lng_value = location.get("longitude")
-            if lat_value is None or lng_value is None:
-                continue
-
-            try:
-                landmark_coordinate = Coordinate(
-                    latitude=float(lat_value), longitude=float(lng_value)
-                )
-            except (ValueError, TypeError):
-                continue
-
-            primary_type = place.get("primaryType")
-            types = place.get("types")
-
-            landmark = Landmark(
-                place_id=place_id,
-                display_name=display_name,
-                coordinate=landmark_coordinate,
-                primary_type=primary_type,
-                types=types if isinstance(types, list) else None,
+        if self._places_cache is None:
+            search_center = google_maps_api.normalize_coordinate(coordinate)
+            search_radius = radius
+        else:
+            # NOTE: 同じタイルの検索結果を共有するため、検索範囲を量子化して問い合わせる
+            search_center, search_radius = google_maps_api.quantize_search_nearby_area(
+                coordinate, radius
             )
-            landmarks.append(landmark)
-
+        cache_key = google_maps_api.build_search_nearby_cache_key(
+            search_center, search_radius, included_types, rank_preference
+        )
+        if self._places_cache is not None:
+            cached_landmarks = self._places_cache.get(cache_key)
+            if cached_landmarks is not None:
+                return list(cached_landmarks)
+
+        places = self._single_flight.run(
+            ("places", cache_key),
+            lambda: self._call_api(
+                google_maps_api.PLACES_SERVICE_NAME,
+                self._search_nearby_once,
+                search_center,
+                search_radius,
+                included_types,
+                rank_preference,
+            ),
+        )
+        landmarks = mappers.map_places_response(places)
+        if self._places_cache is not None:
+            self._places_cache.set(cache_key, landmarks)
+            return list(landmarks)
         return landmarks
 
     @retry(
@@ -415,38 +448,16 @@ class GoogleMapsGatewayImpl(GoogleMapsGateway):
         Raises:
             ExternalServiceError: API呼び出しエラーが発生した場合
         """
-        url = "https://places.googleapis.com/v1/places:searchNearby"
-
-        lat_float, lng_float = coordinate.to_float_tuple()
-        clamped_radius = max(50, min(radius, PLACES_API_MAX_SEARCH_RADIUS_M))
-
-        request_body = {
-            "includedPrimaryTypes": included_types,
-            "maxResultCount": 20,
-            "locationRestriction": {
-                "circle": {
-                    "center": {
-                        "latitude": lat_float,
-                        "longitude": lng_float,
-                    },
-                    "radius": clamped_radius,
-                }
-            },
-            "languageCode": "ja",
-            "rankPreference": rank_preference,
-        }
-
-        headers = {
-            "Content-Type": "application/json",
-            "X-Goog-Api-Key": GOOGLE_API_KEY,
-            "X-Goog-FieldMask": (
-                "places.id,places.displayName,places.location,places.primaryType,places.types"
-            ),
-        }
+        request_body, headers = google_maps_api.build_search_nearby_request(
+            coordinate, radius, included_types, rank_preference
+        )
 
         try:
-            response = requests.post(
-                url, json=request_body, headers=headers, timeout=REQUEST_TIMEOUT_SECONDS
+            response = self._transport.post(
+                google_maps_api.PLACES_SEARCH_NEARBY_API_URL,
+                json=request_body,
+                headers=headers,
+                timeout=REQUEST_TIMEOUT_SECONDS,
             )
 
             # 429/503エラーはリトライ可能な例外として発生
@@ -469,7 +480,7 @@ class GoogleMapsGatewayImpl(GoogleMapsGateway):
             logger.error("Timeout error while fetching landmarks.")
             raise ExternalServiceTimeoutError(
                 "Request timeout: Failed to retrieve landmarks",
-                service_name="Places API",
+                service_name=google_maps_api.PLACES_SERVICE_NAME,
             ) from e
         except RetryableHTTPError:
             # リトライ可能なエラーはそのまま再発生 (tenacityが処理)
@@ -478,7 +489,7 @@ class GoogleMapsGatewayImpl(GoogleMapsGateway):
             logger.error(f"Request error while fetching landmarks: {e}")
             raise ExternalServiceError(
                 f"Failed to retrieve landmarks: {e}",
-                service_name="Places API",
+                service_name=google_maps_api.PLACES_SERVICE_NAME,
             ) from e
 
     def snap_to_road(self, coordinate: Coordinate) -> Coordinate | None:
@@ -494,14 +505,17 @@ class GoogleMapsGatewayImpl(GoogleMapsGateway):
             ExternalServiceError: API呼び出しエラーが発生した場合
             ExternalServiceTimeoutError: API呼び出しがタイムアウトした場合
         """
-        normalized_coordinate = self._normalize_coordinate(coordinate)
-        return self._snap_to_road(normalized_coordinate)
+        normalized_coordinate = google_maps_api.normalize_coordinate(coordinate)
+        return self._single_flight.run(
+            ("snap_to_road", normalized_coordinate),
+            lambda: self._call_api(
+                google_maps_api.ROADS_SERVICE_NAME, self._snap_to_road, normalized_coordinate
+            ),
+        )
 
     def _snap_to_road(self, coordinate: Coordinate) -> Coordinate | None:
         """Roads API (Nearest Roads) から座標を道路上にスナップ
 
-        API Doc: https://developers.google.com/maps/documentation/roads/nearest?hl=ja
-
         Args:
             coordinate: スナップする座標
 
@@ -512,48 +526,91 @@ class GoogleMapsGatewayImpl(GoogleMapsGateway):
             ExternalServiceError: API呼び出しエラーが発生した場合
             ExternalServiceTimeoutError: API呼び出しがタイムアウトした場合
         """
-        lat_float, lng_float = coordinate.to_float_tuple()
-        url = "https://roads.googleapis.com/v1/nearestRoads"
-        params = {
-            "points": f"{lat_float},{lng_float}",
-            "key": GOOGLE_API_KEY,
-        }
+        params = google_maps_api.build_nearest_roads_params(coordinate)
 
         try:
-            response = requests.get(url, params=params, timeout=REQUEST_TIMEOUT_SECONDS)
+            response = self._transport.get(
+                google_maps_api.ROADS_NEAREST_API_URL,
+                params=params,
+                timeout=REQUEST_TIMEOUT_SECONDS,
+            )
             response.raise_for_status()
-            data = response.json()
-
-            snapped_points = data.get("snappedPoints", [])
-            if not snapped_points:
-                logger.info(f"No road found near coordinate: {coordinate}")
-                return None
-
-            # 0番目の座標を使用する
-            location = snapped_points[0].get("location", {})
-            if not isinstance(location, dict):
-                logger.warning(f"Invalid location data in Roads API response: {location}")
-                return None
-
-            lat_value = location.get("latitude")
-            lng_value = location.get("longitude")
-            if lat_value is None or lng_value is None:
-                logger.warning(f"Missing latitude or longitude in Roads API response: {location}")
-                return None
-
-            snapped_coordinate = Coordinate(latitude=float(lat_value), longitude=float(lng_value))
-            logger.info(f"Snapped coordinate {coordinate} to {snapped_coordinate}")
-            return snapped_coordinate
+            return mappers.map_nearest_roads_response(response.json(), coordinate)
 
         except Timeout as e:
             logger.error("Timeout error while snapping coordinate to road.")
             raise ExternalServiceTimeoutError(
                 "Request timeout: Failed to snap coordinate to road",
-                service_name="Roads API",
+                service_name=google_maps_api.ROADS_SERVICE_NAME,
             ) from e
         except RequestException as e:
             logger.error(f"Request error while snapping coordinate to road: {e}")
             raise ExternalServiceError(
                 f"Failed to snap coordinate to road: {e}",
-                service_name="Roads API",
+                service_name=google_maps_api.ROADS_SERVICE_NAME,
+            ) from e
+
+    def snap_to_roads(self, coordinates: list[Coordinate]) -> list[Coordinate | None]:
+        """Roads API (Nearest Roads) を使用して、複数の座標を1回の呼び出しで道路中心線にスナップする
+
+        1リクエストあたりROADS_NEAREST_MAX_POINTS件ずつに分割して問い合わせる。
+
+        Args:
+            coordinates: スナップする座標のリスト
+
+        Returns:
+            list[Coordinate | None]: 入力と同じ順のスナップされた座標。
+                道路が見つからない座標は None
+
+        Raises:
+            ExternalServiceError: API呼び出しエラーが発生した場合
+            ExternalServiceTimeoutError: API呼び出しがタイムアウトした場合
+        """
+        normalized_coordinates = [
+            google_maps_api.normalize_coordinate(coordinate) for coordinate in coordinates
+        ]
+        max_points = google_maps_api.ROADS_NEAREST_MAX_POINTS
+        results: list[Coordinate | None] = []
+        for start in range(0, len(normalized_coordinates), max_points):
+            chunk = normalized_coordinates[start : start + max_points]
+            results.extend(
+                self._call_api(google_maps_api.ROADS_SERVICE_NAME, self._snap_to_roads, chunk)
+            )
+        return results
+
+    def _snap_to_roads(self, coordinates: list[Coordinate]) -> list[Coordinate | None]:
+        """Roads API (Nearest Roads) から複数の座標をまとめて道路上にスナップ
+
+        Args:
+            coordinates: スナップする座標のリスト (最大ROADS_NEAREST_MAX_POINTS件)
+
+        Returns:
+            list[Coordinate | None]: 入力と同じ順のスナップされた座標
+
+        Raises:
+            ExternalServiceError: API呼び出しエラーが発生した場合
+            ExternalServiceTimeoutError: API呼び出しがタイムアウトした場合
+        """
+        params = google_maps_api.build_nearest_roads_batch_params(coordinates)
+
+        try:
+            response = self._transport.get(
+                google_maps_api.ROADS_NEAREST_API_URL,
+                params=params,
+                timeout=REQUEST_TIMEOUT_SECONDS,
+            )
+            response.raise_for_status()
+            return mappers.map_nearest_roads_batch_response(response.json(), coordinates)
+
+        except Timeout as e:
+            logger.error("Timeout error while snapping coordinates to roads.")
+            raise ExternalServiceTimeoutError(
+                "Request timeout: Failed to snap coordinates to roads",
+                service_name=google_maps_api.ROADS_SERVICE_NAME,
+            ) from e
+        except RequestException as e:
+            logger.error(f"Request error while snapping coordinates to roads: {e}")
+            raise ExternalServiceError(
+                f"Failed to snap coordinates to roads: {e}",
+                service_name=google_maps_api.ROADS_SERVICE_NAME,
             ) from e
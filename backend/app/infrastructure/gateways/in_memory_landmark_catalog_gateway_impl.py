@@ -0,0 +1,165 @@
+"""インメモリのランドマークカタログGateway実装
+
+取得済みのランドマークを緯度・経度のグリッドで索引し、中心からの距離で検索します。
+"""
+
+import math
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Iterator
+
+from app.application.gateway_interfaces.landmark_catalog_gateway import LandmarkCatalogGateway
+from app.config import (
+    LANDMARK_CATALOG_CELL_SIZE_DEG,
+    LANDMARK_CATALOG_MAX_ENTRIES,
+    LANDMARK_CATALOG_TTL_SECONDS,
+)
+from app.domain.services.coordinate_service import calculate_bounding_boxes, calculate_distance
+from app.domain.value_objects import Coordinate, Landmark
+
+type _Cell = tuple[int, int]
+
+
+class InMemoryLandmarkCatalogGatewayImpl(LandmarkCatalogGateway):
+    """グリッドで索引するインメモリのランドマークカタログ
+
+    ランドマークを緯度・経度 cell_size_deg 度四方のセルに振り分け、検索時は
+    中心から上限距離までを覆うセルだけを走査して距離で絞り込みます。
+    ttl_seconds の間に再取得されなかったランドマークと、max_entries を超えた分は
+    最後に取得した時刻が古い順に削除します。
+    イベントループ上でのみ使用するため、状態はロックで保護しません。
+    """
+
+    def __init__(
+        self,
+        cell_size_deg: float = LANDMARK_CATALOG_CELL_SIZE_DEG,
+        max_entries: int = LANDMARK_CATALOG_MAX_ENTRIES,
+        ttl_seconds: float = LANDMARK_CATALOG_TTL_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """初期化
+
+        Args:
+            cell_size_deg: セルの大きさ (度)
+            max_entries: 蓄積するランドマーク数の上限
+            ttl_seconds: 再取得されないランドマークを削除するまでの秒数
+            clock: 現在時刻 (秒) を返す関数 (テスト用)
+        """
+        if not 0.0 < cell_size_deg <= 90.0:
+            raise ValueError("cell_size_deg は0より大きく90以下を指定してください")
+        if max_entries < 1:
+            raise ValueError("max_entries は1以上を指定してください")
+        self._cell_size_deg = cell_size_deg
+        self._max_entries = max_entries
+        self._ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._longitude_cells = math.ceil(360.0 / cell_size_deg)
+        # Place ID -> (取得時刻, ランドマーク, セル) の取得時刻順のマップ
+        self._entries: OrderedDict[str, tuple[float, Landmark, _Cell]] = OrderedDict()
+        # セル -> セル内のPlace ID (検索結果の順序を保つため、値を使わないdictで保持する)
+        self._cells: dict[_Cell, dict[str, None]] = {}
+
+    async def add(self, landmarks: list[Landmark]) -> None:
+        """ランドマークを蓄積する (同じPlace IDのランドマークは上書きする)
+
+        Args:
+            landmarks: Places APIで取得したランドマーク
+        """
+        now = self._clock()
+        for landmark in landmarks:
+            self._remove(landmark.place_id)
+            cell = self._cell_of(landmark.coordinate)
+            self._entries[landmark.place_id] = (now, landmark, cell)
+            self._cells.setdefault(cell, {})[landmark.place_id] = None
+        self._evict(now)
+
+    async def find_within(
+        self, center: Coordinate, min_distance_m: float, max_distance_m: float
+    ) -> list[Landmark]:
+        """中心からの距離が範囲内のランドマークを検索する
+
+        Args:
+            center: 中心座標
+            min_distance_m: 距離の下限 (メートル)
+            max_distance_m: 距離の上限 (メートル)
+
+        Returns:
+            list[Landmark]: min_distance_m 以上 max_distance_m 以下の距離にあるランドマーク
+        """
+        self._evict(self._clock())
+        landmarks = []
+        for cell in self._cells_within(center, max_distance_m):
+            for place_id in self._cells.get(cell, {}):
+                landmark = self._entries[place_id][1]
+                distance = calculate_distance(center, landmark.coordinate)
+                if min_distance_m <= distance <= max_distance_m:
+                    landmarks.append(landmark)
+        return landmarks
+
+    def __len__(self) -> int:
+        """蓄積しているランドマーク数"""
+        return len(self._entries)
+
+    def _cell_of(self, coordinate: Coordinate) -> _Cell:
+        """座標が属するセルを取得
+
+        Args:
+            coordinate: 座標
+
+        Returns:
+            _Cell: 緯度方向と経度方向のセルの番号
+        """
+        row = math.floor((coordinate.latitude + 90.0) / self._cell_size_deg)
+        column = math.floor((coordinate.longitude + 180.0) / self._cell_size_deg)
+        # NOTE: 経度180度は-180度と同じ列とし、日付変更線をまたぐ検索でも隣接させる
+        return row, column % self._longitude_cells
+
+    def _cells_within(self, center: Coordinate, distance_m: float) -> Iterator[_Cell]:
+        """中心から指定距離までの範囲を覆うセルを列挙する
+
+        Args:
+            center: 中心座標
+            distance_m: 距離 (メートル)
+
+        Yields:
+            _Cell: 範囲と重なる可能性のあるセル
+        """
+        cells: dict[_Cell, None] = {}
+        for south, north, west, east in calculate_bounding_boxes(center, distance_m):
+            south_row, west_column = self._cell_of(Coordinate.trusted(south, west))
+            north_row, east_column = self._cell_of(Coordinate.trusted(north, east))
+            # NOTE: 経度180度の列番号は0に戻るため、東端が経度180度の場合は最後の列までとする
+            if east >= 180.0:
+                east_column = self._longitude_cells - 1
+            for row in range(south_row, north_row + 1):
+                for column in range(west_column, east_column + 1):
+                    cells[row, column] = None
+        yield from cells
+
+    def _remove(self, place_id: str) -> None:
+        """ランドマークを削除する
+
+        Args:
+            place_id: 削除するランドマークのPlace ID
+        """
+        entry = self._entries.pop(place_id, None)
+        if entry is None:
+            return
+        cell = entry[2]
+        place_ids = self._cells[cell]
+        del place_ids[place_id]
+        if not place_ids:
+            del self._cells[cell]
+
+    def _evict(self, now: float) -> None:
+        """期限切れのランドマークと上限を超えた分を古い順に削除する
+
+        Args:
+            now: 現在時刻 (秒)
+        """
+        expires_before = now - self._ttl_seconds
+        while self._entries:
+            place_id, (added_at, _, _) = next(iter(self._entries.items()))
+            if added_at > expires_before and len(self._entries) <= self._max_entries:
+                return
+            self._remove(place_id)
@@ -0,0 +1,212 @@
+"""SQLiteのランドマークカタログGateway実装
+
+取得済みのランドマークをSQLiteに保存し、R*Treeで索引して中心からの距離で検索します。
+"""
+
+import asyncio
+import json
+import sqlite3
+import threading
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+from app.application.gateway_interfaces.landmark_catalog_gateway import LandmarkCatalogGateway
+from app.config import LANDMARK_CATALOG_TTL_SECONDS
+from app.domain.services.coordinate_service import calculate_bounding_boxes, calculate_distance
+from app.domain.value_objects import Coordinate, Landmark
+
+# 他のワーカープロセスの書き込みが終わるのを待つ上限 (秒)
+_BUSY_TIMEOUT_SECONDS = 5.0
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS landmarks (
+    id INTEGER PRIMARY KEY,
+    place_id TEXT NOT NULL UNIQUE,
+    display_name TEXT NOT NULL,
+    latitude REAL NOT NULL,
+    longitude REAL NOT NULL,
+    primary_type TEXT,
+    types TEXT,
+    last_seen_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS landmarks_last_seen_at ON landmarks (last_seen_at);
+CREATE VIRTUAL TABLE IF NOT EXISTS landmarks_rtree USING rtree (
+    id, min_latitude, max_latitude, min_longitude, max_longitude
+);
+"""
+
+_UPSERT_LANDMARK = """
+INSERT INTO landmarks (
+    place_id, display_name, latitude, longitude, primary_type, types, last_seen_at
+)
+VALUES (?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT (place_id) DO UPDATE SET
+    display_name = excluded.display_name,
+    latitude = excluded.latitude,
+    longitude = excluded.longitude,
+    primary_type = excluded.primary_type,
+    types = excluded.types,
+    last_seen_at = excluded.last_seen_at
+RETURNING id
+"""
+
+_UPSERT_RTREE = """
+INSERT OR REPLACE INTO landmarks_rtree (
+    id, min_latitude, max_latitude, min_longitude, max_longitude
+)
+VALUES (?, ?, ?, ?, ?)
+"""
+
+_FIND_IN_BOX = """
+SELECT l.place_id, l.display_name, l.latitude, l.longitude, l.primary_type, l.types
+FROM landmarks_rtree AS r
+JOIN landmarks AS l ON l.id = r.id
+WHERE r.max_latitude >= ? AND r.min_latitude <= ?
+    AND r.max_longitude >= ? AND r.min_longitude <= ?
+    AND l.last_seen_at > ?
+ORDER BY l.id
+"""
+
+
+class SqliteLandmarkCatalogGatewayImpl(LandmarkCatalogGateway):
+    """SQLiteに永続化するランドマークカタログ
+
+    ランドマークを landmarks テーブルに Place ID で一括upsertし、座標を R*Tree の
+    仮想テーブルで索引します。検索は矩形で候補を絞り込んだ後に測地線距離で判定します。
+    最後に取得してから ttl_seconds を過ぎたランドマークは古いものとして検索結果に含めず、
+    Places APIで再取得させます (古いランドマークは蓄積時に削除します)。
+    WALモードで開くため、同じファイルを複数のワーカープロセスで共有でき、再起動後も
+    蓄積したランドマークを使えます。
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        ttl_seconds: float = LANDMARK_CATALOG_TTL_SECONDS,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """初期化
+
+        Args:
+            path: SQLiteのデータベースファイルのパス
+            ttl_seconds: ランドマークを最後に取得してから古いものとみなすまでの秒数
+            clock: 現在時刻 (UNIX時間の秒) を返す関数 (テスト用)
+        """
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._ttl_seconds = ttl_seconds
+        self._clock = clock
+        # NOTE: スレッドプールから呼び出すため、1つの接続をロックで保護して共有する
+        self._connection = sqlite3.connect(
+            path, timeout=_BUSY_TIMEOUT_SECONDS, check_same_thread=False
+        )
+        self._lock = threading.Lock()
+        with self._lock:
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.executescript(_SCHEMA)
+
+    async def add(self, landmarks: list[Landmark]) -> None:
+        """ランドマークを蓄積する (同じPlace IDのランドマークは上書きする)
+
+        Args:
+            landmarks: Places APIで取得したランドマーク
+        """
+        # ファイルI/Oでイベントループを止めないよう、データベースの操作はスレッドで実行する
+        await asyncio.to_thread(self._upsert, landmarks)
+
+    async def find_within(
+        self, center: Coordinate, min_distance_m: float, max_distance_m: float
+    ) -> list[Landmark]:
+        """中心からの距離が範囲内のランドマークを検索する
+
+        Args:
+            center: 中心座標
+            min_distance_m: 距離の下限 (メートル)
+            max_distance_m: 距離の上限 (メートル)
+
+        Returns:
+            list[Landmark]: min_distance_m 以上 max_distance_m 以下の距離にある、
+                古くないランドマーク
+        """
+        return await asyncio.to_thread(self._find_within, center, min_distance_m, max_distance_m)
+
+    def close(self) -> None:
+        """データベースの接続を閉じる"""
+        with self._lock:
+            self._connection.close()
+
+    def _upsert(self, landmarks: list[Landmark]) -> None:
+        """ランドマークを1つのトランザクションでupsertし、古いランドマークを削除する
+
+        Args:
+            landmarks: 蓄積するランドマーク
+        """
+        now = self._clock()
+        with self._lock, self._connection:
+            for landmark in landmarks:
+                latitude = landmark.coordinate.latitude
+                longitude = landmark.coordinate.longitude
+                (row_id,) = self._connection.execute(
+                    _UPSERT_LANDMARK,
+                    (
+                        landmark.place_id,
+                        landmark.display_name,
+                        latitude,
+                        longitude,
+                        landmark.primary_type,
+                        json.dumps(landmark.types) if landmark.types is not None else None,
+                        now,
+                    ),
+                ).fetchone()
+                self._connection.execute(
+                    _UPSERT_RTREE, (row_id, latitude, latitude, longitude, longitude)
+                )
+
+            expires_before = now - self._ttl_seconds
+            self._connection.execute(
+                "DELETE FROM landmarks_rtree WHERE id IN "
+                "(SELECT id FROM landmarks WHERE last_seen_at <= ?)",
+                (expires_before,),
+            )
+            self._connection.execute(
+                "DELETE FROM landmarks WHERE last_seen_at <= ?", (expires_before,)
+            )
+
+    def _find_within(
+        self, center: Coordinate, min_distance_m: float, max_distance_m: float
+    ) -> list[Landmark]:
+        """R*Treeで矩形内の候補を取得し、距離で絞り込む
+
+        Args:
+            center: 中心座標
+            min_distance_m: 距離の下限 (メートル)
+            max_distance_m: 距離の上限 (メートル)
+
+        Returns:
+            list[Landmark]: 距離が範囲内の古くないランドマーク
+        """
+        expires_before = self._clock() - self._ttl_seconds
+        with self._lock:
+            rows = [
+                row
+                for south, north, west, east in calculate_bounding_boxes(center, max_distance_m)
+                for row in self._connection.execute(
+                    _FIND_IN_BOX, (south, north, west, east, expires_before)
+                )
+            ]
+
+        landmarks: dict[str, Landmark] = {}
+        for place_id, display_name, latitude, longitude, primary_type, types in rows:
+            # NOTE: 保存時に検証済みの値のため、バリデーションを省略して復元する
+            coordinate = Coordinate.trusted(latitude, longitude)
+            if place_id in landmarks:
+                continue
+            if min_distance_m <= calculate_distance(center, coordinate) <= max_distance_m:
+                landmarks[place_id] = Landmark(
+                    place_id=place_id,
+                    display_name=display_name,
+                    coordinate=coordinate,
+                    primary_type=primary_type,
+                    types=json.loads(types) if types is not None else None,
+                )
+        return list(landmarks.values())
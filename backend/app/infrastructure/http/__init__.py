@@ -0,0 +1,9 @@
+"""HTTPトランスポート実装
+
+外部サービスとの通信に使用するHTTPクライアントを定義します。
+"""
+
+from app.infrastructure.http.async_pooled_http_transport import AsyncPooledHttpTransport
+from app.infrastructure.http.pooled_http_transport import HttpPoolStats, PooledHttpTransport
+
+__all__ = ["AsyncPooledHttpTransport", "HttpPoolStats", "PooledHttpTransport"]
@@ -0,0 +1,124 @@
+"""非同期コネクションプール付きHTTPトランスポート
+
+httpx.AsyncClientでコネクションプールとkeep-aliveを管理し、非同期に通信します。
+"""
+
+from collections.abc import Awaitable, Callable
+from urllib.parse import urlsplit
+
+import httpx
+
+from app.config import HTTP_POOL_CONNECTIONS, HTTP_POOL_MAXSIZE, REQUEST_TIMEOUT_SECONDS
+from app.infrastructure.http.pooled_http_transport import HttpPoolStats
+
+# 新規コネクション確立時に httpcore が通知するトレースイベント
+_CONNECT_TCP_COMPLETE_EVENT = "connection.connect_tcp.complete"
+
+
+class AsyncPooledHttpTransport:
+    """keep-aliveコネクションを再利用する非同期HTTPトランスポート
+
+    1つのhttpx.AsyncClientを保持し、イベントループ上の全リクエストでコネクションプールを共有します。
+    新規接続数は httpcore のトレース拡張で計測します。
+    """
+
+    def __init__(
+        self,
+        pool_connections: int = HTTP_POOL_CONNECTIONS,
+        pool_maxsize: int = HTTP_POOL_MAXSIZE,
+        transport: httpx.AsyncBaseTransport | None = None,
+    ) -> None:
+        """初期化
+
+        Args:
+            pool_connections: 接続先ホスト数の想定値 (keep-alive保持数の算出に使用)
+            pool_maxsize: ホストあたりに保持するkeep-aliveコネクションの最大数
+            transport: httpxの下位トランスポート (テスト用。Noneの場合はデフォルト)
+        """
+        # NOTE: requests版と同様に同時接続数は制限せず、保持するkeep-alive数のみ制限する
+        limits = httpx.Limits(
+            max_connections=None,
+            max_keepalive_connections=pool_connections * pool_maxsize,
+        )
+        self._client = httpx.AsyncClient(limits=limits, transport=transport)
+        # ホスト名 -> [新規接続数, リクエスト数]
+        self._counters: dict[str, list[int]] = {}
+
+    async def get(
+        self,
+        url: str,
+        params: dict | None = None,
+        headers: dict | None = None,
+        timeout: float = REQUEST_TIMEOUT_SECONDS,
+    ) -> httpx.Response:
+        """GETリクエストを送信
+
+        Args:
+            url: リクエストURL
+            params: クエリパラメータ
+            headers: リクエストヘッダー
+            timeout: タイムアウト (秒)
+
+        Returns:
+            httpx.Response: レスポンス
+        """
+        return await self._client.get(
+            url,
+            params=params,
+            headers=headers,
+            timeout=timeout,
+            extensions={"trace": self._build_trace(url)},
+        )
+
+    async def post(
+        self,
+        url: str,
+        json: dict | None = None,
+        headers: dict | None = None,
+        timeout: float = REQUEST_TIMEOUT_SECONDS,
+    ) -> httpx.Response:
+        """POSTリクエストを送信
+
+        Args:
+            url: リクエストURL
+            json: JSONとして送信するリクエストボディ
+            headers: リクエストヘッダー
+            timeout: タイムアウト (秒)
+
+        Returns:
+            httpx.Response: レスポンス
+        """
+        return await self._client.post(
+            url,
+            json=json,
+            headers=headers,
+            timeout=timeout,
+            extensions={"trace": self._build_trace(url)},
+        )
+
+    def get_stats(self) -> list[HttpPoolStats]:
+        """ホストごとのコネクションプール統計を取得
+
+        Returns:
+            list[HttpPoolStats]: ホスト単位の統計 (ホスト名順)
+        """
+        return [
+            HttpPoolStats(host=host, connections_opened=opened, requests=requests)
+            for host, (opened, requests) in sorted(self._counters.items())
+        ]
+
+    async def aclose(self) -> None:
+        """保持しているコネクションをすべて閉じる"""
+        await self._client.aclose()
+
+    def _build_trace(self, url: str) -> Callable[[str, dict], Awaitable[None]]:
+        """リクエスト単位のトレースコールバックを生成し、リクエスト数を計上する"""
+        host = urlsplit(url).hostname or ""
+        counter = self._counters.setdefault(host, [0, 0])
+        counter[1] += 1
+
+        async def trace(event_name: str, info: dict) -> None:
+            if event_name == _CONNECT_TCP_COMPLETE_EVENT:
+                counter[0] += 1
+
+        return trace
@@ -3,6 +3,23 @@
 外部サービスのデータ形式をドメインオブジェクトに変換するマッパーを定義します。
 """
 
-from app.infrastructure.mappers.polyline_mapper import decode_polyline
+from app.infrastructure.mappers.google_maps_response_mapper import (
+    map_directions_response,
+    map_directions_response_arrays,
+    map_nearest_roads_batch_response,
+    map_nearest_roads_response,
+    map_places_response,
+    map_street_view_metadata_response,
+)
+from app.infrastructure.mappers.polyline_mapper import decode_polyline, decode_polyline_arrays
 
-__all__ = ["decode_polyline"]
+__all__ = [
+    "decode_polyline",
+    "decode_polyline_arrays",
+    "map_directions_response",
+    "map_directions_response_arrays",
+    "map_nearest_roads_batch_response",
+    "map_nearest_roads_response",
+    "map_places_response",
+    "map_street_view_metadata_response",
+]
@@ -0,0 +1,260 @@
+"""Google Maps APIレスポンスマッパー
+
+Google Maps APIのレスポンスJSONをドメインオブジェクトに変換します。
+"""
+
+import logging
+from array import array
+
+from app.application.gateway_interfaces.google_maps_gateway import StreetViewMetadata
+from app.domain.exceptions import ExternalServiceValidationError
+from app.domain.value_objects import Coordinate, Landmark
+from app.infrastructure.mappers.polyline_mapper import (
+    coordinates_from_arrays,
+    decode_polyline_arrays,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def map_directions_response(data: dict) -> tuple[list[Coordinate], str]:
+    """Directions APIのレスポンスをルート座標列とoverview_polylineに変換
+
+    Args:
+        data: Directions APIのレスポンスJSON
+
+    Returns:
+        tuple[list[Coordinate], str]: (ルート座標リスト, overview_polyline文字列)
+
+    Raises:
+        ExternalServiceValidationError: ステータスがOKでない、またはルートが空の場合
+    """
+    latitudes, longitudes, overview_polyline = map_directions_response_arrays(data)
+    return coordinates_from_arrays(latitudes, longitudes), overview_polyline
+
+
+def map_directions_response_arrays(data: dict) -> tuple[array[float], array[float], str]:
+    """Directions APIのレスポンスをルート座標の緯度・経度の配列とoverview_polylineに変換
+
+    ステップごとのポリラインを座標オブジェクトを生成せずに配列へ連結します。
+
+    Args:
+        data: Directions APIのレスポンスJSON
+
+    Returns:
+        tuple[array[float], array[float], str]:
+            (ルート座標の緯度の配列, ルート座標の経度の配列, overview_polyline文字列)
+
+    Raises:
+        ExternalServiceValidationError: ステータスがOKでない、またはルートが空の場合
+    """
+    if data.get("status") != "OK":
+        logger.error(f"Directions API returned non-OK status: {data.get('status')}")
+        raise ExternalServiceValidationError(
+            f"Directions API error: {data.get('status')}",
+            service_name="Directions API",
+        )
+
+    routes = data.get("routes", [])
+    if not routes or not routes[0].get("legs"):
+        logger.error("Directions API returned empty routes")
+        raise ExternalServiceValidationError(
+            "No route found",
+            service_name="Directions API",
+        )
+
+    latitudes = array("d")
+    longitudes = array("d")
+    for step in routes[0]["legs"][0]["steps"]:
+        step_latitudes, step_longitudes = decode_polyline_arrays(step["polyline"]["points"])
+        latitudes.extend(step_latitudes)
+        longitudes.extend(step_longitudes)
+
+    overview_polyline = routes[0]["overview_polyline"]["points"]
+
+    return latitudes, longitudes, overview_polyline
+
+
+def map_street_view_metadata_response(metadata_dict: dict) -> StreetViewMetadata:
+    """Street View Metadata APIのレスポンスをStreetViewMetadataに変換
+
+    Args:
+        metadata_dict: Street View Metadata APIのレスポンスJSON
+
+    Returns:
+        StreetViewMetadata: メタデータ
+
+    Raises:
+        ExternalServiceValidationError: ステータスがOKなのに座標が不完全または無効な場合
+    """
+    status = metadata_dict.get("status", "")
+    location_coordinate: Coordinate | None = None
+
+    if status == "OK":
+        location = metadata_dict.get("location")
+        if not isinstance(location, dict):
+            logger.error(
+                f"Street View metadata missing or invalid 'location' field. "
+                f"Status: {status}, Metadata: {metadata_dict}"
+            )
+            raise ExternalServiceValidationError(
+                f"Street View metadata incomplete: 'location' field is missing or invalid. "
+                f"Status: {status}, Metadata: {metadata_dict}",
+                service_name="Street View Metadata API",
+            )
+
+        lat_value = location.get("lat")
+        lng_value = location.get("lng")
+
+        if lat_value is None or lng_value is None:
+            logger.error(
+                f"Street View metadata missing 'lat' or 'lng' in location. "
+                f"Status: {status}, Location: {location}, Metadata: {metadata_dict}"
+            )
+            raise ExternalServiceValidationError(
+                f"Street View metadata incomplete: 'lat' or 'lng' is missing in location. "
+                f"Status: {status}, Location: {location}, Metadata: {metadata_dict}",
+                service_name="Street View Metadata API",
+            )
+
+        if not isinstance(lat_value, (int, float)) or not isinstance(lng_value, (int, float)):
+            logger.error(
+                f"Street View metadata has invalid type for 'lat' or 'lng'. "
+                f"Status: {status}, Location: {location}, Metadata: {metadata_dict}"
+            )
+            raise ExternalServiceValidationError(
+                f"Street View metadata incomplete: 'lat' or 'lng' has invalid type. "
+                f"Status: {status}, Location: {location}, Metadata: {metadata_dict}",
+                service_name="Street View Metadata API",
+            )
+
+        location_coordinate = Coordinate(latitude=float(lat_value), longitude=float(lng_value))
+
+    return StreetViewMetadata(status=status, location=location_coordinate)
+
+
+def map_places_response(places: list[dict]) -> list[Landmark]:
+    """Places API searchNearbyのplacesリストをLandmarkリストに変換
+
+    IDや座標が欠けている場所はスキップします。
+
+    Args:
+        places: Places APIのレスポンス (placesリスト)
+
+    Returns:
+        list[Landmark]: ランドマークのリスト
+    """
+    landmarks: list[Landmark] = []
+    for place in places:
+        place_id = place.get("id")
+        if not place_id:
+            continue
+
+        display_name_dict = place.get("displayName", {})
+        display_name = (
+            display_name_dict.get("text", "")
+            if isinstance(display_name_dict, dict)
+            else str(display_name_dict)
+        )
+
+        location = place.get("location", {})
+        if not isinstance(location, dict):
+            continue
+
+        lat_value = location.get("latitude")
+        lng_value = location.get("longitude")
+        if lat_value is None or lng_value is None:
+            continue
+
+        try:
+            landmark_coordinate = Coordinate(latitude=float(lat_value), longitude=float(lng_value))
+        except (ValueError, TypeError):
+            continue
+
+        primary_type = place.get("primaryType")
+        types = place.get("types")
+
+        landmark = Landmark(
+            place_id=place_id,
+            display_name=display_name,
+            coordinate=landmark_coordinate,
+            primary_type=primary_type,
+            types=types if isinstance(types, list) else None,
+        )
+        landmarks.append(landmark)
+
+    return landmarks
+
+
+def map_nearest_roads_response(data: dict, coordinate: Coordinate) -> Coordinate | None:
+    """Roads API (Nearest Roads) のレスポンスをスナップ後の座標に変換
+
+    Args:
+        data: Roads APIのレスポンスJSON
+        coordinate: スナップ対象の座標 (ログ出力用)
+
+    Returns:
+        Coordinate | None: スナップされた座標。道路が見つからない場合は None
+    """
+    snapped_points = data.get("snappedPoints", [])
+    if not snapped_points:
+        logger.info(f"No road found near coordinate: {coordinate}")
+        return None
+
+    # 0番目の座標を使用する
+    location = snapped_points[0].get("location", {})
+    if not isinstance(location, dict):
+        logger.warning(f"Invalid location data in Roads API response: {location}")
+        return None
+
+    lat_value = location.get("latitude")
+    lng_value = location.get("longitude")
+    if lat_value is None or lng_value is None:
+        logger.warning(f"Missing latitude or longitude in Roads API response: {location}")
+        return None
+
+    snapped_coordinate = Coordinate(latitude=float(lat_value), longitude=float(lng_value))
+    logger.info(f"Snapped coordinate {coordinate} to {snapped_coordinate}")
+    return snapped_coordinate
+
+
+def map_nearest_roads_batch_response(
+    data: dict, coordinates: list[Coordinate]
+) -> list[Coordinate | None]:
+    """複数座標に対するRoads API (Nearest Roads) のレスポンスを入力順の座標リストに変換
+
+    snappedPointsはoriginalIndexで入力座標と対応付ける。
+    1つの入力座標に複数のsnappedPointsが返る場合は最初のものを使用する。
+
+    Args:
+        data: Roads APIのレスポンスJSON
+        coordinates: スナップ対象の座標リスト (リクエストと同じ順)
+
+    Returns:
+        list[Coordinate | None]: 入力と同じ順のスナップ後の座標 (道路が見つからない座標は None)
+    """
+    results: list[Coordinate | None] = [None] * len(coordinates)
+    for snapped_point in data.get("snappedPoints", []):
+        original_index = snapped_point.get("originalIndex")
+        if not isinstance(original_index, int) or not 0 <= original_index < len(coordinates):
+            logger.warning(f"Invalid originalIndex in Roads API response: {original_index}")
+            continue
+        if results[original_index] is not None:
+            continue
+
+        location = snapped_point.get("location", {})
+        if not isinstance(location, dict):
+            logger.warning(f"Invalid location data in Roads API response: {location}")
+            continue
+
+        lat_value = location.get("latitude")
+        lng_value = location.get("longitude")
+        if lat_value is None or lng_value is None:
+            logger.warning(f"Missing latitude or longitude in Roads API response: {location}")
+            continue
+
+        results[original_index] = Coordinate(latitude=float(lat_value), longitude=float(lng_value))
+
+    snapped_count = sum(result is not None for result in results)
+    logger.info(f"Snapped {snapped_count}/{len(coordinates)} coordinates to roads")
+    return results
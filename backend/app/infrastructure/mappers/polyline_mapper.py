@@ -1,8 +1,11 @@
 """ポリラインマッパー
 
-Google Maps APIのポリライン形式をドメインオブジェクトに変換します。
+Google Maps APIのポリライン形式をドメインオブジェクトや緯度・経度の配列に変換します。
 """
 
+from array import array
+from collections.abc import Iterable, Sequence
+
 from app.domain.value_objects import Coordinate
 
 
@@ -15,17 +18,32 @@ def encode_polyline(coordinates: list[Coordinate]) -> str:
     Returns:
         str: エンコードされたポリライン文字列
     """
-    if not coordinates:
-        return ""
+    return encode_polyline_arrays(
+        [coord.latitude for coord in coordinates], [coord.longitude for coord in coordinates]
+    )
+
+
+def encode_polyline_arrays(latitudes: Iterable[float], longitudes: Iterable[float]) -> str:
+    """緯度・経度の配列をGoogle Maps APIのポリライン形式にエンコード
+
+    Args:
+        latitudes: 各点の緯度 (array('d') やNumPy配列も可)
+        longitudes: 各点の経度 (緯度と同じ長さ)
 
+    Returns:
+        str: エンコードされたポリライン文字列
+
+    Raises:
+        ValueError: 緯度と経度の長さが異なる場合
+    """
     result: list[str] = []
     prev_lat = 0
     prev_lng = 0
 
-    for coord in coordinates:
+    for latitude, longitude in zip(latitudes, longitudes, strict=True):
         # 緯度・経度を1e5倍して整数化
-        lat = round(coord.latitude * 1e5)
-        lng = round(coord.longitude * 1e5)
+        lat = round(latitude * 1e5)
+        lng = round(longitude * 1e5)
 
         # 差分を計算
         d_lat = lat - prev_lat
@@ -75,16 +93,14 @@ def merge_polylines(polyline1: str, polyline2: str) -> str:
     Returns:
         str: 結合されたポリライン
     """
-    coords1 = decode_polyline(polyline1) if polyline1 else []
-    coords2 = decode_polyline(polyline2) if polyline2 else []
+    lat1, lng1 = decode_polyline_arrays(polyline1)
+    lat2, lng2 = decode_polyline_arrays(polyline2)
 
-    # 座標リストを結合(重複する終点/始点がある場合は2番目の最初の座標を除く)
-    if coords1 and coords2 and coords1[-1] == coords2[0]:
-        merged = coords1 + coords2[1:]
-    else:
-        merged = coords1 + coords2
+    # 座標列を結合(重複する終点/始点がある場合は2番目の最初の座標を除く)
+    if lat1 and lat2 and lat1[-1] == lat2[0] and lng1[-1] == lng2[0]:
+        lat2, lng2 = lat2[1:], lng2[1:]
 
-    return encode_polyline(merged)
+    return encode_polyline_arrays(lat1 + lat2, lng1 + lng2)
 
 
 def decode_polyline(polyline_str: str) -> list[Coordinate]:
@@ -95,17 +111,42 @@ def decode_polyline(polyline_str: str) -> list[Coordinate]:
 
     Returns:
         list[Coordinate]: 座標リスト
+
+    Raises:
+        ValueError: ポリラインが不完全な場合、または座標が範囲外の場合
     """
+    latitudes, longitudes = decode_polyline_arrays(polyline_str)
+    return coordinates_from_arrays(latitudes, longitudes)
+
+
+def decode_polyline_arrays(polyline_str: str) -> tuple[array[float], array[float]]:
+    """Google Maps APIのポリラインを緯度・経度の配列にデコード
+
+    点ごとに座標オブジェクトを生成せず、緯度と経度をそれぞれdouble配列に格納します。
+
+    Args:
+        polyline_str: ポリラインの文字列
+
+    Returns:
+        tuple[array[float], array[float]]: (緯度の配列, 経度の配列)
+
+    Raises:
+        ValueError: ポリラインが不完全な場合、または座標が範囲外の場合
+    """
+    # NOTE: 文字ごとの ord() 呼び出しを避けるため、バイト列として走査する
+    data = polyline_str.encode("ascii")
+    length = len(data)
     index = 0
-    coordinates = []
+    latitudes = array("d")
+    longitudes = array("d")
     lat = 0
     lng = 0
 
-    while index < len(polyline_str):
+    while index < length:
         shift = 0
         result = 0
         while True:
-            if index >= len(polyline_str):
+            if index >= length:
                 lat_float = lat * 1e-5
                 lng_float = lng * 1e-5
                 raise ValueError(
@@ -113,7 +154,7 @@ def decode_polyline(polyline_str: str) -> list[Coordinate]:
                     f"while decoding latitude at index {index} "
                     f"(current position: lat={lat_float:.5f}, lng={lng_float:.5f})"
                 )
-            byte = ord(polyline_str[index]) - 63
+            byte = data[index] - 63
             index += 1
             result |= (byte & 0x1F) << shift
             shift += 5
@@ -126,7 +167,7 @@ def decode_polyline(polyline_str: str) -> list[Coordinate]:
         shift = 0
         result = 0
         while True:
-            if index >= len(polyline_str):
+            if index >= length:
                 lat_float = lat * 1e-5
                 lng_float = lng * 1e-5
                 raise ValueError(
@@ -134,7 +175,7 @@ def decode_polyline(polyline_str: str) -> list[Coordinate]:
                     f"while decoding longitude at index {index} "
                     f"(current position: lat={lat_float:.5f}, lng={lng_float:.5f})"
                 )
-            byte = ord(polyline_str[index]) - 63
+            byte = data[index] - 63
             index += 1
             result |= (byte & 0x1F) << shift
             shift += 5
@@ -144,8 +185,47 @@ def decode_polyline(polyline_str: str) -> list[Coordinate]:
         dlng = ~(result >> 1) if result & 1 else (result >> 1)
         lng += dlng
 
-        lat_float = lat * 1e-5
-        lng_float = lng * 1e-5
-        coordinates.append(Coordinate(latitude=lat_float, longitude=lng_float))
+        latitudes.append(lat * 1e-5)
+        longitudes.append(lng * 1e-5)
+
+    _validate_ranges(latitudes, longitudes)
+    return latitudes, longitudes
+
+
+def coordinates_from_arrays(
+    latitudes: Sequence[float], longitudes: Sequence[float]
+) -> list[Coordinate]:
+    """緯度・経度の配列から座標リストを生成
 
-    return coordinates
+    Args:
+        latitudes: 各点の緯度の配列
+        longitudes: 各点の経度の配列 (緯度と同じ長さ)
+
+    Returns:
+        list[Coordinate]: 座標リスト
+
+    Raises:
+        ValueError: 座標が範囲外の場合、または緯度と経度の長さが異なる場合
+    """
+    # NOTE: 範囲を配列全体でまとめて検証し、点ごとのバリデーションを省略して生成する
+    _validate_ranges(latitudes, longitudes)
+    return [
+        Coordinate.trusted(latitude, longitude)
+        for latitude, longitude in zip(latitudes, longitudes, strict=True)
+    ]
+
+
+def _validate_ranges(latitudes: Sequence[float], longitudes: Sequence[float]) -> None:
+    """緯度・経度がすべて範囲内であることを検証
+
+    Args:
+        latitudes: 各点の緯度の配列
+        longitudes: 各点の経度の配列
+
+    Raises:
+        ValueError: 座標が範囲外の場合
+    """
+    if len(latitudes) and not -90.0 <= min(latitudes) <= max(latitudes) <= 90.0:
+        raise ValueError("Invalid coordinate: latitude is out of range")
+    if len(longitudes) and not -180.0 <= min(longitudes) <= max(longitudes) <= 180.0:
+        raise ValueError("Invalid coordinate: longitude is out of range")
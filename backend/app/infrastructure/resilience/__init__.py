@@ -0,0 +1,22 @@
+"""耐障害性の部品
+
+外部サービスの障害や遅延から呼び出し元を保護する部品を定義します。
+"""
+
+from app.infrastructure.resilience.circuit_breaker import (
+    CircuitBreaker,
+    CircuitBreakerStats,
+    CircuitState,
+)
+from app.infrastructure.resilience.hedging import HedgingPolicy, HedgingStats
+from app.infrastructure.resilience.rate_limiter import RateLimiter, RateLimiterStats
+
+__all__ = [
+    "CircuitBreaker",
+    "CircuitBreakerStats",
+    "CircuitState",
+    "HedgingPolicy",
+    "HedgingStats",
+    "RateLimiter",
+    "RateLimiterStats",
+]
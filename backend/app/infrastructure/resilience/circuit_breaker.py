@@ -0,0 +1,237 @@
+"""サーキットブレーカー
+
+外部APIの失敗率が高い間は呼び出しを即時失敗させ、タイムアウト待ちの連鎖を防ぎます。
+"""
+
+import threading
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable
+from typing import Literal
+
+from pydantic import BaseModel, ConfigDict, Field
+
+from app.config import (
+    CIRCUIT_BREAKER_FAILURE_RATE_THRESHOLD,
+    CIRCUIT_BREAKER_HALF_OPEN_MAX_CALLS,
+    CIRCUIT_BREAKER_MINIMUM_CALLS,
+    CIRCUIT_BREAKER_OPEN_SECONDS,
+    CIRCUIT_BREAKER_WINDOW_SIZE,
+)
+from app.domain.exceptions import ExternalServiceDeadlineExceededError, ExternalServiceError
+
+type CircuitState = Literal["closed", "open", "half_open"]
+
+
+class CircuitBreakerStats(BaseModel):
+    """サーキットブレーカーの統計"""
+
+    model_config = ConfigDict(frozen=True)
+
+    state: CircuitState = Field(description="現在の状態")
+    failure_rate: float = Field(ge=0.0, le=1.0, description="直近の呼び出しの失敗率")
+    window_calls: int = Field(ge=0, description="失敗率の算出対象となっている呼び出し数")
+    rejected_calls: int = Field(ge=0, description="オープン中に即時失敗させた呼び出し数")
+    opened_count: int = Field(ge=0, description="オープン状態に遷移した回数")
+
+
+class CircuitBreaker:
+    """失敗率に基づくサーキットブレーカー
+
+    直近 window_size 件の呼び出しのうち失敗 (タイムアウトを含む例外) の割合が閾値以上になると
+    オープン状態に遷移し、open_seconds の間は外部APIを呼び出さずに
+    ExternalServiceError を送出します。経過後はハーフオープン状態として少数の試行呼び出しを
+    許可し、成功すればクローズ、失敗すれば再びオープンに戻ります。
+    呼び出し側の期限切れ (ExternalServiceDeadlineExceededError) とキャンセルは失敗に含めません。
+    同期Gatewayから複数スレッドで共有されるため、状態はロックで保護します。
+    """
+
+    def __init__(
+        self,
+        name: str,
+        failure_rate_threshold: float = CIRCUIT_BREAKER_FAILURE_RATE_THRESHOLD,
+        minimum_calls: int = CIRCUIT_BREAKER_MINIMUM_CALLS,
+        window_size: int = CIRCUIT_BREAKER_WINDOW_SIZE,
+        open_seconds: float = CIRCUIT_BREAKER_OPEN_SECONDS,
+        half_open_max_calls: int = CIRCUIT_BREAKER_HALF_OPEN_MAX_CALLS,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """初期化
+
+        Args:
+            name: 対象の外部サービス名 (エラーメッセージと統計に使用)
+            failure_rate_threshold: オープンに遷移する失敗率 (0より大きく1以下)
+            minimum_calls: 失敗率を判定するのに必要な最小呼び出し数
+            window_size: 失敗率を算出する直近の呼び出し数
+            open_seconds: オープン状態を維持する時間 (秒)
+            half_open_max_calls: ハーフオープン状態で同時に許可する試行呼び出し数
+            clock: 現在時刻 (秒) を返す関数 (テスト用)
+        """
+        if not 0.0 < failure_rate_threshold <= 1.0:
+            raise ValueError("failure_rate_threshold は0より大きく1以下を指定してください")
+        if not 1 <= minimum_calls <= window_size:
+            raise ValueError("minimum_calls は1以上 window_size 以下を指定してください")
+        if half_open_max_calls < 1:
+            raise ValueError("half_open_max_calls は1以上を指定してください")
+        self._name = name
+        self._failure_rate_threshold = failure_rate_threshold
+        self._minimum_calls = minimum_calls
+        self._open_seconds = open_seconds
+        self._half_open_max_calls = half_open_max_calls
+        self._clock = clock
+        # 直近の呼び出し結果 (Trueが失敗)
+        self._outcomes: deque[bool] = deque(maxlen=window_size)
+        self._state: CircuitState = "closed"
+        self._opened_at = 0.0
+        self._half_open_calls = 0
+        self._rejected_calls = 0
+        self._opened_count = 0
+        self._lock = threading.Lock()
+
+    @property
+    def name(self) -> str:
+        """対象の外部サービス名"""
+        return self._name
+
+    def call[T](self, func: Callable[[], T]) -> T:
+        """ブレーカーを通して関数を実行する
+
+        Args:
+            func: 外部APIを呼び出す関数
+
+        Returns:
+            T: 関数の戻り値
+
+        Raises:
+            ExternalServiceError: ブレーカーがオープンしている場合
+        """
+        is_probe = self._acquire()
+        try:
+            result = func()
+        except ExternalServiceDeadlineExceededError:
+            # NOTE: 呼び出し側の期限切れは外部APIの失敗ではないため、結果として記録しない
+            self._release(is_probe)
+            raise
+        except Exception:
+            self._record(is_probe, failed=True)
+            raise
+        except BaseException:
+            self._release(is_probe)
+            raise
+        self._record(is_probe, failed=False)
+        return result
+
+    async def call_async[T](self, func: Callable[[], Awaitable[T]]) -> T:
+        """ブレーカーを通してコルーチン関数を実行する
+
+        Args:
+            func: 外部APIを呼び出すコルーチン関数
+
+        Returns:
+            T: コルーチンの戻り値
+
+        Raises:
+            ExternalServiceError: ブレーカーがオープンしている場合
+        """
+        is_probe = self._acquire()
+        try:
+            result = await func()
+        except ExternalServiceDeadlineExceededError:
+            # NOTE: 呼び出し側の期限切れは外部APIの失敗ではないため、結果として記録しない
+            self._release(is_probe)
+            raise
+        except Exception:
+            self._record(is_probe, failed=True)
+            raise
+        except BaseException:
+            # NOTE: キャンセルは外部APIの失敗ではないため、結果として記録しない
+            self._release(is_probe)
+            raise
+        self._record(is_probe, failed=False)
+        return result
+
+    def get_stats(self) -> CircuitBreakerStats:
+        """サーキットブレーカーの統計を取得
+
+        Returns:
+            CircuitBreakerStats: 状態と失敗率
+        """
+        with self._lock:
+            self._update_state()
+            window_calls = len(self._outcomes)
+            return CircuitBreakerStats(
+                state=self._state,
+                failure_rate=sum(self._outcomes) / window_calls if window_calls else 0.0,
+                window_calls=window_calls,
+                rejected_calls=self._rejected_calls,
+                opened_count=self._opened_count,
+            )
+
+    def _acquire(self) -> bool:
+        """呼び出しの可否を判定する
+
+        Returns:
+            bool: ハーフオープン状態での試行呼び出しの場合はTrue
+
+        Raises:
+            ExternalServiceError: ブレーカーがオープンしている場合
+        """
+        with self._lock:
+            self._update_state()
+            if self._state == "closed":
+                return False
+            if self._state == "half_open" and self._half_open_calls < self._half_open_max_calls:
+                self._half_open_calls += 1
+                return True
+            self._rejected_calls += 1
+        raise ExternalServiceError(
+            f"Circuit breaker is open: {self._name} is temporarily unavailable",
+            service_name=self._name,
+        )
+
+    def _record(self, is_probe: bool, failed: bool) -> None:
+        """呼び出し結果を記録し、状態を遷移させる"""
+        with self._lock:
+            if is_probe:
+                # NOTE: 他の試行呼び出しの結果で既に遷移している場合は記録しない
+                if self._state != "half_open":
+                    return
+                self._half_open_calls -= 1
+                if failed:
+                    self._open()
+                else:
+                    self._state = "closed"
+                    self._outcomes.clear()
+                return
+
+            # NOTE: オープン前に開始した呼び出しの結果は、遷移後の状態に影響させない
+            if self._state != "closed":
+                return
+            self._outcomes.append(failed)
+            window_calls = len(self._outcomes)
+            if (
+                window_calls >= self._minimum_calls
+                and sum(self._outcomes) / window_calls >= self._failure_rate_threshold
+            ):
+                self._open()
+
+    def _release(self, is_probe: bool) -> None:
+        """結果を記録せずに試行呼び出しの枠を返却する"""
+        if not is_probe:
+            return
+        with self._lock:
+            if self._state == "half_open":
+                self._half_open_calls -= 1
+
+    def _open(self) -> None:
+        """オープン状態に遷移する (ロック取得中に呼び出す)"""
+        self._state = "open"
+        self._opened_at = self._clock()
+        self._half_open_calls = 0
+        self._opened_count += 1
+
+    def _update_state(self) -> None:
+        """オープン期間が経過していればハーフオープンに遷移する (ロック取得中に呼び出す)"""
+        if self._state == "open" and self._clock() - self._opened_at >= self._open_seconds:
+            self._state = "half_open"
+            self._half_open_calls = 0
@@ -0,0 +1,182 @@
+"""ヘッジリクエスト
+
+応答が遅い外部APIリクエストに対して同じリクエストを追加で送信し、
+先に返った応答を採用することで、テールレイテンシを抑えます。
+"""
+
+import asyncio
+import math
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable
+
+from pydantic import BaseModel, ConfigDict, Field
+
+from app.config import (
+    HEDGE_BUDGET_BURST,
+    HEDGE_BUDGET_RATIO,
+    HEDGE_LATENCY_PERCENTILE,
+    HEDGE_LATENCY_WINDOW_SIZE,
+    HEDGE_MIN_SAMPLES,
+)
+
+
+class HedgingStats(BaseModel):
+    """ヘッジリクエストの統計"""
+
+    model_config = ConfigDict(frozen=True)
+
+    requests: int = Field(ge=0, description="ポリシーを通した呼び出し数")
+    hedged: int = Field(ge=0, description="追加のリクエストを送信した呼び出し数")
+    hedge_wins: int = Field(ge=0, description="追加のリクエストの応答を採用した呼び出し数")
+    budget_exhausted: int = Field(ge=0, description="予算不足で追加のリクエストを見送った回数")
+    hedge_delay_seconds: float | None = Field(
+        description="追加のリクエストを送信するまでの待ち時間 (秒)。サンプル不足の場合はNone"
+    )
+
+
+class HedgingPolicy:
+    """観測したレイテンシに基づくヘッジリクエストのポリシー
+
+    直近 window_size 件の応答時間の percentile 分位点を過ぎても応答がない場合に、
+    同じリクエストをもう1件送信し、先に成功した応答を採用して残りをキャンセルします。
+    追加のリクエストは呼び出しごとに budget_ratio 分だけ貯まる予算 (上限 budget_burst) を
+    1つ消費するため、外部APIへのリクエスト数の増加は全体の budget_ratio 程度に抑えられます。
+    非同期Gatewayのイベントループ上でのみ使用するため、状態はロックで保護しません。
+    """
+
+    def __init__(
+        self,
+        percentile: float = HEDGE_LATENCY_PERCENTILE,
+        budget_ratio: float = HEDGE_BUDGET_RATIO,
+        budget_burst: float = HEDGE_BUDGET_BURST,
+        window_size: int = HEDGE_LATENCY_WINDOW_SIZE,
+        min_samples: int = HEDGE_MIN_SAMPLES,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """初期化
+
+        Args:
+            percentile: 追加のリクエストを送信するまでの待ち時間とする分位点 (0より大きく1未満)
+            budget_ratio: 呼び出し1件あたりに貯まる追加リクエストの予算 (0以上1以下)
+            budget_burst: 貯めておける予算の上限
+            window_size: 分位点を算出する直近の応答時間の件数
+            min_samples: 追加のリクエストを送信するのに必要な最小サンプル数
+            clock: 現在時刻 (秒) を返す関数 (テスト用)
+        """
+        if not 0.0 < percentile < 1.0:
+            raise ValueError("percentile は0より大きく1未満を指定してください")
+        if not 0.0 <= budget_ratio <= 1.0:
+            raise ValueError("budget_ratio は0以上1以下を指定してください")
+        if budget_burst < 1.0:
+            raise ValueError("budget_burst は1以上を指定してください")
+        if not 1 <= min_samples <= window_size:
+            raise ValueError("min_samples は1以上 window_size 以下を指定してください")
+        self._percentile = percentile
+        self._budget_ratio = budget_ratio
+        self._budget_burst = budget_burst
+        self._min_samples = min_samples
+        self._clock = clock
+        self._latencies: deque[float] = deque(maxlen=window_size)
+        self._budget = 0.0
+        self._requests = 0
+        self._hedged = 0
+        self._hedge_wins = 0
+        self._budget_exhausted = 0
+
+    async def run[T](self, func: Callable[[], Awaitable[T]]) -> T:
+        """ポリシーに従ってコルーチン関数を実行する
+
+        Args:
+            func: 外部APIを呼び出すコルーチン関数 (追加のリクエストでも同じ関数を呼び出す)
+
+        Returns:
+            T: 先に成功したリクエストの戻り値
+
+        Raises:
+            Exception: すべてのリクエストが失敗した場合は、最初のリクエストの例外
+        """
+        started_at = self._clock()
+        self._requests += 1
+        self._budget = min(self._budget_burst, self._budget + self._budget_ratio)
+        delay = self.hedge_delay_seconds()
+
+        primary = asyncio.ensure_future(func())
+        tasks = [primary]
+        try:
+            if delay is not None:
+                done, _ = await asyncio.wait(tasks, timeout=delay)
+                if not done and self._acquire_budget():
+                    tasks.append(asyncio.ensure_future(func()))
+            winner = await self._wait_first_success(tasks)
+        finally:
+            # NOTE: 負けたリクエストはキャンセルし、接続を解放し終えるまで待つ
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        # NOTE: すべて失敗した場合はここで最初のリクエストの例外を送出する
+        result = winner.result()
+        self._latencies.append(self._clock() - started_at)
+        if winner is not primary:
+            self._hedge_wins += 1
+        return result
+
+    def hedge_delay_seconds(self) -> float | None:
+        """追加のリクエストを送信するまでの待ち時間を取得
+
+        Returns:
+            float | None: 直近の応答時間の分位点 (秒)。サンプル不足の場合はNone
+        """
+        if len(self._latencies) < self._min_samples:
+            return None
+        latencies = sorted(self._latencies)
+        index = math.ceil(self._percentile * len(latencies)) - 1
+        return latencies[index]
+
+    def get_stats(self) -> HedgingStats:
+        """ヘッジリクエストの統計を取得
+
+        Returns:
+            HedgingStats: 呼び出し数と追加のリクエスト数
+        """
+        return HedgingStats(
+            requests=self._requests,
+            hedged=self._hedged,
+            hedge_wins=self._hedge_wins,
+            budget_exhausted=self._budget_exhausted,
+            hedge_delay_seconds=self.hedge_delay_seconds(),
+        )
+
+    def _acquire_budget(self) -> bool:
+        """追加のリクエスト1件分の予算を消費する
+
+        Returns:
+            bool: 予算が残っていた場合はTrue
+        """
+        if self._budget < 1.0:
+            self._budget_exhausted += 1
+            return False
+        self._budget -= 1.0
+        self._hedged += 1
+        return True
+
+    @staticmethod
+    async def _wait_first_success[T](tasks: list[asyncio.Future[T]]) -> asyncio.Future[T]:
+        """最初に成功したタスクを待つ
+
+        Args:
+            tasks: 送信順のタスク
+
+        Returns:
+            asyncio.Future[T]: 最初に成功したタスク。すべて失敗した場合は最初のタスク
+        """
+        pending = set(tasks)
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            # NOTE: 未取得の例外として警告されないよう、完了したタスクの例外はすべて取得する
+            succeeded = [task for task in tasks if task in done and task.exception() is None]
+            if succeeded:
+                return succeeded[0]
+        return tasks[0]
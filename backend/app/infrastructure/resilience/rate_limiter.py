@@ -0,0 +1,178 @@
+"""トークンバケットによるレート制限
+
+外部APIへのリクエストを設定した速度に平準化し、クォータ超過 (429) を未然に防ぎます。
+"""
+
+import asyncio
+import threading
+import time
+from collections.abc import Callable
+
+from pydantic import BaseModel, ConfigDict, Field
+
+from app.config import RATE_LIMIT_MAX_WAIT_SECONDS
+from app.domain.exceptions import ExternalServiceDeadlineExceededError, ExternalServiceError
+
+
+class RateLimiterStats(BaseModel):
+    """レート制限の統計"""
+
+    model_config = ConfigDict(frozen=True)
+
+    rate_per_second: float = Field(gt=0, description="1秒あたりに補充するトークン数")
+    burst: int = Field(ge=1, description="バケットに蓄えられるトークン数の上限")
+    acquired: int = Field(ge=0, description="トークンを取得した呼び出し数")
+    delayed: int = Field(ge=0, description="トークンの補充を待った呼び出し数")
+    rejected: int = Field(
+        ge=0, description="待ち時間が上限または期限までの残り時間を超えたため失敗させた呼び出し数"
+    )
+    total_wait_seconds: float = Field(ge=0, description="トークン待ちの合計時間 (秒)")
+    max_wait_seconds: float = Field(ge=0, description="トークン待ちの最大時間 (秒)")
+
+
+class RateLimiter:
+    """トークンバケットによるレート制限
+
+    呼び出しごとにトークンを1つ予約し、不足している場合は補充されるまで待機します。
+    予約はロック内で行い待機はロック外で行うため、同期Gatewayの複数スレッドや
+    イベントループ上の複数タスクで共有しても、到着順に待ち時間が割り当てられます。
+    """
+
+    def __init__(
+        self,
+        name: str,
+        rate_per_second: float,
+        burst: int,
+        max_wait_seconds: float = RATE_LIMIT_MAX_WAIT_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        """初期化
+
+        Args:
+            name: 対象の外部サービス名 (エラーメッセージに使用)
+            rate_per_second: 1秒あたりに補充するトークン数
+            burst: バケットに蓄えられるトークン数の上限
+            max_wait_seconds: トークン待ちの上限 (秒)
+            clock: 現在時刻 (秒) を返す関数 (テスト用)
+            sleep: 同期版の待機関数 (テスト用)
+        """
+        if rate_per_second <= 0:
+            raise ValueError("rate_per_second は0より大きい値を指定してください")
+        if burst < 1:
+            raise ValueError("burst は1以上を指定してください")
+        self._name = name
+        self._rate_per_second = rate_per_second
+        self._burst = burst
+        self._max_wait_seconds = max_wait_seconds
+        self._clock = clock
+        self._sleep = sleep
+        self._tokens = float(burst)
+        self._updated_at = clock()
+        self._lock = threading.Lock()
+        self._acquired = 0
+        self._delayed = 0
+        self._rejected = 0
+        self._total_wait_seconds = 0.0
+        self._max_observed_wait_seconds = 0.0
+
+    def acquire(self, remaining_seconds: float | None = None) -> None:
+        """トークンを取得する (不足している場合は補充まで待機する)
+
+        Args:
+            remaining_seconds: 呼び出し元の期限までの残り時間 (Noneの場合は期限を考慮しない)
+
+        Raises:
+            ExternalServiceError: 待ち時間が上限を超える場合
+            ExternalServiceDeadlineExceededError: 待機中に期限を過ぎる場合
+        """
+        wait_seconds = self._reserve(remaining_seconds)
+        if wait_seconds > 0:
+            self._sleep(wait_seconds)
+
+    async def acquire_async(self, remaining_seconds: float | None = None) -> None:
+        """トークンを取得する (不足している場合はイベントループを止めずに待機する)
+
+        Args:
+            remaining_seconds: 呼び出し元の期限までの残り時間 (Noneの場合は期限を考慮しない)
+
+        Raises:
+            ExternalServiceError: 待ち時間が上限を超える場合
+            ExternalServiceDeadlineExceededError: 待機中に期限を過ぎる場合
+        """
+        wait_seconds = self._reserve(remaining_seconds)
+        if wait_seconds <= 0:
+            return
+        try:
+            await asyncio.sleep(wait_seconds)
+        except asyncio.CancelledError:
+            # NOTE: 待機中にキャンセルされた呼び出しはリクエストしないため、予約を返却する
+            self._refund()
+            raise
+
+    def get_stats(self) -> RateLimiterStats:
+        """レート制限の統計を取得
+
+        Returns:
+            RateLimiterStats: 取得数と待ち時間
+        """
+        with self._lock:
+            return RateLimiterStats(
+                rate_per_second=self._rate_per_second,
+                burst=self._burst,
+                acquired=self._acquired,
+                delayed=self._delayed,
+                rejected=self._rejected,
+                total_wait_seconds=self._total_wait_seconds,
+                max_wait_seconds=self._max_observed_wait_seconds,
+            )
+
+    def _reserve(self, remaining_seconds: float | None = None) -> float:
+        """トークンを1つ予約し、利用可能になるまでの待ち時間を返す
+
+        Args:
+            remaining_seconds: 呼び出し元の期限までの残り時間 (Noneの場合は期限を考慮しない)
+
+        Returns:
+            float: 待ち時間 (秒)
+
+        Raises:
+            ExternalServiceError: 待ち時間が上限を超える場合
+            ExternalServiceDeadlineExceededError: 待機中に期限を過ぎる場合
+        """
+        with self._lock:
+            self._refill()
+            # NOTE: トークンが負の場合は、先に予約した呼び出しの分だけ待ち時間が延びる
+            wait_seconds = max(0.0, (1.0 - self._tokens) / self._rate_per_second)
+            if wait_seconds > self._max_wait_seconds:
+                self._rejected += 1
+                raise ExternalServiceError(
+                    f"Rate limit exceeded: {self._name} is throttled on the client side",
+                    service_name=self._name,
+                )
+            # NOTE: 待ち終えた時点で期限を過ぎる呼び出しはリクエストしないため、トークンを予約しない
+            if remaining_seconds is not None and wait_seconds >= remaining_seconds:
+                self._rejected += 1
+                raise ExternalServiceDeadlineExceededError(
+                    f"Deadline exceeded before {self._name} rate limit allows a request",
+                    service_name=self._name,
+                )
+            self._tokens -= 1.0
+            self._acquired += 1
+            if wait_seconds > 0:
+                self._delayed += 1
+                self._total_wait_seconds += wait_seconds
+                self._max_observed_wait_seconds = max(self._max_observed_wait_seconds, wait_seconds)
+            return wait_seconds
+
+    def _refund(self) -> None:
+        """予約したトークンを返却する"""
+        with self._lock:
+            self._tokens = min(float(self._burst), self._tokens + 1.0)
+
+    def _refill(self) -> None:
+        """経過時間に応じてトークンを補充する (ロック取得中に呼び出す)"""
+        now = self._clock()
+        elapsed = max(0.0, now - self._updated_at)
+        self._tokens = min(float(self._burst), self._tokens + elapsed * self._rate_per_second)
+        self._updated_at = now
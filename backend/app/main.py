@@ -2,21 +2,48 @@
 
 import functools
 import logging
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 
+from app import container
 from app.api.openapi import custom_openapi
-from app.api.routes import route
+from app.api.routes import images, route, stats
+from app.application.gateway_interfaces.async_google_maps_gateway import AsyncGoogleMapsGateway
+from app.application.usecases.route_pool import RoutePool
 from app.config import ENV
 
 LOG_LEVEL = logging.DEBUG if ENV == "dev" else logging.INFO
 logging.basicConfig(level=LOG_LEVEL)
 
 logger = logging.getLogger(__name__)
-app = FastAPI()
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """アプリケーションの起動・終了時の処理
+
+    起動時に人気エリアのルートの事前生成を開始し、終了時に事前生成を停止して
+    非同期Gatewayが保持するコネクションを閉じます。
+
+    Args:
+        app: FastAPIアプリケーションインスタンス
+    """
+    injector = container.get_container()
+    route_pool = injector.get(RoutePool)
+    route_pool.start()
+    yield
+    await route_pool.aclose()
+    await injector.get(AsyncGoogleMapsGateway).aclose()
+
+
+app = FastAPI(lifespan=lifespan)
 
 # OpenAPIスキーマをカスタマイズ
 # NOTE: functools.partial でラップして呼び出し時に app を渡す
 app.openapi = functools.partial(custom_openapi, app)
 
 app.include_router(route.router)
+app.include_router(images.router)
+app.include_router(stats.router)
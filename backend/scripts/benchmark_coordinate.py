@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""座標オブジェクト生成のベンチマークスクリプト
+
+Coordinate の通常の生成 (バリデーションあり)、model_construct、trusted について、
+1件あたりの生成時間とメモリ使用量を比較します。
+"""
+
+import sys
+import timeit
+import tracemalloc
+from collections.abc import Callable
+from pathlib import Path
+
+# プロジェクトルートを取得
+project_root = Path(__file__).parent.parent.parent
+backend_dir = project_root / "backend"
+
+# バックエンドディレクトリをパスに追加
+sys.path.insert(0, str(backend_dir))
+
+from app.domain.value_objects import Coordinate  # noqa: E402
+
+NUM_COORDINATES = 10_000
+REPEAT = 7
+
+latitudes = [35.6812 + i * 1e-6 for i in range(NUM_COORDINATES)]
+longitudes = [139.7671 + i * 1e-6 for i in range(NUM_COORDINATES)]
+
+constructors: dict[str, Callable[[float, float], Coordinate]] = {
+    "Coordinate()": lambda latitude, longitude: Coordinate(latitude=latitude, longitude=longitude),
+    "model_construct": lambda latitude, longitude: Coordinate.model_construct(
+        latitude=latitude, longitude=longitude
+    ),
+    "trusted": Coordinate.trusted,
+}
+
+
+def build(constructor: Callable[[float, float], Coordinate]) -> list[Coordinate]:
+    """座標のリストを生成する"""
+    return [
+        constructor(latitude, longitude)
+        for latitude, longitude in zip(latitudes, longitudes, strict=True)
+    ]
+
+
+print(f"{NUM_COORDINATES}件の座標を生成 (時間は{REPEAT}回計測の最良値)")
+for name, constructor in constructors.items():
+    elapsed = min(timeit.repeat(lambda c=constructor: build(c), number=1, repeat=REPEAT))
+
+    tracemalloc.start()
+    coordinates = build(constructor)
+    allocated, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del coordinates
+
+    print(
+        f"  {name:<16} {elapsed / NUM_COORDINATES * 1e9:8.0f} ns/件"
+        f"  {allocated / NUM_COORDINATES:6.0f} B/件"
+    )
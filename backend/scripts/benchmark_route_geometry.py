@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""ルート分割のベンチマークスクリプト
+
+10,000点のルートを等分割する処理について、区間ごとにgeopyで距離を計算する従来の方法と、
+RouteGeometry の各距離計算方法の処理時間を比較します。
+"""
+
+import random
+import sys
+import timeit
+from itertools import pairwise
+from pathlib import Path
+
+# プロジェクトルートを取得
+project_root = Path(__file__).parent.parent.parent
+backend_dir = project_root / "backend"
+
+# バックエンドディレクトリをパスに追加
+sys.path.insert(0, str(backend_dir))
+
+from geopy.distance import geodesic  # noqa: E402
+
+from app.domain.services.route_geometry import RouteGeometry  # noqa: E402
+from app.domain.value_objects import Coordinate  # noqa: E402
+
+NUM_POINTS = 10_000
+NUM_SEGMENTS = 5
+REPEAT = 5
+
+
+def build_route(num_points: int) -> list[Coordinate]:
+    """東京駅から数十メートルずつ進む折れ線のルートを生成する"""
+    rng = random.Random(0)  # noqa: S311 (再現性のためのシード付き乱数なので問題なし)
+    latitude, longitude = 35.6812, 139.7671
+    route = [Coordinate(latitude=latitude, longitude=longitude)]
+    for _ in range(num_points - 1):
+        latitude += rng.uniform(-0.0004, 0.0004)
+        longitude += rng.uniform(-0.0004, 0.0004)
+        route.append(Coordinate(latitude=latitude, longitude=longitude))
+    return route
+
+
+def legacy_cumulative_distance(route: list[Coordinate]) -> float:
+    """区間ごとにgeopyで距離を計算する従来の方法で総距離を求める"""
+    return sum(
+        geodesic((start.latitude, start.longitude), (end.latitude, end.longitude)).meters
+        for start, end in pairwise(route)
+    )
+
+
+route = build_route(NUM_POINTS)
+benchmarks = {
+    "geopy (従来)": lambda: legacy_cumulative_distance(route),
+    "geodesic": lambda: RouteGeometry.from_coordinates(route, "geodesic").divide(NUM_SEGMENTS),
+    "ellipsoidal": lambda: RouteGeometry.from_coordinates(route, "ellipsoidal").divide(
+        NUM_SEGMENTS
+    ),
+    "haversine": lambda: RouteGeometry.from_coordinates(route, "haversine").divide(NUM_SEGMENTS),
+}
+
+print(f"{NUM_POINTS}点のルートを{NUM_SEGMENTS}個の中間地点に分割 (最良値、{REPEAT}回計測)")
+baseline = None
+for name, benchmark in benchmarks.items():
+    elapsed = min(timeit.repeat(benchmark, number=1, repeat=REPEAT))
+    baseline = baseline or elapsed
+    print(f"  {name:<14} {elapsed * 1000:9.2f} ms  (x{baseline / elapsed:.1f})")
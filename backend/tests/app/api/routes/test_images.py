@@ -0,0 +1,142 @@
+"""画像配信APIのテスト"""
+
+import asyncio
+import hashlib
+from collections.abc import Iterator
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.api.routes.images import _matches_etag, get_image_storage_gateway
+from app.application.gateway_interfaces.image_storage_gateway import ImageStorageGateway
+from app.config import IMAGE_RESPONSE_MAX_AGE_SECONDS
+from app.main import app
+
+_IMAGE_DATA = b"jpeg-bytes"
+_CONTENT_HASH = hashlib.sha256(_IMAGE_DATA).hexdigest()
+_ETAG = f'"{_CONTENT_HASH}"'
+
+
+class InMemoryImageStorageGateway(ImageStorageGateway):
+    """画像をメモリに保存するテスト用の画像ストレージGateway"""
+
+    def __init__(self, shared: bool = True) -> None:
+        """初期化"""
+        self.images: dict[str, bytes] = {}
+        self._shared = shared
+        self.find_calls = 0
+
+    @property
+    def shared(self) -> bool:
+        """他のインスタンスからも保存した画像を取得できるかどうか"""
+        return self._shared
+
+    async def save(self, image_data: bytes) -> str:
+        """画像を保存する"""
+        content_hash = hashlib.sha256(image_data).hexdigest()
+        self.images[content_hash] = image_data
+        return content_hash
+
+    async def find(self, content_hash: str) -> bytes | None:
+        """コンテンツハッシュに対応する画像を取得する"""
+        self.find_calls += 1
+        return self.images.get(content_hash)
+
+
+@pytest.fixture
+def image_storage() -> InMemoryImageStorageGateway:
+    """テスト用の画像ストレージGateway"""
+    return InMemoryImageStorageGateway()
+
+
+@pytest.fixture
+def client(image_storage: InMemoryImageStorageGateway) -> Iterator[TestClient]:
+    """画像ストレージをテスト用に差し替えたクライアント
+
+    NOTE: ルート事前生成を起動しないよう、lifespanを実行せずにリクエストを送る
+    """
+    app.dependency_overrides[get_image_storage_gateway] = lambda: image_storage
+    try:
+        yield TestClient(app)
+    finally:
+        app.dependency_overrides.clear()
+
+
+class TestGetImage:
+    """GET /images/{content_hash} のテスト"""
+
+    def test_画像とキャッシュ用のヘッダーを返すこと(
+        self, client: TestClient, image_storage: InMemoryImageStorageGateway
+    ) -> None:
+        """保存した画像をJPEGとして返し、ETagとCache-Controlを付けることを確認"""
+        asyncio.run(image_storage.save(_IMAGE_DATA))
+
+        response = client.get(f"/images/{_CONTENT_HASH}")
+
+        assert response.status_code == 200
+        assert response.content == _IMAGE_DATA
+        assert response.headers["content-type"] == "image/jpeg"
+        assert response.headers["etag"] == _ETAG
+        assert response.headers["cache-control"] == (
+            f"public, max-age={IMAGE_RESPONSE_MAX_AGE_SECONDS}, immutable"
+        )
+
+    @pytest.mark.parametrize("if_none_match", [_ETAG, f"W/{_ETAG}", "*", f'"other", {_ETAG}'])
+    def test_ETagが一致する場合はストアを参照せずに304を返すこと(
+        self,
+        client: TestClient,
+        image_storage: InMemoryImageStorageGateway,
+        if_none_match: str,
+    ) -> None:
+        """If-None-Matchが一致する場合は本文なしの304とキャッシュ用のヘッダーを返すことを確認"""
+        response = client.get(f"/images/{_CONTENT_HASH}", headers={"If-None-Match": if_none_match})
+
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers["etag"] == _ETAG
+        assert "immutable" in response.headers["cache-control"]
+        assert image_storage.find_calls == 0
+
+    def test_ETagが一致しない場合は画像を返すこと(
+        self, client: TestClient, image_storage: InMemoryImageStorageGateway
+    ) -> None:
+        """別の画像のETagを指定した場合は200で画像を返すことを確認"""
+        asyncio.run(image_storage.save(_IMAGE_DATA))
+
+        response = client.get(f"/images/{_CONTENT_HASH}", headers={"If-None-Match": '"other"'})
+
+        assert response.status_code == 200
+        assert response.content == _IMAGE_DATA
+
+    def test_存在しないハッシュは404を返すこと(self, client: TestClient) -> None:
+        """保存されていない画像を指定した場合は404となることを確認"""
+        response = client.get(f"/images/{'0' * 64}")
+
+        assert response.status_code == 404
+
+    def test_ハッシュの形式が不正な場合はバリデーションエラーになること(
+        self, client: TestClient
+    ) -> None:
+        """SHA-256の16進表記でないパスは422となることを確認"""
+        response = client.get("/images/not-a-hash")
+
+        assert response.status_code == 422
+
+
+class TestMatchesEtag:
+    """_matches_etagのテスト"""
+
+    @pytest.mark.parametrize(
+        ("if_none_match", "expected"),
+        [
+            ('"abc"', True),
+            ('W/"abc"', True),
+            ("*", True),
+            ('"x", W/"abc"', True),
+            ('"x"', False),
+            ("abc", False),
+        ],
+    )
+    def test_弱い比較でETagと比較すること(self, if_none_match: str, expected: bool) -> None:
+        """W/の有無を無視し、*やカンマ区切りの複数指定にも一致することを確認"""
+        assert _matches_etag(if_none_match, '"abc"') is expected
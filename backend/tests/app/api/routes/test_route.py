@@ -0,0 +1,278 @@
+"""ルート生成APIのテスト"""
+
+import hashlib
+import json
+from collections.abc import AsyncIterator, Iterator
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.api.routes.images import get_image_storage_gateway
+from app.api.routes.route import get_generate_route_usecase, get_route_pool
+from app.application.gateway_interfaces.image_storage_gateway import ImageStorageGateway
+from app.application.usecases.route_result_dto import (
+    RouteCompletedEventDto,
+    RouteDestinationEventDto,
+    RouteEventDto,
+    RouteMidpointEventDto,
+    RoutePointDto,
+    RouteResultDto,
+)
+from app.domain.exceptions import ExternalServiceError, RouteGenerationError
+from app.domain.value_objects import Coordinate, StreetViewImage
+from app.main import app
+
+_DEPARTURE = Coordinate(latitude=35.6812, longitude=139.7671)
+_DESTINATION = Coordinate(latitude=35.6895, longitude=139.6917)
+_MIDPOINT = Coordinate(latitude=35.6850, longitude=139.7300)
+_DESTINATION_REQUEST = {
+    "mode": "destination",
+    "current_lat": _DEPARTURE.latitude,
+    "current_lng": _DEPARTURE.longitude,
+    "destination_lat": _DESTINATION.latitude,
+    "destination_lng": _DESTINATION.longitude,
+}
+
+
+class InMemoryImageStorageGateway(ImageStorageGateway):
+    """画像をメモリに保存するテスト用の画像ストレージGateway"""
+
+    def __init__(self, shared: bool = True) -> None:
+        """初期化"""
+        self.images: dict[str, bytes] = {}
+        self._shared = shared
+
+    @property
+    def shared(self) -> bool:
+        """他のインスタンスからも保存した画像を取得できるかどうか"""
+        return self._shared
+
+    async def save(self, image_data: bytes) -> str:
+        """画像を保存する"""
+        content_hash = hashlib.sha256(image_data).hexdigest()
+        self.images[content_hash] = image_data
+        return content_hash
+
+    async def find(self, content_hash: str) -> bytes | None:
+        """コンテンツハッシュに対応する画像を取得する"""
+        return self.images.get(content_hash)
+
+
+def _point(coordinate: Coordinate, image_data: bytes) -> RoutePointDto:
+    """画像付きの地点を生成する"""
+    return RoutePointDto(
+        coordinate=coordinate,
+        street_view_image=StreetViewImage(
+            metadata_coordinate=coordinate,
+            original_coordinate=coordinate,
+            image_data=image_data,
+        ),
+    )
+
+
+class _EventStream:
+    """イベントを順に返し、指定した位置で例外を送出するユースケースのstreamのスタブ"""
+
+    def __init__(self, events: list[RouteEventDto], error: Exception | None = None) -> None:
+        """初期化
+
+        Args:
+            events: 返すイベント
+            error: すべてのイベントを返した後に送出する例外 (Noneの場合は送出しない)
+        """
+        self._events = events
+        self._error = error
+        self.closed = False
+
+    async def __call__(self, *_: object, **__: object) -> AsyncIterator[RouteEventDto]:
+        """ルート生成イベントを返す"""
+        try:
+            for event in self._events:
+                yield event
+            if self._error is not None:
+                raise self._error
+        finally:
+            self.closed = True
+
+
+def _read_events(response_text: str) -> list[dict]:
+    """NDJSONのレスポンスをイベントのリストに変換する"""
+    return [json.loads(line) for line in response_text.splitlines()]
+
+
+@pytest.fixture
+def usecase() -> AsyncMock:
+    """テスト用のルート生成ユースケース"""
+    return AsyncMock()
+
+
+@pytest.fixture
+def client(usecase: AsyncMock) -> Iterator[TestClient]:
+    """ユースケースと画像ストレージをテスト用に差し替えたクライアント
+
+    NOTE: ルート事前生成を起動しないよう、lifespanを実行せずにリクエストを送る
+    """
+    image_storage = InMemoryImageStorageGateway()
+    route_pool = MagicMock()
+    route_pool.take.return_value = None
+    app.dependency_overrides[get_generate_route_usecase] = lambda: usecase
+    app.dependency_overrides[get_image_storage_gateway] = lambda: image_storage
+    app.dependency_overrides[get_route_pool] = lambda: route_pool
+    try:
+        yield TestClient(app)
+    finally:
+        app.dependency_overrides.clear()
+
+
+class TestRoute:
+    """POST /route のテスト"""
+
+    def test_referenceの場合は画像配信APIから取得できるURLを返すこと(
+        self, client: TestClient, usecase: AsyncMock
+    ) -> None:
+        """画像を埋め込まずに image_url を返し、そのURLで同じ画像が取得できることを確認"""
+        usecase.execute.return_value = RouteResultDto(
+            departure=_DEPARTURE,
+            destination=_point(_DESTINATION, b"destination-image"),
+            midpoints=[_point(_MIDPOINT, b"midpoint-image")],
+            overview_polyline="overview-polyline",
+        )
+
+        response = client.post(
+            "/route", json={**_DESTINATION_REQUEST, "image_delivery": "reference"}
+        )
+
+        assert response.status_code == 200
+        body = response.json()
+        points = [body["destination"], *body["midpoints"]]
+        assert [point["image_base64"] for point in points] == [None, None]
+        images = [client.get(point["image_url"]) for point in points]
+        assert [image.status_code for image in images] == [200, 200]
+        assert [image.content for image in images] == [b"destination-image", b"midpoint-image"]
+
+    def test_保存先を共有していない場合はreferenceでも画像を埋め込むこと(
+        self, client: TestClient, usecase: AsyncMock
+    ) -> None:
+        """別のインスタンスから取得できない画像の取得先を返さないことを確認"""
+        image_storage = InMemoryImageStorageGateway(shared=False)
+        app.dependency_overrides[get_image_storage_gateway] = lambda: image_storage
+        usecase.execute.return_value = RouteResultDto(
+            departure=_DEPARTURE,
+            destination=_point(_DESTINATION, b"destination-image"),
+            midpoints=[],
+            overview_polyline="overview-polyline",
+        )
+
+        response = client.post(
+            "/route", json={**_DESTINATION_REQUEST, "image_delivery": "reference"}
+        )
+
+        assert response.status_code == 200
+        destination = response.json()["destination"]
+        assert destination["image_url"] is None
+        assert destination["image_base64"] is not None
+        assert image_storage.images == {}
+
+    def test_inlineの場合は画像をbase64で埋め込むこと(
+        self, client: TestClient, usecase: AsyncMock
+    ) -> None:
+        """image_delivery を省略した場合は image_url を返さないことを確認"""
+        usecase.execute.return_value = RouteResultDto(
+            departure=_DEPARTURE,
+            destination=_point(_DESTINATION, b"destination-image"),
+            midpoints=[],
+            overview_polyline="overview-polyline",
+        )
+
+        response = client.post("/route", json=_DESTINATION_REQUEST)
+
+        assert response.status_code == 200
+        destination = response.json()["destination"]
+        assert destination["image_url"] is None
+        assert destination["image_base64"] is not None
+
+
+class TestRouteStream:
+    """POST /route/stream のテスト"""
+
+    def test_目的地_中間地点_ルート全体の順にNDJSONで返すこと(
+        self, client: TestClient, usecase: AsyncMock
+    ) -> None:
+        """ユースケースのイベントを1行ずつ同じ順に返すことを確認"""
+        stream = _EventStream(
+            [
+                RouteDestinationEventDto(
+                    departure=_DEPARTURE, destination=_point(_DESTINATION, b"destination-image")
+                ),
+                RouteMidpointEventDto(index=0, midpoint=_point(_MIDPOINT, b"midpoint-image")),
+                RouteCompletedEventDto(overview_polyline="overview-polyline"),
+            ]
+        )
+        usecase.stream = stream
+
+        response = client.post("/route/stream", json=_DESTINATION_REQUEST)
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/x-ndjson"
+        events = _read_events(response.text)
+        assert [event["type"] for event in events] == ["destination", "midpoint", "completed"]
+        assert events[1]["index"] == 0
+        assert events[2]["overview_polyline"] == "overview-polyline"
+        assert stream.closed
+
+    def test_referenceの場合は画像配信APIから取得できるURLを返すこと(
+        self, client: TestClient, usecase: AsyncMock
+    ) -> None:
+        """イベントに画像を埋め込まずに image_url を返すことを確認"""
+        usecase.stream = _EventStream(
+            [
+                RouteDestinationEventDto(
+                    departure=_DEPARTURE, destination=_point(_DESTINATION, b"destination-image")
+                ),
+                RouteCompletedEventDto(overview_polyline="overview-polyline"),
+            ]
+        )
+
+        response = client.post(
+            "/route/stream", json={**_DESTINATION_REQUEST, "image_delivery": "reference"}
+        )
+
+        destination = _read_events(response.text)[0]["destination"]
+        assert destination["image_base64"] is None
+        assert client.get(destination["image_url"]).content == b"destination-image"
+
+    def test_最初のイベントの前に失敗した場合はHTTPエラーを返すこと(
+        self, client: TestClient, usecase: AsyncMock
+    ) -> None:
+        """目的地が決まる前の失敗は /route と同じエラーレスポンスになることを確認"""
+        stream = _EventStream([], RouteGenerationError("目的地が見つかりませんでした"))
+        usecase.stream = stream
+
+        response = client.post("/route/stream", json=_DESTINATION_REQUEST)
+
+        assert response.status_code == 500
+        assert response.json() == {"detail": "目的地が見つかりませんでした"}
+        assert stream.closed
+
+    def test_最初のイベントの後に失敗した場合は最後の行にエラーを返すこと(
+        self, client: TestClient, usecase: AsyncMock
+    ) -> None:
+        """送信済みのイベントの後に type=error の行で終わることを確認"""
+        stream = _EventStream(
+            [
+                RouteDestinationEventDto(
+                    departure=_DEPARTURE, destination=_point(_DESTINATION, b"destination-image")
+                )
+            ],
+            ExternalServiceError("error", service_name="Places API"),
+        )
+        usecase.stream = stream
+
+        response = client.post("/route/stream", json=_DESTINATION_REQUEST)
+
+        assert response.status_code == 200
+        events = _read_events(response.text)
+        assert [event["type"] for event in events] == ["destination", "error"]
+        assert events[-1]["detail"] == "外部サービスとの通信に失敗しました"
+        assert stream.closed
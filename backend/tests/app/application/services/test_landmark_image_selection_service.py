@@ -0,0 +1,267 @@
+"""LandmarkImageSelectionServiceのテスト"""
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from unittest.mock import AsyncMock
+
+import pytest
+
+from app.application.deadline import Deadline
+from app.application.gateway_interfaces.google_maps_gateway import StreetViewMetadata
+from app.application.services.landmark_image_selection_service import (
+    LandmarkImageSelectionService,
+)
+from app.application.services.street_view_dead_zone_cache import StreetViewDeadZoneCache
+from app.application.services.street_view_image_fetch_service import StreetViewImageFetchService
+from app.domain.exceptions import ExternalServiceTimeoutError, ExternalServiceValidationError
+from app.domain.value_objects import Coordinate, Landmark
+
+
+def _metadata_with_delays(
+    delays: dict[float, float], failing_latitudes: frozenset[float] = frozenset()
+) -> Callable[[Coordinate, Deadline | None], Awaitable[StreetViewMetadata]]:
+    """緯度ごとに応答時間を変えたメタデータ取得のside_effectを生成する"""
+
+    async def metadata_side_effect(
+        coordinate: Coordinate, deadline: Deadline | None = None
+    ) -> StreetViewMetadata:
+        await asyncio.sleep(delays.get(coordinate.latitude, 0.0))
+        if coordinate.latitude in failing_latitudes:
+            return StreetViewMetadata(status="ZERO_RESULTS")
+        return StreetViewMetadata(status="OK", location=coordinate)
+
+    return metadata_side_effect
+
+
+def _landmark(place_id: str, latitude: float) -> Landmark:
+    """テスト用のランドマークを生成する"""
+    return Landmark(
+        place_id=place_id,
+        display_name=place_id,
+        coordinate=Coordinate(latitude=latitude, longitude=139.7671),
+    )
+
+
+class TestSelect:
+    """selectのテスト"""
+
+    def test_全候補の道路スナップを1回の呼び出しで行うこと(self) -> None:
+        """候補ごとにsnap_to_roadを呼ばず、snap_to_roadsを1回だけ呼ぶことを確認"""
+        candidates = [_landmark("first", 35.6812), _landmark("second", 35.6822)]
+        snapped = Coordinate(latitude=35.6823, longitude=139.7672)
+        gateway = AsyncMock()
+        gateway.snap_to_roads.return_value = [None, snapped]
+        gateway.get_street_view_metadata.side_effect = [
+            StreetViewMetadata(status="ZERO_RESULTS"),
+            StreetViewMetadata(status="OK", location=snapped),
+        ]
+        gateway.get_street_view_image.return_value = b"image"
+        service = LandmarkImageSelectionService(StreetViewImageFetchService(gateway))
+
+        landmark, image = asyncio.run(service.select(candidates))
+
+        assert landmark == candidates[1]
+        assert image.metadata_coordinate == snapped
+        gateway.snap_to_roads.assert_called_once_with(
+            [candidate.coordinate for candidate in candidates], deadline=None
+        )
+        gateway.snap_to_road.assert_not_called()
+        # 道路が見つからない候補は元の座標でメタデータを取得する
+        assert gateway.get_street_view_metadata.call_args_list[0].args == (
+            candidates[0].coordinate,
+        )
+        assert gateway.get_street_view_metadata.call_args_list[1].args == (snapped,)
+
+    def test_すべての候補で画像が取得できない場合はエラーになること(self) -> None:
+        """全候補で失敗した場合にExternalServiceValidationErrorを発生させることを確認"""
+        candidates = [_landmark("first", 35.6812)]
+        gateway = AsyncMock()
+        gateway.snap_to_roads.return_value = [None]
+        gateway.get_street_view_metadata.return_value = StreetViewMetadata(status="ZERO_RESULTS")
+        service = LandmarkImageSelectionService(StreetViewImageFetchService(gateway))
+
+        with pytest.raises(ExternalServiceValidationError):
+            asyncio.run(service.select(candidates))
+
+    def test_期限を過ぎたら残りの候補を試行しないこと(self) -> None:
+        """1件目の失敗後に期限切れなら2件目の画像取得を行わずタイムアウトとすることを確認"""
+        now = 0.0
+        deadline = Deadline(1.0, clock=lambda: now)
+        candidates = [_landmark("first", 35.6812), _landmark("second", 35.6822)]
+
+        async def metadata_side_effect(
+            coordinate: Coordinate, deadline: Deadline | None = None
+        ) -> StreetViewMetadata:
+            nonlocal now
+            now = 1.0
+            return StreetViewMetadata(status="ZERO_RESULTS")
+
+        gateway = AsyncMock()
+        gateway.snap_to_roads.return_value = [None, None]
+        gateway.get_street_view_metadata.side_effect = metadata_side_effect
+        service = LandmarkImageSelectionService(StreetViewImageFetchService(gateway))
+
+        with pytest.raises(ExternalServiceTimeoutError):
+            asyncio.run(service.select(candidates, deadline=deadline, parallelism=1))
+
+        assert gateway.get_street_view_metadata.call_count == 1
+        assert gateway.snap_to_roads.call_args.kwargs["deadline"] is deadline
+
+
+class TestSelectConcurrently:
+    """上位候補を並行に試行するselectのテスト"""
+
+    def test_リスト順で最初に画像が取得できた候補を返すこと(self) -> None:
+        """後ろの候補が先に成功しても、先頭の候補の成功を待って採用することを確認"""
+        candidates = [_landmark("first", 35.6812), _landmark("second", 35.6822)]
+        gateway = AsyncMock()
+        gateway.snap_to_roads.return_value = [None, None]
+        gateway.get_street_view_metadata.side_effect = _metadata_with_delays({35.6812: 0.05})
+        gateway.get_street_view_image.return_value = b"image"
+        service = LandmarkImageSelectionService(StreetViewImageFetchService(gateway))
+
+        landmark, _ = asyncio.run(service.select(candidates, parallelism=2))
+
+        assert landmark == candidates[0]
+        stats = service.get_stats()
+        assert stats.attempts == 2
+        assert stats.wasted_attempts == 1
+
+    def test_shuffle時は最初に画像の取得が完了した候補を返し残りをキャンセルすること(self) -> None:
+        """応答の遅い候補を待たずに採用し、試行中の候補をキャンセルすることを確認"""
+        candidates = [_landmark("slow", 35.6812), _landmark("fast", 35.6822)]
+        gateway = AsyncMock()
+        gateway.snap_to_roads.return_value = [None, None]
+        gateway.get_street_view_metadata.side_effect = _metadata_with_delays({35.6812: 10.0})
+        gateway.get_street_view_image.return_value = b"image"
+        service = LandmarkImageSelectionService(StreetViewImageFetchService(gateway))
+
+        landmark, _ = asyncio.run(service.select(candidates, shuffle=True, parallelism=2))
+
+        assert landmark == candidates[1]
+        assert gateway.get_street_view_image.call_count == 1
+        assert service.get_stats().wasted_attempts == 1
+
+    def test_失敗した候補の分だけ次の候補を試行すること(self) -> None:
+        """同時に試行する候補数をparallelism以内に保ちながら残りの候補を試行することを確認"""
+        candidates = [
+            _landmark("first", 35.6812),
+            _landmark("second", 35.6822),
+            _landmark("third", 35.6832),
+        ]
+        gateway = AsyncMock()
+        gateway.snap_to_roads.return_value = [None, None, None]
+        gateway.get_street_view_metadata.side_effect = _metadata_with_delays(
+            {}, failing_latitudes=frozenset({35.6812, 35.6822})
+        )
+        gateway.get_street_view_image.return_value = b"image"
+        service = LandmarkImageSelectionService(StreetViewImageFetchService(gateway))
+
+        landmark, _ = asyncio.run(service.select(candidates, parallelism=2))
+
+        assert landmark == candidates[2]
+        stats = service.get_stats()
+        assert stats.selections == 1
+        assert stats.attempts == 3
+        assert stats.wasted_attempts == 0
+
+    def test_parallelismが1未満ならエラーになること(self) -> None:
+        """同時に試行する候補数に0を指定した場合にValueErrorとなることを確認"""
+        service = LandmarkImageSelectionService(StreetViewImageFetchService(AsyncMock()))
+
+        with pytest.raises(ValueError, match="parallelism"):
+            asyncio.run(service.select([_landmark("first", 35.6812)], parallelism=0))
+
+
+class TestSelectWithDeadZones:
+    """画像がなかった候補を後回しにするselectのテスト"""
+
+    def test_画像がなかった候補は次回以降の選択で後回しにすること(self) -> None:
+        """一度失敗した候補より先に他の候補を試行し、失敗した候補を呼び出さないことを確認"""
+        candidates = [_landmark("dead", 35.6812), _landmark("live", 35.6822)]
+        gateway = AsyncMock()
+        gateway.snap_to_roads.return_value = [None, None]
+        gateway.get_street_view_metadata.side_effect = _metadata_with_delays(
+            {}, failing_latitudes=frozenset({35.6812})
+        )
+        gateway.get_street_view_image.return_value = b"image"
+        service = LandmarkImageSelectionService(StreetViewImageFetchService(gateway))
+        asyncio.run(service.select(candidates, parallelism=1))
+        gateway.get_street_view_metadata.reset_mock()
+
+        landmark, _ = asyncio.run(service.select(candidates, parallelism=1))
+
+        assert landmark == candidates[1]
+        assert [call.args[0] for call in gateway.get_street_view_metadata.call_args_list] == [
+            candidates[1].coordinate
+        ]
+        # 道路へのスナップも後回しにした順で行う
+        assert gateway.snap_to_roads.call_args.args == (
+            [candidates[1].coordinate, candidates[0].coordinate],
+        )
+        stats = service.get_stats()
+        assert stats.deprioritized == 1
+        assert stats.dead_zones == 2
+
+    @pytest.mark.parametrize("status", ["OVER_QUERY_LIMIT", "UNKNOWN_ERROR", "REQUEST_DENIED"])
+    def test_一時的なエラーの候補は後回しにしないこと(self, status: str) -> None:
+        """画像がないと確定していないステータスでは記録せず、次回も先に試行することを確認"""
+        candidates = [_landmark("flaky", 35.6812), _landmark("live", 35.6822)]
+        statuses = {35.6812: [status, "OK"]}
+
+        async def metadata_side_effect(
+            coordinate: Coordinate, deadline: Deadline | None = None
+        ) -> StreetViewMetadata:
+            remaining = statuses.get(coordinate.latitude)
+            if remaining and remaining[0] != "OK":
+                return StreetViewMetadata(status=remaining.pop(0))
+            return StreetViewMetadata(status="OK", location=coordinate)
+
+        gateway = AsyncMock()
+        gateway.snap_to_roads.return_value = [None, None]
+        gateway.get_street_view_metadata.side_effect = metadata_side_effect
+        gateway.get_street_view_image.return_value = b"image"
+        service = LandmarkImageSelectionService(StreetViewImageFetchService(gateway))
+        first, _ = asyncio.run(service.select(candidates, parallelism=1))
+
+        landmark, _ = asyncio.run(service.select(candidates, parallelism=1))
+
+        assert first == candidates[1]
+        assert landmark == candidates[0]
+        stats = service.get_stats()
+        assert stats.deprioritized == 0
+        assert stats.dead_zones == 0
+
+    def test_近くの座標で画像がなかった別の候補も後回しにすること(self) -> None:
+        """Place IDが異なっても、量子化した座標が同じ候補は後回しにすることを確認"""
+        dead_zones = StreetViewDeadZoneCache(cell_decimal_places=4)
+        dead_zones.record(_landmark("building-a", 35.68121))
+        candidates = [_landmark("building-b", 35.68119), _landmark("live", 35.6822)]
+        gateway = AsyncMock()
+        gateway.snap_to_roads.return_value = [None, None]
+        gateway.get_street_view_metadata.side_effect = _metadata_with_delays({})
+        gateway.get_street_view_image.return_value = b"image"
+        service = LandmarkImageSelectionService(StreetViewImageFetchService(gateway), dead_zones)
+
+        landmark, _ = asyncio.run(service.select(candidates, parallelism=1))
+
+        assert landmark == candidates[1]
+
+    def test_他の候補がすべて失敗した場合は後回しにした候補も試行すること(self) -> None:
+        """記録済みの候補を除外せず、最後に試行して成功すれば記録を削除することを確認"""
+        dead_zones = StreetViewDeadZoneCache()
+        candidates = [_landmark("recovered", 35.6812), _landmark("dead", 35.6822)]
+        dead_zones.record(candidates[0])
+        gateway = AsyncMock()
+        gateway.snap_to_roads.return_value = [None, None]
+        gateway.get_street_view_metadata.side_effect = _metadata_with_delays(
+            {}, failing_latitudes=frozenset({35.6822})
+        )
+        gateway.get_street_view_image.return_value = b"image"
+        service = LandmarkImageSelectionService(StreetViewImageFetchService(gateway), dead_zones)
+
+        landmark, _ = asyncio.run(service.select(candidates, parallelism=1))
+
+        assert landmark == candidates[0]
+        assert not dead_zones.contains(candidates[0])
+        assert dead_zones.contains(candidates[1])
@@ -0,0 +1,270 @@
+"""LandmarkSearchServiceのテスト"""
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+from app.application.deadline import Deadline
+from app.application.services.landmark_search_service import LandmarkSearchService
+from app.domain.exceptions import ExternalServiceError
+from app.domain.value_objects import Coordinate, Landmark
+
+CENTER = Coordinate(latitude=35.6812, longitude=139.7671)
+TARGET_DISTANCE_M = 1000
+
+
+def _landmark(place_id: str) -> Landmark:
+    """指定距離の範囲内に収まるランドマークを生成する"""
+    return Landmark(
+        place_id=place_id,
+        display_name=place_id,
+        coordinate=Coordinate(latitude=35.6902, longitude=139.7671),
+    )
+
+
+def _search(
+    service: LandmarkSearchService,
+    target_count: int,
+    max_calls: int,
+    parallelism: int,
+    deadline: Deadline | None = None,
+) -> list[Landmark]:
+    """円周上の点を固定してsearch_landmarksを実行する"""
+    circle_points = [(35.69 + i * 0.001, 139.77) for i in range(8)]
+    with patch(
+        "app.application.services.landmark_search_service.generate_equidistant_circle_points",
+        return_value=circle_points,
+    ):
+        return asyncio.run(
+            service.search_landmarks(
+                center=CENTER,
+                target_distance_m=TARGET_DISTANCE_M,
+                target_count=target_count,
+                max_calls=max_calls,
+                parallelism=parallelism,
+                deadline=deadline,
+            )
+        )
+
+
+class TestSearchLandmarks:
+    """search_landmarksのテスト"""
+
+    def test_円周上の点を並行に検索すること(self) -> None:
+        """円周上の点の検索がparallelism件まで同時に発行されることを確認"""
+        in_flight = 0
+        max_in_flight = 0
+
+        async def side_effect(
+            coordinate: Coordinate, radius: int, deadline: Deadline | None = None
+        ) -> list[Landmark]:
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return [_landmark(f"place-{coordinate.latitude}")]
+
+        gateway = AsyncMock()
+        gateway.search_landmarks_nearby.side_effect = side_effect
+
+        landmarks = _search(
+            LandmarkSearchService(gateway), target_count=9, max_calls=9, parallelism=3
+        )
+
+        assert max_in_flight == 3
+        assert len(landmarks) == 9
+
+    def test_後続の点が先に完了しても点の順番で結合すること(self) -> None:
+        """完了順によらず、逐次検索と同じ結果を返すことを確認"""
+
+        async def side_effect(
+            coordinate: Coordinate, radius: int, deadline: Deadline | None = None
+        ) -> list[Landmark]:
+            if coordinate == CENTER:
+                return [_landmark("center")]
+            # 先頭の点ほど遅く完了させる
+            await asyncio.sleep(0.05 - (coordinate.latitude - 35.69) * 5)
+            return [_landmark(f"place-{coordinate.latitude:.3f}")]
+
+        gateway = AsyncMock()
+        gateway.search_landmarks_nearby.side_effect = side_effect
+
+        landmarks = _search(
+            LandmarkSearchService(gateway), target_count=3, max_calls=8, parallelism=4
+        )
+
+        assert [landmark.place_id for landmark in landmarks] == [
+            "center",
+            "place-35.690",
+            "place-35.691",
+        ]
+        assert gateway.search_landmarks_nearby.call_count <= 8
+
+    def test_目標件数に達したら実行中の検索をキャンセルすること(self) -> None:
+        """停止条件を満たした時点で残りの検索の完了を待たないことを確認"""
+        cancelled: list[float] = []
+
+        async def side_effect(
+            coordinate: Coordinate, radius: int, deadline: Deadline | None = None
+        ) -> list[Landmark]:
+            if coordinate == CENTER:
+                return [_landmark("center")]
+            if coordinate.latitude >= 35.692:
+                try:
+                    await asyncio.sleep(10)
+                except asyncio.CancelledError:
+                    cancelled.append(coordinate.latitude)
+                    raise
+            return [_landmark(f"place-{coordinate.latitude:.3f}")]
+
+        gateway = AsyncMock()
+        gateway.search_landmarks_nearby.side_effect = side_effect
+
+        landmarks = _search(
+            LandmarkSearchService(gateway), target_count=3, max_calls=8, parallelism=4
+        )
+
+        assert len(landmarks) == 3
+        # 中心点と先頭2点以外の発行済みの検索はすべてキャンセルされる
+        assert len(cancelled) == gateway.search_landmarks_nearby.call_count - 3
+        assert cancelled
+
+    def test_最大呼び出し回数を超えて発行しないこと(self) -> None:
+        """並行実行時もmax_callsを超えるAPI呼び出しを行わないことを確認"""
+        gateway = AsyncMock()
+        gateway.search_landmarks_nearby.return_value = []
+
+        landmarks = _search(
+            LandmarkSearchService(gateway), target_count=5, max_calls=3, parallelism=4
+        )
+
+        assert landmarks == []
+        assert gateway.search_landmarks_nearby.call_count == 3
+
+    def test_失敗した点は呼び出し回数に数えず次の点を検索すること(self) -> None:
+        """個別の点でのエラーは無視し、逐次検索と同様に次の点を検索することを確認"""
+        gateway = AsyncMock()
+        gateway.search_landmarks_nearby.side_effect = [
+            [_landmark("center")],
+            ExternalServiceError("error", service_name="Places API"),
+            [_landmark("place-1")],
+            [_landmark("place-2")],
+        ]
+
+        landmarks = _search(
+            LandmarkSearchService(gateway), target_count=5, max_calls=3, parallelism=1
+        )
+
+        assert [landmark.place_id for landmark in landmarks] == ["center", "place-1", "place-2"]
+        assert gateway.search_landmarks_nearby.call_count == 4
+
+    def test_期限を過ぎたら見つかった分だけを返すこと(self) -> None:
+        """時間予算を使い切ったら実行中の検索をキャンセルし、それまでの結果を返すことを確認"""
+        cancelled: list[float] = []
+
+        async def side_effect(
+            coordinate: Coordinate, radius: int, deadline: Deadline | None = None
+        ) -> list[Landmark]:
+            if coordinate == CENTER:
+                return [_landmark("center")]
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append(coordinate.latitude)
+                raise
+            return [_landmark(f"place-{coordinate.latitude:.3f}")]
+
+        gateway = AsyncMock()
+        gateway.search_landmarks_nearby.side_effect = side_effect
+
+        landmarks = _search(
+            LandmarkSearchService(gateway),
+            target_count=5,
+            max_calls=8,
+            parallelism=4,
+            deadline=Deadline.after(0.05),
+        )
+
+        assert [landmark.place_id for landmark in landmarks] == ["center"]
+        assert len(cancelled) == 4
+
+    def test_Gatewayに検索の期限を渡すこと(self) -> None:
+        """リクエストの期限より時間予算が短い場合は時間予算の期限を渡すことを確認"""
+        gateway = AsyncMock()
+        gateway.search_landmarks_nearby.return_value = []
+
+        with patch(
+            "app.application.services.landmark_search_service.LANDMARK_SEARCH_TIME_BUDGET_MS", 1000
+        ):
+            _search(
+                LandmarkSearchService(gateway),
+                target_count=5,
+                max_calls=1,
+                parallelism=1,
+                deadline=Deadline.after(60),
+            )
+
+        passed_deadline = gateway.search_landmarks_nearby.call_args.kwargs["deadline"]
+        assert 0 < passed_deadline.remaining_seconds() <= 1.0
+
+
+class TestSearchLandmarksWithCatalog:
+    """ランドマークカタログを指定したsearch_landmarksのテスト"""
+
+    def test_カタログで目標件数に達する場合はPlaces_APIを呼び出さないこと(self) -> None:
+        """指定距離の範囲内の蓄積済みランドマークだけで結果を返すことを確認"""
+        gateway = AsyncMock()
+        catalog = AsyncMock()
+        catalog.find_within.return_value = [_landmark(f"cataloged-{i}") for i in range(3)]
+
+        landmarks = _search(
+            LandmarkSearchService(gateway, catalog), target_count=3, max_calls=8, parallelism=1
+        )
+
+        assert [landmark.place_id for landmark in landmarks] == [
+            "cataloged-0",
+            "cataloged-1",
+            "cataloged-2",
+        ]
+        gateway.search_landmarks_nearby.assert_not_called()
+        # 距離フィルタリングと同じ範囲 (±LANDMARK_DISTANCE_TOLERANCE_PERCENT%) で検索する
+        assert catalog.find_within.call_args.args == (CENTER, 850.0, 1150.0)
+
+    def test_カタログで足りない分をPlaces_APIで補い取得結果を蓄積すること(self) -> None:
+        """蓄積済みのランドマークに検索結果を追加し、取得したランドマークを蓄積することを確認"""
+        gateway = AsyncMock()
+        gateway.search_landmarks_nearby.side_effect = [
+            [_landmark("cataloged-0"), _landmark("center")],
+            [_landmark("place-1")],
+        ]
+        catalog = AsyncMock()
+        catalog.find_within.return_value = [_landmark("cataloged-0")]
+
+        landmarks = _search(
+            LandmarkSearchService(gateway, catalog), target_count=3, max_calls=8, parallelism=1
+        )
+
+        assert [landmark.place_id for landmark in landmarks] == [
+            "cataloged-0",
+            "center",
+            "place-1",
+        ]
+        assert gateway.search_landmarks_nearby.call_count == 2
+        assert [call.args[0] for call in catalog.add.call_args_list] == [
+            [_landmark("cataloged-0"), _landmark("center")],
+            [_landmark("place-1")],
+        ]
+
+    def test_Places_APIが失敗してもカタログで見つかったランドマークを返すこと(self) -> None:
+        """目標件数に満たなくても、中心の検索が失敗した場合は蓄積済みの分を返すことを確認"""
+        gateway = AsyncMock()
+        gateway.search_landmarks_nearby.side_effect = ExternalServiceError("Places API error")
+        catalog = AsyncMock()
+        catalog.find_within.return_value = [_landmark("cataloged-0")]
+
+        landmarks = _search(
+            LandmarkSearchService(gateway, catalog), target_count=3, max_calls=8, parallelism=1
+        )
+
+        assert [landmark.place_id for landmark in landmarks] == ["cataloged-0"]
+        assert gateway.search_landmarks_nearby.call_count == 1
@@ -0,0 +1,84 @@
+"""StreetViewDeadZoneCacheのテスト"""
+
+import pytest
+
+from app.application.services.street_view_dead_zone_cache import StreetViewDeadZoneCache
+from app.domain.value_objects import Coordinate, Landmark
+
+
+class FakeClock:
+    """テスト用に手動で進める時計"""
+
+    def __init__(self) -> None:
+        """初期化"""
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        """現在時刻を返す"""
+        return self.now
+
+
+def _landmark(place_id: str, latitude: float, longitude: float = 139.7671) -> Landmark:
+    """テスト用のランドマークを生成する"""
+    return Landmark(
+        place_id=place_id,
+        display_name=place_id,
+        coordinate=Coordinate(latitude=latitude, longitude=longitude),
+    )
+
+
+class TestStreetViewDeadZoneCache:
+    """StreetViewDeadZoneCacheのテスト"""
+
+    def test_記録したPlace_IDの候補を判定すること(self) -> None:
+        """座標が変わっても同じPlace IDは記録済みと判定することを確認"""
+        cache = StreetViewDeadZoneCache()
+        cache.record(_landmark("dead", 35.6812))
+
+        assert cache.contains(_landmark("dead", 35.7000))
+        assert not cache.contains(_landmark("live", 35.7000))
+        assert cache.get_stats().hits == 1
+
+    def test_同じセルの座標の候補を判定すること(self) -> None:
+        """量子化した座標が同じであれば、Place IDが異なっても記録済みと判定することを確認"""
+        cache = StreetViewDeadZoneCache(cell_decimal_places=3)
+        cache.record(_landmark("dead", 35.68121, 139.76711))
+
+        assert cache.contains(_landmark("neighbor", 35.68149, 139.76689))
+        assert not cache.contains(_landmark("far", 35.6822, 139.7671))
+
+    def test_期限切れの記録は判定に使わないこと(self) -> None:
+        """ttl_seconds を過ぎた記録は削除されることを確認"""
+        clock = FakeClock()
+        cache = StreetViewDeadZoneCache(ttl_seconds=60, clock=clock)
+        cache.record(_landmark("dead", 35.6812))
+
+        clock.now = 60
+
+        assert not cache.contains(_landmark("dead", 35.6812))
+        assert cache.get_stats().size == 0
+
+    def test_上限を超えた場合は古い記録から削除すること(self) -> None:
+        """キーの数が max_entries を超えた場合は最も古く記録したキーから削除することを確認"""
+        cache = StreetViewDeadZoneCache(max_entries=2)
+        cache.record(_landmark("first", 35.6812))
+        cache.record(_landmark("second", 35.6822))
+
+        assert not cache.contains(_landmark("first", 35.6812))
+        assert cache.contains(_landmark("second", 35.6822))
+        assert cache.get_stats().size == 2
+
+    def test_削除した候補は判定しないこと(self) -> None:
+        """画像を取得できた候補の記録をPlace IDとセルの両方から削除することを確認"""
+        cache = StreetViewDeadZoneCache()
+        cache.record(_landmark("recovered", 35.6812))
+
+        cache.discard(_landmark("recovered", 35.6812))
+
+        assert not cache.contains(_landmark("recovered", 35.6812))
+        assert not cache.contains(_landmark("neighbor", 35.6812))
+
+    def test_不正な上限はエラーになること(self) -> None:
+        """max_entries に0を指定した場合にValueErrorとなることを確認"""
+        with pytest.raises(ValueError, match="max_entries"):
+            StreetViewDeadZoneCache(max_entries=0)
@@ -0,0 +1,60 @@
+"""Deadlineのテスト"""
+
+from app.application.deadline import Deadline
+
+
+class FakeClock:
+    """テスト用に手動で進める時計"""
+
+    def __init__(self) -> None:
+        """初期化"""
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        """現在時刻を返す"""
+        return self.now
+
+
+class TestDeadline:
+    """Deadlineのテスト"""
+
+    def test_残り時間が経過時間に応じて減ること(self) -> None:
+        """after で作成した期限の残り時間と期限切れを確認"""
+        clock = FakeClock()
+        deadline = Deadline.after(5.0, clock=clock)
+
+        clock.now += 2.0
+        assert deadline.remaining_seconds() == 3.0
+        assert not deadline.expired()
+
+        clock.now += 3.0
+        assert deadline.remaining_seconds() == 0.0
+        assert deadline.expired()
+
+    def test_タイムアウトを残り時間で切り詰めること(self) -> None:
+        """残り時間より長いタイムアウトだけが切り詰められることを確認"""
+        clock = FakeClock()
+        deadline = Deadline.after(5.0, clock=clock)
+
+        assert deadline.clamp_timeout(15.0) == 5.0
+        assert deadline.clamp_timeout(3.0) == 3.0
+
+    def test_予算は元の期限を超えないこと(self) -> None:
+        """within は予算と元の期限のうち早い方になることを確認"""
+        clock = FakeClock()
+        deadline = Deadline.after(5.0, clock=clock)
+
+        assert deadline.within(3.0).remaining_seconds() == 3.0
+        assert deadline.within(10.0).remaining_seconds() == 5.0
+
+    def test_後続の処理の時間を残した期限を作成できること(self) -> None:
+        """reserve で指定秒数だけ早い期限になることを確認"""
+        clock = FakeClock()
+        deadline = Deadline.after(5.0, clock=clock)
+
+        reserved = deadline.reserve(2.0)
+
+        assert reserved.remaining_seconds() == 3.0
+        clock.now += 3.0
+        assert reserved.expired()
+        assert not deadline.expired()
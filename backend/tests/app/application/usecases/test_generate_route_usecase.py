@@ -1,9 +1,19 @@
 """GenerateRouteUseCaseのテスト"""
 
-from unittest.mock import MagicMock, patch
+import asyncio
+from unittest.mock import AsyncMock, patch
 
+import pytest
+
+from app.application.deadline import Deadline
 from app.application.usecases.generate_route_usecase import GenerateRouteUseCase
+from app.application.usecases.route_result_dto import (
+    RouteCompletedEventDto,
+    RouteDestinationEventDto,
+    RouteMidpointEventDto,
+)
 from app.config import DIRECTIONS_API_MAX_WAYPOINTS
+from app.domain.exceptions import ExternalServiceError, RouteGenerationError
 from app.domain.services.coordinate_service import calculate_distance as real_calculate_distance
 from app.domain.value_objects import Coordinate, Landmark, StreetViewImage
 
@@ -24,14 +34,14 @@ def test_execute_目的地指定モードでは距離算出後にミッション
         destination_coordinate,
     ]
 
-    google_maps_gateway = MagicMock()
+    google_maps_gateway = AsyncMock()
     google_maps_gateway.get_directions.side_effect = [
         (route_coordinates, "initial-overview-polyline"),
         ([], "overview-polyline"),
     ]
-    landmark_search_service = MagicMock()
-    landmark_selector = MagicMock()
-    street_view_image_fetch_service = MagicMock()
+    landmark_search_service = AsyncMock()
+    landmark_selector = AsyncMock()
+    street_view_image_fetch_service = AsyncMock()
     street_view_image_fetch_service.get_image.return_value = destination_image
 
     usecase = GenerateRouteUseCase(
@@ -55,9 +65,11 @@ def test_execute_目的地指定モードでは距離算出後にミッション
             return_value=4,
         ) as mock_calculate_mission_point_count,
     ):
-        result = usecase.execute(
-            current_coordinate=current_coordinate,
-            destination_coordinate=destination_coordinate,
+        result = asyncio.run(
+            usecase.execute(
+                current_coordinate=current_coordinate,
+                destination_coordinate=destination_coordinate,
+            )
         )
 
     mock_calculate_distance.assert_called_once_with(current_coordinate, destination_coordinate)
@@ -71,11 +83,13 @@ def test_execute_目的地指定モードでは距離算出後にミッション
         "origin": current_coordinate,
         "destination": destination_coordinate,
         "waypoints": None,
+        "deadline": None,
     }
     assert google_maps_gateway.get_directions.call_args_list[1].kwargs == {
         "origin": current_coordinate,
         "destination": destination_coordinate,
         "waypoints": [],
+        "deadline": None,
     }
     assert result.destination.coordinate == destination_coordinate
     assert result.destination.street_view_image == destination_image
@@ -99,15 +113,15 @@ def test_execute_ミッション総数が上限超過なら最大件数にクラ
         destination_coordinate,
     ]
 
-    google_maps_gateway = MagicMock()
+    google_maps_gateway = AsyncMock()
     google_maps_gateway.get_directions.side_effect = [
         (route_coordinates, "initial-overview-polyline"),
         ([], "overview-polyline"),
     ]
     google_maps_gateway.search_landmarks_nearby.return_value = []
-    landmark_search_service = MagicMock()
-    landmark_selector = MagicMock()
-    street_view_image_fetch_service = MagicMock()
+    landmark_search_service = AsyncMock()
+    landmark_selector = AsyncMock()
+    street_view_image_fetch_service = AsyncMock()
     street_view_image_fetch_service.get_image.return_value = destination_image
 
     usecase = GenerateRouteUseCase(
@@ -131,9 +145,11 @@ def test_execute_ミッション総数が上限超過なら最大件数にクラ
             return_value=40,
         ) as mock_calculate_mission_point_count,
     ):
-        result = usecase.execute(
-            current_coordinate=current_coordinate,
-            destination_coordinate=destination_coordinate,
+        result = asyncio.run(
+            usecase.execute(
+                current_coordinate=current_coordinate,
+                destination_coordinate=destination_coordinate,
+            )
         )
 
     mock_calculate_mission_point_count.assert_called_once_with(20000)
@@ -157,11 +173,11 @@ def test_execute_中間地点数が0なら分割関数を呼ばないこと() ->
         image_data=b"destination-image",
     )
 
-    google_maps_gateway = MagicMock()
+    google_maps_gateway = AsyncMock()
     google_maps_gateway.get_directions.return_value = ([], "overview-polyline")
-    landmark_search_service = MagicMock()
-    landmark_selector = MagicMock()
-    street_view_image_fetch_service = MagicMock()
+    landmark_search_service = AsyncMock()
+    landmark_selector = AsyncMock()
+    street_view_image_fetch_service = AsyncMock()
     street_view_image_fetch_service.get_image.return_value = destination_image
 
     usecase = GenerateRouteUseCase(
@@ -185,9 +201,11 @@ def test_execute_中間地点数が0なら分割関数を呼ばないこと() ->
             return_value=0,
         ),
     ):
-        result = usecase.execute(
-            current_coordinate=current_coordinate,
-            destination_coordinate=destination_coordinate,
+        result = asyncio.run(
+            usecase.execute(
+                current_coordinate=current_coordinate,
+                destination_coordinate=destination_coordinate,
+            )
         )
 
     mock_divide_route_into_segments.assert_not_called()
@@ -195,6 +213,7 @@ def test_execute_中間地点数が0なら分割関数を呼ばないこと() ->
         origin=current_coordinate,
         destination=destination_coordinate,
         waypoints=[],
+        deadline=None,
     )
     assert result.midpoints == []
 
@@ -214,14 +233,14 @@ def test_execute_実ルート上の候補地点生成にルート座標列を使
         destination_coordinate,
     ]
 
-    google_maps_gateway = MagicMock()
+    google_maps_gateway = AsyncMock()
     google_maps_gateway.get_directions.side_effect = [
         (route_coordinates, "initial-overview-polyline"),
         ([], "overview-polyline"),
     ]
-    landmark_search_service = MagicMock()
-    landmark_selector = MagicMock()
-    street_view_image_fetch_service = MagicMock()
+    landmark_search_service = AsyncMock()
+    landmark_selector = AsyncMock()
+    street_view_image_fetch_service = AsyncMock()
     street_view_image_fetch_service.get_image.return_value = destination_image
 
     usecase = GenerateRouteUseCase(
@@ -245,9 +264,11 @@ def test_execute_実ルート上の候補地点生成にルート座標列を使
             return_value=1,
         ),
     ):
-        usecase.execute(
-            current_coordinate=current_coordinate,
-            destination_coordinate=destination_coordinate,
+        asyncio.run(
+            usecase.execute(
+                current_coordinate=current_coordinate,
+                destination_coordinate=destination_coordinate,
+            )
         )
 
     mock_divide_route_into_segments.assert_called_once_with(
@@ -256,6 +277,76 @@ def test_execute_実ルート上の候補地点生成にルート座標列を使
     )
 
 
+def test_execute_geodesicモードでは実ルートを取得せずに候補地点を生成すること() -> None:
+    """測地線上の候補地点を使い、Directions APIの呼び出しが最後の1回だけになることを確認"""
+    current_coordinate = Coordinate(latitude=35.6812, longitude=139.7671)
+    destination_coordinate = Coordinate(latitude=35.6895, longitude=139.6917)
+    destination_image = StreetViewImage(
+        metadata_coordinate=destination_coordinate,
+        original_coordinate=destination_coordinate,
+        image_data=b"destination-image",
+    )
+    candidate_coordinates = [Coordinate(latitude=35.6850, longitude=139.7300)]
+
+    google_maps_gateway = AsyncMock()
+    google_maps_gateway.get_directions.return_value = ([], "overview-polyline")
+    google_maps_gateway.search_landmarks_nearby.return_value = []
+    landmark_search_service = AsyncMock()
+    landmark_selector = AsyncMock()
+    street_view_image_fetch_service = AsyncMock()
+    street_view_image_fetch_service.get_image.return_value = destination_image
+
+    usecase = GenerateRouteUseCase(
+        google_maps_gateway=google_maps_gateway,
+        landmark_search_service=landmark_search_service,
+        landmark_selector=landmark_selector,
+        street_view_image_fetch_service=street_view_image_fetch_service,
+    )
+
+    with (
+        patch(
+            "app.application.usecases.generate_route_usecase.MIDPOINT_CANDIDATE_MODE",
+            "geodesic",
+        ),
+        patch(
+            "app.application.usecases.generate_route_usecase.coordinate_service.calculate_distance",
+            return_value=1200,
+        ),
+        patch(
+            "app.application.usecases.generate_route_usecase.coordinate_service.generate_geodesic_midpoints",
+            return_value=candidate_coordinates,
+        ) as mock_generate_geodesic_midpoints,
+        patch(
+            "app.application.usecases.generate_route_usecase.calculate_mission_point_count",
+            return_value=1,
+        ),
+    ):
+        asyncio.run(
+            usecase.execute(
+                current_coordinate=current_coordinate,
+                destination_coordinate=destination_coordinate,
+            )
+        )
+
+    mock_generate_geodesic_midpoints.assert_called_once_with(
+        start=current_coordinate,
+        end=destination_coordinate,
+        num_points=1,
+        max_lateral_offset_m=150.0,
+    )
+    google_maps_gateway.search_landmarks_nearby.assert_called_once()
+    assert (
+        google_maps_gateway.search_landmarks_nearby.call_args.kwargs["coordinate"]
+        == candidate_coordinates[0]
+    )
+    google_maps_gateway.get_directions.assert_called_once_with(
+        origin=current_coordinate,
+        destination=destination_coordinate,
+        waypoints=[],
+        deadline=None,
+    )
+
+
 def test_execute_ランダムモードではランドマーク情報も結果に含めること() -> None:
     """ランダム選択されたランドマーク情報がDTOへ保持されることを確認"""
     current_coordinate = Coordinate(latitude=35.6812, longitude=139.7671)
@@ -287,20 +378,20 @@ def test_execute_ランダムモードではランドマーク情報も結果に
         heading=45.0,
     )
 
-    google_maps_gateway = MagicMock()
+    google_maps_gateway = AsyncMock()
     google_maps_gateway.get_directions.side_effect = [
         (route_coordinates, "initial-overview-polyline"),
         ([], "overview-polyline"),
     ]
     google_maps_gateway.search_landmarks_nearby.return_value = [midpoint_landmark]
-    landmark_search_service = MagicMock()
+    landmark_search_service = AsyncMock()
     landmark_search_service.search_landmarks.return_value = [destination_landmark]
-    landmark_selector = MagicMock()
+    landmark_selector = AsyncMock()
     landmark_selector.select.side_effect = [
         (destination_landmark, destination_image),
         (midpoint_landmark, midpoint_image),
     ]
-    street_view_image_fetch_service = MagicMock()
+    street_view_image_fetch_service = AsyncMock()
 
     usecase = GenerateRouteUseCase(
         google_maps_gateway=google_maps_gateway,
@@ -319,7 +410,7 @@ def test_execute_ランダムモードではランドマーク情報も結果に
             return_value=1,
         ),
     ):
-        result = usecase.execute(current_coordinate=current_coordinate, radius_m=1000)
+        result = asyncio.run(usecase.execute(current_coordinate=current_coordinate, radius_m=1000))
 
     assert result.destination.coordinate == destination_coordinate
     assert result.destination.street_view_image == destination_image
@@ -389,7 +480,7 @@ def test_execute_同一place_idの2つ目のセグメントは中間地点を付
         image_data=b"mid-image",
     )
 
-    google_maps_gateway = MagicMock()
+    google_maps_gateway = AsyncMock()
     google_maps_gateway.get_directions.side_effect = [
         (route_coordinates, "initial-overview-polyline"),
         ([], "overview-polyline"),
@@ -398,10 +489,10 @@ def test_execute_同一place_idの2つ目のセグメントは中間地点を付
         [lm1, lm2],
         [lm1],
     ]
-    landmark_search_service = MagicMock()
-    landmark_selector = MagicMock()
+    landmark_search_service = AsyncMock()
+    landmark_selector = AsyncMock()
     landmark_selector.select.return_value = (lm1, mid_image)
-    street_view_image_fetch_service = MagicMock()
+    street_view_image_fetch_service = AsyncMock()
     street_view_image_fetch_service.get_image.return_value = destination_image
 
     usecase = GenerateRouteUseCase(
@@ -424,16 +515,19 @@ def test_execute_同一place_idの2つ目のセグメントは中間地点を付
             return_value=2,
         ),
     ):
-        result = usecase.execute(
-            current_coordinate=current_coordinate,
-            destination_coordinate=destination_coordinate,
+        result = asyncio.run(
+            usecase.execute(
+                current_coordinate=current_coordinate,
+                destination_coordinate=destination_coordinate,
+            )
         )
 
     assert len(result.midpoints) == 1
     assert result.midpoints[0].coordinate == mid_image.metadata_coordinate
     assert result.midpoints[0].street_view_image == mid_image
     assert result.midpoints[0].landmark == lm1
-    assert landmark_selector.select.call_count == 1
+    # 並行実行時は各セグメントで1回ずつ選択し、重複はマージ時に除外される
+    assert landmark_selector.select.call_count == 2
     assert google_maps_gateway.get_directions.call_args_list[1].kwargs["waypoints"] == [
         mid_image.metadata_coordinate
     ]
@@ -459,15 +553,15 @@ def test_execute_候補が目的地と至近のみなら中間地点を付与し
         coordinate=destination_coordinate,
     )
 
-    google_maps_gateway = MagicMock()
+    google_maps_gateway = AsyncMock()
     google_maps_gateway.get_directions.side_effect = [
         (route_coordinates, "initial-overview-polyline"),
         ([], "overview-polyline"),
     ]
     google_maps_gateway.search_landmarks_nearby.return_value = [lm_at_dest]
-    landmark_search_service = MagicMock()
-    landmark_selector = MagicMock()
-    street_view_image_fetch_service = MagicMock()
+    landmark_search_service = AsyncMock()
+    landmark_selector = AsyncMock()
+    street_view_image_fetch_service = AsyncMock()
     street_view_image_fetch_service.get_image.return_value = destination_image
 
     usecase = GenerateRouteUseCase(
@@ -496,9 +590,11 @@ def test_execute_候補が目的地と至近のみなら中間地点を付与し
             return_value=1,
         ),
     ):
-        result = usecase.execute(
-            current_coordinate=current_coordinate,
-            destination_coordinate=destination_coordinate,
+        result = asyncio.run(
+            usecase.execute(
+                current_coordinate=current_coordinate,
+                destination_coordinate=destination_coordinate,
+            )
         )
 
     assert result.midpoints == []
@@ -526,17 +622,17 @@ def test_execute_ランダムモードで目的地と同一place_idの中間候
         dest_coord,
     ]
 
-    google_maps_gateway = MagicMock()
+    google_maps_gateway = AsyncMock()
     google_maps_gateway.get_directions.side_effect = [
         (route_coordinates, "initial-overview-polyline"),
         ([], "overview-polyline"),
     ]
     google_maps_gateway.search_landmarks_nearby.return_value = [dest_landmark]
-    landmark_search_service = MagicMock()
+    landmark_search_service = AsyncMock()
     landmark_search_service.search_landmarks.return_value = [dest_landmark]
-    landmark_selector = MagicMock()
+    landmark_selector = AsyncMock()
     landmark_selector.select.return_value = (dest_landmark, dest_image)
-    street_view_image_fetch_service = MagicMock()
+    street_view_image_fetch_service = AsyncMock()
 
     usecase = GenerateRouteUseCase(
         google_maps_gateway=google_maps_gateway,
@@ -555,9 +651,11 @@ def test_execute_ランダムモードで目的地と同一place_idの中間候
             return_value=1,
         ),
     ):
-        result = usecase.execute(
-            current_coordinate=current_coordinate,
-            radius_m=1000,
+        result = asyncio.run(
+            usecase.execute(
+                current_coordinate=current_coordinate,
+                radius_m=1000,
+            )
         )
 
     assert result.destination.coordinate == dest_coord
@@ -566,3 +664,456 @@ def test_execute_ランダムモードで目的地と同一place_idの中間候
     assert result.midpoints == []
     assert landmark_selector.select.call_count == 1
     assert google_maps_gateway.get_directions.call_args_list[1].kwargs["waypoints"] == []
+
+
+def _build_midpoint_usecase(
+    google_maps_gateway: AsyncMock, landmark_selector: AsyncMock
+) -> GenerateRouteUseCase:
+    """中間地点検索のテスト用に目的地指定モードのユースケースを生成する"""
+    street_view_image_fetch_service = AsyncMock()
+    street_view_image_fetch_service.get_image.return_value = StreetViewImage(
+        metadata_coordinate=Coordinate(latitude=35.6895, longitude=139.6917),
+        original_coordinate=Coordinate(latitude=35.6895, longitude=139.6917),
+        image_data=b"destination-image",
+    )
+    return GenerateRouteUseCase(
+        google_maps_gateway=google_maps_gateway,
+        landmark_search_service=AsyncMock(),
+        landmark_selector=landmark_selector,
+        street_view_image_fetch_service=street_view_image_fetch_service,
+    )
+
+
+def test_execute_中間地点の検索を同時実行数の上限内で並行に行うこと() -> None:
+    """候補地点ごとの検索が並行に進み、同時実行数が上限を超えないことを確認"""
+    current_coordinate = Coordinate(latitude=35.6812, longitude=139.7671)
+    destination_coordinate = Coordinate(latitude=35.6895, longitude=139.6917)
+    candidates = [
+        Coordinate(latitude=35.6820 + i * 0.0005, longitude=139.7600 - i * 0.0030) for i in range(6)
+    ]
+    in_flight = 0
+    max_in_flight = 0
+
+    async def search_side_effect(coordinate: Coordinate, **_: object) -> list[Landmark]:
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return [
+            Landmark(
+                place_id=f"ChIJ_{coordinate.longitude}",
+                display_name="Landmark",
+                coordinate=coordinate,
+            )
+        ]
+
+    async def select_side_effect(
+        landmarks: list[Landmark], deadline: Deadline | None = None
+    ) -> tuple[Landmark, StreetViewImage]:
+        landmark = landmarks[0]
+        return landmark, StreetViewImage(
+            metadata_coordinate=landmark.coordinate,
+            original_coordinate=landmark.coordinate,
+            image_data=b"mid-image",
+        )
+
+    google_maps_gateway = AsyncMock()
+    google_maps_gateway.get_directions.side_effect = [
+        ([current_coordinate, destination_coordinate], "initial-overview-polyline"),
+        ([], "overview-polyline"),
+    ]
+    google_maps_gateway.search_landmarks_nearby.side_effect = search_side_effect
+    landmark_selector = AsyncMock()
+    landmark_selector.select.side_effect = select_side_effect
+    usecase = _build_midpoint_usecase(google_maps_gateway, landmark_selector)
+
+    with (
+        patch(
+            "app.application.usecases.generate_route_usecase.coordinate_service.divide_route_into_segments",
+            return_value=candidates,
+        ),
+        patch(
+            "app.application.usecases.generate_route_usecase.calculate_mission_point_count",
+            return_value=len(candidates),
+        ),
+        patch("app.application.usecases.generate_route_usecase.MIDPOINT_SEARCH_CONCURRENCY", 3),
+    ):
+        result = asyncio.run(
+            usecase.execute(
+                current_coordinate=current_coordinate,
+                destination_coordinate=destination_coordinate,
+            )
+        )
+
+    assert max_in_flight == 3
+    # 完了順によらず、候補地点の順で中間地点が並ぶ
+    assert [point.coordinate for point in result.midpoints] == candidates
+
+
+def test_execute_先行の中間地点と重複した場合は残りの候補から選び直すこと() -> None:
+    """マージ時に重複したセグメントは未採用の候補で逐次選択と同じ結果になることを確認"""
+    current_coordinate = Coordinate(latitude=35.6812, longitude=139.7671)
+    destination_coordinate = Coordinate(latitude=35.6895, longitude=139.6917)
+    lm1 = Landmark(
+        place_id="ChIJ_first",
+        display_name="First",
+        coordinate=Coordinate(latitude=35.6840, longitude=139.7200),
+    )
+    lm2 = Landmark(
+        place_id="ChIJ_second",
+        display_name="Second",
+        coordinate=Coordinate(latitude=35.6845, longitude=139.7210),
+    )
+
+    async def select_side_effect(
+        landmarks: list[Landmark], deadline: Deadline | None = None
+    ) -> tuple[Landmark, StreetViewImage]:
+        landmark = landmarks[0]
+        return landmark, StreetViewImage(
+            metadata_coordinate=landmark.coordinate,
+            original_coordinate=landmark.coordinate,
+            image_data=landmark.place_id.encode(),
+        )
+
+    google_maps_gateway = AsyncMock()
+    google_maps_gateway.get_directions.side_effect = [
+        ([current_coordinate, destination_coordinate], "initial-overview-polyline"),
+        ([], "overview-polyline"),
+    ]
+    google_maps_gateway.search_landmarks_nearby.side_effect = [[lm1], [lm1, lm2]]
+    landmark_selector = AsyncMock()
+    landmark_selector.select.side_effect = select_side_effect
+    usecase = _build_midpoint_usecase(google_maps_gateway, landmark_selector)
+
+    with (
+        patch(
+            "app.application.usecases.generate_route_usecase.coordinate_service.divide_route_into_segments",
+            return_value=[
+                Coordinate(latitude=35.6830, longitude=139.7150),
+                Coordinate(latitude=35.6835, longitude=139.7160),
+            ],
+        ),
+        patch(
+            "app.application.usecases.generate_route_usecase.calculate_mission_point_count",
+            return_value=2,
+        ),
+    ):
+        result = asyncio.run(
+            usecase.execute(
+                current_coordinate=current_coordinate,
+                destination_coordinate=destination_coordinate,
+            )
+        )
+
+    assert [point.landmark for point in result.midpoints] == [lm1, lm2]
+    assert landmark_selector.select.call_args_list[-1].args == ([lm2],)
+
+
+def test_execute_中間地点の検索が失敗した場合はルート生成エラーになること() -> None:
+    """並行実行中の外部サービスエラーがRouteGenerationErrorに変換されることを確認"""
+    current_coordinate = Coordinate(latitude=35.6812, longitude=139.7671)
+    destination_coordinate = Coordinate(latitude=35.6895, longitude=139.6917)
+
+    google_maps_gateway = AsyncMock()
+    google_maps_gateway.get_directions.return_value = (
+        [current_coordinate, destination_coordinate],
+        "initial-overview-polyline",
+    )
+    google_maps_gateway.search_landmarks_nearby.side_effect = ExternalServiceError(
+        "error", service_name="Places API"
+    )
+    usecase = _build_midpoint_usecase(google_maps_gateway, AsyncMock())
+
+    with (
+        patch(
+            "app.application.usecases.generate_route_usecase.coordinate_service.divide_route_into_segments",
+            return_value=[Coordinate(latitude=35.6830, longitude=139.7150)],
+        ),
+        patch(
+            "app.application.usecases.generate_route_usecase.calculate_mission_point_count",
+            return_value=1,
+        ),
+        pytest.raises(RouteGenerationError) as exc_info,
+    ):
+        asyncio.run(
+            usecase.execute(
+                current_coordinate=current_coordinate,
+                destination_coordinate=destination_coordinate,
+            )
+        )
+
+    assert isinstance(exc_info.value.__cause__, ExternalServiceError)
+
+
+def test_execute_中間地点の検索が失敗した場合は残りの検索の終了を待ってから送出すること() -> None:
+    """キャンセルした候補の検索が、例外を送出する前に終了していることを確認"""
+    current_coordinate = Coordinate(latitude=35.6812, longitude=139.7671)
+    destination_coordinate = Coordinate(latitude=35.6895, longitude=139.6917)
+    slow_search_finished = False
+
+    async def search_side_effect(coordinate: Coordinate, **_: object) -> list[Landmark]:
+        nonlocal slow_search_finished
+        if coordinate.longitude == 139.7150:
+            raise ExternalServiceError("error", service_name="Places API")
+        try:
+            await asyncio.sleep(10)
+        finally:
+            slow_search_finished = True
+        return []
+
+    google_maps_gateway = AsyncMock()
+    google_maps_gateway.get_directions.return_value = (
+        [current_coordinate, destination_coordinate],
+        "initial-overview-polyline",
+    )
+    google_maps_gateway.search_landmarks_nearby.side_effect = search_side_effect
+    usecase = _build_midpoint_usecase(google_maps_gateway, AsyncMock())
+
+    async def run() -> bool:
+        with pytest.raises(RouteGenerationError):
+            await usecase.execute(
+                current_coordinate=current_coordinate,
+                destination_coordinate=destination_coordinate,
+            )
+        # NOTE: イベントループに制御を戻す前に、キャンセルした検索が終了していること
+        return slow_search_finished
+
+    with (
+        patch(
+            "app.application.usecases.generate_route_usecase.coordinate_service.divide_route_into_segments",
+            return_value=[
+                Coordinate(latitude=35.6830, longitude=139.7150),
+                Coordinate(latitude=35.6835, longitude=139.7160),
+            ],
+        ),
+        patch(
+            "app.application.usecases.generate_route_usecase.calculate_mission_point_count",
+            return_value=2,
+        ),
+    ):
+        assert asyncio.run(run()) is True
+
+
+def test_execute_期限を過ぎたら残りの中間地点の探索を打ち切ること() -> None:
+    """時間予算を使い切った後の候補はスキップし、最後のルート取得は行うことを確認"""
+    current_coordinate = Coordinate(latitude=35.6812, longitude=139.7671)
+    destination_coordinate = Coordinate(latitude=35.6895, longitude=139.6917)
+    candidates = [
+        Coordinate(latitude=35.6820 + i * 0.0005, longitude=139.7600 - i * 0.0030) for i in range(3)
+    ]
+    now = 0.0
+    # 最後のルート取得のために残す時間を差し引いても1秒の余裕がある期限
+    deadline = Deadline(3.0, clock=lambda: now)
+
+    async def search_side_effect(coordinate: Coordinate, **_: object) -> list[Landmark]:
+        nonlocal now
+        # 1件目の検索で中間地点の探索期限を使い切る
+        now = 1.5
+        return [
+            Landmark(
+                place_id=f"ChIJ_{coordinate.longitude}",
+                display_name="Landmark",
+                coordinate=coordinate,
+            )
+        ]
+
+    async def select_side_effect(
+        landmarks: list[Landmark], deadline: Deadline | None = None
+    ) -> tuple[Landmark, StreetViewImage]:
+        landmark = landmarks[0]
+        return landmark, StreetViewImage(
+            metadata_coordinate=landmark.coordinate,
+            original_coordinate=landmark.coordinate,
+            image_data=b"mid-image",
+        )
+
+    google_maps_gateway = AsyncMock()
+    google_maps_gateway.get_directions.side_effect = [
+        ([current_coordinate, destination_coordinate], "initial-overview-polyline"),
+        ([], "overview-polyline"),
+    ]
+    google_maps_gateway.search_landmarks_nearby.side_effect = search_side_effect
+    landmark_selector = AsyncMock()
+    landmark_selector.select.side_effect = select_side_effect
+    usecase = _build_midpoint_usecase(google_maps_gateway, landmark_selector)
+
+    with (
+        patch(
+            "app.application.usecases.generate_route_usecase.coordinate_service.divide_route_into_segments",
+            return_value=candidates,
+        ),
+        patch(
+            "app.application.usecases.generate_route_usecase.calculate_mission_point_count",
+            return_value=len(candidates),
+        ),
+        patch("app.application.usecases.generate_route_usecase.MIDPOINT_SEARCH_CONCURRENCY", 1),
+    ):
+        result = asyncio.run(
+            usecase.execute(
+                current_coordinate=current_coordinate,
+                destination_coordinate=destination_coordinate,
+                deadline=deadline,
+            )
+        )
+
+    assert [point.coordinate for point in result.midpoints] == candidates[:1]
+    assert google_maps_gateway.search_landmarks_nearby.call_count == 1
+    assert google_maps_gateway.get_directions.call_args_list[1].kwargs["deadline"] is deadline
+    assert result.overview_polyline == "overview-polyline"
+
+
+def test_stream_目的地_中間地点_ルート全体の順にイベントを返すこと() -> None:
+    """目的地のイベントを最初に、中間地点をルート上の順に、ルート全体を最後に返すことを確認"""
+    current_coordinate = Coordinate(latitude=35.6812, longitude=139.7671)
+    destination_coordinate = Coordinate(latitude=35.6895, longitude=139.6917)
+    candidates = [
+        Coordinate(latitude=35.6820 + i * 0.0005, longitude=139.7600 - i * 0.0030) for i in range(3)
+    ]
+
+    async def search_side_effect(coordinate: Coordinate, **_: object) -> list[Landmark]:
+        # 後ろの候補ほど早く完了させる
+        await asyncio.sleep(0.01 * (len(candidates) - candidates.index(coordinate)))
+        return [
+            Landmark(
+                place_id=f"ChIJ_{coordinate.longitude}",
+                display_name="Landmark",
+                coordinate=coordinate,
+            )
+        ]
+
+    async def select_side_effect(
+        landmarks: list[Landmark], deadline: Deadline | None = None
+    ) -> tuple[Landmark, StreetViewImage]:
+        landmark = landmarks[0]
+        return landmark, StreetViewImage(
+            metadata_coordinate=landmark.coordinate,
+            original_coordinate=landmark.coordinate,
+            image_data=b"mid-image",
+        )
+
+    google_maps_gateway = AsyncMock()
+    google_maps_gateway.get_directions.side_effect = [
+        ([current_coordinate, destination_coordinate], "initial-overview-polyline"),
+        ([], "overview-polyline"),
+    ]
+    google_maps_gateway.search_landmarks_nearby.side_effect = search_side_effect
+    landmark_selector = AsyncMock()
+    landmark_selector.select.side_effect = select_side_effect
+    usecase = _build_midpoint_usecase(google_maps_gateway, landmark_selector)
+
+    async def collect() -> list[object]:
+        return [
+            event
+            async for event in usecase.stream(
+                current_coordinate=current_coordinate,
+                destination_coordinate=destination_coordinate,
+            )
+        ]
+
+    with (
+        patch(
+            "app.application.usecases.generate_route_usecase.coordinate_service.divide_route_into_segments",
+            return_value=candidates,
+        ),
+        patch(
+            "app.application.usecases.generate_route_usecase.calculate_mission_point_count",
+            return_value=len(candidates),
+        ),
+    ):
+        events = asyncio.run(collect())
+
+    assert isinstance(events[0], RouteDestinationEventDto)
+    assert events[0].departure == current_coordinate
+    assert events[0].destination.coordinate == destination_coordinate
+    midpoint_events = events[1:-1]
+    assert all(isinstance(event, RouteMidpointEventDto) for event in midpoint_events)
+    assert [event.index for event in midpoint_events] == [0, 1, 2]
+    assert [event.midpoint.coordinate for event in midpoint_events] == candidates
+    assert events[-1] == RouteCompletedEventDto(overview_polyline="overview-polyline")
+
+
+def test_stream_後続の中間地点の検索完了を待たずに目的地を返すこと() -> None:
+    """中間地点の検索が終わる前に目的地のイベントを受け取れることを確認"""
+    current_coordinate = Coordinate(latitude=35.6812, longitude=139.7671)
+    destination_coordinate = Coordinate(latitude=35.6895, longitude=139.6917)
+
+    google_maps_gateway = AsyncMock()
+    google_maps_gateway.get_directions.return_value = (
+        [current_coordinate, destination_coordinate],
+        "initial-overview-polyline",
+    )
+    usecase = _build_midpoint_usecase(google_maps_gateway, AsyncMock())
+
+    async def first_event_then_close() -> object:
+        events = usecase.stream(
+            current_coordinate=current_coordinate,
+            destination_coordinate=destination_coordinate,
+        )
+        try:
+            return await anext(events)
+        finally:
+            await events.aclose()
+
+    with (
+        patch(
+            "app.application.usecases.generate_route_usecase.coordinate_service.divide_route_into_segments",
+            return_value=[Coordinate(latitude=35.6830, longitude=139.7150)],
+        ),
+        patch(
+            "app.application.usecases.generate_route_usecase.calculate_mission_point_count",
+            return_value=1,
+        ),
+    ):
+        event = asyncio.run(first_event_then_close())
+
+    assert isinstance(event, RouteDestinationEventDto)
+    google_maps_gateway.search_landmarks_nearby.assert_not_called()
+
+
+def test_execute_中間地点の検索で取得したランドマークをカタログに蓄積すること() -> None:
+    """中間地点の検索結果を、重複除外の前にすべてカタログに蓄積することを確認"""
+    current_coordinate = Coordinate(latitude=35.6812, longitude=139.7671)
+    destination_coordinate = Coordinate(latitude=35.6895, longitude=139.6917)
+    landmark = Landmark(
+        place_id="ChIJ_midpoint",
+        display_name="Midpoint",
+        coordinate=Coordinate(latitude=35.6840, longitude=139.7200),
+    )
+
+    google_maps_gateway = AsyncMock()
+    google_maps_gateway.get_directions.side_effect = [
+        ([current_coordinate, destination_coordinate], "initial-overview-polyline"),
+        ([], "overview-polyline"),
+    ]
+    google_maps_gateway.search_landmarks_nearby.return_value = [landmark]
+    landmark_selector = AsyncMock()
+    landmark_selector.select.return_value = (
+        landmark,
+        StreetViewImage(
+            metadata_coordinate=landmark.coordinate,
+            original_coordinate=landmark.coordinate,
+            image_data=b"mid-image",
+        ),
+    )
+    usecase = _build_midpoint_usecase(google_maps_gateway, landmark_selector)
+    usecase.landmark_catalog = AsyncMock()
+
+    with (
+        patch(
+            "app.application.usecases.generate_route_usecase.coordinate_service.divide_route_into_segments",
+            return_value=[Coordinate(latitude=35.6830, longitude=139.7150)],
+        ),
+        patch(
+            "app.application.usecases.generate_route_usecase.calculate_mission_point_count",
+            return_value=1,
+        ),
+    ):
+        asyncio.run(
+            usecase.execute(
+                current_coordinate=current_coordinate,
+                destination_coordinate=destination_coordinate,
+            )
+        )
+
+    usecase.landmark_catalog.add.assert_awaited_once_with([landmark])
@@ -0,0 +1,177 @@
+"""RoutePoolのテスト"""
+
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from app.application.usecases.route_pool import RoutePool, RoutePoolArea
+from app.application.usecases.route_result_dto import RoutePointDto, RouteResultDto
+from app.domain.exceptions import RouteGenerationError
+from app.domain.value_objects import Coordinate, StreetViewImage
+
+STATION = Coordinate(latitude=35.6812, longitude=139.7671)
+
+
+class FakeClock:
+    """テスト用に手動で進める時計"""
+
+    def __init__(self) -> None:
+        """初期化"""
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        """現在時刻を返す"""
+        return self.now
+
+
+def _route(polyline: str) -> RouteResultDto:
+    """ポリラインで区別できるルートを生成する"""
+    destination = Coordinate(latitude=35.6895, longitude=139.6917)
+    return RouteResultDto(
+        departure=STATION,
+        destination=RoutePointDto(
+            coordinate=destination,
+            street_view_image=StreetViewImage(
+                metadata_coordinate=destination,
+                original_coordinate=destination,
+                image_data=b"destination-image",
+            ),
+        ),
+        midpoints=[],
+        overview_polyline=polyline,
+    )
+
+
+def _build_pool(
+    usecase: AsyncMock, clock: FakeClock, ttl_seconds: float = 600, size_per_area: int = 2
+) -> RoutePool:
+    """駅前の半径1000mのエリアを対象とするプールを生成する"""
+    return RoutePool(
+        usecase,
+        [RoutePoolArea(start=STATION, radius_m=1000, ttl_seconds=ttl_seconds)],
+        size_per_area=size_per_area,
+        start_tolerance_m=150,
+        radius_bucket_m=500,
+        clock=clock,
+    )
+
+
+class TestRoutePool:
+    """RoutePoolのテスト"""
+
+    def test_不足しているルートをエリアの中心から生成すること(self) -> None:
+        """エリアごとに size_per_area 件まで生成することを確認"""
+        usecase = AsyncMock()
+        usecase.execute.side_effect = [_route("a"), _route("b")]
+        pool = _build_pool(usecase, FakeClock())
+
+        assert asyncio.run(pool.refill()) == 2
+        assert asyncio.run(pool.refill()) == 0
+
+        assert usecase.execute.call_count == 2
+        assert usecase.execute.call_args.args == (STATION,)
+        assert usecase.execute.call_args.kwargs["radius_m"] == 1000
+        assert pool.get_stats().size == 2
+
+    def test_近くからのリクエストには古い順に払い出すこと(self) -> None:
+        """許容範囲内で同じ単位に丸まる半径の場合は生成順に払い出すことを確認"""
+        usecase = AsyncMock()
+        usecase.execute.side_effect = [_route("a"), _route("b")]
+        pool = _build_pool(usecase, FakeClock())
+        asyncio.run(pool.refill())
+        nearby = Coordinate(latitude=35.6820, longitude=139.7671)
+
+        assert pool.take(nearby, 1100).overview_polyline == "a"
+        assert pool.take(STATION, 1000).overview_polyline == "b"
+        assert pool.take(STATION, 1000) is None
+
+        stats = pool.get_stats()
+        assert stats.hits == 2
+        assert stats.misses == 1
+
+    @pytest.mark.parametrize(
+        ("coordinate", "radius_m"),
+        [
+            (Coordinate(latitude=35.6850, longitude=139.7671), 1000),
+            (STATION, 2000),
+        ],
+    )
+    def test_対象エリア外のリクエストには払い出さないこと(
+        self, coordinate: Coordinate, radius_m: int
+    ) -> None:
+        """出発地が許容範囲外か半径が異なる場合はNoneを返し、在庫を減らさないことを確認"""
+        usecase = AsyncMock()
+        usecase.execute.side_effect = [_route("a"), _route("b")]
+        pool = _build_pool(usecase, FakeClock())
+        asyncio.run(pool.refill())
+
+        assert pool.take(coordinate, radius_m) is None
+
+        stats = pool.get_stats()
+        assert stats.size == 2
+        assert stats.misses == 0
+
+    def test_期限切れのルートは払い出さずに破棄して補充すること(self) -> None:
+        """エリアのTTLを過ぎたルートを破棄し、次の補充で生成し直すことを確認"""
+        clock = FakeClock()
+        usecase = AsyncMock()
+        usecase.execute.side_effect = [_route("old"), _route("new")]
+        pool = _build_pool(usecase, clock, ttl_seconds=60, size_per_area=1)
+        asyncio.run(pool.refill())
+
+        clock.now = 60
+        assert pool.take(STATION, 1000) is None
+        asyncio.run(pool.refill())
+
+        assert pool.take(STATION, 1000).overview_polyline == "new"
+        assert pool.get_stats().expired == 1
+
+    def test_生成に失敗しても例外を送出せず次の補充で再試行すること(self) -> None:
+        """失敗したエリアはその回の補充を打ち切り、失敗数を記録することを確認"""
+        usecase = AsyncMock()
+        usecase.execute.side_effect = [RouteGenerationError("failed"), _route("a"), _route("b")]
+        pool = _build_pool(usecase, FakeClock())
+
+        assert asyncio.run(pool.refill()) == 0
+        assert asyncio.run(pool.refill()) == 2
+
+        stats = pool.get_stats()
+        assert stats.failures == 1
+        assert stats.generated == 2
+
+    def test_払い出すとバックグラウンドで補充すること(self) -> None:
+        """開始時に補充し、払い出した分を間隔を待たずに補充することを確認"""
+        usecase = AsyncMock()
+        usecase.execute.side_effect = [_route("a"), _route("b")]
+        pool = RoutePool(
+            usecase,
+            [RoutePoolArea(start=STATION, radius_m=1000)],
+            size_per_area=1,
+            refill_interval_seconds=60,
+        )
+
+        async def run() -> None:
+            pool.start()
+            await asyncio.sleep(0.01)
+            assert pool.take(STATION, 1000).overview_polyline == "a"
+            await asyncio.sleep(0.01)
+            assert pool.take(STATION, 1000).overview_polyline == "b"
+            await pool.aclose()
+
+        asyncio.run(run())
+
+    def test_対象エリアがない場合は補充を開始しないこと(self) -> None:
+        """エリア未設定の場合はバックグラウンドのタスクを作らないことを確認"""
+        usecase = AsyncMock()
+        pool = RoutePool(usecase, [])
+
+        async def run() -> None:
+            pool.start()
+            await asyncio.sleep(0.01)
+            await pool.aclose()
+
+        asyncio.run(run())
+
+        usecase.execute.assert_not_called()
+        assert pool.take(STATION, 1000) is None
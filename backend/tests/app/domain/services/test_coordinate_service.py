@@ -1,11 +1,16 @@
 """coordinate_serviceのテスト"""
 
+import random
+
 import pytest
+from geographiclib.geodesic import Geodesic
 
 from app.domain.services.coordinate_service import (
     calculate_bearing,
+    calculate_bounding_boxes,
     calculate_distance,
     divide_route_into_segments,
+    generate_geodesic_midpoints,
 )
 from app.domain.value_objects import Coordinate
 
@@ -104,6 +109,64 @@ def test_divide_route_into_segments_分割数が非正なら例外を送出す
         divide_route_into_segments(route_coordinates, num_segments)
 
 
+# ===== generate_geodesic_midpoints のテスト =====
+
+
+def test_generate_geodesic_midpoints_測地線を等分した地点を返すこと() -> None:
+    """ずらさない場合は始点終点間の距離を等分した地点が返ることを確認"""
+    start = Coordinate(latitude=35.6812, longitude=139.7671)
+    end = Coordinate(latitude=35.7101, longitude=139.8107)
+
+    points = generate_geodesic_midpoints(start, end, 3)
+
+    total_distance = calculate_distance(start, end)
+    assert len(points) == 3
+    for i, point in enumerate(points, 1):
+        assert calculate_distance(start, point) == pytest.approx(total_distance * i / 4, abs=0.01)
+        assert calculate_distance(point, end) == pytest.approx(
+            total_distance * (4 - i) / 4, abs=0.01
+        )
+
+
+def test_generate_geodesic_midpoints_左右へのずれが上限以内であること() -> None:
+    """ずらした地点が等分点から max_lateral_offset_m 以内に収まることを確認"""
+    start = Coordinate(latitude=35.6812, longitude=139.7671)
+    end = Coordinate(latitude=35.7101, longitude=139.8107)
+    base_points = generate_geodesic_midpoints(start, end, 5)
+    rng = random.Random(0)  # noqa: S311 (再現性のためのシード付き乱数なので問題なし)
+
+    points = generate_geodesic_midpoints(start, end, 5, max_lateral_offset_m=200.0, rng=rng)
+
+    offsets = [calculate_distance(p, b) for p, b in zip(points, base_points, strict=True)]
+    assert all(offset <= 200.0 + 1e-6 for offset in offsets)
+    assert any(offset > 1.0 for offset in offsets)
+
+
+def test_generate_geodesic_midpoints_同じ座標では空配列を返すこと() -> None:
+    """始点と終点が同じ場合は無効な waypoint を生成しないことを確認"""
+    coordinate = Coordinate(latitude=35.6812, longitude=139.7671)
+
+    assert generate_geodesic_midpoints(coordinate, coordinate, 2) == []
+
+
+@pytest.mark.parametrize(
+    ("num_points", "max_lateral_offset_m", "message"),
+    [
+        (0, 0.0, "num_points must be positive"),
+        (1, -1.0, "max_lateral_offset_m must not be negative"),
+    ],
+)
+def test_generate_geodesic_midpoints_不正な引数なら例外を送出すること(
+    num_points: int, max_lateral_offset_m: float, message: str
+) -> None:
+    """中間地点数が0以下、またはずれの上限が負なら ValueError となることを確認"""
+    start = Coordinate(latitude=35.6812, longitude=139.7671)
+    end = Coordinate(latitude=35.7101, longitude=139.8107)
+
+    with pytest.raises(ValueError, match=message):
+        generate_geodesic_midpoints(start, end, num_points, max_lateral_offset_m)
+
+
 # ===== calculate_bearing のテスト =====
 
 
@@ -208,3 +271,40 @@ def test_calculate_bearing_順序を入れ替えると逆方向になること()
     assert 170 < diff < 190 or diff < 10, (
         f"方位角の差が期待範囲外です: bearing1={bearing1}度, bearing2={bearing2}度, diff={diff}度"
     )
+
+
+def test_calculate_bounding_boxes_指定距離の地点を矩形で覆うこと() -> None:
+    """中心から指定距離にある東西南北の地点が矩形に含まれることを確認"""
+    center = Coordinate(latitude=35.6812, longitude=139.7671)
+
+    [(south, north, west, east)] = calculate_bounding_boxes(center, 1000)
+
+    for bearing in (0, 90, 180, 270):
+        point = Geodesic.WGS84.Direct(center.latitude, center.longitude, bearing, 1000)
+        assert south <= point["lat2"] <= north
+        assert west <= point["lon2"] <= east
+    # 覆うための余裕は1割程度に収まる
+    assert north - south < 2 * 1000 / 111_000 * 1.1
+
+
+def test_calculate_bounding_boxes_日付変更線をまたぐ場合は2つに分割すること() -> None:
+    """経度180度をまたぐ範囲は東側と西側の矩形に分割することを確認"""
+    center = Coordinate(latitude=0.0, longitude=179.999)
+
+    boxes = calculate_bounding_boxes(center, 1000)
+
+    assert len(boxes) == 2
+    (_, _, west, east), (_, _, other_west, other_east) = boxes
+    assert west < 179.999 and east == 180.0
+    assert other_west == -180.0 and -180.0 < other_east < -179.99
+
+
+def test_calculate_bounding_boxes_極付近では全経度を覆うこと() -> None:
+    """経度方向の幅を絞り込めない緯度では全経度の矩形を返すことを確認"""
+    center = Coordinate(latitude=89.5, longitude=0.0)
+
+    [(south, north, west, east)] = calculate_bounding_boxes(center, 100_000)
+
+    assert north == 90.0
+    assert south < 89.5
+    assert (west, east) == (-180.0, 180.0)
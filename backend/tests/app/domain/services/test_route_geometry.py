@@ -0,0 +1,162 @@
+"""route_geometryのテスト"""
+
+import random
+from itertools import pairwise
+
+import numpy as np
+import pytest
+from geographiclib.geodesic import Geodesic
+from geopy.distance import geodesic
+
+from app.domain.services.route_geometry import (
+    DistanceModel,
+    RouteGeometry,
+    calculate_segment_lengths,
+)
+from app.domain.value_objects import Coordinate
+
+
+def _random_walk_route(num_points: int, seed: int = 0) -> list[Coordinate]:
+    """東京駅から数十メートルずつ進む折れ線のルートを生成する"""
+    rng = random.Random(seed)  # noqa: S311 (再現性のためのシード付き乱数なので問題なし)
+    latitude, longitude = 35.6812, 139.7671
+    route = [Coordinate(latitude=latitude, longitude=longitude)]
+    for _ in range(num_points - 1):
+        latitude += rng.uniform(-0.0004, 0.0004)
+        longitude += rng.uniform(-0.0004, 0.0004)
+        route.append(Coordinate(latitude=latitude, longitude=longitude))
+    return route
+
+
+def _legacy_divide(route_coordinates: list[Coordinate], num_segments: int) -> list[Coordinate]:
+    """区間ごとにgeopyで距離を計算して走査する、配列化する前の分割処理"""
+    segment_distances = [
+        geodesic((s.latitude, s.longitude), (e.latitude, e.longitude)).meters
+        for s, e in pairwise(route_coordinates)
+    ]
+    total_distance = sum(segment_distances)
+    points: list[Coordinate] = []
+    traversed_distance = 0.0
+    segment_index = 0
+    for i in range(1, num_segments + 1):
+        target_distance = total_distance * i / (num_segments + 1)
+        while segment_index < len(segment_distances):
+            segment_distance = segment_distances[segment_index]
+            if segment_distance > 0 and traversed_distance + segment_distance >= target_distance:
+                start = route_coordinates[segment_index]
+                end = route_coordinates[segment_index + 1]
+                azimuth = Geodesic.WGS84.Inverse(
+                    start.latitude, start.longitude, end.latitude, end.longitude
+                )["azi1"]
+                point = geodesic(meters=target_distance - traversed_distance).destination(
+                    (start.latitude, start.longitude), azimuth
+                )
+                points.append(Coordinate(latitude=point.latitude, longitude=point.longitude))
+                break
+            traversed_distance += segment_distance
+            segment_index += 1
+    return points
+
+
+class TestCalculateSegmentLengths:
+    """calculate_segment_lengthsのテスト"""
+
+    @pytest.mark.parametrize(
+        ("distance_model", "relative_tolerance"),
+        [("geodesic", 1e-12), ("ellipsoidal", 1e-6), ("haversine", 5e-3)],
+    )
+    def test_測地線距離との誤差が計算方法の精度の範囲内であること(
+        self, distance_model: DistanceModel, relative_tolerance: float
+    ) -> None:
+        """各区間の距離がgeographiclibの測地線距離と許容誤差内で一致することを確認"""
+        route = _random_walk_route(200)
+        latitudes = np.array([coordinate.latitude for coordinate in route])
+        longitudes = np.array([coordinate.longitude for coordinate in route])
+
+        lengths = calculate_segment_lengths(latitudes, longitudes, distance_model)
+
+        expected = [
+            Geodesic.WGS84.Inverse(s.latitude, s.longitude, e.latitude, e.longitude)["s12"]
+            for s, e in pairwise(route)
+        ]
+        assert lengths == pytest.approx(expected, rel=relative_tolerance)
+
+    @pytest.mark.parametrize("distance_model", ["geodesic", "ellipsoidal", "haversine"])
+    def test_日付変更線をまたぐ区間は短い方の距離を返すこと(
+        self, distance_model: DistanceModel
+    ) -> None:
+        """経度179.999度と-179.999度の間を地球を一周する距離にしないことを確認"""
+        lengths = calculate_segment_lengths(
+            np.array([0.0, 0.0]), np.array([179.999, -179.999]), distance_model
+        )
+
+        assert lengths[0] == pytest.approx(222.6, abs=1.0)
+
+    def test_未対応の計算方法はエラーになること(self) -> None:
+        """distance_model が未対応の値の場合にValueErrorとなることを確認"""
+        with pytest.raises(ValueError, match="distance_model"):
+            calculate_segment_lengths(np.array([0.0, 1.0]), np.array([0.0, 1.0]), "vincenty")  # type: ignore[arg-type]
+
+
+class TestRouteGeometry:
+    """RouteGeometryのテスト"""
+
+    def test_累積距離の末尾が総距離となること(self) -> None:
+        """累積距離が0から始まり、区間距離の合計で終わることを確認"""
+        geometry = RouteGeometry.from_coordinates(_random_walk_route(50))
+
+        assert geometry.cumulative_distances[0] == 0.0
+        assert len(geometry.cumulative_distances) == 50
+        assert geometry.total_distance == pytest.approx(geometry.segment_lengths.sum())
+
+    def test_区間ごとに走査する分割と同じ地点を返すこと(self) -> None:
+        """geodesicの場合は配列化する前の分割処理と同じ地点を返すことを確認"""
+        route = _random_walk_route(1000)
+
+        points = RouteGeometry.from_coordinates(route, "geodesic").divide(7)
+
+        expected = _legacy_divide(route, 7)
+        assert len(points) == len(expected) == 7
+        for point, expected_point in zip(points, expected, strict=True):
+            assert point.latitude == pytest.approx(expected_point.latitude, abs=1e-9)
+            assert point.longitude == pytest.approx(expected_point.longitude, abs=1e-9)
+
+    def test_近似した距離でも分割位置の誤差がわずかであること(self) -> None:
+        """ellipsoidalで分割した地点がgeodesicで分割した地点から1cm以内であることを確認"""
+        route = _random_walk_route(1000)
+
+        points = RouteGeometry.from_coordinates(route, "ellipsoidal").divide(7)
+
+        expected = RouteGeometry.from_coordinates(route, "geodesic").divide(7)
+        for point, expected_point in zip(points, expected, strict=True):
+            distance = Geodesic.WGS84.Inverse(
+                point.latitude, point.longitude, expected_point.latitude, expected_point.longitude
+            )["s12"]
+            assert distance < 0.01
+
+    def test_長さ0の区間があっても前後の区間から地点を返すこと(self) -> None:
+        """同じ座標が連続する区間を分割位置に選ばないことを確認"""
+        route = [
+            Coordinate(latitude=0.0, longitude=0.0),
+            Coordinate(latitude=0.0, longitude=0.1),
+            Coordinate(latitude=0.0, longitude=0.1),
+            Coordinate(latitude=0.0, longitude=0.2),
+        ]
+
+        points = RouteGeometry.from_coordinates(route).divide(1)
+
+        assert len(points) == 1
+        assert points[0].latitude == pytest.approx(0.0, abs=1e-9)
+        assert points[0].longitude == pytest.approx(0.1, abs=1e-9)
+
+    def test_点が1つだけの場合は空配列を返すこと(self) -> None:
+        """区間がないルートでは中間地点を生成しないことを確認"""
+        geometry = RouteGeometry.from_coordinates([Coordinate(latitude=35.0, longitude=139.0)])
+
+        assert geometry.total_distance == 0.0
+        assert geometry.divide(3) == []
+
+    def test_緯度と経度の長さが異なる場合はエラーになること(self) -> None:
+        """配列の長さが一致しない場合にValueErrorとなることを確認"""
+        with pytest.raises(ValueError, match="same length"):
+            RouteGeometry(np.array([0.0, 1.0]), np.array([0.0]))
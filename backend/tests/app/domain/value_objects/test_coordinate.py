@@ -1,5 +1,7 @@
 """coordinateのテスト"""
 
+import pickle
+
 import pytest
 from pydantic_core import ValidationError
 
@@ -123,3 +125,39 @@ def test_様々な有効な値で作成できること() -> None:
         assert coordinate.latitude == lat
         assert coordinate.longitude == lng
         assert coordinate.to_float_tuple() == (lat, lng)
+
+
+# ===== trusted のテスト =====
+
+
+def test_trustedで生成した座標が通常の生成と同じ値になること() -> None:
+    """バリデーションを省略して生成した座標が通常の生成と区別できないことを確認"""
+    trusted = Coordinate.trusted(35.6812, 139.7671)
+    validated = Coordinate(latitude=35.6812, longitude=139.7671)
+
+    assert trusted == validated
+    assert hash(trusted) == hash(validated)
+    assert trusted.model_dump() == validated.model_dump()
+    assert trusted.model_fields_set == validated.model_fields_set
+    assert repr(trusted) == repr(validated)
+    assert pickle.loads(pickle.dumps(trusted)) == validated  # noqa: S301 (自身で生成したデータのみ)
+
+
+def test_trustedで生成した座標も不変であること() -> None:
+    """バリデーションを省略しても属性を変更できないことを確認"""
+    coordinate = Coordinate.trusted(35.6812, 139.7671)
+
+    with pytest.raises((TypeError, ValueError)):
+        coordinate.latitude = 36.0  # type: ignore[misc]
+
+
+def test_trustedで生成した座標をコピーしても他の座標に影響しないこと() -> None:
+    """共有しているフィールドの集合がコピー時の更新で変更されないことを確認"""
+    coordinate = Coordinate.trusted(35.6812, 139.7671)
+    other = Coordinate.trusted(35.6895, 139.6917)
+
+    copied = coordinate.model_copy(update={"latitude": 36.0})
+
+    assert copied.latitude == 36.0
+    assert coordinate.latitude == 35.6812
+    assert other.model_fields_set == {"latitude", "longitude"}
@@ -0,0 +1,50 @@
+"""CompactRouteのテスト"""
+
+from array import array
+
+import pytest
+
+from app.domain.value_objects import Coordinate
+from app.infrastructure.cache import CompactRoute
+
+
+class TestCompactRoute:
+    """CompactRouteのテスト"""
+
+    def test_保存したルートを同じ値で復元できること(self) -> None:
+        """座標列とoverview_polylineが元の値と等しく復元されることを確認"""
+        coordinates = [
+            Coordinate(latitude=35.6812, longitude=139.7671),
+            Coordinate(latitude=35.6895, longitude=139.6917),
+        ]
+
+        route = CompactRoute.from_coordinates(coordinates, "_p~iF~ps|U_ulLnnqC")
+        restored_coordinates, overview_polyline = route.to_result()
+
+        assert len(route) == 2
+        assert restored_coordinates == coordinates
+        assert overview_polyline == "_p~iF~ps|U_ulLnnqC"
+
+    def test_復元するたびに新しいリストを返すこと(self) -> None:
+        """呼び出し側がリストを変更しても保存内容に影響しないことを確認"""
+        route = CompactRoute.from_coordinates(
+            [Coordinate(latitude=35.6812, longitude=139.7671)], ""
+        )
+
+        route.to_result()[0].clear()
+
+        assert len(route.to_result()[0]) == 1
+
+    def test_緯度と経度の配列から生成できること(self) -> None:
+        """配列から生成したルートを座標リストとして復元できることを確認"""
+        route = CompactRoute(array("d", [35.6812, 35.6895]), array("d", [139.7671, 139.6917]), "")
+
+        assert route.to_result()[0] == [
+            Coordinate(latitude=35.6812, longitude=139.7671),
+            Coordinate(latitude=35.6895, longitude=139.6917),
+        ]
+
+    def test_緯度と経度の配列の長さが異なる場合はエラーになること(self) -> None:
+        """配列の長さが一致しない場合にValueErrorとなることを確認"""
+        with pytest.raises(ValueError, match="same length"):
+            CompactRoute(array("d", [35.6812, 35.6895]), array("d", [139.7671]), "")
@@ -0,0 +1,223 @@
+"""DiskImageStoreのテスト"""
+
+import os
+from pathlib import Path
+
+import pytest
+
+from app.infrastructure.cache import DiskImageStore
+
+
+class FakeClock:
+    """テスト用に手動で進める時計"""
+
+    def __init__(self) -> None:
+        """初期化"""
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        """現在時刻を返す"""
+        return self.now
+
+
+def _blob_files(root_dir: Path) -> list[Path]:
+    """保存されている画像ファイルの一覧"""
+    return sorted((root_dir / "blobs").glob("*/*"))
+
+
+def _stored_bytes(root_dir: Path) -> int:
+    """保存されている画像ファイルの合計バイト数"""
+    return sum(path.stat().st_size for path in _blob_files(root_dir))
+
+
+def _key_files(root_dir: Path) -> list[Path]:
+    """保存されているキーのファイルの一覧"""
+    return sorted((root_dir / "keys").iterdir())
+
+
+class TestDiskImageStore:
+    """DiskImageStoreのテスト"""
+
+    def test_保存した画像をキーで取得できること(self, tmp_path: Path) -> None:
+        """putした画像がgetで返り、ヒット数が増えることを確認"""
+        store = DiskImageStore(tmp_path, max_bytes=1024)
+
+        store.put("key", b"jpeg-bytes")
+
+        assert store.get("key") == b"jpeg-bytes"
+        assert store.get_stats().hits == 1
+
+    def test_存在しないキーはNoneを返すこと(self, tmp_path: Path) -> None:
+        """未保存のキーでNoneが返り、ミス数が増えることを確認"""
+        store = DiskImageStore(tmp_path, max_bytes=1024)
+
+        assert store.get("missing") is None
+        assert store.get_stats().misses == 1
+
+    def test_同じ内容の画像は1ファイルにまとめること(self, tmp_path: Path) -> None:
+        """異なるキーでも内容が同じならコンテンツハッシュで重複排除されることを確認"""
+        store = DiskImageStore(tmp_path, max_bytes=1024)
+
+        first_hash = store.put("key1", b"same-image")
+        second_hash = store.put("key2", b"same-image")
+
+        assert first_hash == second_hash
+        assert len(_blob_files(tmp_path)) == 1
+        assert store.get("key1") == store.get("key2") == b"same-image"
+        assert store.get_stats().stored_bytes == len(b"same-image")
+
+    def test_上限を超えた場合は最も参照されていない画像から削除すること(
+        self, tmp_path: Path
+    ) -> None:
+        """最終参照時刻が古い画像が削除され、最近参照した画像は残ることを確認"""
+        store = DiskImageStore(tmp_path, max_bytes=25)
+        store.put("old", b"o" * 10)
+        store.put("recent", b"r" * 10)
+        blobs = {path.read_bytes()[:1]: path for path in _blob_files(tmp_path)}
+        os.utime(blobs[b"o"], (1, 1))
+        os.utime(blobs[b"r"], (2, 2))
+        store.get("recent")  # 参照すると最終参照時刻が更新される
+
+        store.put("new", b"n" * 10)
+
+        assert store.get("old") is None
+        assert store.get("recent") == b"r" * 10
+        assert store.get("new") == b"n" * 10
+        assert store.get_stats().evicted_files == 1
+
+    def test_一時ファイルを残さずに書き込むこと(self, tmp_path: Path) -> None:
+        """書き込み後に一時ファイルが残っていないことを確認"""
+        store = DiskImageStore(tmp_path, max_bytes=1024)
+
+        store.put("key", b"jpeg-bytes")
+
+        assert not list(tmp_path.rglob(".tmp-*"))
+
+    def test_同じディレクトリを共有する別インスタンスから取得できること(
+        self, tmp_path: Path
+    ) -> None:
+        """複数ワーカーを想定し、別のインスタンスが保存した画像を読めることを確認"""
+        writer = DiskImageStore(tmp_path, max_bytes=1024)
+        reader = DiskImageStore(tmp_path, max_bytes=1024)
+
+        writer.put("key", b"jpeg-bytes")
+
+        assert reader.get("key") == b"jpeg-bytes"
+        assert reader.get_stats().stored_bytes == 0  # 起動後に他のワーカーが書いた分は含まない
+
+    def test_画像が削除済みの場合はミスとして扱うこと(self, tmp_path: Path) -> None:
+        """他のワーカーが画像を削除した場合にNoneを返すことを確認"""
+        store = DiskImageStore(tmp_path, max_bytes=1024)
+        store.put("key", b"jpeg-bytes")
+        for path in _blob_files(tmp_path):
+            path.unlink()
+
+        assert store.get("key") is None
+
+    def test_コンテンツハッシュで画像を取得できること(self, tmp_path: Path) -> None:
+        """publishで保存した画像がget_by_hashで返り、ヒット数・ミス数と上限に計上しないことを確認"""
+        store = DiskImageStore(tmp_path, max_bytes=1024)
+
+        content_hash = store.publish(b"jpeg-bytes")
+
+        assert store.get_by_hash(content_hash) == b"jpeg-bytes"
+        assert store.get_by_hash("0" * 64) is None
+        stats = store.get_stats()
+        assert (stats.hits, stats.misses) == (0, 0)
+        assert stats.stored_bytes == 0
+
+    def test_公開済みの画像は上限を超えても削除しないこと(self, tmp_path: Path) -> None:
+        """キャッシュした同じ画像が削除された後も、公開済みの画像を取得できることを確認"""
+        store = DiskImageStore(tmp_path, max_bytes=25)
+        store.put("published", b"p" * 10)
+        content_hash = store.publish(b"p" * 10)
+
+        for i in range(5):
+            store.put(f"key-{i}", bytes([i]) * 10)
+
+        assert store.get("published") is None
+        assert store.get_stats().evicted_files >= 1
+        assert store.get_by_hash(content_hash) == b"p" * 10
+
+    def test_保持期間を過ぎた公開済みの画像は走査時に削除すること(self, tmp_path: Path) -> None:
+        """最終参照から保持期間を過ぎた画像だけを削除することを確認"""
+        clock = FakeClock()
+        store = DiskImageStore(
+            tmp_path,
+            max_bytes=1024,
+            rescan_interval_seconds=60,
+            published_retention_seconds=3600,
+            clock=clock,
+        )
+        expired_hash = store.publish(b"expired")
+        recent_hash = store.publish(b"recent")
+        expired_path = next((tmp_path / "published").glob(f"*/{expired_hash}"))
+        os.utime(expired_path, (1, 1))
+
+        clock.now = 60
+        store.put("key", b"jpeg-bytes")
+
+        assert store.get_by_hash(expired_hash) is None
+        assert store.get_by_hash(recent_hash) == b"recent"
+        assert store.get_stats().expired_published_files == 1
+
+    @pytest.mark.parametrize("content_hash", ["../keys/x", "ABC", "0" * 63])
+    def test_不正な形式のハッシュはNoneを返すこと(self, tmp_path: Path, content_hash: str) -> None:
+        """SHA-256の16進表記でない場合はファイルを参照せずにNoneを返すことを確認"""
+        store = DiskImageStore(tmp_path, max_bytes=1024)
+
+        assert store.get_by_hash(content_hash) is None
+
+    def test_上限が0以下ならエラーになること(self, tmp_path: Path) -> None:
+        """不正な上限値を拒否することを確認"""
+        with pytest.raises(ValueError):
+            DiskImageStore(tmp_path, max_bytes=0)
+
+    def test_同じディレクトリを共有する複数のインスタンスの合計で上限を守ること(
+        self, tmp_path: Path
+    ) -> None:
+        """他のワーカーの書き込みも含めた実際の合計バイト数で削除することを確認"""
+        stores = [DiskImageStore(tmp_path, max_bytes=10000) for _ in range(2)]
+
+        for i in range(18):
+            stores[i % 2].put(f"key-{i}", bytes([i]) * 1000)
+
+        assert _stored_bytes(tmp_path) <= 10000
+        assert stores[1].get("key-17") == bytes([17]) * 1000
+        assert sum(store.get_stats().evicted_files for store in stores) >= 8
+
+    def test_一定間隔ごとに他のワーカーの書き込みを含めて走査し直すこと(
+        self, tmp_path: Path
+    ) -> None:
+        """自身の書き込みが少なくても、間隔を過ぎると実際の合計で上限を判定することを確認"""
+        clock = FakeClock()
+        store = DiskImageStore(tmp_path, max_bytes=10000, rescan_interval_seconds=60, clock=clock)
+        other = DiskImageStore(tmp_path, max_bytes=10**6)
+        for i in range(12):
+            other.put(f"other-{i}", bytes([i]) * 1000)
+
+        store.put("small-0", b"s" * 10)
+        assert _stored_bytes(tmp_path) > 10000
+
+        clock.now = 60
+        store.put("small-1", b"t" * 10)
+
+        assert _stored_bytes(tmp_path) <= 10000
+        assert store.get_stats().stored_bytes == _stored_bytes(tmp_path)
+
+    def test_画像を削除したキーのファイルも削除すること(self, tmp_path: Path) -> None:
+        """走査時に画像が存在しないキーのファイルを削除し、keys/ が増え続けないことを確認"""
+        store = DiskImageStore(tmp_path, max_bytes=25)
+        store.put("old", b"o" * 10)
+        store.put("recent", b"r" * 10)
+        for path in _key_files(tmp_path):
+            os.utime(path, (1, 1))
+        blobs = {path.read_bytes()[:1]: path for path in _blob_files(tmp_path)}
+        os.utime(blobs[b"o"], (1, 1))
+        os.utime(blobs[b"r"], (2, 2))
+
+        store.put("new", b"n" * 10)
+
+        assert len(_blob_files(tmp_path)) == 2
+        assert len(_key_files(tmp_path)) == 2
+        assert store.get("old") is None
@@ -0,0 +1,68 @@
+"""TtlCacheのテスト"""
+
+import pytest
+
+from app.infrastructure.cache import CacheStats, TtlCache
+
+
+class FakeClock:
+    """テスト用に手動で進める時計"""
+
+    def __init__(self) -> None:
+        """初期化"""
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        """現在時刻を返す"""
+        return self.now
+
+
+class TestTtlCache:
+    """TtlCacheのテスト"""
+
+    def test_保存した値を取得できること(self) -> None:
+        """setした値がgetで返り、ヒット数が増えることを確認"""
+        cache: TtlCache[str, int] = TtlCache(max_entries=10)
+
+        cache.set("key", 1)
+
+        assert cache.get("key") == 1
+        assert cache.get_stats().hits == 1
+
+    def test_存在しないキーはNoneを返しミスとして数えること(self) -> None:
+        """未登録のキーでNoneが返り、ミス数が増えることを確認"""
+        cache: TtlCache[str, int] = TtlCache(max_entries=10)
+
+        assert cache.get("missing") is None
+        assert cache.get_stats() == CacheStats(hits=0, misses=1, size=0, max_entries=10)
+
+    def test_有効期限を過ぎたエントリは削除されること(self) -> None:
+        """TTL経過後はミスとなり、エントリが削除されることを確認"""
+        clock = FakeClock()
+        cache: TtlCache[str, int] = TtlCache(max_entries=10, ttl_seconds=60, clock=clock)
+        cache.set("key", 1)
+
+        clock.now = 59.9
+        assert cache.get("key") == 1
+
+        clock.now = 60.0
+        assert cache.get("key") is None
+        assert cache.get_stats().size == 0
+
+    def test_上限を超えた場合は最も参照されていないエントリから削除すること(self) -> None:
+        """LRU順で古いエントリが追い出されることを確認"""
+        cache: TtlCache[str, int] = TtlCache(max_entries=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")  # aを最近参照したことにする
+
+        cache.set("c", 3)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+
+    def test_最大エントリ数が0以下ならエラーになること(self) -> None:
+        """不正な上限値を拒否することを確認"""
+        with pytest.raises(ValueError):
+            TtlCache(max_entries=0)
@@ -0,0 +1,198 @@
+"""SingleFlight / AsyncSingleFlightのテスト"""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from app.infrastructure.concurrency import AsyncSingleFlight, SingleFlight, SingleFlightStats
+
+
+class TestSingleFlight:
+    """SingleFlightのテスト"""
+
+    def test_同時に実行中の同一キーの呼び出しは1回に集約されること(self) -> None:
+        """後続のスレッドが先行スレッドの結果を共有することを確認"""
+        single_flight = SingleFlight()
+        started = threading.Event()
+        release = threading.Event()
+        calls: list[int] = []
+
+        def func() -> str:
+            calls.append(1)
+            started.set()
+            release.wait(timeout=5)
+            return "result"
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            leader = executor.submit(single_flight.run, "key", func)
+            started.wait(timeout=5)
+            follower = executor.submit(single_flight.run, "key", func)
+            # NOTE: 後続の呼び出しが待機に入ったことを統計で確認してから完了させる
+            while single_flight.get_stats().shared == 0:
+                time.sleep(0.001)
+            release.set()
+
+        assert leader.result() == "result"
+        assert follower.result() == "result"
+        assert len(calls) == 1
+        assert single_flight.get_stats() == SingleFlightStats(calls=1, shared=1)
+
+    def test_例外は待機中の呼び出し元にも送出されること(self) -> None:
+        """先行スレッドの例外を後続スレッドも受け取ることを確認"""
+        single_flight = SingleFlight()
+        started = threading.Event()
+        release = threading.Event()
+
+        def func() -> str:
+            started.set()
+            release.wait(timeout=5)
+            raise ValueError("failed")
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            leader = executor.submit(single_flight.run, "key", func)
+            started.wait(timeout=5)
+            follower = executor.submit(single_flight.run, "key", func)
+            while single_flight.get_stats().shared == 0:
+                time.sleep(0.001)
+            release.set()
+
+        with pytest.raises(ValueError, match="failed"):
+            leader.result()
+        with pytest.raises(ValueError, match="failed"):
+            follower.result()
+
+    def test_完了後の呼び出しは再度実行されること(self) -> None:
+        """結果をキャッシュせず、逐次の呼び出しは毎回実行されることを確認"""
+        single_flight = SingleFlight()
+        calls: list[int] = []
+
+        def func() -> int:
+            calls.append(1)
+            return len(calls)
+
+        assert single_flight.run("key", func) == 1
+        assert single_flight.run("key", func) == 2
+        assert single_flight.get_stats() == SingleFlightStats(calls=2, shared=0)
+
+
+class TestAsyncSingleFlight:
+    """AsyncSingleFlightのテスト"""
+
+    def test_同時に実行中の同一キーの呼び出しは1回に集約されること(self) -> None:
+        """並行したコルーチンが1回の実行結果を共有することを確認"""
+        single_flight = AsyncSingleFlight()
+        calls: list[int] = []
+
+        async def func() -> str:
+            calls.append(1)
+            await asyncio.sleep(0)
+            return "result"
+
+        async def run() -> list[str]:
+            return await asyncio.gather(*(single_flight.run("key", func) for _ in range(3)))
+
+        assert asyncio.run(run()) == ["result", "result", "result"]
+        assert len(calls) == 1
+        assert single_flight.get_stats() == SingleFlightStats(calls=1, shared=2)
+
+    def test_異なるキーの呼び出しは集約されないこと(self) -> None:
+        """キーが異なる場合はそれぞれ実行されることを確認"""
+        single_flight = AsyncSingleFlight()
+
+        async def run() -> list[str]:
+            async def func(value: str) -> str:
+                await asyncio.sleep(0)
+                return value
+
+            return await asyncio.gather(
+                single_flight.run("a", lambda: func("a")),
+                single_flight.run("b", lambda: func("b")),
+            )
+
+        assert asyncio.run(run()) == ["a", "b"]
+        assert single_flight.get_stats() == SingleFlightStats(calls=2, shared=0)
+
+    def test_例外は待機中の呼び出し元にも送出されること(self) -> None:
+        """実行中のコルーチンの例外を全呼び出し元が受け取ることを確認"""
+        single_flight = AsyncSingleFlight()
+
+        async def func() -> str:
+            await asyncio.sleep(0)
+            raise ValueError("failed")
+
+        async def run() -> list[str | BaseException]:
+            return await asyncio.gather(
+                single_flight.run("key", func),
+                single_flight.run("key", func),
+                return_exceptions=True,
+            )
+
+        results = asyncio.run(run())
+
+        assert all(isinstance(result, ValueError) for result in results)
+        assert single_flight.get_stats() == SingleFlightStats(calls=1, shared=1)
+
+    def test_呼び出し元がキャンセルされても他の呼び出し元は結果を受け取ること(self) -> None:
+        """先行する呼び出し元のキャンセルが共有中の実行を止めないことを確認"""
+        single_flight = AsyncSingleFlight()
+
+        async def func() -> str:
+            await asyncio.sleep(0.01)
+            return "result"
+
+        async def run() -> str:
+            leader = asyncio.create_task(single_flight.run("key", func))
+            await asyncio.sleep(0)
+            follower = asyncio.create_task(single_flight.run("key", func))
+            await asyncio.sleep(0)
+            leader.cancel()
+            return await follower
+
+        assert asyncio.run(run()) == "result"
+
+    def test_待ち時間を過ぎた呼び出し元だけがタイムアウトすること(self) -> None:
+        """待ち時間の短い呼び出し元のタイムアウトが共有中の実行を止めないことを確認"""
+        single_flight = AsyncSingleFlight()
+
+        async def func() -> str:
+            await asyncio.sleep(0.05)
+            return "result"
+
+        async def run() -> list[str | BaseException]:
+            return await asyncio.gather(
+                single_flight.run("key", func, timeout=0.01),
+                single_flight.run("key", func, timeout=5.0),
+                return_exceptions=True,
+            )
+
+        leader, follower = asyncio.run(run())
+
+        assert isinstance(leader, TimeoutError)
+        assert follower == "result"
+        assert single_flight.get_stats() == SingleFlightStats(calls=1, shared=1)
+
+    def test_待っている呼び出し元がいなくなったら実行をキャンセルすること(self) -> None:
+        """全呼び出し元がタイムアウトした場合は実行を打ち切り、次の呼び出しで新たに実行することを確認"""
+        single_flight = AsyncSingleFlight()
+        cancelled: list[bool] = []
+
+        async def func() -> str:
+            try:
+                await asyncio.sleep(5.0)
+            except asyncio.CancelledError:
+                cancelled.append(True)
+                raise
+            return "result"
+
+        async def run() -> str:
+            with pytest.raises(TimeoutError):
+                await single_flight.run("key", func, timeout=0.01)
+            await asyncio.sleep(0)
+            return await single_flight.run("key", lambda: asyncio.sleep(0, result="retried"))
+
+        assert asyncio.run(run()) == "retried"
+        assert cancelled == [True]
+        assert single_flight.get_stats() == SingleFlightStats(calls=2, shared=0)
@@ -0,0 +1,807 @@
+"""非同期Google Maps Gatewayのテスト"""
+
+import asyncio
+import json
+from collections.abc import Callable
+from pathlib import Path
+
+import httpx
+import pytest
+
+from app.application.deadline import Deadline
+from app.application.gateway_interfaces.google_maps_gateway import StreetViewMetadata
+from app.domain.exceptions import (
+    ExternalServiceDeadlineExceededError,
+    ExternalServiceError,
+    ExternalServiceTimeoutError,
+    ExternalServiceValidationError,
+)
+from app.domain.value_objects import Coordinate, ImageSize, Landmark
+from app.infrastructure.cache import CompactRoute, DiskImageStore, TtlCache
+from app.infrastructure.gateways import google_maps_api
+from app.infrastructure.gateways.async_google_maps_gateway_impl import AsyncGoogleMapsGatewayImpl
+from app.infrastructure.gateways.google_maps_api import DirectionsCacheKey, SearchNearbyCacheKey
+from app.infrastructure.http import AsyncPooledHttpTransport
+from app.infrastructure.resilience import CircuitBreaker, HedgingPolicy, RateLimiter
+
+
+def _build_gateway(
+    handler: Callable[[httpx.Request], httpx.Response],
+    metadata_cache: TtlCache[Coordinate, StreetViewMetadata] | None = None,
+    places_cache: TtlCache[SearchNearbyCacheKey, list[Landmark]] | None = None,
+    directions_cache: TtlCache[DirectionsCacheKey, CompactRoute] | None = None,
+    image_store: DiskImageStore | None = None,
+    circuit_breakers: dict[str, CircuitBreaker] | None = None,
+    rate_limiters: dict[str, RateLimiter] | None = None,
+    hedging_policies: dict[str, HedgingPolicy] | None = None,
+) -> AsyncGoogleMapsGatewayImpl:
+    """モックトランスポートを使うGatewayを生成する"""
+    transport = AsyncPooledHttpTransport(transport=httpx.MockTransport(handler))
+    return AsyncGoogleMapsGatewayImpl(
+        transport=transport,
+        metadata_cache=metadata_cache,
+        places_cache=places_cache,
+        directions_cache=directions_cache,
+        image_store=image_store,
+        circuit_breakers=circuit_breakers,
+        rate_limiters=rate_limiters,
+        hedging_policies=hedging_policies,
+    )
+
+
+class TestGetDirections:
+    """get_directionsのテスト"""
+
+    def test_ルート座標とoverview_polylineを返すこと(self) -> None:
+        """Directions APIのレスポンスを座標列とポリラインに変換することを確認"""
+        requests: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(
+                200,
+                json={
+                    "status": "OK",
+                    "routes": [
+                        {
+                            "legs": [{"steps": [{"polyline": {"points": "_p~iF~ps|U_ulLnnqC"}}]}],
+                            "overview_polyline": {"points": "_p~iF~ps|U_ulLnnqC"},
+                        }
+                    ],
+                },
+            )
+
+        gateway = _build_gateway(handler)
+        origin = Coordinate(latitude=35.6812, longitude=139.7671)
+        destination = Coordinate(latitude=35.6895, longitude=139.6917)
+        waypoint = Coordinate(latitude=35.685, longitude=139.73)
+
+        route_coordinates, overview_polyline = asyncio.run(
+            gateway.get_directions(origin, destination, waypoints=[waypoint])
+        )
+
+        assert len(route_coordinates) == 2
+        assert overview_polyline == "_p~iF~ps|U_ulLnnqC"
+        assert requests[0].url.params["origin"] == "35.681200,139.767100"
+        assert requests[0].url.params["waypoints"] == "via:35.685000,139.730000"
+        assert requests[0].url.params["mode"] == "walking"
+
+    def test_非OKステータスでバリデーションエラーになること(self) -> None:
+        """statusがOKでない場合にExternalServiceValidationErrorを発生させることを確認"""
+        gateway = _build_gateway(lambda _: httpx.Response(200, json={"status": "ZERO_RESULTS"}))
+        coordinate = Coordinate(latitude=35.6812, longitude=139.7671)
+
+        with pytest.raises(ExternalServiceValidationError) as exc_info:
+            asyncio.run(gateway.get_directions(coordinate, coordinate))
+
+        assert exc_info.value.service_name == "Directions API"
+
+
+class TestDirectionsCache:
+    """Directionsキャッシュのテスト"""
+
+    def test_同じ出発地_目的地_経由地ならキャッシュを使うこと(self) -> None:
+        """丸め後に同一の引数ならリクエストせずに同じ結果を返すことを確認"""
+        requests: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(
+                200,
+                json={
+                    "status": "OK",
+                    "routes": [
+                        {
+                            "legs": [{"steps": [{"polyline": {"points": "_p~iF~ps|U_ulLnnqC"}}]}],
+                            "overview_polyline": {"points": "_p~iF~ps|U_ulLnnqC"},
+                        }
+                    ],
+                },
+            )
+
+        gateway = _build_gateway(handler, directions_cache=TtlCache(max_entries=10))
+        origin = Coordinate(latitude=35.6812, longitude=139.7671)
+        destination = Coordinate(latitude=35.6895, longitude=139.6917)
+        waypoint = Coordinate(latitude=35.685, longitude=139.73)
+
+        first = asyncio.run(gateway.get_directions(origin, destination, waypoints=[waypoint]))
+        second = asyncio.run(
+            gateway.get_directions(
+                Coordinate(latitude=35.68120001, longitude=139.7671),
+                destination,
+                waypoints=[waypoint],
+            )
+        )
+        asyncio.run(gateway.get_directions(origin, destination))
+
+        assert first == second
+        # 経由地が異なる3回目のみ新たにリクエストする
+        assert len(requests) == 2
+        assert gateway.get_stats()["directions_cache"]["hits"] == 1
+
+    def test_非OKステータスはキャッシュしないこと(self) -> None:
+        """エラーになったルートは毎回リクエストすることを確認"""
+        requests: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(200, json={"status": "ZERO_RESULTS"})
+
+        gateway = _build_gateway(handler, directions_cache=TtlCache(max_entries=10))
+        coordinate = Coordinate(latitude=35.6812, longitude=139.7671)
+
+        for _ in range(2):
+            with pytest.raises(ExternalServiceValidationError):
+                asyncio.run(gateway.get_directions(coordinate, coordinate))
+
+        assert len(requests) == 2
+
+
+class TestGetStreetViewMetadata:
+    """get_street_view_metadataのテスト"""
+
+    def test_OKステータスで座標付きのメタデータを返すこと(self) -> None:
+        """status == OKの場合にlocationが設定されることを確認"""
+        gateway = _build_gateway(
+            lambda _: httpx.Response(
+                200, json={"status": "OK", "location": {"lat": 35.6813, "lng": 139.7672}}
+            )
+        )
+        coordinate = Coordinate(latitude=35.6812, longitude=139.7671)
+
+        metadata = asyncio.run(gateway.get_street_view_metadata(coordinate))
+
+        assert metadata.status == "OK"
+        assert metadata.location == Coordinate(latitude=35.6813, longitude=139.7672)
+
+    def test_タイムアウト時はタイムアウトエラーになること(self) -> None:
+        """httpxのタイムアウトをExternalServiceTimeoutErrorに変換することを確認"""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            raise httpx.ReadTimeout("timeout", request=request)
+
+        gateway = _build_gateway(handler)
+        coordinate = Coordinate(latitude=35.6812, longitude=139.7671)
+
+        with pytest.raises(ExternalServiceTimeoutError) as exc_info:
+            asyncio.run(gateway.get_street_view_metadata(coordinate))
+
+        assert exc_info.value.service_name == "Street View Metadata API"
+
+
+class TestStreetViewMetadataCache:
+    """Street Viewメタデータキャッシュのテスト"""
+
+    @pytest.mark.parametrize("status", ["OK", "ZERO_RESULTS"])
+    def test_丸め後に同一座標ならキャッシュを使うこと(self, status: str) -> None:
+        """OK・ZERO_RESULTSの結果をキャッシュし、2回目はリクエストしないことを確認"""
+        requests: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            body: dict = {"status": status}
+            if status == "OK":
+                body["location"] = {"lat": 35.6813, "lng": 139.7672}
+            return httpx.Response(200, json=body)
+
+        cache: TtlCache[Coordinate, StreetViewMetadata] = TtlCache(max_entries=10)
+        gateway = _build_gateway(handler, metadata_cache=cache)
+
+        first = asyncio.run(
+            gateway.get_street_view_metadata(Coordinate(latitude=35.6812001, longitude=139.7671))
+        )
+        second = asyncio.run(
+            gateway.get_street_view_metadata(Coordinate(latitude=35.6812002, longitude=139.7671))
+        )
+
+        assert first == second
+        assert first.status == status
+        assert len(requests) == 1
+        assert gateway.get_stats()["street_view_metadata_cache"] == {
+            "hits": 1,
+            "misses": 1,
+            "size": 1,
+            "max_entries": 10,
+        }
+
+    def test_一時的なエラーステータスはキャッシュしないこと(self) -> None:
+        """OVER_QUERY_LIMITなどの結果は毎回リクエストすることを確認"""
+        requests: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(200, json={"status": "OVER_QUERY_LIMIT"})
+
+        gateway = _build_gateway(handler, metadata_cache=TtlCache(max_entries=10))
+        coordinate = Coordinate(latitude=35.6812, longitude=139.7671)
+
+        asyncio.run(gateway.get_street_view_metadata(coordinate))
+        asyncio.run(gateway.get_street_view_metadata(coordinate))
+
+        assert len(requests) == 2
+
+
+class TestGetStreetViewImage:
+    """get_street_view_imageのテスト"""
+
+    def test_画像データとheadingパラメータが扱われること(self) -> None:
+        """画像バイト列を返し、headingが整数で送信されることを確認"""
+        requests: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(200, content=b"jpeg-bytes")
+
+        gateway = _build_gateway(handler)
+        coordinate = Coordinate(latitude=35.6812, longitude=139.7671)
+
+        image = asyncio.run(
+            gateway.get_street_view_image(
+                coordinate, ImageSize(width=600, height=300), heading=90.7
+            )
+        )
+
+        assert image == b"jpeg-bytes"
+        assert requests[0].url.params["heading"] == "90"
+        assert requests[0].url.params["size"] == "600x300"
+
+    def test_HTTPエラー時は外部サービスエラーになること(self) -> None:
+        """5xxレスポンスをExternalServiceErrorに変換することを確認"""
+        gateway = _build_gateway(lambda _: httpx.Response(500))
+        coordinate = Coordinate(latitude=35.6812, longitude=139.7671)
+
+        with pytest.raises(ExternalServiceError) as exc_info:
+            asyncio.run(gateway.get_street_view_image(coordinate, ImageSize(width=600, height=300)))
+
+        assert exc_info.value.service_name == "Street View Static API"
+
+
+class TestStreetViewImageStore:
+    """Street View画像ストアのテスト"""
+
+    def test_近いheadingの画像はストアから返すこと(self, tmp_path: Path) -> None:
+        """丸め後に同じheadingなら2回目はリクエストしないことを確認"""
+        requests: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(200, content=b"jpeg-bytes")
+
+        gateway = _build_gateway(handler, image_store=DiskImageStore(tmp_path, max_bytes=1024))
+        coordinate = Coordinate(latitude=35.6812, longitude=139.7671)
+        image_size = ImageSize(width=600, height=300)
+
+        first = asyncio.run(gateway.get_street_view_image(coordinate, image_size, heading=91.2))
+        second = asyncio.run(gateway.get_street_view_image(coordinate, image_size, heading=89.4))
+        asyncio.run(gateway.get_street_view_image(coordinate, image_size, heading=120.0))
+
+        assert first == second == b"jpeg-bytes"
+        assert [request.url.params["heading"] for request in requests] == ["90", "120"]
+        assert gateway.get_stats()["street_view_image_store"]["hits"] == 1
+
+    def test_エラー時は保存しないこと(self, tmp_path: Path) -> None:
+        """画像取得に失敗した場合はストアに何も保存しないことを確認"""
+        gateway = _build_gateway(
+            lambda _: httpx.Response(500), image_store=DiskImageStore(tmp_path, max_bytes=1024)
+        )
+        coordinate = Coordinate(latitude=35.6812, longitude=139.7671)
+
+        with pytest.raises(ExternalServiceError):
+            asyncio.run(gateway.get_street_view_image(coordinate, ImageSize(width=600, height=300)))
+
+        assert gateway.get_stats()["street_view_image_store"]["stored_bytes"] == 0
+
+
+class TestSearchLandmarksNearby:
+    """search_landmarks_nearbyのテスト"""
+
+    def test_レスポンスからLandmarkリストを返すこと(self) -> None:
+        """searchNearbyのレスポンスをLandmarkに変換し、リクエストボディを組み立てることを確認"""
+        requests: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(
+                200,
+                json={
+                    "places": [
+                        {
+                            "id": "place1",
+                            "displayName": {"text": "東京駅"},
+                            "location": {"latitude": 35.6812, "longitude": 139.7671},
+                            "primaryType": "train_station",
+                        },
+                        {"id": "place2", "displayName": {"text": "座標なし"}},
+                    ]
+                },
+            )
+
+        gateway = _build_gateway(handler)
+        coordinate = Coordinate(latitude=35.6812, longitude=139.7671)
+
+        landmarks = asyncio.run(
+            gateway.search_landmarks_nearby(coordinate, 1000, rank_preference="DISTANCE")
+        )
+
+        assert [landmark.place_id for landmark in landmarks] == ["place1"]
+        body = json.loads(requests[0].content)
+        assert body["rankPreference"] == "DISTANCE"
+        assert body["locationRestriction"]["circle"]["radius"] == 1000
+
+    def test_非200ステータスで外部サービスエラーになること(self) -> None:
+        """リトライ対象外のエラーステータスは1回で失敗することを確認"""
+        calls: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            calls.append(request)
+            return httpx.Response(400, json={"error": "bad request"})
+
+        gateway = _build_gateway(handler)
+        coordinate = Coordinate(latitude=35.6812, longitude=139.7671)
+
+        with pytest.raises(ExternalServiceError) as exc_info:
+            asyncio.run(gateway.search_landmarks_nearby(coordinate, 1000))
+
+        assert exc_info.value.service_name == "Places API"
+        assert len(calls) == 1
+
+
+class TestPlacesCache:
+    """searchNearbyキャッシュのテスト"""
+
+    @staticmethod
+    def _places_handler(requests: list[httpx.Request]) -> Callable[[httpx.Request], httpx.Response]:
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(
+                200,
+                json={
+                    "places": [
+                        {
+                            "id": "place1",
+                            "displayName": {"text": "東京駅"},
+                            "location": {"latitude": 35.6812, "longitude": 139.7671},
+                        }
+                    ]
+                },
+            )
+
+        return handler
+
+    def test_同じセルと半径バケットの検索はキャッシュを使うこと(self) -> None:
+        """近い中心・半径・タイプ順序違いの検索が1回のリクエストで済むことを確認"""
+        requests: list[httpx.Request] = []
+        gateway = _build_gateway(
+            self._places_handler(requests), places_cache=TtlCache(max_entries=10)
+        )
+
+        first = asyncio.run(
+            gateway.search_landmarks_nearby(
+                Coordinate(latitude=35.68121, longitude=139.76712),
+                310,
+                included_types=["park", "cafe"],
+            )
+        )
+        second = asyncio.run(
+            gateway.search_landmarks_nearby(
+                Coordinate(latitude=35.68149, longitude=139.76681),
+                320,
+                included_types=["cafe", "park"],
+            )
+        )
+
+        assert first == second
+        assert len(requests) == 1
+        body = json.loads(requests[0].content)
+        assert body["locationRestriction"]["circle"] == {
+            "center": {"latitude": 35.681, "longitude": 139.767},
+            "radius": 400,
+        }
+        assert gateway.get_stats()["places_cache"]["hits"] == 1
+
+    def test_ソート順が異なる検索は別のエントリとして扱うこと(self) -> None:
+        """rank_preferenceが異なればキャッシュを共有しないことを確認"""
+        requests: list[httpx.Request] = []
+        gateway = _build_gateway(
+            self._places_handler(requests), places_cache=TtlCache(max_entries=10)
+        )
+        coordinate = Coordinate(latitude=35.6812, longitude=139.7671)
+
+        asyncio.run(gateway.search_landmarks_nearby(coordinate, 300))
+        asyncio.run(gateway.search_landmarks_nearby(coordinate, 300, rank_preference="DISTANCE"))
+
+        assert len(requests) == 2
+
+    def test_キャッシュした結果は呼び出し側の変更の影響を受けないこと(self) -> None:
+        """返したリストを変更してもキャッシュの内容が変わらないことを確認"""
+        requests: list[httpx.Request] = []
+        gateway = _build_gateway(
+            self._places_handler(requests), places_cache=TtlCache(max_entries=10)
+        )
+        coordinate = Coordinate(latitude=35.6812, longitude=139.7671)
+
+        asyncio.run(gateway.search_landmarks_nearby(coordinate, 300)).clear()
+
+        assert len(asyncio.run(gateway.search_landmarks_nearby(coordinate, 300))) == 1
+
+
+class TestSnapToRoad:
+    """snap_to_roadのテスト"""
+
+    def test_道路上にスナップできること(self) -> None:
+        """Roads APIが成功した場合にスナップされた座標を返すことを確認"""
+        gateway = _build_gateway(
+            lambda _: httpx.Response(
+                200,
+                json={
+                    "snappedPoints": [
+                        {
+                            "location": {"latitude": 35.6813, "longitude": 139.7672},
+                            "originalIndex": 0,
+                        }
+                    ]
+                },
+            )
+        )
+        coordinate = Coordinate(latitude=35.6812, longitude=139.7671)
+
+        result = asyncio.run(gateway.snap_to_road(coordinate))
+
+        assert result == Coordinate(latitude=35.6813, longitude=139.7672)
+
+    def test_道路が見つからない場合はNoneを返すこと(self) -> None:
+        """snappedPointsが空の場合にNoneを返すことを確認"""
+        gateway = _build_gateway(lambda _: httpx.Response(200, json={}))
+        coordinate = Coordinate(latitude=35.6812, longitude=139.7671)
+
+        assert asyncio.run(gateway.snap_to_road(coordinate)) is None
+
+
+class TestSnapToRoads:
+    """snap_to_roadsのテスト"""
+
+    def test_1回のリクエストで複数座標をスナップすること(self) -> None:
+        """originalIndexで入力座標と対応付けた結果を返すことを確認"""
+        requests: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(
+                200,
+                json={
+                    "snappedPoints": [
+                        {
+                            "location": {"latitude": 35.6896, "longitude": 139.6918},
+                            "originalIndex": 1,
+                        }
+                    ]
+                },
+            )
+
+        gateway = _build_gateway(handler)
+        coordinates = [
+            Coordinate(latitude=35.6812, longitude=139.7671),
+            Coordinate(latitude=35.6895, longitude=139.6917),
+        ]
+
+        result = asyncio.run(gateway.snap_to_roads(coordinates))
+
+        assert result == [None, Coordinate(latitude=35.6896, longitude=139.6918)]
+        assert len(requests) == 1
+        assert requests[0].url.params["points"] == "35.6812,139.7671|35.6895,139.6917"
+
+
+class TestSingleFlight:
+    """同一呼び出しの集約のテスト"""
+
+    def test_同時に実行中の同一座標のメタデータ取得は1回のリクエストになること(self) -> None:
+        """丸め後に同一となる座標の並行呼び出しがリクエストを共有することを確認"""
+        requests: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(200, json={"status": "ZERO_RESULTS"})
+
+        gateway = _build_gateway(handler)
+
+        async def run() -> list[StreetViewMetadata]:
+            return await asyncio.gather(
+                gateway.get_street_view_metadata(
+                    Coordinate(latitude=35.6812001, longitude=139.7671)
+                ),
+                gateway.get_street_view_metadata(
+                    Coordinate(latitude=35.6812002, longitude=139.7671)
+                ),
+            )
+
+        first, second = asyncio.run(run())
+
+        assert first == second
+        assert len(requests) == 1
+        assert gateway.get_stats()["single_flight"] == {"calls": 1, "shared": 1}
+
+    def test_期限の短い呼び出し元のタイムアウトを他の呼び出し元に伝播しないこと(self) -> None:
+        """先に期限を過ぎた呼び出し元だけがタイムアウトし、期限の長い呼び出し元は結果を受け取ることを確認"""
+        requests: list[httpx.Request] = []
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            await asyncio.sleep(0.05)
+            return httpx.Response(200, json={"status": "ZERO_RESULTS"})
+
+        gateway = _build_gateway(handler)
+        coordinate = Coordinate(latitude=35.6812, longitude=139.7671)
+
+        async def run() -> list[StreetViewMetadata | BaseException]:
+            return await asyncio.gather(
+                gateway.get_street_view_metadata(coordinate, deadline=Deadline.after(0.01)),
+                gateway.get_street_view_metadata(coordinate, deadline=Deadline.after(5.0)),
+                return_exceptions=True,
+            )
+
+        leader, follower = asyncio.run(run())
+
+        assert isinstance(leader, ExternalServiceDeadlineExceededError)
+        assert isinstance(follower, StreetViewMetadata)
+        assert follower.status == "ZERO_RESULTS"
+        assert len(requests) == 1
+
+
+class TestCircuitBreaker:
+    """サーキットブレーカーのテスト"""
+
+    def test_失敗が続いたサービスは呼び出さずに即時失敗すること(self) -> None:
+        """Places APIのエラーでブレーカーが開き、以降はリクエストしないことを確認"""
+        requests: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(500, json={})
+
+        breaker = CircuitBreaker("Places API", minimum_calls=2, window_size=2)
+        gateway = _build_gateway(handler, circuit_breakers={"Places API": breaker})
+        coordinate = Coordinate(latitude=35.6812, longitude=139.7671)
+
+        for _ in range(2):
+            with pytest.raises(ExternalServiceError):
+                asyncio.run(gateway.search_landmarks_nearby(coordinate, 500))
+        with pytest.raises(ExternalServiceError, match="Circuit breaker is open"):
+            asyncio.run(gateway.search_landmarks_nearby(coordinate, 500))
+
+        assert len(requests) == 2
+        assert gateway.get_stats()["circuit_breakers"] == {
+            "Places API": {
+                "state": "open",
+                "failure_rate": 1.0,
+                "window_calls": 2,
+                "rejected_calls": 1,
+                "opened_count": 1,
+            }
+        }
+
+
+class TestRateLimit:
+    """レート制限のテスト"""
+
+    def test_レート制限を超えた呼び出しはリクエストせずに失敗すること(self) -> None:
+        """待ち時間が上限を超える場合はAPIを呼び出さず、ブレーカーの失敗にも含めないことを確認"""
+        requests: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(200, json={"snappedPoints": []})
+
+        limiter = RateLimiter("Roads API", rate_per_second=0.1, burst=1, max_wait_seconds=1.0)
+        breaker = CircuitBreaker("Roads API", minimum_calls=1, window_size=1)
+        gateway = _build_gateway(
+            handler,
+            circuit_breakers={"Roads API": breaker},
+            rate_limiters={"Roads API": limiter},
+        )
+
+        asyncio.run(gateway.snap_to_road(Coordinate(latitude=35.6812, longitude=139.7671)))
+        with pytest.raises(ExternalServiceError, match="Rate limit exceeded"):
+            asyncio.run(gateway.snap_to_road(Coordinate(latitude=35.6813, longitude=139.7671)))
+
+        assert len(requests) == 1
+        stats = gateway.get_stats()
+        assert stats["rate_limiters"]["Roads API"]["rejected"] == 1
+        assert stats["circuit_breakers"]["Roads API"]["state"] == "closed"
+
+    def test_待機中に期限を過ぎる場合はトークンを消費せずに失敗すること(self) -> None:
+        """期限までにトークンを取得できない呼び出しがリクエストもトークンの消費もしないことを確認"""
+        requests: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(200, json={"snappedPoints": []})
+
+        limiter = RateLimiter("Roads API", rate_per_second=0.5, burst=1, max_wait_seconds=10.0)
+        gateway = _build_gateway(handler, rate_limiters={"Roads API": limiter})
+        coordinates = [Coordinate(latitude=35.6812, longitude=139.7671)]
+
+        asyncio.run(gateway.snap_to_roads(coordinates))
+        with pytest.raises(ExternalServiceDeadlineExceededError):
+            asyncio.run(gateway.snap_to_roads(coordinates, deadline=Deadline.after(0.5)))
+
+        assert len(requests) == 1
+        stats = gateway.get_stats()["rate_limiters"]["Roads API"]
+        assert stats["acquired"] == 1
+        assert stats["rejected"] == 1
+
+
+class TestHedging:
+    """ヘッジリクエストのテスト"""
+
+    def test_応答が遅いメタデータ取得は追加のリクエストの応答を採用すること(self) -> None:
+        """応答時間の分位点を過ぎたら同じリクエストを送信し、先に返った応答を使うことを確認"""
+        requests: list[httpx.Request] = []
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            if len(requests) == 2:
+                # NOTE: 2件目 (最初のリクエスト) だけ応答を返さずに待たせる
+                await asyncio.sleep(10)
+            return httpx.Response(200, json={"status": "ZERO_RESULTS"})
+
+        policy = HedgingPolicy(budget_ratio=1.0, budget_burst=1.0, min_samples=1)
+        gateway = _build_gateway(handler, hedging_policies={"Street View Metadata API": policy})
+
+        asyncio.run(gateway.get_street_view_metadata(Coordinate(latitude=35.0, longitude=139.0)))
+        metadata = asyncio.run(
+            gateway.get_street_view_metadata(Coordinate(latitude=35.6812, longitude=139.7671))
+        )
+
+        assert metadata.status == "ZERO_RESULTS"
+        assert len(requests) == 3
+        assert requests[1].url == requests[2].url
+        hedging_stats = gateway.get_stats()["hedging"]["Street View Metadata API"]
+        assert hedging_stats["hedged"] == 1
+        assert hedging_stats["hedge_wins"] == 1
+
+
+class TestDeadline:
+    """リクエスト期限のテスト"""
+
+    def test_HTTPタイムアウトを期限までの残り時間で切り詰めること(self) -> None:
+        """残り時間が固定タイムアウトより短い場合は残り時間をタイムアウトにすることを確認"""
+        requests: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(200, json={"snappedPoints": []})
+
+        gateway = _build_gateway(handler)
+
+        asyncio.run(
+            gateway.snap_to_roads(
+                [Coordinate(latitude=35.6812, longitude=139.7671)], deadline=Deadline.after(2.0)
+            )
+        )
+
+        assert 0 < requests[0].extensions["timeout"]["read"] <= 2.0
+
+    def test_期限を過ぎている場合はリクエストせずにタイムアウトとすること(self) -> None:
+        """期限切れの呼び出しはAPIを呼ばず、ブレーカーの失敗にも含めないことを確認"""
+        requests: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(200, json={})
+
+        breaker = CircuitBreaker("Directions API", minimum_calls=1, window_size=1)
+        gateway = _build_gateway(handler, circuit_breakers={"Directions API": breaker})
+
+        with pytest.raises(ExternalServiceTimeoutError, match="Deadline exceeded"):
+            asyncio.run(
+                gateway.get_directions(
+                    Coordinate(latitude=35.6812, longitude=139.7671),
+                    Coordinate(latitude=35.6895, longitude=139.6917),
+                    deadline=Deadline.after(0.0),
+                )
+            )
+
+        assert requests == []
+        assert breaker.get_stats().window_calls == 0
+
+    def test_残り時間が0ならタイムアウト0で送信せずにタイムアウトとすること(self) -> None:
+        """request_timeout が0以下のタイムアウトを返さずにタイムアウトエラーとすることを確認"""
+        with pytest.raises(
+            ExternalServiceDeadlineExceededError, match="Deadline exceeded"
+        ) as exc_info:
+            google_maps_api.request_timeout(
+                Deadline.after(0.0), google_maps_api.PLACES_SERVICE_NAME
+            )
+
+        assert exc_info.value.service_name == "Places API"
+
+    def test_期限を過ぎたらsearchNearbyのリトライを待たずに打ち切ること(self) -> None:
+        """リトライ前の待機中に期限を過ぎた場合は再送せずにタイムアウトとすることを確認"""
+        requests: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(503, json={"error": "unavailable"})
+
+        gateway = _build_gateway(handler)
+
+        with pytest.raises(
+            ExternalServiceDeadlineExceededError, match="Deadline exceeded while waiting"
+        ) as exc_info:
+            asyncio.run(
+                gateway.search_landmarks_nearby(
+                    Coordinate(latitude=35.6812, longitude=139.7671),
+                    1000,
+                    deadline=Deadline.after(0.5),
+                )
+            )
+
+        assert exc_info.value.service_name == "Places API"
+        assert len(requests) == 1
+
+    def test_期限切れが続いてもサーキットブレーカーをオープンしないこと(self) -> None:
+        """期限で切り詰めたタイムアウトによる失敗を外部APIの障害として数えないことを確認"""
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            await asyncio.sleep(0.02)
+            raise httpx.ReadTimeout("timeout", request=request)
+
+        breaker = CircuitBreaker("Roads API", minimum_calls=1, window_size=5)
+        gateway = _build_gateway(handler, circuit_breakers={"Roads API": breaker})
+
+        for _ in range(5):
+            with pytest.raises(ExternalServiceDeadlineExceededError):
+                asyncio.run(
+                    gateway.snap_to_roads(
+                        [Coordinate(latitude=35.6812, longitude=139.7671)],
+                        deadline=Deadline.after(0.01),
+                    )
+                )
+
+        stats = breaker.get_stats()
+        assert stats.state == "closed"
+        assert stats.window_calls == 0
+
+
+class TestStats:
+    """get_statsのテスト"""
+
+    def test_ホストごとのリクエスト数が集計されること(self) -> None:
+        """統計情報にホストごとのリクエスト数が含まれることを確認"""
+        gateway = _build_gateway(lambda _: httpx.Response(200, json={}))
+        coordinate = Coordinate(latitude=35.6812, longitude=139.7671)
+
+        asyncio.run(gateway.snap_to_road(coordinate))
+        asyncio.run(gateway.snap_to_road(coordinate))
+
+        assert gateway.get_stats() == {
+            "http_pools": [
+                {
+                    "host": "roads.googleapis.com",
+                    "connections_opened": 0,
+                    "requests": 2,
+                    "connections_reused": 2,
+                }
+            ],
+            "single_flight": {"calls": 2, "shared": 0},
+        }
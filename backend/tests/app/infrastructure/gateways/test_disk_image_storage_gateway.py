@@ -0,0 +1,51 @@
+"""ディスク画像ストレージGatewayのテスト"""
+
+import asyncio
+import hashlib
+from pathlib import Path
+
+from app.infrastructure.cache import DiskImageStore
+from app.infrastructure.gateways.disk_image_storage_gateway_impl import (
+    DiskImageStorageGatewayImpl,
+)
+
+
+class TestDiskImageStorageGateway:
+    """DiskImageStorageGatewayImplのテスト"""
+
+    def test_保存した画像をコンテンツハッシュで取得できること(self, tmp_path: Path) -> None:
+        """saveがSHA-256のハッシュを返し、findで同じ画像が取得できることを確認"""
+        gateway = DiskImageStorageGatewayImpl(DiskImageStore(tmp_path, max_bytes=1024))
+
+        content_hash = asyncio.run(gateway.save(b"jpeg-bytes"))
+
+        assert content_hash == hashlib.sha256(b"jpeg-bytes").hexdigest()
+        assert asyncio.run(gateway.find(content_hash)) == b"jpeg-bytes"
+
+    def test_Gatewayが保存した画像も取得できること(self, tmp_path: Path) -> None:
+        """キー付きで保存されたStreet View画像をハッシュで取得できることを確認"""
+        store = DiskImageStore(tmp_path, max_bytes=1024)
+        gateway = DiskImageStorageGatewayImpl(store)
+
+        content_hash = store.put("street_view_image_key", b"street-view")
+
+        assert asyncio.run(gateway.find(content_hash)) == b"street-view"
+
+    def test_保存した画像はキャッシュの上限で削除されないこと(self, tmp_path: Path) -> None:
+        """Street View画像のキャッシュが上限を超えて削除した後も取得できることを確認"""
+        store = DiskImageStore(tmp_path, max_bytes=25)
+        gateway = DiskImageStorageGatewayImpl(store)
+
+        content_hash = asyncio.run(gateway.save(b"p" * 10))
+        for i in range(5):
+            store.put(f"street_view_image_key-{i}", bytes([i]) * 10)
+
+        assert store.get_stats().evicted_files >= 1
+        assert asyncio.run(gateway.find(content_hash)) == b"p" * 10
+
+    def test_保存先を共有するかどうかを返すこと(self, tmp_path: Path) -> None:
+        """指定しない場合は他のインスタンスと共有しないものとして扱うことを確認"""
+        store = DiskImageStore(tmp_path, max_bytes=1024)
+
+        assert DiskImageStorageGatewayImpl(store).shared is False
+        assert DiskImageStorageGatewayImpl(store, shared=True).shared is True
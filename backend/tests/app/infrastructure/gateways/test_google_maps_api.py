@@ -0,0 +1,62 @@
+"""google_maps_apiのテスト"""
+
+import random
+
+import pytest
+from geographiclib.geodesic import Geodesic
+
+from app.config import PLACES_API_MAX_SEARCH_RADIUS_M
+from app.domain.value_objects import Coordinate
+from app.infrastructure.gateways.google_maps_api import quantize_search_nearby_area
+
+
+class TestQuantizeSearchNearbyArea:
+    """quantize_search_nearby_areaのテスト"""
+
+    @pytest.mark.parametrize("latitude_range", [(-1.0, 1.0), (35.0, 36.0), (-70.0, -69.0)])
+    def test_量子化した検索範囲は元の検索範囲を含むこと(
+        self, latitude_range: tuple[float, float]
+    ) -> None:
+        """丸めで中心が動いた距離と元の半径の和が、量子化した半径以下であることを確認"""
+        rng = random.Random(0)  # noqa: S311 (再現性のためのシード付き乱数なので問題なし)
+        for _ in range(500):
+            coordinate = Coordinate(
+                latitude=rng.uniform(*latitude_range), longitude=rng.uniform(-180.0, 180.0)
+            )
+            radius = rng.randint(1, 5000)
+
+            center, quantized_radius = quantize_search_nearby_area(coordinate, radius)
+
+            offset = Geodesic.WGS84.Inverse(
+                coordinate.latitude, coordinate.longitude, center.latitude, center.longitude
+            )["s12"]
+            assert offset + radius <= quantized_radius
+
+    def test_セルの角の座標でも検索範囲を含むこと(self) -> None:
+        """中心が最も大きく動くセルの角でも、元の検索範囲を含むことを確認"""
+        coordinate = Coordinate(latitude=0.00049999, longitude=0.00049999)
+
+        center, quantized_radius = quantize_search_nearby_area(coordinate, 100)
+
+        offset = Geodesic.WGS84.Inverse(
+            coordinate.latitude, coordinate.longitude, center.latitude, center.longitude
+        )["s12"]
+        assert offset > 78
+        assert offset + 100 <= quantized_radius
+
+    def test_同じセルと半径バケットの検索は同じ範囲になること(self) -> None:
+        """セル内の位置によらず、量子化した検索範囲が一致することを確認"""
+        first = quantize_search_nearby_area(Coordinate(latitude=35.68121, longitude=139.76712), 310)
+        second = quantize_search_nearby_area(
+            Coordinate(latitude=35.68149, longitude=139.76681), 320
+        )
+
+        assert first == second
+
+    def test_量子化した半径はAPIの最大検索半径を超えないこと(self) -> None:
+        """最大検索半径付近の半径は最大検索半径に切り詰めることを確認"""
+        _, quantized_radius = quantize_search_nearby_area(
+            Coordinate(latitude=35.6812, longitude=139.7671), PLACES_API_MAX_SEARCH_RADIUS_M
+        )
+
+        assert quantized_radius == PLACES_API_MAX_SEARCH_RADIUS_M
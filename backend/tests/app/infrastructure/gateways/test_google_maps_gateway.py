@@ -3,12 +3,14 @@
 from unittest.mock import MagicMock, patch
 
 import pytest
-from requests.exceptions import HTTPError
+from requests.exceptions import HTTPError, Timeout
 
 from app.config import PLACES_API_MAX_SEARCH_RADIUS_M
-from app.domain.exceptions import ExternalServiceError
+from app.domain.exceptions import ExternalServiceError, ExternalServiceTimeoutError
 from app.domain.value_objects import Coordinate, ImageSize, Landmark
 from app.infrastructure.gateways.google_maps_gateway_impl import GoogleMapsGatewayImpl
+from app.infrastructure.http import HttpPoolStats
+from app.infrastructure.resilience import CircuitBreaker
 
 # Nearby Search (新版) の FieldMask で Pro 以外の SKU を誘発するトークン
 # https://developers.google.com/maps/documentation/places/web-service/nearby-search
@@ -85,7 +87,9 @@ class TestGetDirections:
             ],
         }
 
-        with patch("app.infrastructure.gateways.google_maps_gateway_impl.requests.get") as mock_get:
+        with patch(
+            "app.infrastructure.http.pooled_http_transport.PooledHttpTransport.get"
+        ) as mock_get:
             mock_response = MagicMock()
             mock_response.json.return_value = mock_response_data
             mock_response.raise_for_status = MagicMock()
@@ -118,7 +122,9 @@ class TestGetDirections:
             ],
         }
 
-        with patch("app.infrastructure.gateways.google_maps_gateway_impl.requests.get") as mock_get:
+        with patch(
+            "app.infrastructure.http.pooled_http_transport.PooledHttpTransport.get"
+        ) as mock_get:
             mock_response = MagicMock()
             mock_response.json.return_value = mock_response_data
             mock_response.raise_for_status = MagicMock()
@@ -150,7 +156,9 @@ class TestGetDirections:
             ],
         }
 
-        with patch("app.infrastructure.gateways.google_maps_gateway_impl.requests.get") as mock_get:
+        with patch(
+            "app.infrastructure.http.pooled_http_transport.PooledHttpTransport.get"
+        ) as mock_get:
             mock_response = MagicMock()
             mock_response.json.return_value = mock_response_data
             mock_response.raise_for_status = MagicMock()
@@ -182,7 +190,9 @@ class TestGetDirections:
             ],
         }
 
-        with patch("app.infrastructure.gateways.google_maps_gateway_impl.requests.get") as mock_get:
+        with patch(
+            "app.infrastructure.http.pooled_http_transport.PooledHttpTransport.get"
+        ) as mock_get:
             mock_response = MagicMock()
             mock_response.json.return_value = mock_response_data
             mock_response.raise_for_status = MagicMock()
@@ -215,7 +225,9 @@ class TestGetDirections:
             ],
         }
 
-        with patch("app.infrastructure.gateways.google_maps_gateway_impl.requests.get") as mock_get:
+        with patch(
+            "app.infrastructure.http.pooled_http_transport.PooledHttpTransport.get"
+        ) as mock_get:
             mock_response = MagicMock()
             mock_response.json.return_value = mock_response_data
             mock_response.raise_for_status = MagicMock()
@@ -246,7 +258,9 @@ class TestGetDirections:
             ],
         }
 
-        with patch("app.infrastructure.gateways.google_maps_gateway_impl.requests.get") as mock_get:
+        with patch(
+            "app.infrastructure.http.pooled_http_transport.PooledHttpTransport.get"
+        ) as mock_get:
             mock_response = MagicMock()
             mock_response.json.return_value = mock_response_data
             mock_response.raise_for_status = MagicMock()
@@ -277,7 +291,9 @@ class TestGetDirections:
             ],
         }
 
-        with patch("app.infrastructure.gateways.google_maps_gateway_impl.requests.get") as mock_get:
+        with patch(
+            "app.infrastructure.http.pooled_http_transport.PooledHttpTransport.get"
+        ) as mock_get:
             mock_response = MagicMock()
             mock_response.json.return_value = mock_response_data
             mock_response.raise_for_status = MagicMock()
@@ -309,7 +325,9 @@ class TestGetDirections:
             ],
         }
 
-        with patch("app.infrastructure.gateways.google_maps_gateway_impl.requests.get") as mock_get:
+        with patch(
+            "app.infrastructure.http.pooled_http_transport.PooledHttpTransport.get"
+        ) as mock_get:
             mock_response = MagicMock()
             mock_response.json.return_value = mock_response_data
             mock_response.raise_for_status = MagicMock()
@@ -337,7 +355,9 @@ class TestGetStreetViewMetadata:
             "location": {"lat": 35.6812, "lng": 139.7671},
         }
 
-        with patch("app.infrastructure.gateways.google_maps_gateway_impl.requests.get") as mock_get:
+        with patch(
+            "app.infrastructure.http.pooled_http_transport.PooledHttpTransport.get"
+        ) as mock_get:
             mock_response = MagicMock()
             mock_response.json.return_value = mock_response_data
             mock_response.raise_for_status = MagicMock()
@@ -362,7 +382,9 @@ class TestGetStreetViewMetadata:
             "location": {"lat": 35.6812, "lng": 139.7671},
         }
 
-        with patch("app.infrastructure.gateways.google_maps_gateway_impl.requests.get") as mock_get:
+        with patch(
+            "app.infrastructure.http.pooled_http_transport.PooledHttpTransport.get"
+        ) as mock_get:
             mock_response = MagicMock()
             mock_response.json.return_value = mock_response_data
             mock_response.raise_for_status = MagicMock()
@@ -387,7 +409,9 @@ class TestGetStreetViewMetadata:
             "location": {"lat": 35.6812, "lng": 139.7671},
         }
 
-        with patch("app.infrastructure.gateways.google_maps_gateway_impl.requests.get") as mock_get:
+        with patch(
+            "app.infrastructure.http.pooled_http_transport.PooledHttpTransport.get"
+        ) as mock_get:
             mock_response = MagicMock()
             mock_response.json.return_value = mock_response_data
             mock_response.raise_for_status = MagicMock()
@@ -412,7 +436,9 @@ class TestGetStreetViewMetadata:
             "location": {"lat": 35.6812, "lng": 139.7671},
         }
 
-        with patch("app.infrastructure.gateways.google_maps_gateway_impl.requests.get") as mock_get:
+        with patch(
+            "app.infrastructure.http.pooled_http_transport.PooledHttpTransport.get"
+        ) as mock_get:
             mock_response = MagicMock()
             mock_response.json.return_value = mock_response_data
             mock_response.raise_for_status = MagicMock()
@@ -438,7 +464,9 @@ class TestGetStreetViewImage:
 
         mock_image_data = b"fake_image_data"
 
-        with patch("app.infrastructure.gateways.google_maps_gateway_impl.requests.get") as mock_get:
+        with patch(
+            "app.infrastructure.http.pooled_http_transport.PooledHttpTransport.get"
+        ) as mock_get:
             mock_response = MagicMock()
             mock_response.content = mock_image_data
             mock_response.raise_for_status = MagicMock()
@@ -461,7 +489,9 @@ class TestGetStreetViewImage:
 
         mock_image_data = b"fake_image_data"
 
-        with patch("app.infrastructure.gateways.google_maps_gateway_impl.requests.get") as mock_get:
+        with patch(
+            "app.infrastructure.http.pooled_http_transport.PooledHttpTransport.get"
+        ) as mock_get:
             mock_response = MagicMock()
             mock_response.content = mock_image_data
             mock_response.raise_for_status = MagicMock()
@@ -484,7 +514,9 @@ class TestGetStreetViewImage:
 
         mock_image_data = b"fake_image_data"
 
-        with patch("app.infrastructure.gateways.google_maps_gateway_impl.requests.get") as mock_get:
+        with patch(
+            "app.infrastructure.http.pooled_http_transport.PooledHttpTransport.get"
+        ) as mock_get:
             mock_response = MagicMock()
             mock_response.content = mock_image_data
             mock_response.raise_for_status = MagicMock()
@@ -506,7 +538,9 @@ class TestGetStreetViewImage:
 
         mock_image_data = b"fake_image_data"
 
-        with patch("app.infrastructure.gateways.google_maps_gateway_impl.requests.get") as mock_get:
+        with patch(
+            "app.infrastructure.http.pooled_http_transport.PooledHttpTransport.get"
+        ) as mock_get:
             mock_response = MagicMock()
             mock_response.content = mock_image_data
             mock_response.raise_for_status = MagicMock()
@@ -529,7 +563,9 @@ class TestGetStreetViewImage:
 
         mock_image_data = b"fake_image_data"
 
-        with patch("app.infrastructure.gateways.google_maps_gateway_impl.requests.get") as mock_get:
+        with patch(
+            "app.infrastructure.http.pooled_http_transport.PooledHttpTransport.get"
+        ) as mock_get:
             mock_response = MagicMock()
             mock_response.content = mock_image_data
             mock_response.raise_for_status = MagicMock()
@@ -552,7 +588,9 @@ class TestGetStreetViewImage:
 
         mock_image_data = b"fake_image_data"
 
-        with patch("app.infrastructure.gateways.google_maps_gateway_impl.requests.get") as mock_get:
+        with patch(
+            "app.infrastructure.http.pooled_http_transport.PooledHttpTransport.get"
+        ) as mock_get:
             mock_response = MagicMock()
             mock_response.content = mock_image_data
             mock_response.raise_for_status = MagicMock()
@@ -574,7 +612,9 @@ class TestGetStreetViewImage:
 
         mock_image_data = b"fake_image_data"
 
-        with patch("app.infrastructure.gateways.google_maps_gateway_impl.requests.get") as mock_get:
+        with patch(
+            "app.infrastructure.http.pooled_http_transport.PooledHttpTransport.get"
+        ) as mock_get:
             mock_response = MagicMock()
             mock_response.content = mock_image_data
             mock_response.raise_for_status = MagicMock()
@@ -597,7 +637,9 @@ class TestGetStreetViewImage:
 
         mock_image_data = b"fake_image_data"
 
-        with patch("app.infrastructure.gateways.google_maps_gateway_impl.requests.get") as mock_get:
+        with patch(
+            "app.infrastructure.http.pooled_http_transport.PooledHttpTransport.get"
+        ) as mock_get:
             mock_response = MagicMock()
             mock_response.content = mock_image_data
             mock_response.raise_for_status = MagicMock()
@@ -622,7 +664,9 @@ class TestGetStreetViewImage:
 
         mock_image_data = b"fake_image_data"
 
-        with patch("app.infrastructure.gateways.google_maps_gateway_impl.requests.get") as mock_get:
+        with patch(
+            "app.infrastructure.http.pooled_http_transport.PooledHttpTransport.get"
+        ) as mock_get:
             mock_response = MagicMock()
             mock_response.content = mock_image_data
             mock_response.raise_for_status = MagicMock()
@@ -646,7 +690,9 @@ class TestGetStreetViewImage:
 
         mock_image_data = b"fake_image_data"
 
-        with patch("app.infrastructure.gateways.google_maps_gateway_impl.requests.get") as mock_get:
+        with patch(
+            "app.infrastructure.http.pooled_http_transport.PooledHttpTransport.get"
+        ) as mock_get:
             mock_response = MagicMock()
             mock_response.content = mock_image_data
             mock_response.raise_for_status = MagicMock()
@@ -679,7 +725,9 @@ class TestSnapToRoad:
             ]
         }
 
-        with patch("app.infrastructure.gateways.google_maps_gateway_impl.requests.get") as mock_get:
+        with patch(
+            "app.infrastructure.http.pooled_http_transport.PooledHttpTransport.get"
+        ) as mock_get:
             mock_response = MagicMock()
             mock_response.json.return_value = mock_response_data
             mock_response.raise_for_status = MagicMock()
@@ -698,7 +746,9 @@ class TestSnapToRoad:
 
         mock_response_data = {"snappedPoints": []}
 
-        with patch("app.infrastructure.gateways.google_maps_gateway_impl.requests.get") as mock_get:
+        with patch(
+            "app.infrastructure.http.pooled_http_transport.PooledHttpTransport.get"
+        ) as mock_get:
             mock_response = MagicMock()
             mock_response.json.return_value = mock_response_data
             mock_response.raise_for_status = MagicMock()
@@ -723,7 +773,9 @@ class TestSnapToRoad:
             ]
         }
 
-        with patch("app.infrastructure.gateways.google_maps_gateway_impl.requests.get") as mock_get:
+        with patch(
+            "app.infrastructure.http.pooled_http_transport.PooledHttpTransport.get"
+        ) as mock_get:
             mock_response = MagicMock()
             mock_response.json.return_value = mock_response_data
             mock_response.raise_for_status = MagicMock()
@@ -753,7 +805,9 @@ class TestSnapToRoad:
             ]
         }
 
-        with patch("app.infrastructure.gateways.google_maps_gateway_impl.requests.get") as mock_get:
+        with patch(
+            "app.infrastructure.http.pooled_http_transport.PooledHttpTransport.get"
+        ) as mock_get:
             mock_response = MagicMock()
             mock_response.json.return_value = mock_response_data
             mock_response.raise_for_status = MagicMock()
@@ -773,7 +827,9 @@ class TestSnapToRoad:
         """Timeoutエラー時にExternalServiceTimeoutErrorを発生させることを確認"""
         coordinate = Coordinate(latitude=35.6812, longitude=139.7671)
 
-        with patch("app.infrastructure.gateways.google_maps_gateway_impl.requests.get") as mock_get:
+        with patch(
+            "app.infrastructure.http.pooled_http_transport.PooledHttpTransport.get"
+        ) as mock_get:
             from requests.exceptions import Timeout
 
             mock_get.side_effect = Timeout("Request timeout")
@@ -793,7 +849,9 @@ class TestSnapToRoad:
         """RequestException時にExternalServiceErrorを発生させることを確認"""
         coordinate = Coordinate(latitude=35.6812, longitude=139.7671)
 
-        with patch("app.infrastructure.gateways.google_maps_gateway_impl.requests.get") as mock_get:
+        with patch(
+            "app.infrastructure.http.pooled_http_transport.PooledHttpTransport.get"
+        ) as mock_get:
             from requests.exceptions import RequestException
 
             mock_get.side_effect = RequestException("Request failed")
@@ -819,7 +877,7 @@ class TestSearchLandmarksNearby:
         mock_response_data = {"places": []}
 
         with patch(
-            "app.infrastructure.gateways.google_maps_gateway_impl.requests.post"
+            "app.infrastructure.http.pooled_http_transport.PooledHttpTransport.post"
         ) as mock_post:
             mock_response = MagicMock()
             mock_response.json.return_value = mock_response_data
@@ -845,7 +903,7 @@ class TestSearchLandmarksNearby:
         mock_response_data = {"places": []}
 
         with patch(
-            "app.infrastructure.gateways.google_maps_gateway_impl.requests.post"
+            "app.infrastructure.http.pooled_http_transport.PooledHttpTransport.post"
         ) as mock_post:
             mock_response = MagicMock()
             mock_response.json.return_value = mock_response_data
@@ -897,7 +955,7 @@ class TestSearchLandmarksNearby:
         }
 
         with patch(
-            "app.infrastructure.gateways.google_maps_gateway_impl.requests.post"
+            "app.infrastructure.http.pooled_http_transport.PooledHttpTransport.post"
         ) as mock_post:
             mock_response = MagicMock()
             mock_response.json.return_value = mock_response_data
@@ -931,7 +989,7 @@ class TestSearchLandmarksNearby:
         mock_response_data = {"places": []}
 
         with patch(
-            "app.infrastructure.gateways.google_maps_gateway_impl.requests.post"
+            "app.infrastructure.http.pooled_http_transport.PooledHttpTransport.post"
         ) as mock_post:
             mock_response = MagicMock()
             mock_response.json.return_value = mock_response_data
@@ -968,7 +1026,7 @@ class TestSearchLandmarksNearby:
         }
 
         with patch(
-            "app.infrastructure.gateways.google_maps_gateway_impl.requests.post"
+            "app.infrastructure.http.pooled_http_transport.PooledHttpTransport.post"
         ) as mock_post:
             mock_response = MagicMock()
             mock_response.json.return_value = mock_response_data
@@ -1001,7 +1059,7 @@ class TestSearchLandmarksNearby:
         }
 
         with patch(
-            "app.infrastructure.gateways.google_maps_gateway_impl.requests.post"
+            "app.infrastructure.http.pooled_http_transport.PooledHttpTransport.post"
         ) as mock_post:
             mock_response = MagicMock()
             mock_response.json.return_value = mock_response_data
@@ -1039,7 +1097,7 @@ class TestSearchLandmarksNearby:
         }
 
         with patch(
-            "app.infrastructure.gateways.google_maps_gateway_impl.requests.post"
+            "app.infrastructure.http.pooled_http_transport.PooledHttpTransport.post"
         ) as mock_post:
             mock_response = MagicMock()
             mock_response.json.return_value = mock_response_data
@@ -1075,7 +1133,7 @@ class TestSearchLandmarksNearby:
         }
 
         with patch(
-            "app.infrastructure.gateways.google_maps_gateway_impl.requests.post"
+            "app.infrastructure.http.pooled_http_transport.PooledHttpTransport.post"
         ) as mock_post:
             mock_response = MagicMock()
             mock_response.json.return_value = mock_response_data
@@ -1099,7 +1157,7 @@ class TestSearchLandmarksNearby:
         radius = 1000
 
         with patch(
-            "app.infrastructure.gateways.google_maps_gateway_impl.requests.post"
+            "app.infrastructure.http.pooled_http_transport.PooledHttpTransport.post"
         ) as mock_post:
             mock_response = MagicMock()
             mock_response.status_code = 500
@@ -1126,7 +1184,7 @@ class TestSearchLandmarksNearby:
         mock_response_data = {"error": "Invalid request"}
 
         with patch(
-            "app.infrastructure.gateways.google_maps_gateway_impl.requests.post"
+            "app.infrastructure.http.pooled_http_transport.PooledHttpTransport.post"
         ) as mock_post:
             mock_response = MagicMock()
             mock_response.json.return_value = mock_response_data
@@ -1140,3 +1198,185 @@ class TestSearchLandmarksNearby:
             # placesキーがない場合、空のリストが返される
             assert mock_post.call_count == 1
             assert len(landmarks) == 0
+
+
+class TestSnapToRoads:
+    """snap_to_roadsのテスト"""
+
+    def test_originalIndexで入力座標と対応付けること(self) -> None:
+        """順不同・重複・欠落のあるsnappedPointsを入力順の結果に変換することを確認"""
+        coordinates = [
+            Coordinate(latitude=35.6812, longitude=139.7671),
+            Coordinate(latitude=35.6895, longitude=139.6917),
+            Coordinate(latitude=35.6586, longitude=139.7454),
+        ]
+        mock_response_data = {
+            "snappedPoints": [
+                {"location": {"latitude": 35.6586, "longitude": 139.7455}, "originalIndex": 2},
+                {"location": {"latitude": 35.6813, "longitude": 139.7672}, "originalIndex": 0},
+                {"location": {"latitude": 35.6814, "longitude": 139.7673}, "originalIndex": 0},
+            ]
+        }
+
+        with patch(
+            "app.infrastructure.http.pooled_http_transport.PooledHttpTransport.get"
+        ) as mock_get:
+            mock_response = MagicMock()
+            mock_response.json.return_value = mock_response_data
+            mock_response.raise_for_status = MagicMock()
+            mock_get.return_value = mock_response
+
+            gateway = GoogleMapsGatewayImpl()
+            result = gateway.snap_to_roads(coordinates)
+
+            assert result == [
+                Coordinate(latitude=35.6813, longitude=139.7672),
+                None,
+                Coordinate(latitude=35.6586, longitude=139.7455),
+            ]
+            assert mock_get.call_count == 1
+            assert mock_get.call_args.kwargs["params"]["points"] == (
+                "35.6812,139.7671|35.6895,139.6917|35.6586,139.7454"
+            )
+
+    def test_上限を超える座標は分割してリクエストすること(self) -> None:
+        """100件を超える座標は100件ずつに分割して問い合わせることを確認"""
+        coordinates = [Coordinate(latitude=35.0 + i * 0.0001, longitude=139.0) for i in range(150)]
+
+        with patch(
+            "app.infrastructure.http.pooled_http_transport.PooledHttpTransport.get"
+        ) as mock_get:
+            mock_response = MagicMock()
+            mock_response.json.return_value = {"snappedPoints": []}
+            mock_response.raise_for_status = MagicMock()
+            mock_get.return_value = mock_response
+
+            gateway = GoogleMapsGatewayImpl()
+            result = gateway.snap_to_roads(coordinates)
+
+            assert result == [None] * 150
+            assert mock_get.call_count == 2
+            chunk_sizes = [
+                len(call.kwargs["params"]["points"].split("|")) for call in mock_get.call_args_list
+            ]
+            assert chunk_sizes == [100, 50]
+
+    def test_空のリストではリクエストしないこと(self) -> None:
+        """座標がない場合はAPIを呼び出さずに空のリストを返すことを確認"""
+        with patch(
+            "app.infrastructure.http.pooled_http_transport.PooledHttpTransport.get"
+        ) as mock_get:
+            gateway = GoogleMapsGatewayImpl()
+
+            assert gateway.snap_to_roads([]) == []
+            mock_get.assert_not_called()
+
+    def test_タイムアウト時はタイムアウトエラーになること(self) -> None:
+        """Timeout例外をExternalServiceTimeoutErrorに変換することを確認"""
+        coordinate = Coordinate(latitude=35.6812, longitude=139.7671)
+
+        with patch(
+            "app.infrastructure.http.pooled_http_transport.PooledHttpTransport.get"
+        ) as mock_get:
+            mock_get.side_effect = Timeout()
+
+            gateway = GoogleMapsGatewayImpl()
+            with pytest.raises(ExternalServiceTimeoutError) as exc_info:
+                gateway.snap_to_roads([coordinate])
+
+            assert exc_info.value.service_name == "Roads API"
+
+
+class TestTransport:
+    """HTTPトランスポートのテスト"""
+
+    def test_注入したトランスポートでリクエストが送信されること(self) -> None:
+        """コンストラクタで渡したトランスポートを使ってAPIを呼び出すことを確認"""
+        coordinate = Coordinate(latitude=35.6812, longitude=139.7671)
+        transport = MagicMock()
+        mock_response = MagicMock()
+        mock_response.json.return_value = {"snappedPoints": []}
+        transport.get.return_value = mock_response
+
+        gateway = GoogleMapsGatewayImpl(transport=transport)
+        gateway.snap_to_road(coordinate)
+
+        transport.get.assert_called_once()
+
+    def test_複数回の呼び出しで同じトランスポートを使い回すこと(self) -> None:
+        """呼び出しごとに新しいセッションを作らず、同じトランスポートを共有することを確認"""
+        coordinate = Coordinate(latitude=35.6812, longitude=139.7671)
+        transport = MagicMock()
+        mock_response = MagicMock()
+        mock_response.json.return_value = {"snappedPoints": []}
+        transport.get.return_value = mock_response
+
+        gateway = GoogleMapsGatewayImpl(transport=transport)
+        gateway.snap_to_road(coordinate)
+        gateway.get_street_view_metadata(coordinate)
+
+        assert transport.get.call_count == 2
+
+    def test_統計情報にコネクションプールの利用状況が含まれること(self) -> None:
+        """get_statsでホストごとの新規接続数と再利用数を取得できることを確認"""
+        transport = MagicMock()
+        transport.get_stats.return_value = [
+            HttpPoolStats(host="roads.googleapis.com", connections_opened=1, requests=3)
+        ]
+
+        gateway = GoogleMapsGatewayImpl(transport=transport)
+
+        assert gateway.get_stats() == {
+            "http_pools": [
+                {
+                    "host": "roads.googleapis.com",
+                    "connections_opened": 1,
+                    "requests": 3,
+                    "connections_reused": 2,
+                }
+            ],
+            "single_flight": {"calls": 0, "shared": 0},
+        }
+
+
+class TestCircuitBreaker:
+    """サーキットブレーカーのテスト"""
+
+    def test_失敗が続いたサービスは呼び出さずに即時失敗すること(self) -> None:
+        """Roads APIのタイムアウトでブレーカーが開き、以降はリクエストしないことを確認"""
+        coordinate = Coordinate(latitude=35.6812, longitude=139.7671)
+        transport = MagicMock()
+        transport.get.side_effect = Timeout()
+        breaker = CircuitBreaker("Roads API", minimum_calls=2, window_size=2)
+        gateway = GoogleMapsGatewayImpl(
+            transport=transport, circuit_breakers={"Roads API": breaker}
+        )
+
+        for _ in range(2):
+            with pytest.raises(ExternalServiceTimeoutError):
+                gateway.snap_to_road(coordinate)
+        with pytest.raises(ExternalServiceError, match="Circuit breaker is open"):
+            gateway.snap_to_road(coordinate)
+
+        assert transport.get.call_count == 2
+        assert gateway.get_stats()["circuit_breakers"]["Roads API"]["state"] == "open"
+
+    def test_ブレーカーは外部サービスごとに独立していること(self) -> None:
+        """Roads APIのブレーカーが開いてもStreet View APIは呼び出せることを確認"""
+        coordinate = Coordinate(latitude=35.6812, longitude=139.7671)
+        transport = MagicMock()
+        transport.get.side_effect = Timeout()
+        gateway = GoogleMapsGatewayImpl(
+            transport=transport,
+            circuit_breakers={
+                "Roads API": CircuitBreaker("Roads API", minimum_calls=1, window_size=1),
+                "Street View Metadata API": CircuitBreaker("Street View Metadata API"),
+            },
+        )
+        with pytest.raises(ExternalServiceTimeoutError):
+            gateway.snap_to_road(coordinate)
+
+        with pytest.raises(ExternalServiceTimeoutError):
+            gateway.get_street_view_metadata(coordinate)
+
+        assert transport.get.call_count == 2
@@ -0,0 +1,125 @@
+"""インメモリのランドマークカタログGatewayのテスト"""
+
+import asyncio
+import random
+
+import pytest
+
+from app.domain.services.coordinate_service import calculate_distance
+from app.domain.value_objects import Coordinate, Landmark
+from app.infrastructure.gateways.in_memory_landmark_catalog_gateway_impl import (
+    InMemoryLandmarkCatalogGatewayImpl,
+)
+
+CENTER = Coordinate(latitude=35.6812, longitude=139.7671)
+
+
+class FakeClock:
+    """テスト用に手動で進める時計"""
+
+    def __init__(self) -> None:
+        """初期化"""
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        """現在時刻を返す"""
+        return self.now
+
+
+def _landmark(place_id: str, latitude: float, longitude: float) -> Landmark:
+    """指定した座標のランドマークを生成する"""
+    return Landmark(
+        place_id=place_id,
+        display_name=place_id,
+        coordinate=Coordinate(latitude=latitude, longitude=longitude),
+    )
+
+
+def _place_ids(landmarks: list[Landmark]) -> set[str]:
+    """ランドマークのPlace IDの集合を取得する"""
+    return {landmark.place_id for landmark in landmarks}
+
+
+class TestInMemoryLandmarkCatalogGateway:
+    """InMemoryLandmarkCatalogGatewayImplのテスト"""
+
+    def test_距離の範囲内のランドマークをすべて返すこと(self) -> None:
+        """セルの境界をまたぐ範囲でも、全件を距離で絞り込んだ結果と一致することを確認"""
+        rng = random.Random(0)  # noqa: S311 (再現性のためのシード付き乱数なので問題なし)
+        landmarks = [
+            _landmark(
+                f"place-{i}",
+                CENTER.latitude + rng.uniform(-0.03, 0.03),
+                CENTER.longitude + rng.uniform(-0.03, 0.03),
+            )
+            for i in range(500)
+        ]
+        catalog = InMemoryLandmarkCatalogGatewayImpl(cell_size_deg=0.005)
+        asyncio.run(catalog.add(landmarks))
+
+        found = asyncio.run(catalog.find_within(CENTER, 850, 1150))
+
+        expected = {
+            landmark.place_id
+            for landmark in landmarks
+            if 850 <= calculate_distance(CENTER, landmark.coordinate) <= 1150
+        }
+        assert expected
+        assert _place_ids(found) == expected
+        assert len(found) == len(expected)
+
+    def test_日付変更線をまたいで検索できること(self) -> None:
+        """経度180度付近では反対側の経度のランドマークも検索できることを確認"""
+        catalog = InMemoryLandmarkCatalogGatewayImpl()
+        asyncio.run(
+            catalog.add([_landmark("east", 0.0, 179.995), _landmark("west", 0.0, -179.995)])
+        )
+
+        found = asyncio.run(catalog.find_within(Coordinate(latitude=0.0, longitude=180.0), 0, 1000))
+
+        assert _place_ids(found) == {"east", "west"}
+
+    def test_同じPlace_IDのランドマークは上書きすること(self) -> None:
+        """再取得したランドマークは最新の座標で索引し直すことを確認"""
+        catalog = InMemoryLandmarkCatalogGatewayImpl()
+        asyncio.run(catalog.add([_landmark("moved", 35.6902, 139.7671)]))
+        asyncio.run(catalog.add([_landmark("moved", 35.7000, 139.7671)]))
+
+        assert asyncio.run(catalog.find_within(CENTER, 850, 1150)) == []
+        assert len(catalog) == 1
+
+    def test_再取得されないランドマークは期限切れで削除すること(self) -> None:
+        """ttl_seconds の間に再取得されたランドマークだけが残ることを確認"""
+        clock = FakeClock()
+        catalog = InMemoryLandmarkCatalogGatewayImpl(ttl_seconds=60, clock=clock)
+        asyncio.run(
+            catalog.add(
+                [_landmark("stale", 35.6902, 139.7671), _landmark("kept", 35.6902, 139.7672)]
+            )
+        )
+
+        clock.now = 30
+        asyncio.run(catalog.add([_landmark("kept", 35.6902, 139.7672)]))
+        clock.now = 60
+
+        assert _place_ids(asyncio.run(catalog.find_within(CENTER, 850, 1150))) == {"kept"}
+        assert len(catalog) == 1
+
+    def test_上限を超えた場合は古い順に削除すること(self) -> None:
+        """max_entries を超えた分は最後に取得した時刻が古いランドマークから削除することを確認"""
+        catalog = InMemoryLandmarkCatalogGatewayImpl(max_entries=2)
+        asyncio.run(catalog.add([_landmark("first", 35.6902, 139.7671)]))
+        asyncio.run(catalog.add([_landmark("second", 35.6902, 139.7672)]))
+        asyncio.run(catalog.add([_landmark("first", 35.6902, 139.7671)]))
+        asyncio.run(catalog.add([_landmark("third", 35.6902, 139.7673)]))
+
+        assert _place_ids(asyncio.run(catalog.find_within(CENTER, 850, 1150))) == {
+            "first",
+            "third",
+        }
+
+    @pytest.mark.parametrize("cell_size_deg", [0.0, 91.0])
+    def test_不正なセルの大きさはエラーになること(self, cell_size_deg: float) -> None:
+        """cell_size_deg が範囲外の場合にValueErrorとなることを確認"""
+        with pytest.raises(ValueError, match="cell_size_deg"):
+            InMemoryLandmarkCatalogGatewayImpl(cell_size_deg=cell_size_deg)
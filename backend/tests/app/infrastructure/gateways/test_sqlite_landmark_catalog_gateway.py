@@ -0,0 +1,160 @@
+"""SQLiteのランドマークカタログGatewayのテスト"""
+
+import asyncio
+import random
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from app.domain.services.coordinate_service import calculate_distance
+from app.domain.value_objects import Coordinate, Landmark
+from app.infrastructure.gateways.sqlite_landmark_catalog_gateway_impl import (
+    SqliteLandmarkCatalogGatewayImpl,
+)
+
+CENTER = Coordinate(latitude=35.6812, longitude=139.7671)
+
+
+class FakeClock:
+    """テスト用に手動で進める時計"""
+
+    def __init__(self) -> None:
+        """初期化"""
+        self.now = 1_700_000_000.0
+
+    def __call__(self) -> float:
+        """現在時刻を返す"""
+        return self.now
+
+
+def _landmark(place_id: str, latitude: float, longitude: float) -> Landmark:
+    """指定した座標のランドマークを生成する"""
+    return Landmark(
+        place_id=place_id,
+        display_name=place_id,
+        coordinate=Coordinate(latitude=latitude, longitude=longitude),
+    )
+
+
+def _place_ids(landmarks: list[Landmark]) -> set[str]:
+    """ランドマークのPlace IDの集合を取得する"""
+    return {landmark.place_id for landmark in landmarks}
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    """テスト用の時計"""
+    return FakeClock()
+
+
+@pytest.fixture
+def catalog(tmp_path: Path, clock: FakeClock) -> Iterator[SqliteLandmarkCatalogGatewayImpl]:
+    """一時ディレクトリに保存するカタログ"""
+    catalog = SqliteLandmarkCatalogGatewayImpl(
+        tmp_path / "catalog.sqlite3", ttl_seconds=60, clock=clock
+    )
+    yield catalog
+    catalog.close()
+
+
+class TestSqliteLandmarkCatalogGateway:
+    """SqliteLandmarkCatalogGatewayImplのテスト"""
+
+    def test_距離の範囲内のランドマークをすべて返すこと(
+        self, catalog: SqliteLandmarkCatalogGatewayImpl
+    ) -> None:
+        """R*Treeで絞り込んだ結果が、全件を距離で絞り込んだ結果と一致することを確認"""
+        rng = random.Random(0)  # noqa: S311 (再現性のためのシード付き乱数なので問題なし)
+        landmarks = [
+            _landmark(
+                f"place-{i}",
+                CENTER.latitude + rng.uniform(-0.03, 0.03),
+                CENTER.longitude + rng.uniform(-0.03, 0.03),
+            )
+            for i in range(500)
+        ]
+        asyncio.run(catalog.add(landmarks))
+
+        found = asyncio.run(catalog.find_within(CENTER, 850, 1150))
+
+        expected = {
+            landmark.place_id
+            for landmark in landmarks
+            if 850 <= calculate_distance(CENTER, landmark.coordinate) <= 1150
+        }
+        assert expected
+        assert _place_ids(found) == expected
+        assert len(found) == len(expected)
+
+    def test_ランドマークのすべての項目を保存すること(
+        self, catalog: SqliteLandmarkCatalogGatewayImpl
+    ) -> None:
+        """タイプを含めて保存したランドマークと同じ値を返すことを確認"""
+        landmark = Landmark(
+            place_id="ChIJ_park",
+            display_name="公園",
+            coordinate=Coordinate(latitude=35.6902, longitude=139.7671),
+            primary_type="park",
+            types=["park", "point_of_interest"],
+        )
+        asyncio.run(catalog.add([landmark, _landmark("no-types", 35.6902, 139.7672)]))
+
+        found = asyncio.run(catalog.find_within(CENTER, 850, 1150))
+
+        assert found == [landmark, _landmark("no-types", 35.6902, 139.7672)]
+
+    def test_日付変更線をまたいで検索できること(
+        self, catalog: SqliteLandmarkCatalogGatewayImpl
+    ) -> None:
+        """経度180度付近では反対側の経度のランドマークも検索できることを確認"""
+        asyncio.run(
+            catalog.add([_landmark("east", 0.0, 179.995), _landmark("west", 0.0, -179.995)])
+        )
+
+        found = asyncio.run(catalog.find_within(Coordinate(latitude=0.0, longitude=180.0), 0, 1000))
+
+        assert _place_ids(found) == {"east", "west"}
+
+    def test_同じPlace_IDのランドマークは上書きすること(
+        self, catalog: SqliteLandmarkCatalogGatewayImpl
+    ) -> None:
+        """再取得したランドマークは最新の座標で索引し直すことを確認"""
+        asyncio.run(catalog.add([_landmark("moved", 35.6902, 139.7671)]))
+        asyncio.run(catalog.add([_landmark("moved", 35.7000, 139.7671)]))
+
+        assert asyncio.run(catalog.find_within(CENTER, 850, 1150)) == []
+        assert _place_ids(asyncio.run(catalog.find_within(CENTER, 2000, 2300))) == {"moved"}
+
+    def test_最後に取得してから期限を過ぎたランドマークは返さないこと(
+        self, catalog: SqliteLandmarkCatalogGatewayImpl, clock: FakeClock
+    ) -> None:
+        """ttl_seconds の間に再取得されたランドマークだけを返すことを確認"""
+        asyncio.run(
+            catalog.add(
+                [_landmark("stale", 35.6902, 139.7671), _landmark("kept", 35.6902, 139.7672)]
+            )
+        )
+
+        clock.now += 30
+        asyncio.run(catalog.add([_landmark("kept", 35.6902, 139.7672)]))
+        clock.now += 30
+
+        assert _place_ids(asyncio.run(catalog.find_within(CENTER, 850, 1150))) == {"kept"}
+
+    def test_再起動後や他のプロセスからも蓄積したランドマークを検索できること(
+        self, tmp_path: Path, clock: FakeClock
+    ) -> None:
+        """同じファイルを開いた別のインスタンスから検索できることを確認"""
+        path = tmp_path / "shared" / "catalog.sqlite3"
+        writer = SqliteLandmarkCatalogGatewayImpl(path, clock=clock)
+        reader = SqliteLandmarkCatalogGatewayImpl(path, clock=clock)
+        try:
+            asyncio.run(writer.add([_landmark("shared", 35.6902, 139.7671)]))
+
+            found = asyncio.run(reader.find_within(CENTER, 850, 1150))
+        finally:
+            writer.close()
+            reader.close()
+
+        assert _place_ids(found) == {"shared"}
@@ -0,0 +1 @@
+"""HTTPトランスポートテスト"""
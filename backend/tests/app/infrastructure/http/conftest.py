@@ -0,0 +1,38 @@
+"""HTTPトランスポートテストの共通フィクスチャ"""
+
+import threading
+from collections.abc import Iterator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+
+class _KeepAliveHandler(BaseHTTPRequestHandler):
+    """keep-aliveで空のJSONを返すテスト用ハンドラ"""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self) -> None:
+        """GETリクエストに応答する"""
+        body = b"{}"
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: object) -> None:
+        """テスト出力を汚さないようにログを抑制する"""
+
+
+@pytest.fixture
+def server_url() -> Iterator[str]:
+    """ローカルのkeep-alive対応HTTPサーバーを起動する"""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _KeepAliveHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_port}/"
+    finally:
+        server.shutdown()
+        server.server_close()
@@ -0,0 +1,48 @@
+"""AsyncPooledHttpTransportのテスト"""
+
+import asyncio
+
+from app.infrastructure.http import AsyncPooledHttpTransport
+
+
+class TestAsyncPooledHttpTransport:
+    """AsyncPooledHttpTransportのテスト"""
+
+    def test_同一ホストへの連続リクエストでコネクションが再利用されること(
+        self, server_url: str
+    ) -> None:
+        """keep-aliveにより2回目以降のリクエストで新規接続が発生しないことを確認"""
+
+        async def run() -> AsyncPooledHttpTransport:
+            transport = AsyncPooledHttpTransport()
+            for _ in range(5):
+                response = await transport.get(server_url, timeout=5)
+                assert response.status_code == 200
+            await transport.aclose()
+            return transport
+
+        transport = asyncio.run(run())
+
+        stats = transport.get_stats()
+        assert len(stats) == 1
+        assert stats[0].host == "127.0.0.1"
+        assert stats[0].connections_opened == 1
+        assert stats[0].requests == 5
+        assert stats[0].connections_reused == 4
+
+    def test_並行リクエストでもホストごとに統計が集計されること(self, server_url: str) -> None:
+        """同時に発行したリクエストがすべて計上され、接続数がリクエスト数以下になることを確認"""
+
+        async def run() -> AsyncPooledHttpTransport:
+            transport = AsyncPooledHttpTransport()
+            await asyncio.gather(*(transport.get(server_url, timeout=5) for _ in range(10)))
+            await asyncio.gather(*(transport.get(server_url, timeout=5) for _ in range(10)))
+            await transport.aclose()
+            return transport
+
+        transport = asyncio.run(run())
+
+        stats = transport.get_stats()
+        assert stats[0].requests == 20
+        assert stats[0].connections_opened <= 10
+        assert stats[0].connections_reused >= 10
@@ -0,0 +1,70 @@
+"""PooledHttpTransportのテスト"""
+
+import threading
+
+from app.infrastructure.http import HttpPoolStats, PooledHttpTransport
+
+
+class TestPooledHttpTransport:
+    """PooledHttpTransportのテスト"""
+
+    def test_同一ホストへの連続リクエストでコネクションが再利用されること(
+        self, server_url: str
+    ) -> None:
+        """keep-aliveにより2回目以降のリクエストで新規接続が発生しないことを確認"""
+        transport = PooledHttpTransport()
+
+        for _ in range(5):
+            response = transport.get(server_url, timeout=5)
+            assert response.status_code == 200
+
+        stats = transport.get_stats()
+        assert len(stats) == 1
+        assert stats[0].host == "127.0.0.1"
+        assert stats[0].connections_opened == 1
+        assert stats[0].requests == 5
+        assert stats[0].connections_reused == 4
+        transport.close()
+
+    def test_複数スレッドから共有してもプールサイズを超えて接続しないこと(
+        self, server_url: str
+    ) -> None:
+        """スレッド間で共有したときに、接続数がプール上限以内に収まることを確認"""
+        transport = PooledHttpTransport(pool_maxsize=2)
+        errors: list[Exception] = []
+
+        def worker() -> None:
+            try:
+                for _ in range(5):
+                    transport.get(server_url, timeout=5)
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert errors == []
+        stats = transport.get_stats()
+        assert stats[0].requests == 20
+        # NOTE: 上限を超えた接続は返却時に破棄されるが、再利用は必ず発生する
+        assert stats[0].connections_reused > 0
+        transport.close()
+
+    def test_リクエスト前は統計が空であること(self) -> None:
+        """まだ接続していない場合は空の統計を返すことを確認"""
+        transport = PooledHttpTransport()
+
+        assert transport.get_stats() == []
+
+
+class TestHttpPoolStats:
+    """HttpPoolStatsのテスト"""
+
+    def test_再利用回数はリクエスト数から新規接続数を引いた値になること(self) -> None:
+        """connections_reusedの計算を確認"""
+        stats = HttpPoolStats(host="maps.googleapis.com", connections_opened=2, requests=10)
+
+        assert stats.connections_reused == 8
@@ -1,11 +1,17 @@
 """polyline_mapperのテスト"""
 
+from array import array
+
+import numpy as np
 import pytest
 
 from app.domain.value_objects import Coordinate
 from app.infrastructure.mappers.polyline_mapper import (
+    coordinates_from_arrays,
     decode_polyline,
+    decode_polyline_arrays,
     encode_polyline,
+    encode_polyline_arrays,
     merge_polylines,
 )
 
@@ -248,3 +254,60 @@ def test_両方空のポリラインを結合すると空文字列を返すこ
     merged = merge_polylines("", "")
 
     assert merged == ""
+
+
+# ===== 配列でのエンコード・デコードのテスト =====
+
+
+def test_配列へのデコードが座標リストへのデコードと同じ値を返すこと() -> None:
+    """decode_polyline_arrays の緯度・経度が decode_polyline の座標と一致することを確認"""
+    polyline = "_p~iF~ps|U_ulLnnqC_mqNvxq`@"
+
+    latitudes, longitudes = decode_polyline_arrays(polyline)
+
+    assert isinstance(latitudes, array)
+    assert isinstance(longitudes, array)
+    assert [
+        Coordinate(latitude=latitude, longitude=longitude)
+        for latitude, longitude in zip(latitudes, longitudes, strict=True)
+    ] == decode_polyline(polyline)
+
+
+def test_配列からのエンコードが座標リストからのエンコードと同じ文字列を返すこと() -> None:
+    """array('d') やNumPy配列を座標リストと同じポリラインにエンコードできることを確認"""
+    coordinates = [
+        Coordinate(latitude=35.6812, longitude=139.7671),
+        Coordinate(latitude=35.6896, longitude=139.6917),
+        Coordinate(latitude=-33.8688, longitude=151.2093),
+    ]
+    latitudes = [coordinate.latitude for coordinate in coordinates]
+    longitudes = [coordinate.longitude for coordinate in coordinates]
+
+    expected = encode_polyline(coordinates)
+
+    assert encode_polyline_arrays(array("d", latitudes), array("d", longitudes)) == expected
+    assert encode_polyline_arrays(np.array(latitudes), np.array(longitudes)) == expected
+
+
+def test_緯度と経度の長さが異なる配列はエンコードできないこと() -> None:
+    """緯度と経度の配列の長さが異なる場合にValueErrorとなることを確認"""
+    with pytest.raises(ValueError):
+        encode_polyline_arrays([35.6812, 35.6896], [139.7671])
+
+
+def test_範囲外の座標を含むポリラインはデコードできないこと() -> None:
+    """デコードした座標が緯度・経度の範囲外の場合にValueErrorとなることを確認"""
+    polyline = encode_polyline_arrays([35.6812, 95.0], [139.7671, 139.7671])
+
+    with pytest.raises(ValueError, match="out of range"):
+        decode_polyline_arrays(polyline)
+    with pytest.raises(ValueError, match="out of range"):
+        decode_polyline(polyline)
+
+
+def test_範囲外の座標を含む配列から座標リストを生成できないこと() -> None:
+    """バリデーションを省略する前に、配列全体の範囲を検証することを確認"""
+    with pytest.raises(ValueError, match="longitude is out of range"):
+        coordinates_from_arrays(array("d", [35.6812]), array("d", [180.5]))
+    with pytest.raises(ValueError, match="latitude is out of range"):
+        coordinates_from_arrays(np.array([-90.5]), np.array([139.7671]))
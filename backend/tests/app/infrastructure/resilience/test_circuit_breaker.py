@@ -0,0 +1,182 @@
+"""CircuitBreakerのテスト"""
+
+import asyncio
+
+import pytest
+
+from app.domain.exceptions import (
+    ExternalServiceDeadlineExceededError,
+    ExternalServiceError,
+    ExternalServiceTimeoutError,
+)
+from app.infrastructure.resilience import CircuitBreaker, CircuitBreakerStats
+
+
+class FakeClock:
+    """テスト用に手動で進める時計"""
+
+    def __init__(self) -> None:
+        """初期化"""
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        """現在時刻を返す"""
+        return self.now
+
+
+def _fail() -> None:
+    raise ExternalServiceTimeoutError("timeout", service_name="Test API")
+
+
+def _build_breaker(clock: FakeClock) -> CircuitBreaker:
+    return CircuitBreaker(
+        "Test API",
+        failure_rate_threshold=0.5,
+        minimum_calls=4,
+        window_size=4,
+        open_seconds=10.0,
+        clock=clock,
+    )
+
+
+def _open_breaker(breaker: CircuitBreaker) -> None:
+    for _ in range(4):
+        with pytest.raises(ExternalServiceTimeoutError):
+            breaker.call(_fail)
+
+
+class TestCircuitBreaker:
+    """CircuitBreakerのテスト"""
+
+    def test_失敗率が閾値未満の間はクローズのままであること(self) -> None:
+        """成功と失敗が混在しても閾値未満なら呼び出しを続けることを確認"""
+        breaker = _build_breaker(FakeClock())
+
+        for _ in range(3):
+            assert breaker.call(lambda: "ok") == "ok"
+        with pytest.raises(ExternalServiceTimeoutError):
+            breaker.call(_fail)
+
+        assert breaker.get_stats() == CircuitBreakerStats(
+            state="closed", failure_rate=0.25, window_calls=4, rejected_calls=0, opened_count=0
+        )
+
+    def test_最小呼び出し数に満たない間はオープンしないこと(self) -> None:
+        """失敗のみでも最小呼び出し数までは判定しないことを確認"""
+        breaker = _build_breaker(FakeClock())
+
+        for _ in range(3):
+            with pytest.raises(ExternalServiceTimeoutError):
+                breaker.call(_fail)
+
+        assert breaker.get_stats().state == "closed"
+
+    def test_オープン中は関数を呼ばずに即時失敗すること(self) -> None:
+        """失敗率が閾値に達した後はExternalServiceErrorを即時送出することを確認"""
+        breaker = _build_breaker(FakeClock())
+        _open_breaker(breaker)
+        calls: list[int] = []
+
+        with pytest.raises(ExternalServiceError, match="Circuit breaker is open") as exc_info:
+            breaker.call(lambda: calls.append(1))
+
+        assert exc_info.value.service_name == "Test API"
+        assert calls == []
+        stats = breaker.get_stats()
+        assert stats.state == "open"
+        assert stats.rejected_calls == 1
+        assert stats.opened_count == 1
+
+    def test_オープン期間経過後の試行が成功するとクローズすること(self) -> None:
+        """ハーフオープンで試行呼び出しが成功したら通常状態に戻ることを確認"""
+        clock = FakeClock()
+        breaker = _build_breaker(clock)
+        _open_breaker(breaker)
+
+        clock.now = 10.0
+        assert breaker.get_stats().state == "half_open"
+        assert breaker.call(lambda: "ok") == "ok"
+
+        assert breaker.get_stats() == CircuitBreakerStats(
+            state="closed", failure_rate=0.0, window_calls=0, rejected_calls=0, opened_count=1
+        )
+
+    def test_オープン期間経過後の試行が失敗すると再びオープンすること(self) -> None:
+        """ハーフオープンで試行呼び出しが失敗したらオープン期間をやり直すことを確認"""
+        clock = FakeClock()
+        breaker = _build_breaker(clock)
+        _open_breaker(breaker)
+
+        clock.now = 10.0
+        with pytest.raises(ExternalServiceTimeoutError):
+            breaker.call(_fail)
+
+        clock.now = 15.0
+        assert breaker.get_stats().state == "open"
+        assert breaker.get_stats().opened_count == 2
+
+    def test_ハーフオープン中は試行数を超える呼び出しを拒否すること(self) -> None:
+        """試行呼び出しの完了前に届いた呼び出しは即時失敗することを確認"""
+        clock = FakeClock()
+        breaker = _build_breaker(clock)
+        _open_breaker(breaker)
+        clock.now = 10.0
+
+        async def run() -> None:
+            started = asyncio.Event()
+            release = asyncio.Event()
+
+            async def probe() -> str:
+                started.set()
+                await release.wait()
+                return "ok"
+
+            probe_task = asyncio.create_task(breaker.call_async(probe))
+            await started.wait()
+            with pytest.raises(ExternalServiceError, match="Circuit breaker is open"):
+                await breaker.call_async(probe)
+            release.set()
+            assert await probe_task == "ok"
+
+        asyncio.run(run())
+
+        assert breaker.get_stats().state == "closed"
+
+    def test_キャンセルされた試行は結果として記録しないこと(self) -> None:
+        """試行呼び出しがキャンセルされた場合は次の試行を許可することを確認"""
+        clock = FakeClock()
+        breaker = _build_breaker(clock)
+        _open_breaker(breaker)
+        clock.now = 10.0
+
+        async def run() -> None:
+            task = asyncio.create_task(breaker.call_async(lambda: asyncio.sleep(10)))
+            await asyncio.sleep(0)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+        asyncio.run(run())
+
+        assert breaker.get_stats().state == "half_open"
+        assert breaker.call(lambda: "ok") == "ok"
+
+    def test_期限切れの呼び出しは失敗として記録しないこと(self) -> None:
+        """呼び出し側の期限切れが続いてもオープンせず、失敗率の算出対象にしないことを確認"""
+        breaker = _build_breaker(FakeClock())
+
+        def expire() -> None:
+            raise ExternalServiceDeadlineExceededError("deadline", service_name="Test API")
+
+        for _ in range(8):
+            with pytest.raises(ExternalServiceDeadlineExceededError):
+                breaker.call(expire)
+
+        stats = breaker.get_stats()
+        assert stats.state == "closed"
+        assert stats.window_calls == 0
+
+    def test_不正な閾値はエラーになること(self) -> None:
+        """failure_rate_thresholdが範囲外の場合はValueErrorになることを確認"""
+        with pytest.raises(ValueError):
+            CircuitBreaker("Test API", failure_rate_threshold=0.0)
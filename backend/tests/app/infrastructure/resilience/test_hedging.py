@@ -0,0 +1,196 @@
+"""HedgingPolicyのテスト"""
+
+import asyncio
+
+import pytest
+
+from app.domain.exceptions import ExternalServiceError
+from app.infrastructure.resilience import HedgingPolicy
+
+
+class FakeClock:
+    """テスト用に手動で進める時計"""
+
+    def __init__(self) -> None:
+        """初期化"""
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        """現在時刻を返す"""
+        return self.now
+
+
+async def _immediate() -> str:
+    """すぐに応答するリクエスト"""
+    return "fast"
+
+
+def _warm_up(policy: HedgingPolicy, count: int) -> None:
+    """すぐに応答するリクエストで応答時間のサンプルを貯める"""
+    for _ in range(count):
+        asyncio.run(policy.run(_immediate))
+
+
+class _SlowThenFast:
+    """最初の呼び出しだけ応答が遅いリクエスト"""
+
+    def __init__(self, first_error: Exception | None = None) -> None:
+        """初期化
+
+        Args:
+            first_error: 最初の呼び出しで遅延後に送出する例外 (Noneの場合は応答しない)
+        """
+        self.calls = 0
+        self.cancelled = 0
+        self._first_error = first_error
+
+    async def __call__(self) -> str:
+        """リクエストを実行する"""
+        self.calls += 1
+        if self.calls > 1:
+            await asyncio.sleep(0.05)
+            return "hedge"
+        try:
+            if self._first_error is not None:
+                await asyncio.sleep(0.01)
+                raise self._first_error
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        return "primary"
+
+
+class TestHedgingPolicy:
+    """HedgingPolicyのテスト"""
+
+    def test_直近の応答時間の分位点を待ち時間とすること(self) -> None:
+        """応答時間のp90を追加のリクエストまでの待ち時間として使うことを確認"""
+        clock = FakeClock()
+        policy = HedgingPolicy(percentile=0.9, window_size=10, min_samples=10, clock=clock)
+
+        latencies = [0.01 * i for i in range(1, 11)]
+
+        async def request() -> None:
+            clock.now += latencies.pop()
+
+        for _ in range(10):
+            asyncio.run(policy.run(request))
+
+        assert policy.hedge_delay_seconds() == pytest.approx(0.09)
+
+    def test_サンプルが不足している間は追加のリクエストを送信しないこと(self) -> None:
+        """min_samples に満たない場合は待ち時間がなく、1回だけ呼び出すことを確認"""
+        policy = HedgingPolicy(budget_ratio=1.0, budget_burst=1.0, min_samples=3)
+        request = _SlowThenFast()
+        _warm_up(policy, 1)
+
+        async def run() -> None:
+            await asyncio.wait_for(policy.run(request), timeout=0.2)
+
+        with pytest.raises(TimeoutError):
+            asyncio.run(run())
+
+        assert request.calls == 1
+        assert policy.get_stats().hedge_delay_seconds is None
+
+    def test_応答が遅い場合は追加のリクエストの応答を採用すること(self) -> None:
+        """分位点を過ぎたら同じリクエストを送信し、先に返った応答以外はキャンセルすることを確認"""
+        policy = HedgingPolicy(budget_ratio=1.0, budget_burst=1.0, min_samples=1)
+        request = _SlowThenFast()
+        _warm_up(policy, 1)
+
+        result = asyncio.run(policy.run(request))
+
+        assert result == "hedge"
+        assert request.calls == 2
+        assert request.cancelled == 1
+        stats = policy.get_stats()
+        assert stats.requests == 2
+        assert stats.hedged == 1
+        assert stats.hedge_wins == 1
+
+    def test_負けたリクエストのキャンセルが完了してから応答を返すこと(self) -> None:
+        """応答を返す時点で、キャンセルした最初のリクエストが終了していることを確認"""
+        policy = HedgingPolicy(budget_ratio=1.0, budget_burst=1.0, min_samples=1)
+        request = _SlowThenFast()
+        _warm_up(policy, 1)
+
+        async def run() -> int:
+            await policy.run(request)
+            # NOTE: イベントループに制御を戻す前にキャンセルが処理されていること
+            return request.cancelled
+
+        assert asyncio.run(run()) == 1
+
+    def test_すぐに応答する場合は追加のリクエストを送信しないこと(self) -> None:
+        """分位点より前に応答が返れば1回の呼び出しで済むことを確認"""
+        clock = FakeClock()
+        policy = HedgingPolicy(budget_ratio=1.0, budget_burst=1.0, min_samples=1, clock=clock)
+
+        async def slow_sample() -> None:
+            clock.now += 10.0
+
+        asyncio.run(policy.run(slow_sample))
+        result = asyncio.run(policy.run(_immediate))
+
+        assert result == "fast"
+        assert policy.get_stats().hedged == 0
+
+    def test_予算が不足している場合は最初のリクエストの応答を待つこと(self) -> None:
+        """追加のリクエストの数が budget_ratio の割合に抑えられることを確認"""
+        # NOTE: 時計を進めないため、待ち時間は常に0となり毎回追加のリクエストを試みる
+        policy = HedgingPolicy(budget_ratio=0.1, budget_burst=1.0, min_samples=1, clock=FakeClock())
+        _warm_up(policy, 1)
+
+        async def slow() -> str:
+            await asyncio.sleep(0.05)
+            return "slow"
+
+        for _ in range(5):
+            assert asyncio.run(policy.run(slow)) == "slow"
+
+        stats = policy.get_stats()
+        assert stats.hedged == 0
+        assert stats.budget_exhausted == 5
+
+    def test_最初のリクエストが失敗しても追加のリクエストの応答を採用すること(self) -> None:
+        """追加のリクエスト送信後に最初のリクエストが失敗した場合は、もう一方の応答を待つことを確認"""
+        policy = HedgingPolicy(budget_ratio=1.0, budget_burst=1.0, min_samples=1)
+        request = _SlowThenFast(first_error=ExternalServiceError("primary failed"))
+        _warm_up(policy, 1)
+
+        assert asyncio.run(policy.run(request)) == "hedge"
+        assert policy.get_stats().hedge_wins == 1
+
+    def test_すべてのリクエストが失敗した場合は最初のリクエストの例外を送出すること(self) -> None:
+        """どちらも失敗した場合は最初に送信したリクエストの例外を送出することを確認"""
+        policy = HedgingPolicy(budget_ratio=1.0, budget_burst=1.0, min_samples=1)
+        _warm_up(policy, 1)
+        calls = 0
+
+        async def failing() -> str:
+            nonlocal calls
+            calls += 1
+            call = calls
+            await asyncio.sleep(0.05)
+            raise ExternalServiceError(f"failed {call}")
+
+        with pytest.raises(ExternalServiceError, match="failed 1"):
+            asyncio.run(policy.run(failing))
+
+        assert calls == 2
+
+    @pytest.mark.parametrize(
+        ("kwargs", "message"),
+        [
+            ({"percentile": 1.0}, "percentile"),
+            ({"budget_ratio": 1.5}, "budget_ratio"),
+            ({"budget_burst": 0.5}, "budget_burst"),
+            ({"window_size": 5, "min_samples": 10}, "min_samples"),
+        ],
+    )
+    def test_不正な設定はエラーになること(self, kwargs: dict, message: str) -> None:
+        """設定値の範囲外を指定した場合にValueErrorとなることを確認"""
+        with pytest.raises(ValueError, match=message):
+            HedgingPolicy(**kwargs)
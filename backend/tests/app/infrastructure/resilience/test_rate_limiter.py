@@ -0,0 +1,152 @@
+"""RateLimiterのテスト"""
+
+import asyncio
+
+import pytest
+
+from app.domain.exceptions import ExternalServiceDeadlineExceededError, ExternalServiceError
+from app.infrastructure.resilience import RateLimiter
+
+
+class FakeClock:
+    """テスト用に手動で進める時計"""
+
+    def __init__(self) -> None:
+        """初期化"""
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        """現在時刻を返す"""
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        """待機した分だけ時計を進める"""
+        self.now += seconds
+
+
+class TestRateLimiter:
+    """RateLimiterのテスト"""
+
+    def test_バースト数までは待たずに取得できること(self) -> None:
+        """バケットに蓄えたトークンの範囲では待機しないことを確認"""
+        clock = FakeClock()
+        limiter = RateLimiter(
+            "Test API", rate_per_second=10, burst=3, clock=clock, sleep=clock.sleep
+        )
+
+        for _ in range(3):
+            limiter.acquire()
+
+        assert clock.now == 0.0
+        stats = limiter.get_stats()
+        assert stats.acquired == 3
+        assert stats.delayed == 0
+
+    def test_トークンが不足したら補充まで待機すること(self) -> None:
+        """バーストを超えた呼び出しが設定した速度に平準化されることを確認"""
+        clock = FakeClock()
+        limiter = RateLimiter(
+            "Test API", rate_per_second=10, burst=1, clock=clock, sleep=clock.sleep
+        )
+
+        for _ in range(3):
+            limiter.acquire()
+
+        assert clock.now == pytest.approx(0.2)
+        stats = limiter.get_stats()
+        assert stats.delayed == 2
+        assert stats.total_wait_seconds == pytest.approx(0.2)
+        assert stats.max_wait_seconds == pytest.approx(0.1)
+
+    def test_待機中の予約の分だけ後続の待ち時間が延びること(self) -> None:
+        """同時に到着した呼び出しに到着順の待ち時間が割り当てられることを確認"""
+        clock = FakeClock()
+        waits: list[float] = []
+        limiter = RateLimiter(
+            "Test API", rate_per_second=10, burst=1, clock=clock, sleep=waits.append
+        )
+
+        for _ in range(3):
+            limiter.acquire()
+
+        assert waits == [pytest.approx(0.1), pytest.approx(0.2)]
+
+    def test_待ち時間が上限を超える場合は即時失敗すること(self) -> None:
+        """待機せずにExternalServiceErrorを送出し、拒否数を記録することを確認"""
+        clock = FakeClock()
+        waits: list[float] = []
+        limiter = RateLimiter(
+            "Test API",
+            rate_per_second=1,
+            burst=1,
+            max_wait_seconds=1.5,
+            clock=clock,
+            sleep=waits.append,
+        )
+        limiter.acquire()
+        limiter.acquire()
+
+        with pytest.raises(ExternalServiceError, match="Rate limit exceeded") as exc_info:
+            limiter.acquire()
+
+        assert exc_info.value.service_name == "Test API"
+        assert waits == [pytest.approx(1.0)]
+        assert limiter.get_stats().rejected == 1
+
+    def test_非同期版は待機してからトークンを取得すること(self) -> None:
+        """acquire_asyncがイベントループ上で待機することを確認"""
+        limiter = RateLimiter("Test API", rate_per_second=100, burst=1)
+
+        async def run() -> None:
+            await asyncio.gather(*(limiter.acquire_async() for _ in range(3)))
+
+        asyncio.run(run())
+
+        stats = limiter.get_stats()
+        assert stats.acquired == 3
+        assert stats.delayed == 2
+
+    def test_待機中にキャンセルされた予約は返却されること(self) -> None:
+        """キャンセルされた呼び出しの分だけ後続の待ち時間が短くなることを確認"""
+        clock = FakeClock()
+        waits: list[float] = []
+        limiter = RateLimiter(
+            "Test API", rate_per_second=1, burst=1, clock=clock, sleep=waits.append
+        )
+
+        async def run() -> None:
+            await limiter.acquire_async()
+            task = asyncio.create_task(limiter.acquire_async())
+            await asyncio.sleep(0)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+        asyncio.run(run())
+        limiter.acquire()
+
+        assert waits == [pytest.approx(1.0)]
+
+    def test_待機中に期限を過ぎる場合はトークンを予約しないこと(self) -> None:
+        """期限までに待ち終えられない呼び出しがトークンを消費せず、後続の待ち時間を延ばさないことを確認"""
+        clock = FakeClock()
+        waits: list[float] = []
+        limiter = RateLimiter(
+            "Test API", rate_per_second=1, burst=1, clock=clock, sleep=waits.append
+        )
+
+        async def run() -> None:
+            await limiter.acquire_async()
+            await limiter.acquire_async(remaining_seconds=0.5)
+
+        with pytest.raises(
+            ExternalServiceDeadlineExceededError, match="Deadline exceeded"
+        ) as exc_info:
+            asyncio.run(run())
+        limiter.acquire()
+
+        assert exc_info.value.service_name == "Test API"
+        assert waits == [pytest.approx(1.0)]
+        stats = limiter.get_stats()
+        assert stats.acquired == 2
+        assert stats.rejected == 1